@@ -0,0 +1,128 @@
+"""
+Benchmark the SQLite tuning profiles under concurrent load.
+
+For each profile, imports transactions in batches (one writer) while
+reader threads page through the account like the dashboard does.
+Reports import throughput and read latency (p50 / p95 / max).
+
+Usage:
+    python scripts/benchmark_database.py --rows 20000 --readers 4
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+# Add backend to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.infrastructure.persistence.database import Database, DatabaseConfig, SQLiteProfile
+from src.infrastructure.persistence.models import Base
+from src.infrastructure.persistence.repositories.sqlite_transaction_repository import (
+    SQLiteTransactionRepository,
+)
+from src.domain.entities.transaction import Transaction
+from src.domain.value_objects.money import Money
+
+
+def make_batch(account_id, start: int, size: int) -> list[Transaction]:
+    """Build `size` distinct transactions, spread over the last ~3 years."""
+    batch = []
+    for i in range(start, start + size):
+        tx = Transaction(
+            account_id=account_id,
+            date=date.today() - timedelta(days=i % 1000),
+            amount=Money(Decimal(-(i % 20000)) / 100),
+            description=f"CB MARCHAND {i % 997} REF{i}",
+        )
+        tx.ensure_import_hash()
+        batch.append(tx)
+    return batch
+
+
+def run_profile(name: str, rows: int, batch_size: int, readers: int) -> dict:
+    """Import `rows` transactions while `readers` threads query the account."""
+    with tempfile.TemporaryDirectory() as tmp:
+        config = DatabaseConfig(
+            f"sqlite:///{tmp}/bench.db",
+            profile=SQLiteProfile.from_name(name),
+            pool_size=readers + 1,
+        )
+        db = Database(config)
+        db.create_all_tables(Base)
+        account_id = uuid4()
+
+        # Seed one batch so readers have something to page through
+        with db.get_session_context() as session:
+            SQLiteTransactionRepository(session).save_many(make_batch(account_id, 0, batch_size))
+
+        done = threading.Event()
+        latencies: list[float] = []
+        lock = threading.Lock()
+
+        def reader() -> None:
+            while not done.is_set():
+                started = time.perf_counter()
+                with db.get_session_context() as session:
+                    repo = SQLiteTransactionRepository(session)
+                    repo.find_by_account(account_id, limit=50)
+                    repo.count_by_account(account_id)
+                elapsed = time.perf_counter() - started
+                with lock:
+                    latencies.append(elapsed)
+
+        threads = [threading.Thread(target=reader, daemon=True) for _ in range(readers)]
+        for thread in threads:
+            thread.start()
+
+        started = time.perf_counter()
+        for offset in range(batch_size, rows, batch_size):
+            batch = make_batch(account_id, offset, min(batch_size, rows - offset))
+            with db.get_session_context() as session:
+                SQLiteTransactionRepository(session).save_many(batch)
+        import_seconds = time.perf_counter() - started
+
+        done.set()
+        for thread in threads:
+            thread.join()
+        db.close()
+
+    latencies.sort()
+    return {
+        "profile": name,
+        "rows_per_s": (rows - batch_size) / import_seconds if import_seconds else 0.0,
+        "reads": len(latencies),
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000 if latencies else 0.0,
+        "max_ms": latencies[-1] * 1000 if latencies else 0.0,
+    }
+
+
+def main() -> None:
+    """Run the benchmark for each profile and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--profiles", nargs="+", default=["default", "performance"])
+    args = parser.parse_args()
+
+    print(f"{'profile':<12} {'import rows/s':>14} {'reads':>7} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for name in args.profiles:
+        r = run_profile(name, args.rows, args.batch_size, args.readers)
+        print(
+            f"{r['profile']:<12} {r['rows_per_s']:>14.0f} {r['reads']:>7} "
+            f"{r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['max_ms']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
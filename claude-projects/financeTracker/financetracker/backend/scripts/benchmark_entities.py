@@ -0,0 +1,142 @@
+"""
+Benchmark memory and construction time of the domain objects.
+
+Compares, for Money, ProjectionPoint, Transaction and RecurringTransaction:
+- dict: the same dataclass without __slots__ (previous layout)
+- slots: the current dataclass(slots=True), validated constructor
+- trusted: slots + from_trusted (database read path, no re-validation)
+
+Usage:
+    python scripts/benchmark_entities.py --count 100000
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import gc
+import time
+import tracemalloc
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+# Add backend to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.domain.entities.recurring_transaction import (
+    BusinessDayAdjustment,
+    Frequency,
+    RecurringTransaction,
+)
+from src.domain.entities.transaction import Transaction
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.projection_point import ProjectionPoint
+
+
+def without_slots(cls: type) -> type:
+    """Rebuild a slotted dataclass as a plain (per-instance __dict__) dataclass."""
+    params = cls.__dataclass_params__
+    # Slots, dataclass bookkeeping and generated methods (regenerated below)
+    skip = {*cls.__slots__, "__slots__", "__dict__", "__weakref__",
+            "__dataclass_fields__", "__dataclass_params__", "__match_args__",
+            "__init__", "__setattr__", "__delattr__", "__getstate__", "__setstate__"}
+    namespace = {k: v for k, v in cls.__dict__.items() if k not in skip}
+    for f in dataclasses.fields(cls):
+        if f.default is not dataclasses.MISSING or f.default_factory is not dataclasses.MISSING:
+            namespace[f.name] = dataclasses.field(
+                default=f.default, default_factory=f.default_factory,
+                init=f.init, repr=f.repr, compare=f.compare, hash=f.hash,
+            )
+    plain = type(cls.__name__, cls.__bases__, namespace)
+    return dataclasses.dataclass(eq=params.eq, frozen=params.frozen)(plain)
+
+
+def measure(factory, count: int, repeat: int = 3) -> dict:
+    """Build `count` objects; report best µs per object and bytes per object."""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        started = time.perf_counter()
+        objects = [factory(i) for i in range(count)]
+        timings.append(time.perf_counter() - started)
+        gc.enable()
+        del objects
+    elapsed = min(timings)
+
+    gc.collect()
+    tracemalloc.start()
+    objects = [factory(i) for i in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+
+    return {"us": elapsed / count * 1e6, "bytes": current / count}
+
+
+def scenarios():
+    """(name, {variant: factory}) for each benchmarked class."""
+    amount = Decimal("-42.50")
+    # Identifiants fixes: seul le coût de construction est mesuré
+    tx_id, account_id, category_id = uuid4(), uuid4(), uuid4()
+    today, now = date(2025, 1, 15), datetime(2025, 1, 15, 10, 0)
+    money = Money(amount)
+
+    PlainMoney = without_slots(Money)
+    yield "Money", {
+        "dict": lambda i: PlainMoney(amount, "EUR"),
+        "slots": lambda i: Money(amount, "EUR"),
+        "trusted": lambda i: Money.from_trusted(amount, "EUR"),
+    }
+
+    PlainPoint = without_slots(ProjectionPoint)
+    yield "ProjectionPoint", {
+        "dict": lambda i: PlainPoint(today, money, money),
+        "slots": lambda i: ProjectionPoint(today, money, money),
+    }
+
+    tx_values = dict(
+        account_id=account_id, date=today, value_date=today, amount=money,
+        description="CB CARREFOUR", category_id=category_id, category_confidence=0.9,
+        is_recurring=False, recurring_id=None, notes="", import_hash="",
+        created_at=now, updated_at=now,
+    )
+    PlainTransaction = without_slots(Transaction)
+    yield "Transaction", {
+        "dict": lambda i: PlainTransaction(id=tx_id, tags=[], **tx_values),
+        "slots": lambda i: Transaction(id=tx_id, tags=[], **tx_values),
+        "trusted": lambda i: Transaction.from_trusted(id=tx_id, tags=[], **tx_values),
+    }
+
+    rec_values = dict(
+        account_id=account_id, name="Loyer", amount=money, category_id=category_id,
+        frequency=Frequency.MONTHLY, day_of_month=5, interval=1, day_of_week=None,
+        month_of_year=None, business_day_adjustment=BusinessDayAdjustment.NONE,
+        start_date=today, end_date=None, is_variable=False, variance_percent=0.0,
+        created_at=now, updated_at=now,
+    )
+    PlainRecurring = without_slots(RecurringTransaction)
+    yield "RecurringTransaction", {
+        "dict": lambda i: PlainRecurring(id=tx_id, **rec_values),
+        "slots": lambda i: RecurringTransaction(id=tx_id, **rec_values),
+        "trusted": lambda i: RecurringTransaction.from_trusted(id=tx_id, **rec_values),
+    }
+
+
+def main() -> None:
+    """Print a table of construction time and memory per object."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'class':<22} {'variant':<8} {'µs/object':>10} {'bytes/object':>13}")
+    for name, variants in scenarios():
+        for variant, factory in variants.items():
+            r = measure(factory, args.count)
+            print(f"{name:<22} {variant:<8} {r['us']:>10.2f} {r['bytes']:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark transaction page reads: entity path vs read-model rows.
+
+The entity path hydrates ORM models, Transaction entities and pydantic
+responses (previous GET /transactions). The row path selects columns with
+Core into TransactionRow and serializes them directly.
+Reports time per serialized page and the peak memory per row while a page
+is fetched and held (tracemalloc).
+
+Usage:
+    python scripts/benchmark_read_path.py --rows 20000 --page-size 500
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+# Add backend to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.infrastructure.api.routes.transactions import _to_response
+from src.infrastructure.persistence.database import Database, DatabaseConfig
+from src.infrastructure.persistence.models import Base
+from src.infrastructure.persistence.repositories.sqlite_transaction_repository import (
+    SQLiteTransactionRepository,
+)
+from src.domain.entities.transaction import Transaction
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.transaction_query import TransactionQuery
+
+
+def seed(db: Database, account_id, rows: int) -> None:
+    """Insert `rows` transactions on one account."""
+    with db.get_session_context() as session:
+        batch = []
+        for i in range(rows):
+            tx = Transaction(
+                account_id=account_id,
+                date=date.today() - timedelta(days=i % 1000),
+                amount=Money(Decimal(-(i % 20000)) / 100),
+                description=f"CB MARCHAND {i % 997} REF{i}",
+                tags=["courses"] if i % 3 == 0 else [],
+            )
+            tx.ensure_import_hash()
+            batch.append(tx)
+        SQLiteTransactionRepository(session).save_many(batch)
+
+
+def entity_page(repo: SQLiteTransactionRepository, query: TransactionQuery, size: int) -> list:
+    """Previous list path: ORM model → Transaction entity → pydantic response."""
+    return [_to_response(tx) for tx in repo.find(query, limit=size)]
+
+
+def entity_json(items: list) -> str:
+    """Serialize pydantic responses like FastAPI's response_model does."""
+    return json.dumps([item.model_dump(mode="json") for item in items])
+
+
+def row_page(repo: SQLiteTransactionRepository, query: TransactionQuery, size: int) -> list:
+    """Read-model path: Core columns → TransactionRow."""
+    return repo.find_rows(query, limit=size)
+
+
+def row_json(items: list) -> str:
+    """Serialize read-model rows like the list route does."""
+    return json.dumps([row.to_dict() for row in items])
+
+
+def measure(db: Database, page, serialize, query: TransactionQuery, size: int, repeat: int) -> dict:
+    """Time `repeat` serialized pages and trace the memory of one fetched page."""
+    with db.get_session_context() as session:
+        repo = SQLiteTransactionRepository(session)
+        serialize(page(repo, query, size))  # warm-up (statement cache, page cache)
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            serialize(page(repo, query, size))
+            session.expunge_all()
+        elapsed = (time.perf_counter() - started) / repeat
+
+        tracemalloc.start()
+        items = page(repo, query, size)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del items
+
+    return {"ms_per_page": elapsed * 1000, "bytes_per_row": peak / size}
+
+
+def main() -> None:
+    """Seed a temporary database and compare both read paths."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(DatabaseConfig(f"sqlite:///{tmp}/bench.db"))
+        db.create_all_tables(Base)
+        account_id = uuid4()
+        seed(db, account_id, args.rows)
+        query = TransactionQuery(account_ids=[account_id])
+
+        print(f"{'path':<8} {'ms/page':>10} {'peak bytes/row':>16}")
+        for name, page, serialize in (
+            ("entity", entity_page, entity_json),
+            ("rows", row_page, row_json),
+        ):
+            r = measure(db, page, serialize, query, args.page_size, args.repeat)
+            print(f"{name:<8} {r['ms_per_page']:>10.2f} {r['bytes_per_row']:>16.0f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark UUID storage modes: VARCHAR(36) text vs 16-byte BLOB.
+
+Seeds the same transactions (Core bulk insert) into one database per mode,
+then reports the file size, the size of the id-bearing indexes and the
+latency of the hot paths: keyset page, count per account, lookup by id.
+
+Usage:
+    python scripts/benchmark_uuid_storage.py --rows 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+# Add backend to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from src.infrastructure.persistence.database import Database, DatabaseConfig
+from src.infrastructure.persistence.models import (
+    UUID_STORAGES,
+    AccountModel,
+    Base,
+    TransactionModel,
+)
+from src.infrastructure.persistence.repositories.sqlite_transaction_repository import (
+    SQLiteTransactionRepository,
+)
+from src.domain.value_objects.transaction_query import TransactionQuery
+
+BATCH_SIZE = 20_000
+
+
+def seed(db: Database, accounts: list, rows: int) -> list:
+    """Insert `rows` transactions spread over `accounts`; return their ids."""
+    now = datetime(2025, 1, 1)
+    ids = [uuid4() for _ in range(rows)]
+    with db.engine.begin() as connection:
+        connection.execute(AccountModel.__table__.insert(), [
+            {"id": a, "name": f"Compte {i}", "bank": "Banque", "account_type": "checking",
+             "created_at": now, "updated_at": now}
+            for i, a in enumerate(accounts)
+        ])
+        for start in range(0, rows, BATCH_SIZE):
+            connection.execute(TransactionModel.__table__.insert(), [
+                {
+                    "id": ids[i],
+                    "account_id": accounts[i % len(accounts)],
+                    "date": date(2025, 1, 1) - timedelta(days=i % 2000),
+                    "amount": -(i % 20000) / 100,
+                    "currency": "EUR",
+                    "description": f"CB MARCHAND {i % 997}",
+                    "category_confidence": 0.0,
+                    "is_recurring": False,
+                    "tags": [],
+                    "notes": "",
+                    "import_hash": f"{i:064x}",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(start, min(start + BATCH_SIZE, rows))
+            ])
+    return ids
+
+
+def sizes(db: Database) -> dict:
+    """File size and id-bearing index sizes (dbstat when available)."""
+    with db.engine.connect() as connection:
+        page_size = connection.execute(text("PRAGMA page_size")).scalar()
+        page_count = connection.execute(text("PRAGMA page_count")).scalar()
+        try:
+            index_bytes = connection.execute(text(
+                "SELECT SUM(pgsize) FROM dbstat WHERE name IN "
+                "('sqlite_autoindex_transactions_1', 'idx_transaction_account_date_id', "
+                "'idx_transaction_date_account')"
+            )).scalar()
+        except Exception:
+            index_bytes = None
+    return {"file_mb": page_size * page_count / 1e6,
+            "index_mb": index_bytes / 1e6 if index_bytes else float("nan")}
+
+
+def timed(operation, repeat: int) -> float:
+    """Best-of-3 mean milliseconds per call."""
+    operation()  # warm-up
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            operation()
+        best = min(best, (time.perf_counter() - started) / repeat)
+    return best * 1000
+
+
+def measure(db: Database, accounts: list, ids: list, repeat: int) -> dict:
+    """Latency of the repository hot paths."""
+    rng = random.Random(42)
+    sample = [ids[rng.randrange(len(ids))] for _ in range(repeat)]
+    query = TransactionQuery(account_ids=[accounts[0]])
+
+    with db.get_session_context() as session:
+        repo = SQLiteTransactionRepository(session)
+        first = repo.find_rows(query, limit=50)
+        cursor = (first[-1].date, first[-1].id)
+        lookups = iter(sample * 4)
+
+        return {
+            "page_ms": timed(lambda: repo.find_rows(query, limit=50, after=cursor), repeat),
+            "count_ms": timed(lambda: repo.count(query), max(1, repeat // 50)),
+            "get_ms": timed(lambda: repo.get_by_id(next(lookups)), repeat // 4),
+        }
+
+
+def main() -> None:
+    """Seed one temporary database per storage mode and compare them."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--accounts", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    accounts = [uuid4() for _ in range(args.accounts)]
+    print(f"{'storage':<8} {'file MB':>9} {'index MB':>9} {'page ms':>9} "
+          f"{'count ms':>9} {'get ms':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for storage in UUID_STORAGES:
+            db = Database(DatabaseConfig(f"sqlite:///{tmp}/{storage}.db", uuid_storage=storage))
+            db.create_all_tables(Base)
+            ids = seed(db, accounts, args.rows)
+            with db.engine.connect() as connection:
+                connection.execute(text("ANALYZE"))
+            s = sizes(db)
+            r = measure(db, accounts, ids, args.repeat)
+            print(f"{storage:<8} {s['file_mb']:>9.1f} {s['index_mb']:>9.1f} "
+                  f"{r['page_ms']:>9.3f} {r['count_ms']:>9.2f} {r['get_ms']:>8.3f}")
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Recompute the import hashes of an existing database with the current scheme.
+
+Import hashes are now blake2b digests of account, date, amount, description
+and the occurrence rank of identical rows; hashes stored by earlier versions
+(SHA-256 without account nor rank) would no longer match a re-imported
+statement. Identical rows of an account are ranked in insertion order. All
+rows are rewritten in one transaction; running the script twice is harmless.
+
+Usage:
+    python scripts/convert_import_hashes.py
+    python scripts/convert_import_hashes.py --database-url sqlite:///./data/finance.db
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+# Add backend to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select, update
+
+from src.config import settings
+from src.domain.entities.transaction import compute_import_hash
+from src.domain.value_objects.money import Money
+from src.infrastructure.persistence.database import Database, DatabaseConfig
+from src.infrastructure.persistence.models import TransactionModel
+
+BATCH_SIZE = 5000
+
+
+def convert(database_url: str) -> int:
+    """Rewrite every import_hash in one transaction; return changed rows."""
+    database = Database(DatabaseConfig(
+        database_url,
+        money_storage=settings.money_storage,
+        uuid_storage=settings.uuid_storage,
+    ))
+    seen: dict[tuple, int] = {}
+    changes = []
+    try:
+        with database.get_session_context() as session:
+            rows = session.execute(
+                select(
+                    TransactionModel.id,
+                    TransactionModel.account_id,
+                    TransactionModel.date,
+                    TransactionModel.amount,
+                    TransactionModel.description,
+                    TransactionModel.import_hash,
+                ).order_by(TransactionModel.created_at, TransactionModel.id)
+            )
+            for row in rows:
+                key = (row.date, Money(row.amount).amount, row.description[:50])
+                occurrence = seen.get((row.account_id, key), 0)
+                seen[(row.account_id, key)] = occurrence + 1
+                new_hash = compute_import_hash(row.account_id, key, occurrence)
+                if new_hash != row.import_hash:
+                    changes.append({"id": row.id, "import_hash": new_hash})
+
+            for start in range(0, len(changes), BATCH_SIZE):
+                session.execute(update(TransactionModel), changes[start:start + BATCH_SIZE])
+    finally:
+        database.close()
+    return len(changes)
+
+
+def main() -> None:
+    """Parse arguments and convert the database."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=settings.database_url)
+    args = parser.parse_args()
+
+    print(f"{convert(args.database_url)} import hashes rewritten")
+
+
+if __name__ == "__main__":
+    main()
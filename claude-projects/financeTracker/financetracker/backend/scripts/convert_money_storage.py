@@ -0,0 +1,73 @@
+"""
+Convert the money columns of an existing database between storage modes.
+
+`decimal` stores amounts as NUMERIC (REAL in SQLite), `cents` as INTEGER
+cents. Run once, then set MONEY_STORAGE to the new mode.
+
+Usage:
+    python scripts/convert_money_storage.py --to cents
+    python scripts/convert_money_storage.py --database-url sqlite:///./data/finance.db --to decimal
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+# Add backend to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, text
+
+from src.config import settings
+from src.infrastructure.persistence.models import MONEY_STORAGE_CENTS, MONEY_STORAGES
+
+# (table, colonne) de type MoneyAmount
+MONEY_COLUMNS = [
+    ("transactions", "amount"),
+    ("accounts", "initial_balance"),
+    ("categories", "budget_default"),
+    ("recurring_transactions", "amount"),
+    ("monthly_category_totals", "total"),
+    ("account_projections", "balance"),
+    ("alert_events", "amount"),
+    ("alert_events", "threshold"),
+]
+
+
+def convert(database_url: str, to: str) -> dict[str, int]:
+    """Rewrite every money column in one transaction; return rows per table."""
+    if to == MONEY_STORAGE_CENTS:
+        expression = "CAST(ROUND({column} * 100) AS INTEGER)"
+    else:
+        expression = "ROUND({column} / 100.0, 2)"
+
+    converted = {}
+    engine = create_engine(database_url)
+    with engine.begin() as connection:
+        for table, column in MONEY_COLUMNS:
+            result = connection.execute(
+                text(
+                    f"UPDATE {table} SET {column} = {expression.format(column=column)} "
+                    f"WHERE {column} IS NOT NULL"
+                )
+            )
+            converted[f"{table}.{column}"] = result.rowcount
+    engine.dispose()
+    return converted
+
+
+def main() -> None:
+    """Parse arguments and convert the database."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=settings.database_url)
+    parser.add_argument("--to", choices=MONEY_STORAGES, required=True)
+    args = parser.parse_args()
+
+    for column, rows in convert(args.database_url, args.to).items():
+        print(f"{column:<32} {rows:>8} rows")
+    print(f"Done. Set MONEY_STORAGE={args.to}")
+
+
+if __name__ == "__main__":
+    main()
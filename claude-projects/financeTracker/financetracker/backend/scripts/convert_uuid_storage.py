@@ -0,0 +1,89 @@
+"""
+Convert the UUID columns of an existing database between storage modes.
+
+`text` stores identifiers as 36-character strings, `binary` as 16-byte
+BLOBs. Primary and foreign keys are rewritten together in one transaction;
+rows already in the target mode are left untouched. Run once, then set
+UUID_STORAGE to the new mode and VACUUM to reclaim the freed pages.
+
+Usage:
+    python scripts/convert_uuid_storage.py --to binary
+    python scripts/convert_uuid_storage.py --database-url sqlite:///./data/finance.db --to text
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from uuid import UUID
+
+# Add backend to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, event, text
+
+from src.config import settings
+from src.infrastructure.persistence.models import (
+    UUID_STORAGE_BINARY,
+    UUID_STORAGES,
+    Base,
+    UUIDKey,
+)
+
+# (table, colonne) de type UUIDKey
+UUID_COLUMNS = [
+    (table.name, column.name)
+    for table in Base.metadata.sorted_tables
+    for column in table.columns
+    if isinstance(column.type, UUIDKey)
+]
+
+
+def _register_functions(dbapi_connection, connection_record) -> None:
+    """SQLite < 3.41 n'a pas unhex(): conversions en Python."""
+    dbapi_connection.create_function(
+        "uuid_to_blob", 1, lambda value: UUID(value).bytes, deterministic=True
+    )
+    dbapi_connection.create_function(
+        "uuid_to_text", 1, lambda value: str(UUID(bytes=value)), deterministic=True
+    )
+
+
+def convert(database_url: str, to: str) -> dict[str, int]:
+    """Rewrite every UUID column in one transaction; return rows per column."""
+    if to == UUID_STORAGE_BINARY:
+        expression, source_type = "uuid_to_blob({column})", "text"
+    else:
+        expression, source_type = "uuid_to_text({column})", "blob"
+
+    converted = {}
+    engine = create_engine(database_url)
+    event.listen(engine, "connect", _register_functions)
+    # foreign_keys reste OFF (défaut SQLite): parents et enfants changent ensemble
+    with engine.begin() as connection:
+        for table, column in UUID_COLUMNS:
+            result = connection.execute(
+                text(
+                    f"UPDATE {table} SET {column} = {expression.format(column=column)} "
+                    f"WHERE typeof({column}) = '{source_type}'"
+                )
+            )
+            converted[f"{table}.{column}"] = result.rowcount
+    engine.dispose()
+    return converted
+
+
+def main() -> None:
+    """Parse arguments and convert the database."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=settings.database_url)
+    parser.add_argument("--to", choices=UUID_STORAGES, required=True)
+    args = parser.parse_args()
+
+    for column, rows in convert(args.database_url, args.to).items():
+        print(f"{column:<40} {rows:>8} rows")
+    print(f"Done. Set UUID_STORAGE={args.to}")
+
+
+if __name__ == "__main__":
+    main()
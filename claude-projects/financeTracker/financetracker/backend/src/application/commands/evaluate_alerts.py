@@ -0,0 +1,35 @@
+"""
+Command: EvaluateAlerts
+
+Represent a request to re-evaluate alerts, after an import or on a
+scheduler tick.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+
+@dataclass
+class EvaluateAlertsCommand:
+    """
+    Commande de réévaluation des alertes.
+
+    Args:
+        account_ids: Comptes affectés (tous les comptes actifs si None)
+        on_date: Jour d'évaluation (défaut: aujourd'hui)
+
+    Examples:
+        >>> cmd = EvaluateAlertsCommand(account_ids=(account_id,))
+        >>> # handler.handle(cmd)  # Traité par AlertHandler
+    """
+
+    account_ids: Optional[tuple[UUID, ...]] = None
+    on_date: Optional[date] = None
+
+    def __post_init__(self):
+        """Valide la commande."""
+        if self.account_ids is not None:
+            self.account_ids = tuple(self.account_ids)
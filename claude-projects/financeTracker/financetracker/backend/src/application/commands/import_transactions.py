@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO, Optional
 from uuid import UUID
 
 
@@ -22,9 +23,10 @@ class ImportTransactionsCommand:
     importe les transactions dans son compte.
 
     Args:
-        file_path: Chemin du fichier CSV
+        file_path: Chemin du fichier CSV (nom d'origine si stream est fourni)
         account_id: UUID du compte d'importation
         auto_categorize: Si True, catégoriser automatiquement
+        stream: Contenu binaire positionnable (upload), lu sans copie disque
 
     Examples:
         >>> cmd = ImportTransactionsCommand(
@@ -38,6 +40,7 @@ class ImportTransactionsCommand:
     file_path: Path
     account_id: UUID
     auto_categorize: bool = True
+    stream: Optional[BinaryIO] = None
 
     def __post_init__(self):
         """Valide la commande."""
@@ -0,0 +1,101 @@
+"""
+DTO: AlertDTO
+
+Data Transfer Objects for alert events and evaluations.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class AlertDTO:
+    """
+    Événement d'alerte.
+
+    Attributes:
+        id: UUID de l'alerte
+        alert_type: balance_below_threshold | category_over_budget
+        trigger_date: Date de franchissement ou premier jour du mois (ISO format)
+        amount: Solde projeté ou dépense du mois
+        threshold: Seuil de solde ou budget
+        account_id: Compte concerné (alertes de solde)
+        category_id: Catégorie concernée (alertes de budget)
+        message: Description lisible
+        created_at: Date d'enregistrement (ISO format)
+    """
+
+    id: str
+    alert_type: str
+    trigger_date: str
+    amount: str
+    threshold: str
+    account_id: Optional[str]
+    category_id: Optional[str]
+    message: str
+    created_at: str
+
+    def to_dict(self) -> dict:
+        """Convertit en dictionnaire pour sérialisation JSON."""
+        return {
+            "id": self.id,
+            "alert_type": self.alert_type,
+            "trigger_date": self.trigger_date,
+            "amount": self.amount,
+            "threshold": self.threshold,
+            "account_id": self.account_id,
+            "category_id": self.category_id,
+            "message": self.message,
+            "created_at": self.created_at,
+        }
+
+    @staticmethod
+    def from_alert(alert) -> AlertDTO:
+        """
+        Crée un DTO depuis une entité Alert.
+
+        Args:
+            alert: Alert domain entity
+
+        Returns:
+            AlertDTO prêt pour sérialisation
+        """
+        return AlertDTO(
+            id=str(alert.id),
+            alert_type=alert.alert_type.value,
+            trigger_date=alert.trigger_date.isoformat(),
+            amount=str(alert.amount.amount),
+            threshold=str(alert.threshold.amount),
+            account_id=str(alert.account_id) if alert.account_id else None,
+            category_id=str(alert.category_id) if alert.category_id else None,
+            message=alert.message,
+            created_at=alert.created_at.isoformat(),
+        )
+
+
+@dataclass
+class AlertEvaluationDTO:
+    """
+    Résultat d'une réévaluation des alertes.
+
+    Attributes:
+        new_alerts: Alertes enregistrées par cette évaluation
+        reprojected: Comptes dont la projection a été recalculée
+        rebased: Comptes réévalués depuis la projection en cache
+        unchanged: Comptes sans changement
+    """
+
+    new_alerts: list[AlertDTO]
+    reprojected: int
+    rebased: int
+    unchanged: int
+
+    def to_dict(self) -> dict:
+        """Convertit en dictionnaire pour sérialisation JSON."""
+        return {
+            "new_alerts": [a.to_dict() for a in self.new_alerts],
+            "reprojected": self.reprojected,
+            "rebased": self.rebased,
+            "unchanged": self.unchanged,
+        }
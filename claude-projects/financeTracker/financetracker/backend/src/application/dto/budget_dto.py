@@ -0,0 +1,114 @@
+"""
+DTO: BudgetDTO
+
+Data Transfer Objects for budget-vs-actual results.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class BudgetStatusDTO:
+    """
+    État du budget d'une catégorie.
+
+    Attributes:
+        category_id: UUID de la catégorie
+        name: Nom de la catégorie
+        budget: Budget mensuel
+        spent: Dépense nette du mois à date
+        remaining: Budget restant (négatif si dépassé)
+        consumption: Part consommée (1.0 = 100%)
+        burn_rate: Dépense moyenne par jour écoulé
+        projected_spend: Dépense projetée en fin de mois
+        projected_overshoot: Dépassement projeté (0 si dans le budget)
+        is_over_budget: Budget déjà dépassé
+        is_projected_over: Dépassement projeté en fin de mois
+    """
+
+    category_id: str
+    name: str
+    budget: str
+    spent: str
+    remaining: str
+    consumption: float
+    burn_rate: str
+    projected_spend: str
+    projected_overshoot: str
+    is_over_budget: bool
+    is_projected_over: bool
+
+    def to_dict(self) -> dict:
+        """Convertit en dictionnaire pour sérialisation JSON."""
+        return {
+            "category_id": self.category_id,
+            "name": self.name,
+            "budget": self.budget,
+            "spent": self.spent,
+            "remaining": self.remaining,
+            "consumption": self.consumption,
+            "burn_rate": self.burn_rate,
+            "projected_spend": self.projected_spend,
+            "projected_overshoot": self.projected_overshoot,
+            "is_over_budget": self.is_over_budget,
+            "is_projected_over": self.is_projected_over,
+        }
+
+    @staticmethod
+    def from_status(status) -> BudgetStatusDTO:
+        """
+        Crée un DTO depuis un BudgetStatus domain object.
+
+        Args:
+            status: BudgetStatus value object
+
+        Returns:
+            BudgetStatusDTO prêt pour sérialisation
+        """
+        return BudgetStatusDTO(
+            category_id=str(status.category_id),
+            name=status.name,
+            budget=str(status.budget.amount),
+            spent=str(status.spent.amount),
+            remaining=str(status.remaining.amount),
+            consumption=float(status.consumption),
+            burn_rate=str(status.burn_rate.amount),
+            projected_spend=str(status.projected_spend.amount),
+            projected_overshoot=str(status.projected_overshoot.amount),
+            is_over_budget=status.is_over_budget(),
+            is_projected_over=status.is_projected_over(),
+        )
+
+
+@dataclass
+class BudgetReportDTO:
+    """
+    État de tous les budgets d'un mois.
+
+    Attributes:
+        month: Mois évalué (YYYY-MM)
+        as_of: Jour d'évaluation (ISO format)
+        days_elapsed: Jours écoulés dans le mois (jour courant inclus)
+        days_in_month: Nombre de jours du mois
+        scenario: Scénario appliqué aux récurrences à venir
+        categories: Une entrée par catégorie budgétée
+    """
+
+    month: str
+    as_of: str
+    days_elapsed: int
+    days_in_month: int
+    scenario: str
+    categories: list[BudgetStatusDTO]
+
+    def to_dict(self) -> dict:
+        """Convertit en dictionnaire pour sérialisation JSON."""
+        return {
+            "month": self.month,
+            "as_of": self.as_of,
+            "days_elapsed": self.days_elapsed,
+            "days_in_month": self.days_in_month,
+            "scenario": self.scenario,
+            "categories": [c.to_dict() for c in self.categories],
+        }
@@ -8,6 +8,7 @@ Used to return results from import operations to the user/API.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Optional
 from uuid import UUID
 
 
@@ -25,6 +26,8 @@ class ImportResultDTO:
         error_count: Nombre d'erreurs pendant l'import
         categorized_count: Nombre de transactions catégorisées
         errors: Liste des messages d'erreur
+        batch_id: Lot d'import créé (ou lot existant si déjà importé)
+        already_imported: True si le fichier avait déjà été importé (non reparsé)
     """
 
     account_id: UUID
@@ -33,6 +36,8 @@ class ImportResultDTO:
     error_count: int = 0
     categorized_count: int = 0
     errors: list[str] = field(default_factory=list)
+    batch_id: Optional[UUID] = None
+    already_imported: bool = False
 
     @property
     def total_processed(self) -> int:
@@ -65,6 +70,8 @@ class ImportResultDTO:
             "success_rate": round(self.success_rate, 2),
             "categorization_rate": round(self.categorization_rate, 2),
             "errors": self.errors,
+            "batch_id": str(self.batch_id) if self.batch_id else None,
+            "already_imported": self.already_imported,
         }
 
     def __str__(self) -> str:
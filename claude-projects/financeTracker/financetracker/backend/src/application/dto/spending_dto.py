@@ -0,0 +1,74 @@
+"""
+DTO: SpendingDTO
+
+Read model for spending analytics (monthly totals per category).
+
+Built from the monthly_category_totals rollup, never from raw transactions.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Optional
+
+
+@dataclass
+class MonthlyTotalDTO:
+    """
+    Total d'une catégorie sur un mois.
+
+    Attributes:
+        month: Mois (YYYY-MM)
+        total: Somme signée des montants
+        count: Nombre de transactions
+    """
+
+    month: str
+    total: Decimal
+    count: int
+
+    def to_dict(self) -> dict:
+        """Convertit en dictionnaire."""
+        return {"month": self.month, "total": str(self.total), "count": self.count}
+
+
+@dataclass
+class CategorySpendingDTO:
+    """
+    Dépenses d'une catégorie sur une période, mois par mois.
+
+    Avec le cumul hiérarchique, le total d'une catégorie inclut celui de
+    toutes ses sous-catégories.
+
+    Attributes:
+        category_id: UUID de la catégorie (texte), None = non catégorisé
+        name: Nom de la catégorie (None si non catégorisé ou supprimée)
+        parent_id: UUID de la catégorie parente (texte) ou None
+        total: Somme signée sur la période
+        count: Nombre de transactions sur la période
+        months: Totaux par mois (mois sans transaction omis)
+    """
+
+    category_id: Optional[str]
+    name: Optional[str]
+    parent_id: Optional[str]
+    total: Decimal = Decimal("0.00")
+    count: int = 0
+    months: list[MonthlyTotalDTO] = field(default_factory=list)
+
+    def add(self, month: str, total: Decimal, count: int) -> None:
+        """Ajoute le total d'un mois."""
+        self.months.append(MonthlyTotalDTO(month, total, count))
+        self.total += total
+        self.count += count
+
+    def to_dict(self) -> dict:
+        """Convertit en dictionnaire."""
+        return {
+            "category_id": self.category_id,
+            "name": self.name,
+            "parent_id": self.parent_id,
+            "total": str(self.total),
+            "count": self.count,
+            "months": [m.to_dict() for m in self.months],
+        }
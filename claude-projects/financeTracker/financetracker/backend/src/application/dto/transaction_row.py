@@ -0,0 +1,115 @@
+"""
+DTO: TransactionRow
+
+Read model for transaction list endpoints.
+
+Built straight from a SQL row: no ORM instance, no domain entity, no
+re-validation. Identifiers stay as the strings stored in the database and
+the amount is already formatted, so a page can be serialized as-is.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+
+class TransactionRow:
+    """
+    Ligne de transaction en lecture seule (liste, export).
+
+    Classe à __slots__: pas de __dict__ par instance. L'ordre des champs
+    est celui des colonnes sélectionnées (voir ROW_FIELDS).
+
+    Attributes:
+        id: UUID de la transaction (texte)
+        account_id: UUID du compte (texte)
+        amount: Montant signé formaté ("-42.50")
+        category_id / recurring_id: UUID (texte) ou None
+    """
+
+    ROW_FIELDS = (
+        "id",
+        "account_id",
+        "date",
+        "value_date",
+        "amount",
+        "currency",
+        "description",
+        "category_id",
+        "category_confidence",
+        "is_recurring",
+        "recurring_id",
+        "tags",
+        "notes",
+        "import_hash",
+        "created_at",
+        "updated_at",
+    )
+
+    __slots__ = ROW_FIELDS
+
+    def __init__(
+        self,
+        id: str,
+        account_id: str,
+        date: date,
+        value_date: Optional[date],
+        amount: Decimal,
+        currency: str,
+        description: str,
+        category_id: Optional[str],
+        category_confidence: float,
+        is_recurring: bool,
+        recurring_id: Optional[str],
+        tags: list[str],
+        notes: str,
+        import_hash: str,
+        created_at: datetime,
+        updated_at: datetime,
+    ):
+        self.id = id
+        self.account_id = account_id
+        self.date = date
+        self.value_date = value_date
+        self.amount = str(amount)
+        self.currency = currency
+        self.description = description
+        self.category_id = category_id
+        self.category_confidence = category_confidence
+        self.is_recurring = is_recurring
+        self.recurring_id = recurring_id
+        self.tags = tags
+        self.notes = notes
+        self.import_hash = import_hash
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    def to_dict(self) -> dict:
+        """Convertit en dictionnaire prêt pour la sérialisation JSON."""
+        return {
+            "id": self.id,
+            "account_id": self.account_id,
+            "date": self.date.isoformat(),
+            "value_date": self.value_date.isoformat() if self.value_date else None,
+            "amount": self.amount,
+            "currency": self.currency,
+            "description": self.description,
+            "category_id": self.category_id,
+            "category_confidence": self.category_confidence,
+            "is_recurring": self.is_recurring,
+            "recurring_id": self.recurring_id,
+            "tags": self.tags,
+            "notes": self.notes,
+            "import_hash": self.import_hash,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TransactionRow):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.ROW_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"TransactionRow({self.id}, {self.date}, {self.amount} {self.currency})"
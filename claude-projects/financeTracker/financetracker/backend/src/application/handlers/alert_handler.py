@@ -0,0 +1,105 @@
+"""
+Handler: AlertHandler
+
+Handles EvaluateAlertsCommand and GetAlertsQuery in the application layer.
+
+Orchestrates: balance snapshots → cached projections → AlertService → DTO
+"""
+from __future__ import annotations
+
+import logging
+from decimal import Decimal
+
+from src.application.commands.evaluate_alerts import EvaluateAlertsCommand
+from src.application.dto.alert_dto import AlertDTO, AlertEvaluationDTO
+from src.application.queries.get_alerts import GetAlertsQuery
+from src.domain.repositories.account_repository import AccountRepository
+from src.domain.repositories.alert_repository import AlertRepository
+from src.domain.repositories.budget_repository import BudgetRepository
+from src.domain.repositories.recurring_repository import RecurringRepository
+from src.domain.services.alert_service import AlertService
+
+logger = logging.getLogger(__name__)
+
+
+class AlertHandler:
+    """
+    Handler du moteur d'alertes.
+
+    Examples:
+        >>> handler = AlertHandler(
+        ...     account_repository=account_repo,
+        ...     recurring_repository=recurring_repo,
+        ...     alert_repository=alert_repo,
+        ...     budget_repository=budget_repo,
+        ...     threshold=Decimal("0"),
+        ... )
+        >>> handler.handle(EvaluateAlertsCommand(account_ids=(account_id,)))
+    """
+
+    def __init__(
+        self,
+        account_repository: AccountRepository,
+        recurring_repository: RecurringRepository,
+        alert_repository: AlertRepository,
+        budget_repository: BudgetRepository,
+        threshold: Decimal = Decimal("0"),
+    ):
+        """
+        Initialise le handler.
+
+        Args:
+            account_repository: Repository des comptes
+            recurring_repository: Repository des transactions récurrentes
+            alert_repository: Soldes, projections en cache et événements
+            budget_repository: Budgets et dépenses constatées
+            threshold: Seuil de solde (alerte strictement en dessous)
+        """
+        self.alert_repository = alert_repository
+        self.alert_service = AlertService(
+            account_repository=account_repository,
+            recurring_repository=recurring_repository,
+            alert_repository=alert_repository,
+            budget_repository=budget_repository,
+            threshold=threshold,
+        )
+
+    def handle(self, command: EvaluateAlertsCommand) -> AlertEvaluationDTO:
+        """
+        Réévalue les alertes des comptes affectés.
+
+        Args:
+            command: Commande de réévaluation
+
+        Returns:
+            AlertEvaluationDTO avec les nouvelles alertes
+        """
+        try:
+            evaluation = self.alert_service.evaluate(
+                account_ids=command.account_ids,
+                on_date=command.on_date,
+            )
+            return AlertEvaluationDTO(
+                new_alerts=[AlertDTO.from_alert(a) for a in evaluation.alerts],
+                reprojected=evaluation.reprojected,
+                rebased=evaluation.rebased,
+                unchanged=evaluation.unchanged,
+            )
+        except Exception as e:
+            logger.error(f"Alert evaluation error: {e}")
+            raise
+
+    def list_alerts(self, query: GetAlertsQuery) -> list[AlertDTO]:
+        """
+        Liste les dernières alertes enregistrées.
+
+        Args:
+            query: Requête de liste
+
+        Returns:
+            AlertDTO, plus récentes d'abord
+        """
+        alerts = self.alert_repository.find_alerts(
+            account_id=query.account_id, limit=query.limit
+        )
+        return [AlertDTO.from_alert(a) for a in alerts]
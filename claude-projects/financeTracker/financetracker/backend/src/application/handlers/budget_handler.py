@@ -0,0 +1,87 @@
+"""
+Handler: BudgetHandler
+
+Handles GetBudgetStatusQuery in the application layer.
+
+Orchestrates: budget lines (one read of the rollups) → recurring
+transactions → BudgetService → DTO
+"""
+from __future__ import annotations
+
+import calendar
+import logging
+from datetime import date
+
+from src.application.dto.budget_dto import BudgetReportDTO, BudgetStatusDTO
+from src.application.queries.get_budget_status import GetBudgetStatusQuery
+from src.domain.repositories.budget_repository import BudgetRepository
+from src.domain.repositories.recurring_repository import RecurringRepository
+from src.domain.services.budget_service import BudgetService
+
+logger = logging.getLogger(__name__)
+
+
+class BudgetHandler:
+    """
+    Handler pour la requête d'état des budgets.
+
+    Examples:
+        >>> handler = BudgetHandler(
+        ...     budget_repository=budget_repo,
+        ...     recurring_repository=recurring_repo,
+        ... )
+        >>> report = handler.handle(GetBudgetStatusQuery())
+    """
+
+    def __init__(
+        self,
+        budget_repository: BudgetRepository,
+        recurring_repository: RecurringRepository,
+    ):
+        """
+        Initialise le handler.
+
+        Args:
+            budget_repository: Budgets et dépenses constatées
+            recurring_repository: Repository des transactions récurrentes
+        """
+        self.budget_service = BudgetService(
+            budget_repository=budget_repository,
+            recurring_repository=recurring_repository,
+        )
+
+    def handle(self, query: GetBudgetStatusQuery) -> BudgetReportDTO:
+        """
+        Traite la requête d'état des budgets.
+
+        Args:
+            query: Requête d'état des budgets
+
+        Returns:
+            BudgetReportDTO avec une entrée par catégorie budgétée
+        """
+        on_date = query.on_date or date.today()
+        try:
+            statuses = self.budget_service.statuses(
+                on_date=on_date,
+                scenario=query.scenario,
+                account_ids=query.account_ids,
+            )
+            over = sum(1 for s in statuses if s.is_projected_over())
+            logger.info(
+                f"Budget status {on_date:%Y-%m}: {len(statuses)} budgets, "
+                f"{over} projected over"
+            )
+
+            return BudgetReportDTO(
+                month=f"{on_date:%Y-%m}",
+                as_of=on_date.isoformat(),
+                days_elapsed=on_date.day,
+                days_in_month=calendar.monthrange(on_date.year, on_date.month)[1],
+                scenario=query.scenario.value,
+                categories=[BudgetStatusDTO.from_status(s) for s in statuses],
+            )
+
+        except Exception as e:
+            logger.error(f"Budget status error: {e}")
+            raise
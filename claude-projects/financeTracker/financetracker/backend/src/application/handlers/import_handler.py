@@ -4,22 +4,112 @@ Handler: ImportTransactionsHandler
 Handles ImportTransactionsCommand in the application layer.
 
 Orchestrates: adapter factory → parsing → deduplication → categorization → persistence
+
+With an ImportBatchRepository, every imported file is recorded as a batch
+(digest, adapter, rows, date span): a file already imported into the
+account is recognized by its digest before parsing, and rows strictly
+inside the span of an earlier batch are skipped without a hash lookup.
 """
 from __future__ import annotations
 
+import hashlib
 import logging
+from bisect import bisect_right
+from dataclasses import dataclass, replace
+from datetime import date, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Optional, Union
 from uuid import UUID
 
 from src.application.commands.import_transactions import ImportTransactionsCommand
 from src.application.dto.import_result_dto import ImportResultDTO
+from src.domain.entities.import_batch import ImportBatch
+from src.domain.entities.transaction import Transaction
 from src.domain.repositories.category_repository import CategoryRepository
-from src.domain.repositories.transaction_repository import TransactionRepository
-from src.infrastructure.import_adapters.adapter_factory import AdapterFactory
+from src.domain.repositories.import_batch_repository import ImportBatchRepository
+from src.domain.repositories.transaction_repository import (
+    TransactionBulkWritePort,
+    TransactionRepository,
+)
 from src.domain.services.categorization_service import CategorizationService
+from src.domain.value_objects.date_range import DateRange
+
+if TYPE_CHECKING:
+    # Annotation seulement: les adapters (et chardet) ne sont chargés que
+    # par qui construit la factory
+    from src.infrastructure.import_adapters.adapter_factory import AdapterFactory
 
 logger = logging.getLogger(__name__)
 
+DIGEST_CHUNK_SIZE = 1024 * 1024
+
+# Transactions insérées par SAVEPOINT (cf. TransactionBulkWritePort)
+SAVE_CHUNK_SIZE = 500
+
+
+def file_digest(source: Union[Path, BinaryIO]) -> str:
+    """
+    Empreinte SHA-256 d'un fichier ou d'un flux binaire positionnable.
+
+    Le flux est lu par blocs puis remis à sa position de départ.
+    """
+    digest = hashlib.sha256()
+    if isinstance(source, Path):
+        with open(source, "rb") as f:
+            while chunk := f.read(DIGEST_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    position = source.tell()
+    while chunk := source.read(DIGEST_CHUNK_SIZE):
+        digest.update(chunk)
+    source.seek(position)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class ImportSource:
+    """
+    Provenance d'un lot de transactions parsées.
+
+    Attributes:
+        digest: Empreinte du fichier (cf. file_digest)
+        file_name: Nom du fichier d'origine
+        adapter: Nom de l'adaptateur utilisé
+    """
+
+    digest: str
+    file_name: str = ""
+    adapter: str = ""
+
+
+class _CoveredDays:
+    """
+    Jours déjà couverts par des lots: intérieur strict de chaque période.
+
+    Les jours de bord (premier et dernier jour d'un relevé) peuvent être
+    incomplets (export en cours de journée): ils restent soumis au contrôle
+    par import_hash. Les intérieurs fusionnés sont interrogés par bisection.
+    """
+
+    def __init__(self, spans: Iterable[DateRange]):
+        one_day = timedelta(days=1)
+        merged: list[list[date]] = []
+        for span in sorted(spans, key=lambda s: s.start):
+            start, end = span.start + one_day, span.end - one_day
+            if start > end:
+                continue
+            if merged and start <= merged[-1][1] + one_day:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        self._starts = [start for start, _ in merged]
+        self._ends = [end for _, end in merged]
+
+    def __contains__(self, day: date) -> bool:
+        i = bisect_right(self._starts, day) - 1
+        return i >= 0 and day <= self._ends[i]
+
 
 class ImportTransactionsHandler:
     """
@@ -45,21 +135,26 @@ class ImportTransactionsHandler:
 
     def __init__(
         self,
-        adapter_factory: AdapterFactory,
+        adapter_factory: Optional[AdapterFactory],
         transaction_repository: TransactionRepository,
         category_repository: CategoryRepository,
+        batch_repository: Optional[ImportBatchRepository] = None,
     ):
         """
         Initialise le handler.
 
         Args:
-            adapter_factory: Factory pour obtenir le bon adapter
+            adapter_factory: Factory pour obtenir le bon adapter (inutile
+                si seul import_parsed est appelé)
             transaction_repository: Repository pour persister les transactions
             category_repository: Repository pour les catégories (pour catégorisation)
+            batch_repository: Repository des lots d'import (provenance,
+                réimport par empreinte); sans lui, aucun lot n'est enregistré
         """
         self.adapter_factory = adapter_factory
         self.transaction_repository = transaction_repository
         self.category_repository = category_repository
+        self.batch_repository = batch_repository
         self.categorization_service = CategorizationService(
             category_repository=category_repository,
             transaction_repository=transaction_repository,
@@ -88,60 +183,34 @@ class ImportTransactionsHandler:
         result = ImportResultDTO(account_id=command.account_id)
 
         try:
-            # 1. Valider que le fichier existe
-            if not command.file_path.exists():
+            if command.stream is None and not command.file_path.exists():
                 raise FileNotFoundError(f"File not found: {command.file_path}")
 
-            # 2. Utiliser l'adapter factory pour parser
-            adapter = self.adapter_factory.get_adapter(command.file_path)
-            logger.info(f"Using adapter: {adapter.name}")
+            # 1. Fichier déjà importé dans ce compte: rien à parser
+            digest = None
+            if self.batch_repository is not None:
+                digest = file_digest(
+                    command.stream if command.stream is not None else command.file_path
+                )
+                known = self.batch_repository.find_by_digest(command.account_id, digest)
+                if known is not None:
+                    logger.info(f"File already imported as batch {known.id}, skipping")
+                    result.skipped_count = known.row_count
+                    result.batch_id = known.id
+                    result.already_imported = True
+                    return result
 
-            # 3. Parser les transactions
-            parsed_transactions = adapter.parse(
-                command.file_path,
-                command.account_id,
-                auto_categorize=False,  # On catégorise après
-            )
+            # 2-3. Choisir l'adapter et parser (fichier ou flux d'upload)
+            adapter_name, parsed_transactions = self._parse(command)
             logger.info(f"Parsed {len(parsed_transactions)} transactions from file")
 
-            # 4. Traiter chaque transaction
-            transactions_to_import = []
-
-            for tx in parsed_transactions:
-                # Vérifier les doublons
-                if self.transaction_repository.exists_by_hash(tx.import_hash):
-                    result.skipped_count += 1
-                    logger.debug(f"Skipping duplicate: {tx.import_hash[:8]}...")
-                    continue
-
-                # Catégoriser si demandé
-                if command.auto_categorize:
-                    categorization_result = self.categorization_service.categorize(tx)
-                    if categorization_result.category_id:
-                        tx.category_id = categorization_result.category_id
-                        tx.category_confidence = categorization_result.confidence
-                        result.categorized_count += 1
-                        logger.debug(
-                            f"Categorized: {categorization_result.reason} "
-                            f"(confidence={categorization_result.confidence})"
-                        )
-
-                transactions_to_import.append(tx)
-
-            # 5. Persister les transactions
-            if transactions_to_import:
-                try:
-                    imported = self.transaction_repository.save_many(
-                        transactions_to_import
-                    )
-                    result.imported_count = imported
-                    logger.info(f"Successfully imported {imported} transactions")
-                except Exception as e:
-                    error_msg = f"Error persisting transactions: {str(e)}"
-                    result.error_count = len(transactions_to_import)
-                    result.errors.append(error_msg)
-                    logger.error(error_msg)
-                    raise
+            # 4-5. Dédupliquer, catégoriser et persister
+            source = None
+            if digest is not None:
+                source = ImportSource(digest, command.file_path.name, adapter_name)
+            self._import_batch(
+                parsed_transactions, command.account_id, command.auto_categorize, source, result
+            )
 
         except FileNotFoundError as e:
             result.error_count += 1
@@ -161,3 +230,192 @@ class ImportTransactionsHandler:
         )
 
         return result
+
+    def import_parsed(
+        self,
+        transactions: list[Transaction],
+        account_id: UUID,
+        auto_categorize: bool = True,
+        source: Optional[ImportSource] = None,
+    ) -> ImportResultDTO:
+        """
+        Importe des transactions déjà parsées (étapes 2 à 5).
+
+        Permet de parser hors du handler (processus de la CLI) et de ne
+        garder ici que la partie qui touche la base.
+
+        Args:
+            transactions: Transactions issues d'un adapter
+            account_id: UUID du compte d'importation
+            auto_categorize: Si True, catégoriser automatiquement
+            source: Provenance du fichier; avec un batch_repository, un
+                fichier déjà importé est ignoré et un lot est enregistré
+
+        Returns:
+            ImportResultDTO avec statistiques d'importation
+        """
+        result = ImportResultDTO(account_id=account_id)
+        if self.batch_repository is not None and source is not None:
+            known = self.batch_repository.find_by_digest(account_id, source.digest)
+            if known is not None:
+                result.skipped_count = len(transactions)
+                result.batch_id = known.id
+                result.already_imported = True
+                return result
+        self._import_batch(transactions, account_id, auto_categorize, source, result)
+        return result
+
+    def list_batches(self, account_id: UUID, limit: int = 50) -> list[ImportBatch]:
+        """Derniers lots d'import d'un compte, plus récents d'abord."""
+        if self.batch_repository is None:
+            return []
+        return self.batch_repository.find_by_account(account_id, limit)
+
+    def undo_import(self, batch_id: UUID) -> int:
+        """
+        Annule un import: supprime le lot et les transactions qu'il a créées.
+
+        Args:
+            batch_id: UUID du lot (ImportResultDTO.batch_id)
+
+        Returns:
+            Nombre de transactions supprimées
+
+        Raises:
+            LookupError: Si le lot est inconnu
+        """
+        count = None
+        if self.batch_repository is not None:
+            count = self.batch_repository.delete_with_transactions(batch_id)
+        if count is None:
+            raise LookupError(f"Import batch not found: {batch_id}")
+        logger.info(f"Import batch {batch_id} undone: {count} transactions deleted")
+        return count
+
+    # === Méthodes privées ===
+
+    def _parse(self, command: ImportTransactionsCommand) -> tuple[str, list[Transaction]]:
+        """Nom de l'adapter et transactions du fichier ou du flux de la commande."""
+        if command.stream is not None:
+            name = command.file_path.name
+            adapter = self.adapter_factory.get_adapter_for_stream(command.stream, name)
+            logger.info(f"Using adapter: {adapter.name}")
+            return adapter.name, adapter.parse_stream(command.stream, command.account_id, name)
+
+        adapter = self.adapter_factory.get_adapter(command.file_path)
+        logger.info(f"Using adapter: {adapter.name}")
+        return adapter.name, adapter.parse(
+            command.file_path,
+            command.account_id,
+            auto_categorize=False,  # On catégorise après
+        )
+
+    def _import_batch(
+        self,
+        transactions: list[Transaction],
+        account_id: UUID,
+        auto_categorize: bool,
+        source: Optional[ImportSource],
+        result: ImportResultDTO,
+    ) -> None:
+        """Enregistre le lot (si provenance connue) autour de _import_parsed."""
+        if self.batch_repository is None or source is None:
+            self._import_parsed(transactions, auto_categorize, result)
+            return
+
+        dates = [tx.date for tx in transactions]
+        batch = ImportBatch(
+            account_id=account_id,
+            file_digest=source.digest,
+            file_name=source.file_name,
+            adapter=source.adapter,
+            row_count=len(transactions),
+            first_date=min(dates) if dates else None,
+            last_date=max(dates) if dates else None,
+        )
+
+        # Relevés qui se chevauchent: la période déjà importée n'est pas relue
+        covered = _CoveredDays(self.batch_repository.find_spans(account_id))
+        fresh = [tx for tx in transactions if tx.date not in covered]
+        result.skipped_count += len(transactions) - len(fresh)
+        for tx in fresh:
+            tx.import_batch_id = batch.id
+
+        # Lot enregistré avant ses transactions (clé étrangère)
+        self.batch_repository.save(batch)
+        self._import_parsed(fresh, auto_categorize, result)
+        self.batch_repository.save(replace(
+            batch,
+            imported_count=result.imported_count,
+            skipped_count=result.skipped_count,
+            error_count=result.error_count,
+        ))
+        result.batch_id = batch.id
+
+    def _import_parsed(
+        self,
+        transactions: list[Transaction],
+        auto_categorize: bool,
+        result: ImportResultDTO,
+    ) -> None:
+        """Déduplique, catégorise et persiste; met à jour result."""
+        transactions_to_import = []
+        # save_chunked écarte lui-même les doublons (une requête IN par lot)
+        bulk = isinstance(self.transaction_repository, TransactionBulkWritePort)
+
+        for tx in transactions:
+            # Vérifier les doublons
+            if not bulk and self.transaction_repository.exists_by_hash(tx.import_hash):
+                result.skipped_count += 1
+                logger.debug(f"Skipping duplicate: {tx.import_hash[:8]}...")
+                continue
+
+            # Catégoriser si demandé
+            if auto_categorize:
+                categorization_result = self.categorization_service.categorize(tx)
+                if categorization_result.category_id:
+                    tx.category_id = categorization_result.category_id
+                    tx.category_confidence = categorization_result.confidence
+                    result.categorized_count += 1
+                    logger.debug(
+                        f"Categorized: {categorization_result.reason} "
+                        f"(confidence={categorization_result.confidence})"
+                    )
+
+            transactions_to_import.append(tx)
+
+        # Persister les transactions
+        if not transactions_to_import:
+            return
+        if bulk:
+            # Lots isolés: doublons ignorés, autres lignes refusées rapportées une à une
+            report = self.transaction_repository.save_chunked(
+                transactions_to_import, SAVE_CHUNK_SIZE
+            )
+            failures = [rejected for rejected in report.rejected if not rejected.is_duplicate]
+            result.imported_count = report.saved_count
+            result.skipped_count += report.rejected_count - len(failures)
+            result.error_count += len(failures)
+            result.errors.extend(str(rejected) for rejected in failures)
+            if auto_categorize:
+                result.categorized_count -= sum(
+                    1 for rejected in report.rejected if rejected.transaction.category_id
+                )
+            logger.info(
+                f"Successfully imported {report.saved_count} transactions, "
+                f"{len(failures)} rejected"
+            )
+            return
+
+        try:
+            imported = self.transaction_repository.save_many(
+                transactions_to_import
+            )
+            result.imported_count = imported
+            logger.info(f"Successfully imported {imported} transactions")
+        except Exception as e:
+            error_msg = f"Error persisting transactions: {str(e)}"
+            result.error_count = len(transactions_to_import)
+            result.errors.append(error_msg)
+            logger.error(error_msg)
+            raise
@@ -0,0 +1,29 @@
+"""
+Query: GetAlerts
+
+Represent a user request for the latest alert events.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+
+@dataclass
+class GetAlertsQuery:
+    """
+    Requête pour lister les dernières alertes.
+
+    Args:
+        account_id: Filtrer sur un compte (toutes si None)
+        limit: Nombre maximum d'alertes (1-500)
+    """
+
+    account_id: Optional[UUID] = None
+    limit: int = 50
+
+    def __post_init__(self):
+        """Valide la requête."""
+        if not 1 <= self.limit <= 500:
+            raise ValueError("limit must be between 1 and 500")
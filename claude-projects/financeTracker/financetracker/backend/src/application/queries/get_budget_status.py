@@ -0,0 +1,40 @@
+"""
+Query: GetBudgetStatus
+
+Represent a user request for the budget-vs-actual status of every
+budgeted category on a given day.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from src.domain.value_objects.scenario import Scenario
+
+
+@dataclass
+class GetBudgetStatusQuery:
+    """
+    Requête pour obtenir l'état des budgets du mois.
+
+    Args:
+        on_date: Jour d'évaluation (défaut: aujourd'hui)
+        scenario: Scénario appliqué aux récurrences à venir
+        account_ids: Comptes à inclure (tous si vide)
+
+    Examples:
+        >>> query = GetBudgetStatusQuery(on_date=date(2025, 3, 10))
+        >>> # result = handler.handle(query)  # Traité par BudgetHandler
+    """
+
+    on_date: Optional[date] = None
+    scenario: Scenario = Scenario.REALISTIC
+    account_ids: tuple[UUID, ...] = field(default_factory=tuple)
+
+    def __post_init__(self):
+        """Valide la requête."""
+        if not isinstance(self.scenario, Scenario):
+            raise ValueError("scenario must be a Scenario enum")
+        self.account_ids = tuple(self.account_ids)
@@ -17,6 +17,10 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite:///./data/finance.db"
+    database_profile: str = "performance"  # SQLiteProfile: default | performance
+    database_pool_size: int = 5
+    money_storage: str = "decimal"  # Montants: decimal (NUMERIC) | cents (INTEGER)
+    uuid_storage: str = "text"  # Identifiants: text (VARCHAR(36)) | binary (BLOB 16 octets)
 
     # API
     debug: bool = False
@@ -28,9 +32,17 @@ class Settings(BaseSettings):
     # Claude API (optionnel, pour catégorisation avancée)
     claude_api_key: str = ""
 
+    # Import: profils CSV supplémentaires (fichier JSON, cf. bank_profile)
+    import_profiles_path: str = ""
+
     # Alert settings
     default_alert_threshold: float = 0.0
 
+    # Scheduler (jobs périodiques dans le lifespan de l'API)
+    scheduler_enabled: bool = True
+    scheduler_workers: int = 2
+    scheduler_max_pending: int = 2
+
 
 # Instance globale
 settings = Settings()
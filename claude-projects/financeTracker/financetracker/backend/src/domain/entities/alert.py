@@ -0,0 +1,100 @@
+"""
+Entity: Alert
+
+Représente un événement d'alerte levé par le moteur d'alertes.
+
+Types:
+- BALANCE_BELOW_THRESHOLD: le solde projeté d'un compte passe sous le seuil
+  à une date donnée
+- CATEGORY_OVER_BUDGET: la dépense du mois d'une catégorie dépasse son budget
+
+Un événement est identifié fonctionnellement par sa clé de déduplication:
+la même situation (même compte, même date de franchissement) n'est
+enregistrée qu'une fois, quel que soit le nombre de réévaluations.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from enum import Enum
+from typing import Optional
+from uuid import UUID, uuid4
+
+from src.domain.value_objects.money import Money
+
+
+class AlertType(str, Enum):
+    """Énumération des types d'alertes."""
+
+    BALANCE_BELOW_THRESHOLD = "balance_below_threshold"
+    CATEGORY_OVER_BUDGET = "category_over_budget"
+
+
+@dataclass(frozen=True, slots=True)
+class Alert:
+    """
+    Événement d'alerte.
+
+    Invariants:
+    - BALANCE_BELOW_THRESHOLD porte un account_id
+    - CATEGORY_OVER_BUDGET porte un category_id
+
+    Attributes:
+        alert_type: Type d'alerte
+        trigger_date: Date de franchissement (solde) ou premier jour du mois (budget)
+        amount: Solde projeté (solde) ou dépense du mois (budget)
+        threshold: Seuil de solde ou budget mensuel
+        account_id: Compte concerné (alertes de solde)
+        category_id: Catégorie concernée (alertes de budget)
+        message: Description lisible
+
+    Examples:
+        >>> alert = Alert(
+        ...     alert_type=AlertType.BALANCE_BELOW_THRESHOLD,
+        ...     trigger_date=date(2025, 3, 28),
+        ...     amount=Money(Decimal("-120.00")),
+        ...     threshold=Money.zero(),
+        ...     account_id=account.id,
+        ... )
+        >>> alert.dedup_key
+        'balance_below_threshold:...:-:2025-03-28'
+    """
+
+    # === Identité ===
+    id: UUID = field(default_factory=uuid4)
+
+    # === Données principales ===
+    alert_type: AlertType = AlertType.BALANCE_BELOW_THRESHOLD
+    trigger_date: date = field(default_factory=date.today)
+    amount: Money = field(default_factory=lambda: Money.zero())
+    threshold: Money = field(default_factory=lambda: Money.zero())
+
+    # === Relations ===
+    account_id: Optional[UUID] = None
+    category_id: Optional[UUID] = None
+
+    message: str = ""
+
+    # === Métadonnées ===
+    created_at: datetime = field(default_factory=datetime.now)
+
+    def __post_init__(self) -> None:
+        """Validation des invariants à la création."""
+        if self.alert_type == AlertType.BALANCE_BELOW_THRESHOLD and self.account_id is None:
+            raise ValueError("balance alert requires account_id")
+        if self.alert_type == AlertType.CATEGORY_OVER_BUDGET and self.category_id is None:
+            raise ValueError("budget alert requires category_id")
+
+    @property
+    def dedup_key(self) -> str:
+        """Clé fonctionnelle: une seule alerte par situation."""
+        return ":".join((
+            self.alert_type.value,
+            str(self.account_id) if self.account_id else "-",
+            str(self.category_id) if self.category_id else "-",
+            self.trigger_date.isoformat(),
+        ))
+
+    def __repr__(self) -> str:
+        """Représentation technique."""
+        return f"Alert({self.alert_type.value}, {self.trigger_date}, {self.amount.amount})"
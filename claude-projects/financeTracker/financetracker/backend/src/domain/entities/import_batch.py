@@ -0,0 +1,101 @@
+"""
+Entity: ImportBatch
+
+Représente l'import d'un fichier de relevé dans un compte (provenance).
+
+Un lot est identifié fonctionnellement par (compte, empreinte du fichier):
+le même fichier réimporté dans le même compte est reconnu sans être
+reparsé. Les transactions créées portent l'identifiant du lot, ce qui
+permet d'annuler l'import d'un bloc.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Optional
+from uuid import UUID, uuid4
+
+from src.domain.value_objects.date_range import DateRange
+
+
+@dataclass(frozen=True, slots=True)
+class ImportBatch:
+    """
+    Import d'un fichier de relevé.
+
+    Invariants:
+    - file_digest est renseigné
+    - les compteurs sont positifs ou nuls
+    - first_date et last_date sont tous deux définis (first <= last) ou absents
+
+    Attributes:
+        account_id: Compte d'importation
+        file_digest: Empreinte SHA-256 du contenu du fichier
+        file_name: Nom du fichier d'origine
+        adapter: Nom de l'adaptateur utilisé (ex: "LCL CSV")
+        row_count: Nombre de transactions lues dans le fichier
+        imported_count: Transactions créées par ce lot
+        skipped_count: Transactions ignorées (déjà importées)
+        error_count: Erreurs pendant l'import
+        first_date: Date de la première opération du fichier
+        last_date: Date de la dernière opération du fichier
+
+    Examples:
+        >>> batch = ImportBatch(
+        ...     account_id=account.id,
+        ...     file_digest="9f86d081...",
+        ...     file_name="releve_2025_01.csv",
+        ...     adapter="LCL CSV",
+        ...     row_count=42,
+        ...     first_date=date(2025, 1, 2),
+        ...     last_date=date(2025, 1, 31),
+        ... )
+        >>> batch.span.contains(date(2025, 1, 15))
+        True
+    """
+
+    # === Identité ===
+    id: UUID = field(default_factory=uuid4)
+    account_id: UUID = field(default_factory=uuid4)
+    file_digest: str = ""
+
+    # === Données principales ===
+    file_name: str = ""
+    adapter: str = ""
+    row_count: int = 0
+    imported_count: int = 0
+    skipped_count: int = 0
+    error_count: int = 0
+    first_date: Optional[date] = None
+    last_date: Optional[date] = None
+
+    # === Métadonnées ===
+    created_at: datetime = field(default_factory=datetime.now)
+
+    def __post_init__(self) -> None:
+        """Validation des invariants à la création."""
+        if not self.file_digest:
+            raise ValueError("file_digest cannot be empty")
+        counts = (self.row_count, self.imported_count, self.skipped_count, self.error_count)
+        if min(counts) < 0:
+            raise ValueError(f"Import counts cannot be negative: {counts}")
+        if (self.first_date is None) != (self.last_date is None):
+            raise ValueError("first_date and last_date must be set together")
+        if self.first_date is not None and self.first_date > self.last_date:
+            raise ValueError(
+                f"first_date must be <= last_date, got: {self.first_date} > {self.last_date}"
+            )
+
+    @property
+    def span(self) -> Optional[DateRange]:
+        """Période couverte par le fichier (None si aucune opération)."""
+        if self.first_date is None:
+            return None
+        return DateRange(self.first_date, self.last_date)
+
+    def __repr__(self) -> str:
+        """Représentation technique."""
+        return (
+            f"ImportBatch({self.file_name!r}, {self.adapter}, "
+            f"{self.imported_count}/{self.row_count}, {self.first_date}..{self.last_date})"
+        )
@@ -5,18 +5,19 @@ Représente un modèle de transaction récurrente (loyer, salaire, etc.).
 
 Principes DDD:
 - Entité avec identité unique
-- Encapsule les règles de récurrence (fréquence, jours)
-- Peut générer des instances de Transaction
+- Encapsule les règles de récurrence (fréquence, intervalle, jours)
+- Génère ses occurrences par calcul direct (pas d'évaluation jour par jour)
 """
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from enum import Enum
 from typing import Optional
 from uuid import UUID, uuid4
 
+from src.domain.trusted import TrustedConstructor
 from src.domain.value_objects.money import Money
 
 
@@ -29,7 +30,32 @@ class Frequency(str, Enum):
     YEARLY = "yearly"
 
 
-@dataclass(frozen=True)
+class BusinessDayAdjustment(str, Enum):
+    """
+    Convention de report des occurrences tombant un week-end.
+
+    - NONE: pas d'ajustement
+    - FOLLOWING: jour ouvré suivant
+    - PRECEDING: jour ouvré précédent
+    - MODIFIED_FOLLOWING: jour ouvré suivant, sauf s'il change de mois
+    """
+
+    NONE = "none"
+    FOLLOWING = "following"
+    PRECEDING = "preceding"
+    MODIFIED_FOLLOWING = "modified_following"
+
+
+# Un ajustement jour ouvré déplace une occurrence d'au plus 2 jours
+_MAX_ADJUSTMENT = timedelta(days=2)
+
+
+def _ceil_div(numerator: int, denominator: int) -> int:
+    """Division entière arrondie vers le haut (numérateur éventuellement négatif)."""
+    return -(-numerator // denominator)
+
+
+@dataclass(frozen=True, slots=True)
 class RecurringTransaction:
     """
     Représente un modèle de transaction récurrente.
@@ -38,9 +64,13 @@ class RecurringTransaction:
     - id est toujours défini
     - name ne peut pas être vide
     - day_of_month doit être entre 1 et 31
+    - interval doit être >= 1
+    - day_of_week (si défini) doit être entre 0 (lundi) et 6 (dimanche)
+    - month_of_year (si défini) doit être entre 1 et 12
     - variance_percent doit être entre 0 et 100
     - start_date <= end_date
-    - La clé du déclenchement est (frequency, day_of_month)
+    - La clé du déclenchement est (frequency, interval, day_of_month,
+      day_of_week, month_of_year), ancrée sur start_date
 
     Examples:
         >>> recurring = RecurringTransaction(
@@ -69,6 +99,10 @@ class RecurringTransaction:
     # === Récurrence ===
     frequency: Frequency = Frequency.MONTHLY
     day_of_month: int = 1
+    interval: int = 1  # Toutes les N périodes
+    day_of_week: Optional[int] = None  # WEEKLY (défaut: jour de start_date)
+    month_of_year: Optional[int] = None  # YEARLY (défaut: mois de start_date)
+    business_day_adjustment: BusinessDayAdjustment = BusinessDayAdjustment.NONE
 
     # === Période ===
     start_date: date = field(default_factory=date.today)
@@ -82,6 +116,9 @@ class RecurringTransaction:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
 
+    # Reconstruction sans validation (lecture en base, cf. domain.trusted)
+    from_trusted = TrustedConstructor()
+
     def __post_init__(self) -> None:
         """Validation des invariants à la création."""
         self._validate()
@@ -98,6 +135,22 @@ class RecurringTransaction:
                 f"day_of_month must be between 1 and 31, got: {self.day_of_month}"
             )
 
+        # interval doit être strictement positif
+        if self.interval < 1:
+            raise ValueError(f"interval must be >= 1, got: {self.interval}")
+
+        # day_of_week doit être entre 0 (lundi) et 6 (dimanche)
+        if self.day_of_week is not None and not 0 <= self.day_of_week <= 6:
+            raise ValueError(
+                f"day_of_week must be between 0 and 6, got: {self.day_of_week}"
+            )
+
+        # month_of_year doit être entre 1 et 12
+        if self.month_of_year is not None and not 1 <= self.month_of_year <= 12:
+            raise ValueError(
+                f"month_of_year must be between 1 and 12, got: {self.month_of_year}"
+            )
+
         # variance_percent doit être entre 0 et 100
         if not 0.0 <= self.variance_percent <= 100.0:
             raise ValueError(
@@ -149,12 +202,8 @@ class RecurringTransaction:
         """
         Vérifie si la récurrence doit se déclencher à une date donnée.
 
-        La logique dépend de la fréquence:
-        - MONTHLY: déclenche si day_of_month == check_date.day
-                   (ou derniers jours du mois si day > jours dans le mois)
-        - YEARLY: déclenche si day_of_month == check_date.day ET dans le mois correct
-        - WEEKLY: non implémenté pour V1
-        - DAILY: déclenche chaque jour
+        Délègue à occurrences_between() sur une fenêtre d'un jour: le calcul
+        est en O(1) quelle que soit la fréquence.
 
         Args:
             check_date: Date à vérifier
@@ -176,53 +225,71 @@ class RecurringTransaction:
             >>> rec.should_trigger_on(date(2025, 2, 1))
             True
         """
-        # Ne doit pas être active
-        if not self.is_active_on(check_date):
-            return False
+        return bool(self.occurrences_between(check_date, check_date))
 
-        if self.frequency == Frequency.MONTHLY:
-            return self._should_trigger_monthly(check_date)
-        elif self.frequency == Frequency.YEARLY:
-            return self._should_trigger_yearly(check_date)
-        elif self.frequency == Frequency.DAILY:
-            return True
-        elif self.frequency == Frequency.WEEKLY:
-            return False  # TODO: Implémenter
-
-        return False
-
-    def _should_trigger_monthly(self, check_date: date) -> bool:
-        """Logique pour déclenchement mensuel."""
-        # Si day_of_month est 31 et mois a moins de 31 jours,
-        # déclenche le dernier jour du mois
-        days_in_month = self._days_in_month(check_date.year, check_date.month)
-
-        if self.day_of_month > days_in_month:
-            # Déclenche le dernier jour du mois
-            return check_date.day == days_in_month
-
-        # Sinon, déclenche le jour spécifique
-        return check_date.day == self.day_of_month
-
-    def _should_trigger_yearly(self, check_date: date) -> bool:
-        """Logique pour déclenchement annuel."""
-        # Déclenche le jour_of_month du premier mois (janvier)
-        if check_date.month != 1:
-            return False
+    def occurrences_between(self, start: date, end: date) -> list[date]:
+        """
+        Génère les dates d'occurrence comprises dans [start, end] (inclusif).
 
-        # Gère le cas du 31 janvier (existe)
-        return check_date.day == self.day_of_month
+        Les règles sont ancrées sur start_date:
+        - DAILY: tous les `interval` jours
+        - WEEKLY: le jour `day_of_week`, toutes les `interval` semaines
+        - MONTHLY: le `day_of_month` (borné au dernier jour du mois),
+                   tous les `interval` mois
+        - YEARLY: le `day_of_month` du mois `month_of_year`,
+                  toutes les `interval` années
 
-    @staticmethod
-    def _days_in_month(year: int, month: int) -> int:
-        """Retourne le nombre de jours dans un mois."""
-        if month == 2:
-            # Février: 29 si année bissextile, sinon 28
-            return 29 if (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)) else 28
-        elif month in [4, 6, 9, 11]:
-            return 30
-        else:
-            return 31
+        L'indice de la première occurrence est calculé directement, puis
+        seules les occurrences réelles sont énumérées: aucun prédicat n'est
+        évalué jour par jour. L'ajustement jour ouvré est appliqué ensuite.
+
+        Args:
+            start: Début de la fenêtre
+            end: Fin de la fenêtre
+
+        Returns:
+            Liste triée des dates d'occurrence (après ajustement)
+
+        Examples:
+            >>> rec = RecurringTransaction(
+            ...     name="Cours de sport",
+            ...     amount=Money(Decimal("-15")),
+            ...     frequency=Frequency.WEEKLY,
+            ...     day_of_week=2,  # mercredi
+            ...     interval=2,
+            ...     start_date=date(2025, 1, 1),
+            ... )
+            >>> rec.occurrences_between(date(2025, 1, 1), date(2025, 1, 31))
+            [datetime.date(2025, 1, 1), datetime.date(2025, 1, 15), datetime.date(2025, 1, 29)]
+        """
+        if end < start:
+            return []
+
+        # L'ajustement peut déplacer une occurrence de quelques jours:
+        # on élargit la fenêtre brute puis on filtre sur la date ajustée.
+        margin = (
+            timedelta(0)
+            if self.business_day_adjustment == BusinessDayAdjustment.NONE
+            else _MAX_ADJUSTMENT
+        )
+        low = max(start - margin, self.start_date)
+        high = end + margin
+        if self.end_date is not None:
+            high = min(high, self.end_date)
+        if low > high:
+            return []
+
+        occurrences = []
+        index = self._first_index_on_or_after(low)
+        raw = self._nth_occurrence(index)
+        while raw <= high:
+            adjusted = self._adjust_to_business_day(raw)
+            if start <= adjusted <= end:
+                occurrences.append(adjusted)
+            index += 1
+            raw = self._nth_occurrence(index)
+
+        return occurrences
 
     def next_occurrence_after(self, check_date: date) -> Optional[date]:
         """
@@ -234,72 +301,119 @@ class RecurringTransaction:
         Returns:
             La date de la prochaine occurrence, ou None si pas de prochaine occurrence
         """
-        if self.frequency == Frequency.MONTHLY:
-            return self._next_monthly_after(check_date)
-        elif self.frequency == Frequency.YEARLY:
-            return self._next_yearly_after(check_date)
-        elif self.frequency == Frequency.DAILY:
-            return self._next_daily_after(check_date)
-
-        return None
-
-    def _next_monthly_after(self, check_date: date) -> Optional[date]:
-        """Calcule la prochaine occurrence mensuelle."""
-        # Essaie de déclencher le même mois
-        days_in_current_month = self._days_in_month(check_date.year, check_date.month)
-        target_day = min(self.day_of_month, days_in_current_month)
-
-        # Si on n'a pas encore atteint le jour du mois
-        if check_date.day < target_day:
-            candidate = date(check_date.year, check_date.month, target_day)
-            if self.is_active_on(candidate):
-                return candidate
-
-        # Sinon, essaie le mois suivant
-        if check_date.month == 12:
-            next_year = check_date.year + 1
-            next_month = 1
-        else:
-            next_year = check_date.year
-            next_month = check_date.month + 1
-
-        days_in_next_month = self._days_in_month(next_year, next_month)
-        target_day = min(self.day_of_month, days_in_next_month)
-
-        candidate = date(next_year, next_month, target_day)
+        low = max(check_date - _MAX_ADJUSTMENT, self.start_date)
+        index = self._first_index_on_or_after(low)
+
+        while True:
+            raw = self._nth_occurrence(index)
+            if self.end_date is not None and raw > self.end_date:
+                return None
+            adjusted = self._adjust_to_business_day(raw)
+            if adjusted > check_date:
+                return adjusted
+            index += 1
+
+    # === Arithmétique des occurrences ===
+
+    @property
+    def anchor_weekday(self) -> int:
+        """Jour de la semaine des occurrences hebdomadaires (0 = lundi)."""
+        if self.day_of_week is not None:
+            return self.day_of_week
+        return self.start_date.weekday()
+
+    @property
+    def anchor_month(self) -> int:
+        """Mois des occurrences annuelles (1 = janvier)."""
+        if self.month_of_year is not None:
+            return self.month_of_year
+        return self.start_date.month
+
+    def _nth_occurrence(self, index: int) -> date:
+        """Retourne la n-ième occurrence brute (avant ajustement), en O(1)."""
+        if self.frequency == Frequency.DAILY:
+            return self.start_date + timedelta(days=index * self.interval)
+
+        if self.frequency == Frequency.WEEKLY:
+            return self._first_weekly_occurrence() + timedelta(weeks=index * self.interval)
 
-        # Vérifie que c'est avant la fin de la récurrence
-        if self.end_date is not None and candidate > self.end_date:
-            return None
-
-        return candidate
-
-    def _next_yearly_after(self, check_date: date) -> Optional[date]:
-        """Calcule la prochaine occurrence annuelle."""
-        # Essaie cette année en janvier
-        candidate = date(check_date.year, 1, self.day_of_month)
-
-        if candidate > check_date and self.is_active_on(candidate):
-            return candidate
+        if self.frequency == Frequency.MONTHLY:
+            month_index = (
+                self.start_date.year * 12 + self.start_date.month - 1
+                + index * self.interval
+            )
+            year, month = divmod(month_index, 12)
+            return self._clamped_date(year, month + 1, self.day_of_month)
 
-        # Sinon, l'année suivante
-        candidate = date(check_date.year + 1, 1, self.day_of_month)
+        # YEARLY
+        year = self.start_date.year + index * self.interval
+        return self._clamped_date(year, self.anchor_month, self.day_of_month)
 
-        if self.end_date is not None and candidate > self.end_date:
-            return None
+    def _first_index_on_or_after(self, check_date: date) -> int:
+        """
+        Retourne le plus petit indice n >= 0 tel que l'occurrence n >= check_date.
 
-        return candidate
+        Calcul direct par division, sans itérer sur les périodes.
+        """
+        if self.frequency == Frequency.DAILY:
+            offset = (check_date - self.start_date).days
+            return max(0, _ceil_div(offset, self.interval))
 
-    def _next_daily_after(self, check_date: date) -> Optional[date]:
-        """Calcule la prochaine occurrence quotidienne."""
-        from datetime import timedelta
+        if self.frequency == Frequency.WEEKLY:
+            offset = (check_date - self._first_weekly_occurrence()).days
+            return max(0, _ceil_div(offset, 7 * self.interval))
 
-        candidate = check_date + timedelta(days=1)
+        if self.frequency == Frequency.MONTHLY:
+            offset = (
+                (check_date.year - self.start_date.year) * 12
+                + check_date.month - self.start_date.month
+            )
+        else:  # YEARLY
+            offset = check_date.year - self.start_date.year
+
+        # La période de check_date peut contenir une occurrence antérieure
+        # à check_date: on passe alors à la suivante.
+        index = max(0, _ceil_div(offset, self.interval))
+        if self._nth_occurrence(index) < check_date:
+            index += 1
+        return index
+
+    def _first_weekly_occurrence(self) -> date:
+        """Premier jour anchor_weekday à partir de start_date."""
+        delta = (self.anchor_weekday - self.start_date.weekday()) % 7
+        return self.start_date + timedelta(days=delta)
+
+    def _adjust_to_business_day(self, raw: date) -> date:
+        """Décale une occurrence tombant un week-end selon la convention."""
+        weekday = raw.weekday()
+        if weekday < 5 or self.business_day_adjustment == BusinessDayAdjustment.NONE:
+            return raw
+
+        following = raw + timedelta(days=7 - weekday)
+        preceding = raw - timedelta(days=weekday - 4)
+
+        if self.business_day_adjustment == BusinessDayAdjustment.FOLLOWING:
+            return following
+        if self.business_day_adjustment == BusinessDayAdjustment.PRECEDING:
+            return preceding
+        # MODIFIED_FOLLOWING: jour ouvré suivant, sauf changement de mois
+        return following if following.month == raw.month else preceding
 
-        if self.end_date is not None and candidate > self.end_date:
-            return None
+    @classmethod
+    def _clamped_date(cls, year: int, month: int, day: int) -> date:
+        """Construit une date en bornant le jour au dernier jour du mois."""
+        return date(year, month, min(day, cls._days_in_month(year, month)))
 
-        return candidate
+    @staticmethod
+    def _days_in_month(year: int, month: int) -> int:
+        """Retourne le nombre de jours dans un mois."""
+        if month == 2:
+            # Février: 29 si année bissextile, sinon 28
+            return 29 if (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)) else 28
+        elif month in [4, 6, 9, 11]:
+            return 30
+        else:
+            return 31
 
     # === Comparaison ===
 
@@ -325,6 +439,10 @@ class RecurringTransaction:
             "category_id": str(self.category_id),
             "frequency": self.frequency.value,
             "day_of_month": self.day_of_month,
+            "interval": self.interval,
+            "day_of_week": self.day_of_week,
+            "month_of_year": self.month_of_year,
+            "business_day_adjustment": self.business_day_adjustment.value,
             "start_date": self.start_date.isoformat(),
             "end_date": self.end_date.isoformat() if self.end_date else None,
             "is_variable": self.is_variable,
@@ -361,6 +479,10 @@ class RecurringTransaction:
         if isinstance(frequency, str):
             frequency = Frequency(frequency)
 
+        adjustment = data.get("business_day_adjustment", "none")
+        if isinstance(adjustment, str):
+            adjustment = BusinessDayAdjustment(adjustment)
+
         start_date = data.get("start_date")
         if isinstance(start_date, str):
             start_date = datetime.fromisoformat(start_date).date()
@@ -377,6 +499,10 @@ class RecurringTransaction:
             category_id=category_id,
             frequency=frequency,
             day_of_month=data.get("day_of_month", 1),
+            interval=data.get("interval", 1),
+            day_of_week=data.get("day_of_week"),
+            month_of_year=data.get("month_of_year"),
+            business_day_adjustment=adjustment,
             start_date=start_date,
             end_date=end_date,
             is_variable=data.get("is_variable", False),
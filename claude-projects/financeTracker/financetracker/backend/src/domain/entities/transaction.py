@@ -16,13 +16,33 @@ from __future__ import annotations
 import hashlib
 from dataclasses import dataclass, field
 from datetime import date, datetime
+from decimal import Decimal
 from typing import Optional
 from uuid import UUID, uuid4
 
+from src.domain.trusted import TrustedConstructor
 from src.domain.value_objects.money import Money
 
+# Clé métier d'une ligne de relevé: (date, montant, début du libellé)
+ImportKey = tuple[date, Decimal, str]
 
-@dataclass
+
+def compute_import_hash(
+    account_id: UUID, key: ImportKey, occurrence: int = 0
+) -> str:
+    """
+    Hash de déduplication à l'import (blake2b, 64 caractères hexadécimaux).
+
+    Le rang d'occurrence distingue les lignes identiques d'un même fichier
+    (deux achats identiques le même jour): 0 pour la première, 1 pour la
+    suivante... Un réimport du fichier retrouve les mêmes hash.
+    """
+    day, amount, description = key
+    data = f"{account_id}|{day}|{amount}|{description}|{occurrence}"
+    return hashlib.blake2b(data.encode(), digest_size=32).hexdigest()
+
+
+@dataclass(slots=True)
 class Transaction:
     """
     Représente une opération bancaire unique.
@@ -66,8 +86,12 @@ class Transaction:
     tags: list[str] = field(default_factory=list)
     notes: str = ""
     import_hash: str = ""
+    import_batch_id: Optional[UUID] = None  # Lot d'import d'origine (cf. ImportBatch)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+
+    # Reconstruction sans validation (lecture en base, cf. domain.trusted)
+    from_trusted = TrustedConstructor()
     
     def __post_init__(self) -> None:
         """Validation des invariants à la création."""
@@ -174,19 +198,23 @@ class Transaction:
     
     # === Calcul du hash de déduplication ===
     
-    def compute_import_hash(self) -> str:
+    @property
+    def import_key(self) -> ImportKey:
+        """Clé métier: date + montant + 50 premiers caractères du libellé."""
+        return (self.date, self.amount.amount, self.description[:50])
+
+    def compute_import_hash(self, occurrence: int = 0) -> str:
         """
         Calcule un hash unique pour détecter les doublons à l'import.
         
-        Basé sur: date + montant + 50 premiers caractères du libellé
+        Basé sur: compte + import_key + rang d'occurrence dans le fichier
         """
-        data = f"{self.date}|{self.amount.amount}|{self.description[:50]}"
-        return hashlib.sha256(data.encode()).hexdigest()
+        return compute_import_hash(self.account_id, self.import_key, occurrence)
     
-    def ensure_import_hash(self) -> None:
+    def ensure_import_hash(self, occurrence: int = 0) -> None:
         """Calcule et stocke le hash si non défini."""
         if not self.import_hash:
-            self.import_hash = self.compute_import_hash()
+            self.import_hash = self.compute_import_hash(occurrence)
     
     # === Comparaison ===
     
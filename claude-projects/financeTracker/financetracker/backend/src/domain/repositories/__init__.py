@@ -4,12 +4,24 @@ Domain Repositories (Ports)
 Abstract interfaces defining contracts for data persistence.
 Implementations are in infrastructure layer.
 """
-from src.domain.repositories.transaction_repository import TransactionRepository
+from src.domain.repositories.transaction_repository import (
+    TransactionRepository,
+    TransactionBulkWritePort,
+    TransactionQueryPort,
+)
 from src.domain.repositories.account_repository import AccountRepository
 from src.domain.repositories.category_repository import CategoryRepository
+from src.domain.repositories.budget_repository import BudgetRepository
+from src.domain.repositories.alert_repository import AlertRepository
+from src.domain.repositories.import_batch_repository import ImportBatchRepository
 
 __all__ = [
     "TransactionRepository",
+    "TransactionQueryPort",
+    "TransactionBulkWritePort",
     "AccountRepository",
     "CategoryRepository",
+    "BudgetRepository",
+    "AlertRepository",
+    "ImportBatchRepository",
 ]
@@ -0,0 +1,86 @@
+"""
+Port: AlertRepository
+
+Abstract interface for the alert engine state: balance snapshots,
+cached projections and alert events.
+
+This is a port in the hexagonal architecture - it defines
+the contract that any persistence adapter must fulfill.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Sequence
+from uuid import UUID
+
+from src.domain.entities.alert import Alert
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.projection_snapshot import ProjectionSnapshot
+
+
+class AlertRepository(ABC):
+    """
+    Port pour l'état du moteur d'alertes.
+
+    Les soldes courants doivent provenir d'agrégats maintenus à l'écriture,
+    pas d'un parcours des transactions à chaque évaluation.
+    """
+
+    # === Soldes ===
+
+    @abstractmethod
+    def current_balances(self, account_ids: Sequence[UUID]) -> dict[UUID, Money]:
+        """
+        Solde courant de chaque compte (solde initial + transactions).
+
+        Args:
+            account_ids: Comptes à lire
+
+        Returns:
+            Dict {account_id: solde}; les comptes inconnus sont absents
+        """
+        ...
+
+    # === Projections en cache ===
+
+    @abstractmethod
+    def find_snapshots(self, account_ids: Sequence[UUID]) -> dict[UUID, ProjectionSnapshot]:
+        """
+        Récupère les projections en cache des comptes.
+
+        Returns:
+            Dict {account_id: snapshot}; les comptes jamais évalués sont absents
+        """
+        ...
+
+    @abstractmethod
+    def save_snapshots(self, snapshots: Iterable[ProjectionSnapshot]) -> None:
+        """Enregistre (ou remplace) les projections en cache."""
+        ...
+
+    # === Événements ===
+
+    @abstractmethod
+    def add_alerts(self, alerts: Iterable[Alert]) -> List[Alert]:
+        """
+        Enregistre les alertes dont la clé de déduplication est nouvelle.
+
+        Returns:
+            Les alertes effectivement enregistrées
+        """
+        ...
+
+    @abstractmethod
+    def find_alerts(
+        self,
+        account_id: Optional[UUID] = None,
+        limit: int = 50,
+    ) -> List[Alert]:
+        """
+        Récupère les dernières alertes, plus récentes d'abord.
+
+        Args:
+            account_id: Filtrer sur un compte (toutes si None)
+            limit: Nombre maximum d'alertes
+        """
+        ...
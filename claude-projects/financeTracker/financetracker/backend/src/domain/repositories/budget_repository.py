@@ -0,0 +1,44 @@
+"""
+Port: BudgetRepository
+
+Abstract interface for reading category budgets and their actuals.
+
+This is a port in the hexagonal architecture - it defines
+the contract that any persistence adapter must fulfill.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Sequence
+from uuid import UUID
+
+from src.domain.value_objects.budget_status import BudgetLine
+
+
+class BudgetRepository(ABC):
+    """
+    Port pour la lecture des budgets et des dépenses constatées.
+
+    Les dépenses constatées doivent provenir d'agrégats maintenus à
+    l'écriture, pas d'un parcours des transactions à chaque lecture.
+    """
+
+    @abstractmethod
+    def find_budget_lines(
+        self,
+        month: date,
+        account_ids: Sequence[UUID] = (),
+    ) -> List[BudgetLine]:
+        """
+        Récupère toutes les catégories budgétées et leur dépense du mois.
+
+        Args:
+            month: Un jour quelconque du mois
+            account_ids: Comptes à inclure (tous si vide)
+
+        Returns:
+            Une BudgetLine par catégorie ayant un budget, sous-catégories
+            comprises dans la dépense
+        """
+        ...
@@ -104,6 +104,31 @@ class CategoryRepository(ABC):
         """
         ...
 
+    def find_descendants(self, category_id: UUID) -> List[Category]:
+        """
+        Récupère tout le sous-arbre d'une catégorie (sans la catégorie).
+
+        Implémentation par défaut: parcours en largeur via find_children.
+        Les adapters disposant d'un index hiérarchique la remplacent par
+        une requête unique.
+
+        Args:
+            category_id: UUID of the root of the subtree
+
+        Returns:
+            List of descendant Category entities
+        """
+        descendants: List[Category] = []
+        seen = {category_id}
+        pending = [category_id]
+        while pending:
+            for child in self.find_children(pending.pop()):
+                if child.id not in seen:
+                    seen.add(child.id)
+                    descendants.append(child)
+                    pending.append(child.id)
+        return descendants
+
     @abstractmethod
     def find_by_keyword(self, keyword: str) -> List[Category]:
         """
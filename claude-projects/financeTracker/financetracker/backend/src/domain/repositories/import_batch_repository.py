@@ -0,0 +1,74 @@
+"""
+Port: ImportBatchRepository
+
+Abstract interface for import provenance: one batch per imported file,
+looked up by file digest, and undone as a whole.
+
+This is a port in the hexagonal architecture - it defines
+the contract that any persistence adapter must fulfill.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from uuid import UUID
+
+from src.domain.entities.import_batch import ImportBatch
+from src.domain.value_objects.date_range import DateRange
+
+
+class ImportBatchRepository(ABC):
+    """
+    Port pour les lots d'import.
+
+    La recherche par empreinte est appelée à chaque import: elle doit être
+    indexée sur (compte, empreinte).
+    """
+
+    # === Écriture ===
+
+    @abstractmethod
+    def save(self, batch: ImportBatch) -> None:
+        """Enregistre (ou remplace) un lot."""
+        ...
+
+    @abstractmethod
+    def delete_with_transactions(self, batch_id: UUID) -> Optional[int]:
+        """
+        Supprime un lot et toutes les transactions qu'il a créées.
+
+        Args:
+            batch_id: UUID du lot
+
+        Returns:
+            Nombre de transactions supprimées, None si le lot est inconnu
+        """
+        ...
+
+    # === Lecture ===
+
+    @abstractmethod
+    def get_by_id(self, batch_id: UUID) -> Optional[ImportBatch]:
+        """Récupère un lot par son ID."""
+        ...
+
+    @abstractmethod
+    def find_by_digest(self, account_id: UUID, file_digest: str) -> Optional[ImportBatch]:
+        """
+        Lot ayant déjà importé ce fichier dans ce compte.
+
+        Args:
+            account_id: Compte d'importation
+            file_digest: Empreinte du contenu du fichier
+        """
+        ...
+
+    @abstractmethod
+    def find_by_account(self, account_id: UUID, limit: int = 50) -> List[ImportBatch]:
+        """Derniers lots d'un compte, plus récents d'abord."""
+        ...
+
+    @abstractmethod
+    def find_spans(self, account_id: UUID) -> List[DateRange]:
+        """Périodes couvertes par les lots d'un compte (lots vides exclus)."""
+        ...
@@ -14,11 +14,14 @@ Principes SOLID:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import Optional
 from uuid import UUID
 
 from src.domain.entities.transaction import Transaction
 from src.domain.value_objects.date_range import DateRange
+from src.domain.value_objects.save_report import SaveReport
+from src.domain.value_objects.transaction_query import TransactionQuery
 
 
 class TransactionReader(ABC):
@@ -46,16 +49,21 @@ class TransactionReader(ABC):
     def find_by_account(
         self, 
         account_id: UUID,
+        date_range: Optional[DateRange] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[tuple[date, UUID]] = None,
     ) -> list[Transaction]:
         """
-        Récupère les transactions d'un compte.
+        Récupère les transactions d'un compte (plus récentes d'abord).
         
         Args:
             account_id: UUID du compte
+            date_range: Optionnel, filtre par période
             limit: Nombre max de résultats
-            offset: Pagination
+            offset: Pagination par décalage
+            after: Optionnel, curseur keyset (date, id) de la dernière
+                   transaction vue; prioritaire sur offset
             
         Returns:
             Liste de transactions
@@ -117,8 +125,12 @@ class TransactionReader(ABC):
         ...
     
     @abstractmethod
-    def count_by_account(self, account_id: UUID) -> int:
-        """Compte le nombre de transactions d'un compte."""
+    def count_by_account(
+        self,
+        account_id: UUID,
+        date_range: Optional[DateRange] = None,
+    ) -> int:
+        """Compte le nombre de transactions d'un compte (filtre période optionnel)."""
         ...
     
     @abstractmethod
@@ -129,7 +141,7 @@ class TransactionReader(ABC):
         Utilisé pour le dédoublonnage à l'import.
         
         Args:
-            import_hash: Hash SHA256 de la transaction
+            import_hash: Hash de déduplication de la transaction
             
         Returns:
             True si existe, False sinon
@@ -222,6 +234,68 @@ class TransactionRepository(TransactionReader, TransactionWriter):
 
 # === Ports spécialisés pour cas d'usage spécifiques ===
 
+class TransactionQueryPort(ABC):
+    """
+    Port de requête par spécification combinée (optionnel).
+    
+    Toutes les combinaisons de filtres du tableau de bord passent par une
+    seule méthode: l'adapter compile la TransactionQuery en une requête
+    unique plutôt que d'enchaîner des find_by_* et de filtrer en mémoire.
+    """
+    
+    @abstractmethod
+    def find(
+        self,
+        query: TransactionQuery,
+        limit: Optional[int] = 100,
+        offset: int = 0,
+        after: Optional[tuple[date, UUID]] = None,
+    ) -> list[Transaction]:
+        """
+        Récupère les transactions correspondant à la spécification.
+        
+        Args:
+            query: Critères combinés (ET logique)
+            limit: Nombre max de résultats (None = tous)
+            offset: Pagination par décalage
+            after: Optionnel, curseur keyset (date, id); prioritaire sur offset
+            
+        Returns:
+            Transactions les plus récentes d'abord
+        """
+        ...
+    
+    @abstractmethod
+    def count(self, query: TransactionQuery) -> int:
+        """Compte les transactions correspondant à la spécification."""
+        ...
+
+
+class TransactionBulkWritePort(ABC):
+    """
+    Port d'écriture en masse tolérante aux échecs partiels (optionnel).
+    
+    Pour les imports: une ligne refusée (doublon, contrainte) n'annule pas
+    les autres, elle est rapportée dans le SaveReport.
+    """
+    
+    @abstractmethod
+    def save_chunked(
+        self, transactions: list[Transaction], chunk_size: int = 500
+    ) -> SaveReport:
+        """
+        Persiste de nouvelles transactions par lots, sans tout-ou-rien.
+        
+        Args:
+            transactions: Transactions à insérer
+            chunk_size: Taille des lots
+            
+        Returns:
+            Nombre de transactions sauvegardées et transactions refusées
+        """
+        ...
+
+
 class TransactionSearchPort(ABC):
     """
     Port de recherche full-text (optionnel).
@@ -235,20 +309,20 @@ class TransactionSearchPort(ABC):
     @abstractmethod
     def search(
         self, 
-        query: str, 
-        account_id: Optional[UUID] = None,
+        text: str, 
+        filters: Optional[TransactionQuery] = None,
         limit: int = 20
     ) -> list[Transaction]:
         """
-        Recherche full-text dans les descriptions.
+        Recherche full-text dans les descriptions et les notes.
         
         Args:
-            query: Termes de recherche
-            account_id: Optionnel, filtre par compte
+            text: Termes de recherche (texte libre)
+            filters: Optionnel, critères combinés appliqués en plus
             limit: Nombre max de résultats
             
         Returns:
-            Transactions matchant la recherche
+            Transactions matchant la recherche, plus pertinentes d'abord
         """
         ...
 
@@ -0,0 +1,235 @@
+"""
+Domain Service: Alert Service
+
+Détecte les situations d'alerte et les enregistre comme événements.
+
+Algorithme (par compte évalué):
+1. Lit le solde courant (agrégats maintenus à l'écriture) et la projection
+   en cache
+2. Si la date, le scénario et les récurrences du compte sont inchangés, le
+   cumul planifié en cache est réutilisé: seul le solde est décalé
+   (cas d'un import). Sinon, le cumul est recalculé avec le noyau de
+   projection (scheduled_changes) pour ce seul compte
+3. Premier jour où solde + cumul passe sous le seuil → alerte de solde
+4. Catégories dont la dépense du mois dépasse le budget → alerte de budget
+
+Les alertes sont dédupliquées par clé fonctionnelle: réévaluer une
+situation inchangée n'enregistre rien.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+from src.domain.entities.account import Account
+from src.domain.entities.alert import Alert, AlertType
+from src.domain.entities.recurring_transaction import RecurringTransaction
+from src.domain.repositories.account_repository import AccountRepository
+from src.domain.repositories.alert_repository import AlertRepository
+from src.domain.repositories.budget_repository import BudgetRepository
+from src.domain.repositories.recurring_repository import RecurringRepository
+from src.domain.services.projection_service import scheduled_changes
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.projection_snapshot import ProjectionSnapshot
+from src.domain.value_objects.scenario import Scenario
+
+logger = logging.getLogger(__name__)
+
+# Horizon de détection des franchissements de seuil
+DEFAULT_HORIZON_DAYS = 90
+
+
+def recurring_digest(recurring_transactions: Sequence[RecurringTransaction]) -> str:
+    """Empreinte d'un ensemble de récurrences (ordre indifférent)."""
+    payload = json.dumps(
+        sorted((r.to_dict() for r in recurring_transactions), key=lambda d: d["id"]),
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+@dataclass
+class AlertEvaluation:
+    """
+    Résultat d'une évaluation.
+
+    Attributes:
+        alerts: Nouvelles alertes enregistrées
+        reprojected: Comptes dont le cumul planifié a été recalculé
+        rebased: Comptes réévalués par décalage du solde (cache réutilisé)
+        unchanged: Comptes sans changement de solde ni d'entrées
+    """
+
+    alerts: List[Alert] = field(default_factory=list)
+    reprojected: int = 0
+    rebased: int = 0
+    unchanged: int = 0
+
+
+class AlertService:
+    """
+    Moteur d'alertes de solde projeté et de budget.
+
+    Examples:
+        >>> service = AlertService(
+        ...     account_repo, recurring_repo, alert_repo, budget_repo,
+        ...     threshold=Decimal("0"),
+        ... )
+        >>> evaluation = service.evaluate(account_ids=[account.id])
+        >>> [a.trigger_date for a in evaluation.alerts]
+        [datetime.date(2025, 3, 28)]
+    """
+
+    def __init__(
+        self,
+        account_repository: AccountRepository,
+        recurring_repository: RecurringRepository,
+        alert_repository: AlertRepository,
+        budget_repository: BudgetRepository,
+        threshold: Decimal = Decimal("0"),
+        horizon_days: int = DEFAULT_HORIZON_DAYS,
+        scenario: Scenario = Scenario.REALISTIC,
+    ):
+        """
+        Initialise le service.
+
+        Args:
+            account_repository: Repository des comptes
+            recurring_repository: Repository des transactions récurrentes
+            alert_repository: Soldes, projections en cache et événements
+            budget_repository: Budgets et dépenses constatées
+            threshold: Seuil de solde (alerte strictement en dessous)
+            horizon_days: Nombre de jours projetés
+            scenario: Scénario appliqué aux récurrences
+        """
+        if horizon_days < 1:
+            raise ValueError("horizon_days must be positive")
+        self.account_repository = account_repository
+        self.recurring_repository = recurring_repository
+        self.alert_repository = alert_repository
+        self.budget_repository = budget_repository
+        self.threshold = Decimal(str(threshold))
+        self.horizon_days = horizon_days
+        self.scenario = scenario
+
+    def evaluate(
+        self,
+        account_ids: Optional[Sequence[UUID]] = None,
+        on_date: Optional[date] = None,
+    ) -> AlertEvaluation:
+        """
+        Réévalue les alertes des comptes donnés et les budgets du mois.
+
+        Args:
+            account_ids: Comptes affectés (tous les comptes actifs si None)
+            on_date: Jour d'évaluation (défaut: aujourd'hui)
+
+        Returns:
+            AlertEvaluation avec les nouvelles alertes et le détail du travail
+        """
+        on_date = on_date or date.today()
+        accounts = [
+            a for a in self.account_repository.find_active()
+            if account_ids is None or a.id in account_ids
+        ]
+        evaluation = AlertEvaluation()
+        alerts = self._balance_alerts(accounts, on_date, evaluation)
+        alerts.extend(self._budget_alerts(on_date))
+
+        evaluation.alerts = self.alert_repository.add_alerts(alerts)
+        logger.info(
+            f"Alerts evaluated for {len(accounts)} accounts: "
+            f"{evaluation.reprojected} reprojected, {evaluation.rebased} rebased, "
+            f"{evaluation.unchanged} unchanged, {len(evaluation.alerts)} new alerts"
+        )
+        return evaluation
+
+    # === Méthodes privées ===
+
+    def _balance_alerts(
+        self,
+        accounts: List[Account],
+        on_date: date,
+        evaluation: AlertEvaluation,
+    ) -> List[Alert]:
+        """Met à jour les projections en cache et détecte les franchissements."""
+        if not accounts:
+            return []
+        ids = [a.id for a in accounts]
+        balances = self.alert_repository.current_balances(ids)
+        snapshots = self.alert_repository.find_snapshots(ids)
+        recurring_by_account: dict[UUID, list[RecurringTransaction]] = {}
+        for recurring in self.recurring_repository.find_active(on_date):
+            recurring_by_account.setdefault(recurring.account_id, []).append(recurring)
+
+        horizon_end = on_date + timedelta(days=self.horizon_days)
+        updated: list[ProjectionSnapshot] = []
+        alerts: list[Alert] = []
+
+        for account in accounts:
+            balance = balances.get(account.id, account.initial_balance)
+            recurring = recurring_by_account.get(account.id, [])
+            digest = recurring_digest(recurring)
+            snapshot = snapshots.get(account.id)
+
+            if snapshot is not None and snapshot.is_valid_for(
+                on_date, horizon_end, self.scenario, digest
+            ):
+                if snapshot.balance == balance:
+                    evaluation.unchanged += 1
+                    continue
+                snapshot = snapshot.rebased(balance)
+                evaluation.rebased += 1
+            else:
+                changes = scheduled_changes(
+                    recurring, on_date + timedelta(days=1), horizon_end, self.scenario
+                )
+                snapshot = ProjectionSnapshot.from_changes(
+                    account.id, on_date, horizon_end, self.scenario, digest, changes, balance
+                )
+                evaluation.reprojected += 1
+            updated.append(snapshot)
+
+            breach = snapshot.first_breach(balance.amount, self.threshold)
+            if breach is not None:
+                breach_date, projected = breach
+                alerts.append(Alert(
+                    alert_type=AlertType.BALANCE_BELOW_THRESHOLD,
+                    trigger_date=breach_date,
+                    amount=Money(projected, balance.currency),
+                    threshold=Money(self.threshold, balance.currency),
+                    account_id=account.id,
+                    message=(
+                        f"Balance of {account.name} projected at {projected:.2f} "
+                        f"on {breach_date}, below {self.threshold:.2f}"
+                    ),
+                ))
+
+        self.alert_repository.save_snapshots(updated)
+        return alerts
+
+    def _budget_alerts(self, on_date: date) -> List[Alert]:
+        """Catégories dont la dépense du mois dépasse déjà le budget."""
+        month_start = on_date.replace(day=1)
+        return [
+            Alert(
+                alert_type=AlertType.CATEGORY_OVER_BUDGET,
+                trigger_date=month_start,
+                amount=line.spent,
+                threshold=line.budget,
+                category_id=line.category_id,
+                message=(
+                    f"{line.name} spent {line.spent.amount:.2f} in {month_start:%Y-%m}, "
+                    f"over its {line.budget.amount:.2f} budget"
+                ),
+            )
+            for line in self.budget_repository.find_budget_lines(month_start)
+            if line.spent > line.budget
+        ]
@@ -0,0 +1,146 @@
+"""
+Domain Service: Budget Service
+
+Calcule la consommation du budget de chaque catégorie sur le mois courant.
+
+Algorithme:
+1. Récupère en une lecture les catégories budgétées et leur dépense du mois
+   (agrégats maintenus à l'écriture, sous-catégories comprises)
+2. Génère les occurrences des récurrences du mois avec le noyau de
+   projection (scheduled_changes), au montant du scénario
+3. Sépare la dépense constatée en part planifiée (récurrences échues) et
+   part discrétionnaire
+4. Fin de mois projetée = constaté + récurrences à venir
+   + rythme discrétionnaire × jours restants
+"""
+from __future__ import annotations
+
+import calendar
+import logging
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+from src.domain.entities.recurring_transaction import RecurringTransaction
+from src.domain.repositories.budget_repository import BudgetRepository
+from src.domain.repositories.recurring_repository import RecurringRepository
+from src.domain.services.projection_service import scheduled_changes
+from src.domain.value_objects.budget_status import BudgetLine, BudgetStatus
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.scenario import Scenario
+
+logger = logging.getLogger(__name__)
+
+
+class BudgetService:
+    """
+    Service de suivi budget / réalisé par catégorie.
+
+    Examples:
+        >>> service = BudgetService(budget_repository, recurring_repository)
+        >>> statuses = service.statuses(on_date=date(2025, 3, 10))
+        >>> [s.name for s in statuses if s.is_projected_over()]
+        ['Courses']
+    """
+
+    def __init__(
+        self,
+        budget_repository: BudgetRepository,
+        recurring_repository: RecurringRepository,
+    ):
+        """
+        Initialise le service.
+
+        Args:
+            budget_repository: Budgets et dépenses constatées
+            recurring_repository: Repository des transactions récurrentes
+        """
+        self.budget_repository = budget_repository
+        self.recurring_repository = recurring_repository
+
+    def statuses(
+        self,
+        on_date: Optional[date] = None,
+        scenario: Scenario = Scenario.REALISTIC,
+        account_ids: Sequence[UUID] = (),
+    ) -> List[BudgetStatus]:
+        """
+        État de toutes les catégories budgétées au jour donné.
+
+        Args:
+            on_date: Jour d'évaluation (défaut: aujourd'hui)
+            scenario: Scénario appliqué aux récurrences à venir
+            account_ids: Comptes à inclure (tous si vide)
+
+        Returns:
+            Un BudgetStatus par catégorie budgétée, plus forte consommation
+            projetée d'abord
+        """
+        on_date = on_date or date.today()
+        month_start = on_date.replace(day=1)
+        days_in_month = calendar.monthrange(on_date.year, on_date.month)[1]
+        month_end = on_date.replace(day=days_in_month)
+
+        lines = self.budget_repository.find_budget_lines(month_start, account_ids)
+        recurring = [
+            r for r in self.recurring_repository.find_active(on_date)
+            if not account_ids or r.account_id in account_ids
+        ]
+        logger.info(f"Evaluating {len(lines)} budgets for {month_start:%Y-%m}")
+
+        statuses = [
+            self._status(line, recurring, scenario, on_date, month_start, month_end)
+            for line in lines
+        ]
+        return sorted(
+            statuses,
+            key=lambda s: s.projected_spend.amount / s.budget.amount if not s.budget.is_zero() else 0,
+            reverse=True,
+        )
+
+    # === Méthodes privées ===
+
+    def _status(
+        self,
+        line: BudgetLine,
+        recurring: List[RecurringTransaction],
+        scenario: Scenario,
+        on_date: date,
+        month_start: date,
+        month_end: date,
+    ) -> BudgetStatus:
+        """Calcule l'état d'une ligne de budget."""
+        currency = line.budget.currency
+        days_elapsed = on_date.day
+        days_remaining = month_end.day - days_elapsed
+
+        # Récurrences de la catégorie (et de ses descendants) sur le mois
+        changes = scheduled_changes(
+            [r for r in recurring if r.category_id in line.category_ids],
+            month_start, month_end, scenario,
+        )
+        # Dépenses = montants négatifs: signe inversé pour raisonner en dépense
+        scheduled_to_date = -sum(
+            (v for d, v in changes.items() if d <= on_date), Decimal("0")
+        )
+        scheduled_ahead = -sum(
+            (v for d, v in changes.items() if d > on_date), Decimal("0")
+        )
+
+        spent = line.spent.amount
+        discretionary_rate = max(spent - scheduled_to_date, Decimal("0")) / days_elapsed
+        projected = spent + max(scheduled_ahead, Decimal("0")) + discretionary_rate * days_remaining
+
+        return BudgetStatus(
+            category_id=line.category_id,
+            name=line.name,
+            month=month_start,
+            as_of=on_date,
+            days_elapsed=days_elapsed,
+            days_in_month=month_end.day,
+            budget=line.budget,
+            spent=line.spent,
+            burn_rate=Money(spent / days_elapsed, currency),
+            projected_spend=Money(max(projected, spent), currency),
+        )
@@ -6,11 +6,11 @@ Fournit la logique de projection du solde bancaire sur une période future.
 Algorithme:
 1. Récupère le solde initial (somme des comptes)
 2. Récupère les transactions récurrentes actives
-3. Pour chaque jour de la période:
-   - Vérifie quelles transactions récurrentes déclenchent
-   - Applique les montants selon le scénario
-   - Calcule le nouveau solde
-4. Retourne ProjectionResult avec points et statistiques
+3. Pour chaque transaction récurrente:
+   - Génère ses occurrences sur la période (calcul direct)
+   - Applique le montant selon le scénario à chaque occurrence
+4. Cumule les variations jour par jour pour calculer le solde
+5. Retourne ProjectionResult avec points et statistiques
 
 Scénarios:
 - Pessimiste: Exclut les revenus variables, ajoute variance aux dépenses
@@ -38,6 +38,84 @@ from src.domain.value_objects.scenario import Scenario
 logger = logging.getLogger(__name__)
 
 
+def scenario_amount(amount: Money, is_income: bool, scenario: Scenario) -> Decimal:
+    """
+    Applique la logique du scénario au montant.
+
+    Règles:
+    - Pessimiste: Réduit les revenus de 20%, ajoute 10% aux dépenses
+    - Réaliste: Utilise le montant tel quel
+    - Optimiste: Augmente les revenus de 10%, réduit les dépenses de 10%
+
+    Args:
+        amount: Montant de la transaction
+        is_income: True si c'est un revenu
+        scenario: Scénario à appliquer
+
+    Returns:
+        Montant ajusté selon le scénario
+    """
+    if scenario == Scenario.PESSIMISTIC:
+        if is_income:
+            # Pour le scénario pessimiste, réduire les revenus de 20%
+            return amount.amount * Decimal("0.80")
+        else:
+            # Augmenter les dépenses de 10%
+            return amount.amount * Decimal("1.10")
+
+    elif scenario == Scenario.REALISTIC:
+        # Utiliser le montant tel quel
+        return amount.amount
+
+    elif scenario == Scenario.OPTIMISTIC:
+        if is_income:
+            # Augmenter les revenus de 10%
+            return amount.amount * Decimal("1.10")
+        else:
+            # Réduire les dépenses de 10%
+            return amount.amount * Decimal("0.90")
+
+    return amount.amount
+
+
+def scheduled_changes(
+    recurring_transactions: list[RecurringTransaction],
+    from_date: date,
+    to_date: date,
+    scenario: Scenario,
+) -> dict[date, Decimal]:
+    """
+    Noyau de projection: variations nettes planifiées, indexées par date.
+
+    Les occurrences de chaque récurrence sont générées une seule fois sur
+    la période (calcul direct), au montant du scénario. Utilisé par la
+    projection de solde et par le suivi de budget.
+
+    Args:
+        recurring_transactions: Transactions récurrentes à projeter
+        from_date: Début de période (inclus)
+        to_date: Fin de période (incluse)
+        scenario: Scénario de projection
+
+    Returns:
+        Dict {date: variation nette}; les dates sans occurrence sont absentes
+    """
+    changes_by_date: dict[date, Decimal] = {}
+
+    for recurring_tx in recurring_transactions:
+        amount = scenario_amount(
+            recurring_tx.amount,
+            is_income=recurring_tx.amount.is_positive(),
+            scenario=scenario,
+        )
+        for occurrence in recurring_tx.occurrences_between(from_date, to_date):
+            changes_by_date[occurrence] = (
+                changes_by_date.get(occurrence, Decimal("0.00")) + amount
+            )
+
+    return changes_by_date
+
+
 class ProjectionService:
     """
     Service de projection du solde bancaire.
@@ -222,6 +300,10 @@ class ProjectionService:
         """
         Génère les points de projection jour par jour.
 
+        Les occurrences de chaque récurrence sont générées une seule fois
+        sur la période, puis agrégées par date: le coût est proportionnel
+        au nombre d'occurrences, pas au produit jours × récurrences.
+
         Args:
             from_date: Date de début
             to_date: Date de fin
@@ -232,22 +314,17 @@ class ProjectionService:
         Returns:
             Liste de ProjectionPoint triée par date
         """
+        # Variations nettes indexées par date d'occurrence
+        changes_by_date = scheduled_changes(
+            recurring_transactions, from_date, to_date, scenario
+        )
+
         points = []
         current_balance = starting_balance.amount
         current_date = from_date
 
         while current_date <= to_date:
-            # Vérifier quelles transactions récurrentes déclenchent
-            net_change = Decimal("0.00")
-
-            for recurring_tx in recurring_transactions:
-                if recurring_tx.should_trigger_on(current_date):
-                    amount = self._get_scenario_amount(
-                        recurring_tx.amount,
-                        is_income=recurring_tx.amount.is_positive(),
-                        scenario=scenario,
-                    )
-                    net_change += amount
+            net_change = changes_by_date.get(current_date, Decimal("0.00"))
 
             # Calculer le nouveau solde
             new_balance = current_balance + net_change
@@ -272,40 +349,5 @@ class ProjectionService:
         is_income: bool,
         scenario: Scenario,
     ) -> Decimal:
-        """
-        Applique la logique du scénario au montant.
-
-        Règles:
-        - Pessimiste: Exclut les revenus variables, ajoute 10% aux dépenses
-        - Réaliste: Utilise le montant tel quel
-        - Optimiste: Inclut tous les revenus, réduit les dépenses de 10%
-
-        Args:
-            amount: Montant de la transaction
-            is_income: True si c'est un revenu
-            scenario: Scénario à appliquer
-
-        Returns:
-            Montant ajusté selon le scénario
-        """
-        if scenario == Scenario.PESSIMISTIC:
-            if is_income:
-                # Pour le scénario pessimiste, réduire les revenus de 20%
-                return amount.amount * Decimal("0.80")
-            else:
-                # Augmenter les dépenses de 10%
-                return amount.amount * Decimal("1.10")
-
-        elif scenario == Scenario.REALISTIC:
-            # Utiliser le montant tel quel
-            return amount.amount
-
-        elif scenario == Scenario.OPTIMISTIC:
-            if is_income:
-                # Augmenter les revenus de 10%
-                return amount.amount * Decimal("1.10")
-            else:
-                # Réduire les dépenses de 10%
-                return amount.amount * Decimal("0.90")
-
-        return amount.amount
+        """Applique la logique du scénario au montant (cf. scenario_amount)."""
+        return scenario_amount(amount, is_income, scenario)
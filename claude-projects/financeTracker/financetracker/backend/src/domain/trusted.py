@@ -0,0 +1,65 @@
+"""
+Construction de confiance des entités et value objects
+
+Les adapters de persistance relisent des données déjà validées à l'écriture.
+Repasser par __init__/__post_init__ pour chaque ligne refait des contrôles
+inutiles (dates, bornes, quantize) sur des centaines de milliers d'objets.
+
+TrustedConstructor expose `Cls.from_trusted(**champs)`, qui remplit les slots
+d'une dataclass(slots=True) sans validation: réservé aux données issues du
+stockage, jamais aux entrées utilisateur.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+
+def _compile_constructor(cls: type) -> Callable[..., Any]:
+    """
+    Génère `def from_trusted(*, id, account_id, ...)` pour cls.
+
+    Comme les __init__ générés par dataclasses: une fonction compilée une
+    fois, une affectation par champ. Les classes frozen passent par
+    object.__setattr__ (leur __setattr__ lève FrozenInstanceError).
+    """
+    names = cls.__slots__
+    frozen = cls.__dataclass_params__.frozen
+    if frozen:
+        body = [f"    _setattr(self, {name!r}, {name})" for name in names]
+    else:
+        body = [f"    self.{name} = {name}" for name in names]
+    source = "\n".join([
+        f"def from_trusted(*, {', '.join(names)}):",
+        "    self = _new(_cls)",
+        *body,
+        "    return self",
+    ])
+    namespace = {"_new": object.__new__, "_setattr": object.__setattr__, "_cls": cls}
+    exec(source, namespace)
+    return namespace["from_trusted"]
+
+
+class TrustedConstructor:
+    """
+    Descripteur: `Cls.from_trusted(**champs)` sans __init__ ni __post_init__.
+
+    Le constructeur est généré au premier accès, pour la classe finale
+    (dataclass(slots=True) recrée la classe), puis remplace le descripteur.
+    Tous les champs sont requis (TypeError sinon).
+
+    Examples:
+        >>> @dataclass(slots=True)
+        ... class Point:
+        ...     x: int
+        ...     from_trusted = TrustedConstructor()
+        >>> Point.from_trusted(x=1)
+        Point(x=1)
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Any, owner: type) -> Callable[..., Any]:
+        constructor = _compile_constructor(owner)
+        setattr(owner, self._name, staticmethod(constructor))
+        return constructor
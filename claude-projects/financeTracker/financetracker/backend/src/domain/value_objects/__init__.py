@@ -5,8 +5,10 @@ Immuables et hashables, encapsulent la logique métier des concepts élémentair
 """
 from src.domain.value_objects.money import Money
 from src.domain.value_objects.date_range import DateRange
+from src.domain.value_objects.transaction_query import TransactionQuery
 
 __all__ = [
     "Money",
     "DateRange",
+    "TransactionQuery",
 ]
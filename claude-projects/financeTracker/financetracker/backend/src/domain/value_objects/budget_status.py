@@ -0,0 +1,107 @@
+"""
+Value Objects: BudgetLine, BudgetStatus
+
+Suivi du budget mensuel d'une catégorie.
+
+- BudgetLine: budget et dépense constatée d'une catégorie (sous-catégories
+  comprises) pour un mois, tels que lus en base
+- BudgetStatus: consommation à date, rythme de dépense et projection de
+  fin de mois
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+from src.domain.value_objects.money import Money
+
+
+@dataclass(frozen=True, slots=True)
+class BudgetLine:
+    """
+    Budget d'une catégorie et dépense constatée sur un mois.
+
+    Attributes:
+        category_id: Catégorie budgétée
+        name: Nom de la catégorie
+        budget: Budget mensuel (positif)
+        spent: Dépense nette du mois (positive; les remboursements la réduisent)
+        category_ids: La catégorie et tous ses descendants
+    """
+
+    category_id: UUID
+    name: str
+    budget: Money
+    spent: Money
+    category_ids: frozenset[UUID]
+
+
+@dataclass(frozen=True, slots=True)
+class BudgetStatus:
+    """
+    État du budget d'une catégorie à une date du mois.
+
+    Invariants:
+    - 1 <= days_elapsed <= days_in_month
+    - projected_spend >= spent
+
+    Examples:
+        >>> status = BudgetStatus(
+        ...     category_id=uuid4(), name="Courses", month=date(2025, 3, 1),
+        ...     as_of=date(2025, 3, 10), days_elapsed=10, days_in_month=31,
+        ...     budget=Money(Decimal("400")), spent=Money(Decimal("150")),
+        ...     burn_rate=Money(Decimal("15")), projected_spend=Money(Decimal("465")),
+        ... )
+        >>> status.projected_overshoot.amount
+        Decimal('65.00')
+    """
+
+    category_id: UUID
+    name: str
+    month: date
+    as_of: date
+    days_elapsed: int
+    days_in_month: int
+    budget: Money
+    spent: Money
+    burn_rate: Money
+    projected_spend: Money
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.days_elapsed <= self.days_in_month:
+            raise ValueError("days_elapsed must be between 1 and days_in_month")
+
+    @property
+    def remaining(self) -> Money:
+        """Budget restant (négatif si dépassé)."""
+        return self.budget - self.spent
+
+    @property
+    def consumption(self) -> Decimal:
+        """Part du budget consommée (1 = 100%); 0 pour un budget nul."""
+        if self.budget.is_zero():
+            return Decimal("0")
+        return (self.spent.amount / self.budget.amount).quantize(Decimal("0.0001"))
+
+    @property
+    def projected_overshoot(self) -> Money:
+        """Dépassement projeté en fin de mois (0 si dans le budget)."""
+        overshoot = self.projected_spend - self.budget
+        return overshoot if overshoot.is_positive() else Money.zero(self.budget.currency)
+
+    def is_over_budget(self) -> bool:
+        """True si la dépense constatée dépasse déjà le budget."""
+        return self.spent > self.budget
+
+    def is_projected_over(self) -> bool:
+        """True si la fin de mois projetée dépasse le budget."""
+        return self.projected_spend > self.budget
+
+    def __repr__(self) -> str:
+        """Représentation technique."""
+        return (
+            f"BudgetStatus({self.name}, {self.month:%Y-%m}, spent={self.spent.amount}"
+            f"/{self.budget.amount}, projected={self.projected_spend.amount})"
+        )
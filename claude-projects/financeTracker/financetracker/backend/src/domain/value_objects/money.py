@@ -10,6 +10,7 @@ Principes SOLID appliqués:
 
 Caractéristiques:
 - Immuable (frozen dataclass)
+- Compact (__slots__: pas de __dict__ par instance)
 - Utilise Decimal pour précision financière
 - Hashable (utilisable dans sets/dicts)
 """
@@ -19,8 +20,12 @@ from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
 from typing import Union
 
+# Exposant d'un Decimal à 2 décimales (Decimal("1.50").as_tuple().exponent)
+_CENTS_EXPONENT = -2
+_CENT = Decimal("0.01")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Money:
     """
     Représente une somme d'argent avec sa devise.
@@ -48,9 +53,10 @@ class Money:
         if not isinstance(self.amount, Decimal):
             object.__setattr__(self, "amount", Decimal(str(self.amount)))
         
-        # Arrondir à 2 décimales (standard monétaire)
-        rounded = self.amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-        object.__setattr__(self, "amount", rounded)
+        # Arrondir à 2 décimales (standard monétaire), sauf si déjà le cas
+        if self.amount.as_tuple().exponent != _CENTS_EXPONENT:
+            rounded = self.amount.quantize(_CENT, rounding=ROUND_HALF_UP)
+            object.__setattr__(self, "amount", rounded)
         
         # Valider la devise
         if not self.currency or len(self.currency) != 3:
@@ -125,9 +131,37 @@ class Money:
     
     @classmethod
     def from_cents(cls, cents: int, currency: str = "EUR") -> Money:
-        """Crée un montant à partir de centimes."""
-        return cls(Decimal(cents) / 100, currency)
+        """
+        Crée un montant à partir de centimes (chemin rapide).
+
+        Un entier de centimes est exact: le Decimal est construit
+        directement à 2 décimales, sans conversion texte ni quantize.
+
+        Examples:
+            >>> Money.from_cents(-4250)
+            Money(Decimal('-42.50'), 'EUR')
+        """
+        if not currency or len(currency) != 3:
+            raise ValueError(f"Currency must be 3 characters, got: {currency}")
+        money = object.__new__(cls)
+        object.__setattr__(money, "amount", Decimal(int(cents)).scaleb(_CENTS_EXPONENT))
+        object.__setattr__(money, "currency", currency)
+        return money
     
+    @classmethod
+    def from_trusted(cls, amount: Decimal, currency: str) -> Money:
+        """
+        Crée un montant sans validation (valeurs relues du stockage).
+
+        Args:
+            amount: Decimal déjà à 2 décimales
+            currency: Code devise déjà validé
+        """
+        money = object.__new__(cls)
+        object.__setattr__(money, "amount", amount)
+        object.__setattr__(money, "currency", currency)
+        return money
+
     @classmethod
     def from_float(cls, value: float, currency: str = "EUR") -> Money:
         """
@@ -137,6 +171,12 @@ class Money:
         """
         return cls(Decimal(str(value)), currency)
     
+    # === Conversions ===
+
+    def to_cents(self) -> int:
+        """Montant en centimes (entier exact)."""
+        return int(self.amount.scaleb(-_CENTS_EXPONENT))
+
     # === Helpers ===
     
     def _check_same_currency(self, other: Money) -> None:
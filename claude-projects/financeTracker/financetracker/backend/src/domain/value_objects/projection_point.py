@@ -17,7 +17,7 @@ from decimal import Decimal
 from src.domain.value_objects.money import Money
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProjectionPoint:
     """
     Représente un point de données dans une projection.
@@ -0,0 +1,133 @@
+"""
+Value Object: ProjectionSnapshot
+
+Projection mise en cache d'un compte, indépendante de son solde.
+
+La courbe projetée d'un compte est solde courant + cumul des récurrences
+planifiées. Seul le cumul dépend des récurrences et de la fenêtre: il est
+calculé une fois, puis réutilisé tant que ni les récurrences, ni la date,
+ni le scénario ne changent. Un import ne modifie que le solde: la détection
+d'un franchissement de seuil se fait alors par simple décalage, sans
+régénérer les occurrences.
+
+Seuls les records à la baisse du cumul sont conservés: le premier jour où
+solde + cumul passe sous un seuil est nécessairement un nouveau minimum.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.scenario import Scenario
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectionSnapshot:
+    """
+    Projection en cache d'un compte.
+
+    Attributes:
+        account_id: Compte projeté
+        as_of: Jour d'évaluation (occurrences à partir du lendemain)
+        horizon_end: Dernier jour projeté
+        scenario: Scénario appliqué aux récurrences
+        recurring_digest: Empreinte des récurrences du compte
+        lows: Records à la baisse du cumul planifié [(date, cumul)], dates croissantes
+        balance: Solde courant lors de la dernière évaluation
+
+    Examples:
+        >>> snapshot = ProjectionSnapshot.from_changes(
+        ...     account_id, date(2025, 3, 1), date(2025, 5, 30), Scenario.REALISTIC,
+        ...     "digest", {date(2025, 3, 5): Decimal("-800")}, Money(Decimal("500")),
+        ... )
+        >>> snapshot.first_breach(Decimal("500"), Decimal("0"))
+        (datetime.date(2025, 3, 5), Decimal('-300'))
+    """
+
+    account_id: UUID
+    as_of: date
+    horizon_end: date
+    scenario: Scenario
+    recurring_digest: str
+    lows: tuple[tuple[date, Decimal], ...]
+    balance: Money
+
+    @classmethod
+    def from_changes(
+        cls,
+        account_id: UUID,
+        as_of: date,
+        horizon_end: date,
+        scenario: Scenario,
+        recurring_digest: str,
+        changes: dict[date, Decimal],
+        balance: Money,
+    ) -> ProjectionSnapshot:
+        """
+        Construit le cache depuis les variations planifiées (cf. scheduled_changes).
+
+        Args:
+            changes: Variations nettes par date, sur ]as_of, horizon_end]
+            balance: Solde courant
+        """
+        lows = []
+        cumulative = Decimal("0")
+        lowest = Decimal("0")
+        for day in sorted(changes):
+            cumulative += changes[day]
+            if cumulative < lowest:
+                lowest = cumulative
+                lows.append((day, cumulative))
+        return cls(
+            account_id=account_id,
+            as_of=as_of,
+            horizon_end=horizon_end,
+            scenario=scenario,
+            recurring_digest=recurring_digest,
+            lows=tuple(lows),
+            balance=balance,
+        )
+
+    def is_valid_for(
+        self,
+        as_of: date,
+        horizon_end: date,
+        scenario: Scenario,
+        recurring_digest: str,
+    ) -> bool:
+        """True si le cumul en cache correspond à ces entrées."""
+        return (
+            self.as_of == as_of
+            and self.horizon_end == horizon_end
+            and self.scenario == scenario
+            and self.recurring_digest == recurring_digest
+        )
+
+    def first_breach(
+        self, balance: Decimal, threshold: Decimal
+    ) -> Optional[tuple[date, Decimal]]:
+        """
+        Premier jour où le solde projeté passe sous le seuil.
+
+        Args:
+            balance: Solde courant
+            threshold: Seuil (strictement en dessous = franchissement)
+
+        Returns:
+            (date, solde projeté) ou None; as_of si le solde courant est déjà
+            sous le seuil
+        """
+        if balance < threshold:
+            return self.as_of, balance
+        for day, cumulative in self.lows:
+            if balance + cumulative < threshold:
+                return day, balance + cumulative
+        return None
+
+    def rebased(self, balance: Money) -> ProjectionSnapshot:
+        """Même cumul, nouveau solde courant."""
+        return replace(self, balance=balance)
@@ -0,0 +1,58 @@
+"""
+Value Objects: RejectedTransaction, SaveReport
+
+Bilan d'une sauvegarde de transactions tolérante aux échecs partiels:
+les lignes valides sont persistées, les lignes refusées sont rapportées
+une à une avec leur motif.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from src.domain.entities.transaction import Transaction
+
+# Motif de rejet d'une transaction dont l'import_hash est déjà enregistré
+DUPLICATE_HASH_REASON = "Transaction already exists (duplicate import_hash)"
+
+
+@dataclass(frozen=True, slots=True)
+class RejectedTransaction:
+    """
+    Transaction refusée par la persistance.
+
+    Attributes:
+        transaction: Transaction non sauvegardée
+        reason: Motif (ex: "UNIQUE constraint failed: transactions.import_hash")
+    """
+
+    transaction: Transaction
+    reason: str
+
+    @property
+    def is_duplicate(self) -> bool:
+        """True si la transaction était déjà importée (doublon, pas une erreur)."""
+        return self.reason == DUPLICATE_HASH_REASON
+
+    def __str__(self) -> str:
+        """Message d'erreur lisible (une ligne par transaction refusée)."""
+        tx = self.transaction
+        return f"{tx.date} {tx.description!r} {tx.amount}: {self.reason}"
+
+
+@dataclass(frozen=True, slots=True)
+class SaveReport:
+    """
+    Bilan d'une sauvegarde par lots.
+
+    Attributes:
+        saved_count: Transactions persistées
+        rejected: Transactions refusées, dans l'ordre d'origine
+    """
+
+    saved_count: int = 0
+    rejected: tuple[RejectedTransaction, ...] = ()
+
+    @property
+    def rejected_count(self) -> int:
+        """Nombre de transactions refusées."""
+        return len(self.rejected)
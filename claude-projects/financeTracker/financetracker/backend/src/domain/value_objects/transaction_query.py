@@ -0,0 +1,115 @@
+"""
+Value Object: TransactionQuery
+
+Spécification combinable des filtres de recherche de transactions.
+
+Principes SOLID appliqués:
+- SRP: Décrit uniquement QUELLES transactions sont voulues, pas COMMENT les lire
+- OCP: Un nouveau critère = un nouveau champ, sans nouvelle méthode de repository
+- DIP: Aucune dépendance à SQLAlchemy; l'adapter compile la spec en SQL
+
+Caractéristiques:
+- Immuable (frozen dataclass)
+- Tous les critères sont combinés en ET logique
+- Un critère vide (None ou tuple vide) n'est pas appliqué
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable, Optional
+from uuid import UUID
+
+from src.domain.value_objects.date_range import DateRange
+
+
+@dataclass(frozen=True)
+class TransactionQuery:
+    """
+    Filtre combiné sur les transactions.
+
+    Invariants:
+    - min_amount <= max_amount si les deux sont fournis
+    - min_confidence est entre 0 et 1
+    - uncategorized et category_ids sont mutuellement exclusifs
+
+    Examples:
+        >>> query = TransactionQuery(
+        ...     account_ids=(account_id,),
+        ...     category_ids=(food_id,),
+        ...     date_range=DateRange.this_month(),
+        ...     max_amount=Decimal("0"),
+        ... )
+        >>> query.is_empty()
+        False
+    """
+
+    account_ids: tuple[UUID, ...] = ()
+    category_ids: tuple[UUID, ...] = ()
+    include_subcategories: bool = True
+    date_range: Optional[DateRange] = None
+    min_amount: Optional[Decimal] = None
+    max_amount: Optional[Decimal] = None
+    text: Optional[str] = None
+    tags: tuple[str, ...] = ()
+    uncategorized: bool = False
+    min_confidence: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        """Validation et normalisation à la création."""
+        # Accepter n'importe quel itérable (list, set...) pour les collections
+        object.__setattr__(self, "account_ids", _as_tuple(self.account_ids))
+        object.__setattr__(self, "category_ids", _as_tuple(self.category_ids))
+
+        # Tags normalisés comme Transaction.add_tag
+        tags = tuple(t.strip().lower() for t in _as_tuple(self.tags) if t.strip())
+        object.__setattr__(self, "tags", tags)
+
+        text = self.text.strip() if self.text else None
+        object.__setattr__(self, "text", text or None)
+
+        for name in ("min_amount", "max_amount"):
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, Decimal):
+                object.__setattr__(self, name, Decimal(str(value)))
+
+        if (
+            self.min_amount is not None
+            and self.max_amount is not None
+            and self.min_amount > self.max_amount
+        ):
+            raise ValueError(
+                f"min_amount must be <= max_amount, "
+                f"got: {self.min_amount} > {self.max_amount}"
+            )
+
+        if self.min_confidence is not None and not 0.0 <= self.min_confidence <= 1.0:
+            raise ValueError(
+                f"min_confidence must be between 0 and 1, got: {self.min_confidence}"
+            )
+
+        if self.uncategorized and self.category_ids:
+            raise ValueError("uncategorized cannot be combined with category_ids")
+
+    # === Prédicats ===
+
+    def is_empty(self) -> bool:
+        """Retourne True si aucun critère n'est appliqué."""
+        return not (
+            self.account_ids
+            or self.category_ids
+            or self.date_range
+            or self.min_amount is not None
+            or self.max_amount is not None
+            or self.text
+            or self.tags
+            or self.uncategorized
+            or self.min_confidence is not None
+        )
+
+
+def _as_tuple(values: Optional[Iterable]) -> tuple:
+    """Convertit un itérable optionnel en tuple (ordre conservé, sans doublons)."""
+    if not values:
+        return ()
+    return tuple(dict.fromkeys(values))
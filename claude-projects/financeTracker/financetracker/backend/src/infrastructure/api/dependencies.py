@@ -8,9 +8,11 @@ Provides FastAPI dependencies for:
 """
 from __future__ import annotations
 
+from decimal import Decimal
 from functools import lru_cache
-from typing import Generator
+from typing import TYPE_CHECKING, Generator
 
+from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from src.config import settings
@@ -18,7 +20,9 @@ from src.infrastructure.persistence.database import (
     initialize_database,
     get_database,
     DatabaseConfig,
+    SQLiteProfile,
 )
+from src.infrastructure.persistence.unit_of_work import UnitOfWork
 from src.infrastructure.persistence.repositories.sqlite_transaction_repository import (
     SQLiteTransactionRepository,
 )
@@ -28,9 +32,13 @@ from src.infrastructure.persistence.repositories.sqlite_account_repository impor
 from src.infrastructure.persistence.repositories.sqlite_category_repository import (
     SQLiteCategoryRepository,
 )
-from src.infrastructure.import_adapters.adapter_factory import AdapterFactory
 from src.application.handlers.import_handler import ImportTransactionsHandler
 from src.application.handlers.projection_handler import ProjectionHandler
+from src.application.handlers.budget_handler import BudgetHandler
+from src.application.handlers.alert_handler import AlertHandler
+
+if TYPE_CHECKING:
+    from src.infrastructure.import_adapters.adapter_factory import AdapterFactory
 
 
 # === Database ===
@@ -42,6 +50,10 @@ def get_db_config() -> DatabaseConfig:
     return DatabaseConfig(
         database_url=settings.database_url,
         echo=settings.debug,
+        profile=SQLiteProfile.from_name(settings.database_profile),
+        pool_size=settings.database_pool_size,
+        money_storage=settings.money_storage,
+        uuid_storage=settings.uuid_storage,
     )
 
 
@@ -72,29 +84,23 @@ def get_session() -> Generator[Session, None, None]:
 
 
 def get_transaction_repository(
-    session: Session = None,
+    session: Session = Depends(get_session),
 ) -> SQLiteTransactionRepository:
     """Get transaction repository instance."""
-    if session is None:
-        session = get_session()
     return SQLiteTransactionRepository(session)
 
 
 def get_account_repository(
-    session: Session = None,
+    session: Session = Depends(get_session),
 ) -> SQLiteAccountRepository:
     """Get account repository instance."""
-    if session is None:
-        session = get_session()
     return SQLiteAccountRepository(session)
 
 
 def get_category_repository(
-    session: Session = None,
+    session: Session = Depends(get_session),
 ) -> SQLiteCategoryRepository:
     """Get category repository instance."""
-    if session is None:
-        session = get_session()
     return SQLiteCategoryRepository(session)
 
 
@@ -103,61 +109,54 @@ def get_category_repository(
 
 @lru_cache(maxsize=1)
 def get_adapter_factory() -> AdapterFactory:
-    """Get cached adapter factory instance."""
-    return AdapterFactory()
+    """Get cached adapter factory instance (adapters loaded on first import)."""
+    from src.infrastructure.import_adapters.adapter_factory import create_adapter_factory
+
+    return create_adapter_factory(settings.import_profiles_path)
 
 
 # === Application Handlers ===
 
 
 def get_import_handler(
+    uow: UnitOfWork,
     adapter_factory: AdapterFactory = None,
-    transaction_repo: SQLiteTransactionRepository = None,
-    category_repo: SQLiteCategoryRepository = None,
 ) -> ImportTransactionsHandler:
-    """Get import transactions handler."""
+    """Get import transactions handler bound to a unit of work."""
     if adapter_factory is None:
         adapter_factory = get_adapter_factory()
-    if transaction_repo is None:
-        session = get_database().get_session()
-        transaction_repo = SQLiteTransactionRepository(session)
-    if category_repo is None:
-        session = get_database().get_session()
-        category_repo = SQLiteCategoryRepository(session)
 
     return ImportTransactionsHandler(
         adapter_factory=adapter_factory,
-        transaction_repository=transaction_repo,
-        category_repository=category_repo,
+        transaction_repository=uow.transactions,
+        category_repository=uow.categories,
+        batch_repository=uow.import_batches,
     )
 
 
-def get_projection_handler(
-    account_repo: SQLiteAccountRepository = None,
-    recurring_repo: SQLiteAccountRepository = None,  # Placeholder - implement RecurringRepository
-    transaction_repo: SQLiteTransactionRepository = None,
-) -> ProjectionHandler:
-    """Get projection handler."""
-    if account_repo is None:
-        session = get_database().get_session()
-        account_repo = SQLiteAccountRepository(session)
-    if transaction_repo is None:
-        session = get_database().get_session()
-        transaction_repo = SQLiteTransactionRepository(session)
+def get_projection_handler(uow: UnitOfWork) -> ProjectionHandler:
+    """Get projection handler bound to a unit of work."""
+    return ProjectionHandler(
+        account_repository=uow.accounts,
+        recurring_repository=uow.recurring,
+        transaction_repository=uow.transactions,
+    )
 
-    # TODO: Implement RecurringRepository
-    # if recurring_repo is None:
-    #     session = get_database().get_session()
-    #     recurring_repo = SQLiteRecurringRepository(session)
 
-    from src.domain.repositories.recurring_repository import RecurringRepository
-    from unittest.mock import Mock
+def get_budget_handler(uow: UnitOfWork) -> BudgetHandler:
+    """Get budget status handler bound to a unit of work."""
+    return BudgetHandler(
+        budget_repository=uow.budgets,
+        recurring_repository=uow.recurring,
+    )
 
-    if recurring_repo is None:
-        recurring_repo = Mock(spec=RecurringRepository)
 
-    return ProjectionHandler(
-        account_repository=account_repo,
-        recurring_repository=recurring_repo,
-        transaction_repository=transaction_repo,
+def get_alert_handler(uow: UnitOfWork) -> AlertHandler:
+    """Get alert engine handler bound to a unit of work."""
+    return AlertHandler(
+        account_repository=uow.accounts,
+        recurring_repository=uow.recurring,
+        alert_repository=uow.alerts,
+        budget_repository=uow.budgets,
+        threshold=Decimal(str(settings.default_alert_threshold)),
     )
@@ -0,0 +1,168 @@
+"""
+Transaction Export Encoders
+
+Encode des paquets de TransactionRow en CSV, NDJSON ou Parquet, au fil de
+l'eau: chaque paquet lu en base devient un morceau de réponse, la mémoire
+reste bornée par la taille d'un paquet quel que soit le nombre de lignes.
+
+Parquet dépend de pyarrow, dépendance optionnelle importée à la demande.
+"""
+from __future__ import annotations
+
+import csv
+import importlib.util
+import io
+import json
+from enum import Enum
+from typing import AsyncIterator, List
+
+from src.application.dto.transaction_row import TransactionRow
+
+RowBatches = AsyncIterator[List[TransactionRow]]
+
+# Séparateur des tags dans une cellule CSV
+CSV_TAG_SEPARATOR = "|"
+
+
+class ExportFormat(str, Enum):
+    """Formats d'export des transactions."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+    PARQUET = "parquet"
+
+    @property
+    def media_type(self) -> str:
+        """Content-Type de la réponse."""
+        return {
+            ExportFormat.CSV: "text/csv; charset=utf-8",
+            ExportFormat.NDJSON: "application/x-ndjson",
+            ExportFormat.PARQUET: "application/vnd.apache.parquet",
+        }[self]
+
+    @property
+    def available(self) -> bool:
+        """False si la dépendance optionnelle du format manque (pyarrow)."""
+        if self is ExportFormat.PARQUET:
+            return importlib.util.find_spec("pyarrow") is not None
+        return True
+
+
+def encode(export_format: ExportFormat, batches: RowBatches) -> AsyncIterator[bytes]:
+    """
+    Encode des paquets de lignes dans le format demandé.
+
+    Args:
+        export_format: Format de sortie
+        batches: Paquets de TransactionRow (ex: stream_rows)
+
+    Returns:
+        Itérateur async de morceaux d'octets (un par paquet)
+    """
+    encoders = {
+        ExportFormat.CSV: encode_csv,
+        ExportFormat.NDJSON: encode_ndjson,
+        ExportFormat.PARQUET: encode_parquet,
+    }
+    return encoders[export_format](batches)
+
+
+async def encode_csv(batches: RowBatches) -> AsyncIterator[bytes]:
+    """CSV avec ligne d'en-tête (colonnes de TransactionRow.ROW_FIELDS)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(TransactionRow.ROW_FIELDS)
+    async for batch in batches:
+        for row in batch:
+            values = row.to_dict()
+            values["tags"] = CSV_TAG_SEPARATOR.join(row.tags or ())
+            writer.writerow(values.values())
+        yield _drain(buffer).encode("utf-8")
+    if buffer.tell():
+        yield _drain(buffer).encode("utf-8")
+
+
+async def encode_ndjson(batches: RowBatches) -> AsyncIterator[bytes]:
+    """Un objet JSON par ligne (mêmes clés que GET /transactions)."""
+    async for batch in batches:
+        yield "".join(
+            json.dumps(row.to_dict(), ensure_ascii=False) + "\n" for row in batch
+        ).encode("utf-8")
+
+
+async def encode_parquet(batches: RowBatches) -> AsyncIterator[bytes]:
+    """
+    Fichier Parquet, un row group par paquet.
+
+    Raises:
+        ImportError: Si pyarrow n'est pas installé
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ("id", pa.string()),
+        ("account_id", pa.string()),
+        ("date", pa.date32()),
+        ("value_date", pa.date32()),
+        ("amount", pa.string()),
+        ("currency", pa.string()),
+        ("description", pa.string()),
+        ("category_id", pa.string()),
+        ("category_confidence", pa.float64()),
+        ("is_recurring", pa.bool_()),
+        ("recurring_id", pa.string()),
+        ("tags", pa.list_(pa.string())),
+        ("notes", pa.string()),
+        ("import_hash", pa.string()),
+        ("created_at", pa.timestamp("us")),
+        ("updated_at", pa.timestamp("us")),
+    ])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        async for batch in batches:
+            columns = {
+                field: [getattr(row, field) for row in batch]
+                for field in TransactionRow.ROW_FIELDS
+            }
+            writer.write_batch(pa.RecordBatch.from_pydict(columns, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def _drain(buffer: io.StringIO) -> str:
+    """Vide un StringIO et retourne son contenu."""
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
+
+
+class _ChunkSink(io.RawIOBase):
+    """Fichier en écriture seule dont le contenu est relevé morceau par morceau."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        """Retourne et oublie les octets écrits depuis le dernier appel."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
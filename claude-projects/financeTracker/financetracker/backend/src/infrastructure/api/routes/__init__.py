@@ -1,4 +1,4 @@
 """API Routes package"""
-from . import import_routes, transactions, projection, accounts
+from . import import_routes, transactions, projection, accounts, analytics, budgets, alerts
 
-__all__ = ["import_routes", "transactions", "projection", "accounts"]
+__all__ = ["import_routes", "transactions", "projection", "accounts", "analytics", "budgets", "alerts"]
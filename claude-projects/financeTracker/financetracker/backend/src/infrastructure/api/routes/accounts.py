@@ -10,13 +10,13 @@ from decimal import Decimal
 import logging
 
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.account import Account, AccountType
 from src.domain.value_objects.money import Money
-from src.infrastructure.persistence.database import get_session_local
-from src.infrastructure.persistence.repositories.sqlite_account_repository import (
-    SQLiteAccountRepository,
+from src.infrastructure.persistence.async_database import get_async_session
+from src.infrastructure.persistence.repositories.async_sqlite_account_repository import (
+    AsyncSQLiteAccountRepository,
 )
 from src.infrastructure.api.schemas.account import (
     AccountResponse,
@@ -35,7 +35,7 @@ router = APIRouter(tags=["accounts"], prefix="/accounts")
     summary="List all accounts",
 )
 async def list_accounts(
-    session: Session = Depends(get_session_local),
+    session: AsyncSession = Depends(get_async_session),
 ) -> AccountListResponse:
     """
     Get list of all accounts.
@@ -44,8 +44,8 @@ async def list_accounts(
     - List of account details
     """
     try:
-        repo = SQLiteAccountRepository(session)
-        accounts = repo.find_all()
+        repo = AsyncSQLiteAccountRepository(session)
+        accounts = await repo.find_all()
 
         return AccountListResponse(
             accounts=[
@@ -81,7 +81,7 @@ async def list_accounts(
 )
 async def create_account(
     request: AccountCreateRequest,
-    session: Session = Depends(get_session_local),
+    session: AsyncSession = Depends(get_async_session),
 ) -> AccountResponse:
     """
     Create a new account.
@@ -127,8 +127,8 @@ async def create_account(
         )
 
         # Save to repository
-        repo = SQLiteAccountRepository(session)
-        repo.save(account)
+        repo = AsyncSQLiteAccountRepository(session)
+        await repo.save(account)
 
         logger.info(f"Account created: {account.id} ({account.name})")
 
@@ -161,7 +161,7 @@ async def create_account(
 )
 async def get_account(
     account_id: UUID,
-    session: Session = Depends(get_session_local),
+    session: AsyncSession = Depends(get_async_session),
 ) -> AccountResponse:
     """
     Get account details by ID.
@@ -173,8 +173,8 @@ async def get_account(
     - Account details
     """
     try:
-        repo = SQLiteAccountRepository(session)
-        account = repo.get_by_id(account_id)
+        repo = AsyncSQLiteAccountRepository(session)
+        account = await repo.get_by_id(account_id)
 
         if not account:
             raise HTTPException(
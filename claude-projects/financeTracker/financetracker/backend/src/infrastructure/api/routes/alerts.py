@@ -0,0 +1,96 @@
+"""
+Alert API Routes
+
+Handles alert listing and on-demand re-evaluation.
+"""
+from __future__ import annotations
+
+from typing import Optional
+from uuid import UUID
+import logging
+
+from fastapi import APIRouter, HTTPException, status, Query
+from fastapi.concurrency import run_in_threadpool
+
+from src.application.commands.evaluate_alerts import EvaluateAlertsCommand
+from src.application.queries.get_alerts import GetAlertsQuery
+from src.infrastructure.api.dependencies import get_alert_handler
+from src.infrastructure.persistence.unit_of_work import UnitOfWork
+from src.infrastructure.api.schemas.alert import (
+    AlertEvaluationResponse,
+    AlertListResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["alerts"])
+
+
+def _list_alerts(query: GetAlertsQuery):
+    """Read alerts in one unit of work (worker thread)."""
+    with UnitOfWork() as uow:
+        return get_alert_handler(uow).list_alerts(query)
+
+
+def _evaluate_alerts(command: EvaluateAlertsCommand):
+    """Evaluate alerts in one unit of work, committed on success (worker thread)."""
+    with UnitOfWork() as uow:
+        return get_alert_handler(uow).handle(command)
+
+
+@router.get(
+    "/alerts",
+    response_model=AlertListResponse,
+    summary="List alerts",
+    description="Latest alert events, most recent first",
+)
+async def list_alerts(
+    account_id: Optional[UUID] = Query(None, description="Restrict to one account"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of alerts"),
+) -> AlertListResponse:
+    """
+    List stored alert events.
+
+    Parameters:
+    - **account_id**: Only balance alerts of this account
+    - **limit**: Maximum number of alerts (1-500, default: 50)
+    """
+    try:
+        alerts = await run_in_threadpool(
+            _list_alerts, GetAlertsQuery(account_id=account_id, limit=limit)
+        )
+        return AlertListResponse(items=[a.to_dict() for a in alerts])
+    except Exception as e:
+        logger.error(f"Alert listing error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to list alerts",
+        )
+
+
+@router.post(
+    "/alerts/evaluate",
+    response_model=AlertEvaluationResponse,
+    summary="Re-evaluate alerts",
+    description="Re-evaluate balance and budget alerts for some or all accounts",
+)
+async def evaluate_alerts(
+    account_id: Optional[list[UUID]] = Query(None, description="Accounts to re-evaluate (all when omitted)"),
+) -> AlertEvaluationResponse:
+    """
+    Re-evaluate alerts.
+
+    Accounts whose balance, recurring transactions and evaluation day are
+    unchanged are skipped; a balance change alone reuses the cached
+    projection.
+    """
+    try:
+        command = EvaluateAlertsCommand(account_ids=tuple(account_id) if account_id else None)
+        result = await run_in_threadpool(_evaluate_alerts, command)
+        return AlertEvaluationResponse(**result.to_dict())
+    except Exception as e:
+        logger.error(f"Alert evaluation error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to evaluate alerts",
+        )
@@ -0,0 +1,84 @@
+"""
+Analytics API Routes
+
+Handles aggregated spending reports, served from the monthly rollup.
+"""
+from __future__ import annotations
+
+from datetime import date
+from uuid import UUID
+from typing import List, Optional
+import logging
+
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.persistence.async_database import get_async_session
+from src.infrastructure.persistence.repositories.async_sqlite_analytics_repository import (
+    AsyncSQLiteAnalyticsRepository,
+)
+from src.infrastructure.api.schemas.analytics import SpendingResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["analytics"], prefix="/analytics")
+
+MONTH_PATTERN = r"^\d{4}-(0[1-9]|1[0-2])$"
+
+
+def _month_range(end_month: str, months: int) -> tuple[str, str]:
+    """Premier et dernier mois (YYYY-MM) d'une fenêtre de `months` mois."""
+    year, month = (int(part) for part in end_month.split("-"))
+    index = year * 12 + (month - 1) - (months - 1)
+    return f"{index // 12:04d}-{index % 12 + 1:02d}", end_month
+
+
+@router.get(
+    "/spending",
+    response_model=SpendingResponse,
+    summary="Spending by category",
+    description="Monthly totals per category, rolled up the category hierarchy",
+)
+async def get_spending(
+    months: int = Query(12, ge=1, le=120, description="Number of months, ending with end_month"),
+    end_month: Optional[str] = Query(
+        None, pattern=MONTH_PATTERN, description="Last month included (YYYY-MM, default: current)"
+    ),
+    account_id: Optional[List[UUID]] = Query(None, description="Filter by account ID (repeatable)"),
+    rollup: bool = Query(True, description="Include subcategory totals in their ancestors"),
+    session: AsyncSession = Depends(get_async_session),
+) -> SpendingResponse:
+    """
+    Get spending by category over the last months.
+
+    Reads the monthly_category_totals rollup only (no scan of transactions).
+
+    Parameters:
+    - **months**: Window size in months (default: 12)
+    - **end_month**: Last month of the window (YYYY-MM)
+    - **account_id**: Restrict to these accounts
+    - **rollup**: Roll subcategories up into their parents
+
+    Returns:
+    - One entry per category with its total, count and monthly breakdown
+    """
+    try:
+        start, end = _month_range(end_month or date.today().strftime("%Y-%m"), months)
+        repo = AsyncSQLiteAnalyticsRepository(session)
+        spending = await repo.spending_by_category(
+            start, end, account_ids=account_id or (), rollup=rollup
+        )
+
+        return SpendingResponse(
+            start_month=start,
+            end_month=end,
+            rollup=rollup,
+            categories=[dto.to_dict() for dto in spending],
+        )
+
+    except Exception as e:
+        logger.error(f"Error computing spending: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to compute spending",
+        )
@@ -0,0 +1,92 @@
+"""
+Budget API Routes
+
+Handles budget-vs-actual status queries.
+"""
+from __future__ import annotations
+
+from datetime import date
+from typing import Optional
+from uuid import UUID
+import logging
+
+from fastapi import APIRouter, HTTPException, status, Query
+from fastapi.concurrency import run_in_threadpool
+
+from src.application.queries.get_budget_status import GetBudgetStatusQuery
+from src.domain.value_objects.scenario import Scenario
+from src.infrastructure.api.dependencies import get_budget_handler
+from src.infrastructure.persistence.unit_of_work import UnitOfWork
+from src.infrastructure.api.schemas.budget import BudgetReportResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["budgets"])
+
+
+def _handle_budget_status(query: GetBudgetStatusQuery):
+    """Evaluate budgets in one unit of work, closed afterwards (worker thread)."""
+    with UnitOfWork() as uow:
+        return get_budget_handler(uow).handle(query)
+
+
+@router.get(
+    "/budgets/status",
+    response_model=BudgetReportResponse,
+    summary="Get budget status",
+    description="Month-to-date spend, burn rate and projected overshoot of every budgeted category",
+)
+async def get_budget_status(
+    as_of: Optional[date] = Query(None, description="Evaluation day (default: today)"),
+    scenario: str = Query(
+        "realistic",
+        description="Scenario applied to upcoming recurring transactions",
+    ),
+    account_id: Optional[list[UUID]] = Query(None, description="Restrict to these accounts"),
+) -> BudgetReportResponse:
+    """
+    Get the budget-vs-actual status of every budgeted category.
+
+    Actuals come from the monthly rollup (subcategories included), so the
+    cost does not depend on the number of transactions.
+
+    Parameters:
+    - **as_of**: Evaluation day; its month is evaluated (default: today)
+    - **scenario**: pessimistic, realistic or optimistic
+    - **account_id**: Repeatable; all accounts when omitted
+
+    Returns:
+    - One entry per budgeted category, highest projected consumption first
+    """
+    try:
+        try:
+            scenario_enum = Scenario(scenario)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid scenario. Must be one of: {', '.join([s.value for s in Scenario])}",
+            )
+
+        query = GetBudgetStatusQuery(
+            on_date=as_of,
+            scenario=scenario_enum,
+            account_ids=tuple(account_id or ()),
+        )
+        result = await run_in_threadpool(_handle_budget_status, query)
+
+        return BudgetReportResponse(**result.to_dict())
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.error(f"Budget status validation error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Budget status error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to evaluate budgets",
+        )
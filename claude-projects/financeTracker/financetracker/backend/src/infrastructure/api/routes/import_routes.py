@@ -8,19 +8,64 @@ from __future__ import annotations
 from pathlib import Path
 from uuid import UUID
 import logging
-import tempfile
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, status
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 
+from src.application.commands.evaluate_alerts import EvaluateAlertsCommand
 from src.application.commands.import_transactions import ImportTransactionsCommand
-from src.infrastructure.api.dependencies import get_import_handler
-from src.infrastructure.api.schemas.import_request import ImportResultResponse
+from src.infrastructure.api.dependencies import get_alert_handler, get_import_handler
+from src.infrastructure.persistence.unit_of_work import UnitOfWork
+from src.infrastructure.api.schemas.import_request import (
+    ImportBatchListResponse,
+    ImportBatchResponse,
+    ImportResultResponse,
+    UndoImportResponse,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["import"])
 
+# Extensions acceptées sans type MIME CSV (les relevés OFX/QIF arrivent
+# souvent en application/octet-stream)
+STATEMENT_SUFFIXES = {".csv", ".ofx", ".qfx", ".qif"}
+
+
+def _handle_import(command: ImportTransactionsCommand):
+    """Run the import in one unit of work, committed on success (worker thread)."""
+    with UnitOfWork() as uow:
+        result = get_import_handler(uow).handle(command)
+    if result.imported_count:
+        _evaluate_alerts(command.account_id)
+    return result
+
+
+def _list_batches(account_id: UUID, limit: int):
+    """Read import batches in one unit of work (worker thread)."""
+    with UnitOfWork() as uow:
+        return get_import_handler(uow).list_batches(account_id, limit)
+
+
+def _undo_import(batch_id: UUID) -> int:
+    """Undo an import in one unit of work, committed on success (worker thread)."""
+    with UnitOfWork() as uow:
+        batch = uow.import_batches.get_by_id(batch_id)
+        deleted = get_import_handler(uow).undo_import(batch_id)
+    if deleted:
+        _evaluate_alerts(batch.account_id)
+    return deleted
+
+
+def _evaluate_alerts(account_id: UUID) -> None:
+    """Re-evaluate the imported account's alerts; never fails the import."""
+    try:
+        with UnitOfWork() as uow:
+            get_alert_handler(uow).handle(EvaluateAlertsCommand(account_ids=(account_id,)))
+    except Exception as e:
+        logger.error(f"Alert evaluation after import failed: {e}")
+
 
 @router.post(
     "/import",
@@ -39,10 +84,11 @@ async def import_transactions(
     auto_categorize: bool = Form(True, description="Automatically categorize transactions"),
 ) -> ImportResultResponse:
     """
-    Import transactions from a CSV file.
+    Import transactions from a bank statement file.
 
     Supports:
-    - LCL CSV format (French bank export)
+    - CSV exports described by bank profiles (LCL, Boursorama, custom)
+    - OFX/QFX and QIF statements
     - Automatic duplicate detection via import_hash
     - Automatic categorization (optional)
 
@@ -63,40 +109,36 @@ async def import_transactions(
             detail="No file provided",
         )
 
-    if not file.content_type or "csv" not in file.content_type.lower():
+    suffix = Path(file.filename).suffix.lower()
+    is_csv = bool(file.content_type) and "csv" in file.content_type.lower()
+    if not is_csv and suffix not in STATEMENT_SUFFIXES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid file format. Expected CSV.",
+            detail="Invalid file format. Expected CSV, OFX or QIF.",
         )
 
+    # L'extension d'origine guide le choix de l'adapter
+    name = Path(file.filename).name
+    if suffix not in STATEMENT_SUFFIXES:
+        name = f"{Path(name).stem}.csv"
+
     try:
-        # Save uploaded file to temporary location
-        with tempfile.NamedTemporaryFile(
-            delete=False,
-            suffix=".csv",
-            prefix=f"import_{account_id}_",
-        ) as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = Path(tmp.name)
-
-        # Process import
-        handler = get_import_handler()
+        # Parsed straight from the upload spool (SpooledTemporaryFile):
+        # no full read in memory, no copy to a second temporary file
         command = ImportTransactionsCommand(
-            file_path=tmp_path,
+            file_path=Path(name),
             account_id=account_id,
             auto_categorize=auto_categorize,
+            stream=file.file,
         )
 
-        result = handler.handle(command)
+        # Parsing + synchronous persistence: keep them off the event loop
+        result = await run_in_threadpool(_handle_import, command)
         logger.info(
             f"Import complete: imported={result.imported_count}, "
             f"skipped={result.skipped_count}, errors={result.error_count}"
         )
 
-        # Clean up temp file
-        tmp_path.unlink(missing_ok=True)
-
         return ImportResultResponse(
             account_id=result.account_id,
             imported_count=result.imported_count,
@@ -107,6 +149,8 @@ async def import_transactions(
             success_rate=result.success_rate,
             categorization_rate=result.categorization_rate,
             errors=result.errors,
+            batch_id=result.batch_id,
+            already_imported=result.already_imported,
         )
 
     except ValueError as e:
@@ -121,3 +165,63 @@ async def import_transactions(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Import failed: {str(e)}",
         )
+
+
+@router.get(
+    "/import/batches",
+    response_model=ImportBatchListResponse,
+    summary="List import batches",
+    description="Files imported into an account, most recent first",
+)
+async def list_import_batches(
+    account_id: UUID = Query(..., description="Account UUID"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of batches"),
+) -> ImportBatchListResponse:
+    """
+    List recorded import batches of an account.
+
+    Parameters:
+    - **account_id**: UUID of the account
+    - **limit**: Maximum number of batches (1-500, default: 50)
+    """
+    try:
+        batches = await run_in_threadpool(_list_batches, account_id, limit)
+        return ImportBatchListResponse(
+            items=[ImportBatchResponse.model_validate(b) for b in batches]
+        )
+    except Exception as e:
+        logger.error(f"Import batch listing error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to list import batches",
+        )
+
+
+@router.delete(
+    "/import/batches/{batch_id}",
+    response_model=UndoImportResponse,
+    summary="Undo an import",
+    description="Delete an import batch and every transaction it created",
+    responses={404: {"description": "Import batch not found"}},
+)
+async def undo_import(batch_id: UUID) -> UndoImportResponse:
+    """
+    Undo an import: its transactions are removed in one bulk delete.
+
+    Parameters:
+    - **batch_id**: UUID of the batch (batch_id of the import response)
+    """
+    try:
+        deleted = await run_in_threadpool(_undo_import, batch_id)
+        return UndoImportResponse(batch_id=batch_id, deleted_count=deleted)
+    except LookupError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Import batch {batch_id} not found",
+        )
+    except Exception as e:
+        logger.error(f"Undo import error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to undo import",
+        )
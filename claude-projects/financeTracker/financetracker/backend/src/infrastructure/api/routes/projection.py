@@ -9,10 +9,12 @@ from typing import Optional
 import logging
 
 from fastapi import APIRouter, HTTPException, status, Query
+from fastapi.concurrency import run_in_threadpool
 
 from src.application.queries.get_projection import GetProjectionQuery
 from src.domain.value_objects.scenario import Scenario
 from src.infrastructure.api.dependencies import get_projection_handler
+from src.infrastructure.persistence.unit_of_work import UnitOfWork
 from src.infrastructure.api.schemas.projection import ProjectionResponse
 
 logger = logging.getLogger(__name__)
@@ -20,6 +22,12 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["projection"])
 
 
+def _handle_projection(query: GetProjectionQuery):
+    """Run the projection in one unit of work, closed afterwards (worker thread)."""
+    with UnitOfWork() as uow:
+        return get_projection_handler(uow).handle(query)
+
+
 @router.get(
     "/projection",
     response_model=ProjectionResponse,
@@ -63,8 +71,8 @@ async def get_projection(
 
         # Create and execute query
         query = GetProjectionQuery(months=months, scenario=scenario_enum)
-        handler = get_projection_handler()
-        result = handler.handle(query)
+        # CPU-bound projection + synchronous reads: keep them off the event loop
+        result = await run_in_threadpool(_handle_projection, query)
 
         logger.info(
             f"Projection calculated: months={months}, scenario={scenario}, "
@@ -1,26 +1,32 @@
 """
 Transaction API Routes
 
-Handles transaction listing, retrieval, and updates.
+Handles transaction listing, search, export, retrieval, and updates.
 """
 from __future__ import annotations
 
 from datetime import date
+from decimal import Decimal
 from uuid import UUID
-from typing import Optional
+from typing import AsyncIterator, List, Optional
 import logging
 
 from fastapi import APIRouter, HTTPException, status, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.dto.transaction_row import TransactionRow
 from src.domain.value_objects.date_range import DateRange
-from src.infrastructure.persistence.database import get_session_local
-from src.infrastructure.persistence.repositories.sqlite_transaction_repository import (
-    SQLiteTransactionRepository,
+from src.domain.value_objects.transaction_query import TransactionQuery
+from src.infrastructure.api.export import ExportFormat, encode
+from src.infrastructure.persistence.async_database import get_async_database, get_async_session
+from src.infrastructure.persistence.repositories.async_sqlite_transaction_repository import (
+    AsyncSQLiteTransactionRepository,
 )
 from src.infrastructure.api.schemas.transaction import (
     TransactionResponse,
     TransactionListResponse,
+    TransactionSearchResponse,
     TransactionUpdateRequest,
 )
 
@@ -28,106 +34,168 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["transactions"], prefix="/transactions")
 
+# Lignes lues par aller-retour au curseur pendant un export
+EXPORT_BATCH_SIZE = 2000
+
+
+def _to_response(transaction) -> TransactionResponse:
+    """Convertit une entité Transaction en schéma de réponse."""
+    return TransactionResponse(
+        id=transaction.id,
+        account_id=transaction.account_id,
+        date=transaction.date,
+        value_date=transaction.value_date,
+        amount=str(transaction.amount.amount),
+        currency=transaction.amount.currency,
+        description=transaction.description,
+        category_id=transaction.category_id,
+        category_confidence=transaction.category_confidence,
+        is_recurring=transaction.is_recurring,
+        recurring_id=transaction.recurring_id,
+        tags=transaction.tags,
+        notes=transaction.notes,
+        import_hash=transaction.import_hash,
+        created_at=transaction.created_at,
+        updated_at=transaction.updated_at,
+    )
+
+
+def _encode_cursor(transaction) -> str:
+    """Encode le curseur keyset (date, id) d'une transaction."""
+    return f"{transaction.date.isoformat()}_{transaction.id}"
+
+
+def _decode_cursor(cursor: str) -> tuple[date, UUID]:
+    """
+    Décode un curseur keyset produit par _encode_cursor.
+
+    Raises:
+        HTTPException: 400 si le curseur est invalide
+    """
+    try:
+        date_part, id_part = cursor.split("_", 1)
+        return date.fromisoformat(date_part), UUID(id_part)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid cursor: {cursor}",
+        )
+
+
+def transaction_filters(
+    account_id: Optional[List[UUID]] = Query(None, description="Filter by account ID (repeatable)"),
+    date_from: Optional[date] = Query(None, description="Filter from date (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="Filter to date (YYYY-MM-DD)"),
+    category_id: Optional[List[UUID]] = Query(None, description="Filter by category ID (repeatable)"),
+    include_subcategories: bool = Query(True, description="Include descendants of category_id"),
+    amount_min: Optional[Decimal] = Query(None, description="Minimum signed amount"),
+    amount_max: Optional[Decimal] = Query(None, description="Maximum signed amount"),
+    q: Optional[str] = Query(None, max_length=100, description="Words in description or notes (prefix match)"),
+    tag: Optional[List[str]] = Query(None, description="Required tag (repeatable)"),
+    uncategorized: bool = Query(False, description="Only transactions without category"),
+    min_confidence: Optional[float] = Query(None, ge=0.0, le=1.0, description="Minimum category confidence"),
+) -> TransactionQuery:
+    """
+    Filtres communs à la liste et à l'export (dépendance FastAPI).
+
+    Raises:
+        HTTPException: 400 si la combinaison de filtres est invalide
+    """
+    try:
+        if date_from and date_to:
+            date_range = DateRange(date_from, date_to)
+        elif date_from:
+            date_range = DateRange(date_from, date.today())
+        elif date_to:
+            # Assume one year back if only date_to is provided
+            one_year_ago = date_to.replace(year=date_to.year - 1)
+            date_range = DateRange(one_year_ago, date_to)
+        else:
+            date_range = None
+
+        return TransactionQuery(
+            account_ids=account_id or (),
+            category_ids=category_id or (),
+            include_subcategories=include_subcategories,
+            date_range=date_range,
+            min_amount=amount_min,
+            max_amount=amount_max,
+            text=q,
+            tags=tag or (),
+            uncategorized=uncategorized,
+            min_confidence=min_confidence,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
 
 @router.get(
     "",
     response_model=TransactionListResponse,
     summary="List transactions",
-    description="Get paginated list of transactions with optional filters",
+    description="Get paginated list of transactions with combinable filters",
 )
 async def list_transactions(
-    account_id: Optional[UUID] = Query(None, description="Filter by account ID"),
-    date_from: Optional[date] = Query(None, description="Filter from date (YYYY-MM-DD)"),
-    date_to: Optional[date] = Query(None, description="Filter to date (YYYY-MM-DD)"),
-    category_id: Optional[UUID] = Query(None, description="Filter by category ID"),
+    query: TransactionQuery = Depends(transaction_filters),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     size: int = Query(100, ge=1, le=500, description="Page size (max 500)"),
-    session: Session = Depends(get_session_local),
-) -> TransactionListResponse:
+    after: Optional[str] = Query(
+        None, description="Keyset cursor from a previous next_cursor (overrides page)"
+    ),
+    include_total: bool = Query(True, description="Compute the filtered total count"),
+    session: AsyncSession = Depends(get_async_session),
+) -> JSONResponse:
     """
     Get paginated list of transactions.
 
+    All filters are optional and combined with AND into a single SQL query.
+
     Parameters:
-    - **account_id**: Filter by account (optional)
+    - **account_id**: Filter by account(s) (optional, repeatable)
     - **date_from**: Filter transactions from this date (optional)
     - **date_to**: Filter transactions to this date (optional)
-    - **category_id**: Filter by category (optional)
+    - **category_id**: Filter by category(ies) (optional, repeatable)
+    - **include_subcategories**: Also match descendants of category_id (default: true)
+    - **amount_min** / **amount_max**: Signed amount bounds (optional)
+    - **q**: Full-text search in description and notes (optional)
+    - **tag**: Required tag(s) (optional, repeatable)
+    - **uncategorized**: Only transactions without category (default: false)
+    - **min_confidence**: Minimum categorization confidence (optional)
     - **page**: Page number for pagination (default: 1)
     - **size**: Number of items per page (default: 100, max: 500)
+    - **after**: Keyset cursor returned as next_cursor; constant-cost deep paging
+    - **include_total**: Skip the COUNT query when false (total/pages are null)
 
     Returns:
     - Paginated list of transactions with metadata
     """
-    try:
-        repo = SQLiteTransactionRepository(session)
+    cursor = _decode_cursor(after) if after else None
+    offset = 0 if cursor else (page - 1) * size
 
-        # Build filters
-        if date_from and date_to:
-            date_range = DateRange(date_from, date_to)
-        elif date_from:
-            date_range = DateRange(date_from, date.today())
-        elif date_to:
-            # Assume one year back if only date_to is provided
-            import datetime
-            one_year_ago = date_to.replace(year=date_to.year - 1)
-            date_range = DateRange(one_year_ago, date_to)
-        else:
-            date_range = None
+    try:
+        repo = AsyncSQLiteTransactionRepository(session)
 
-        # Fetch transactions based on filters
-        if account_id:
-            offset = (page - 1) * size
-            transactions = repo.find_by_account(
-                account_id=account_id,
-                date_range=date_range,
-                limit=size,
-                offset=offset,
-            )
-            # Count for pagination
-            total = repo.count_by_account(account_id)
-        elif category_id:
-            transactions = repo.find_by_category(
-                category_id=category_id,
-                date_range=date_range,
-            )
-            total = len(transactions)
-        elif date_range:
-            transactions = repo.find_by_date_range(date_range)
-            total = len(transactions)
-        else:
-            # Return empty if no filters
-            transactions = []
-            total = 0
+        # One filtered SELECT (+ optional COUNT) whatever the filter combination.
+        # Read-model rows skip ORM/entity hydration and response re-validation.
+        rows = await repo.find_rows(query, limit=size, offset=offset, after=cursor)
+        total = await repo.count(query) if include_total else None
 
         # Calculate pagination
-        pages = (total + size - 1) // size
-
-        return TransactionListResponse(
-            items=[
-                TransactionResponse(
-                    id=tx.id,
-                    account_id=tx.account_id,
-                    date=tx.date,
-                    value_date=tx.value_date,
-                    amount=str(tx.amount.amount),
-                    currency=tx.amount.currency,
-                    description=tx.description,
-                    category_id=tx.category_id,
-                    category_confidence=tx.category_confidence,
-                    is_recurring=tx.is_recurring,
-                    recurring_id=tx.recurring_id,
-                    tags=tx.tags,
-                    notes=tx.notes,
-                    import_hash=tx.import_hash,
-                    created_at=tx.created_at,
-                    updated_at=tx.updated_at,
-                )
-                for tx in transactions
-            ],
-            total=total,
-            page=page,
-            size=size,
-            pages=pages,
+        pages = (total + size - 1) // size if total is not None else None
+        next_cursor = _encode_cursor(rows[-1]) if len(rows) == size else None
+
+        return JSONResponse(
+            content={
+                "items": [row.to_dict() for row in rows],
+                "total": total,
+                "page": page,
+                "size": size,
+                "pages": pages,
+                "next_cursor": next_cursor,
+            }
         )
 
     except Exception as e:
@@ -138,6 +206,132 @@ async def list_transactions(
         )
 
 
+@router.get(
+    "/search",
+    response_model=TransactionSearchResponse,
+    summary="Full-text search",
+    description="Ranked full-text search over descriptions and notes",
+)
+async def search_transactions(
+    q: str = Query(..., min_length=1, max_length=100, description="Search terms"),
+    account_id: Optional[List[UUID]] = Query(None, description="Filter by account ID (repeatable)"),
+    category_id: Optional[List[UUID]] = Query(None, description="Filter by category ID (repeatable)"),
+    date_from: Optional[date] = Query(None, description="Filter from date (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="Filter to date (YYYY-MM-DD)"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+    session: AsyncSession = Depends(get_async_session),
+) -> TransactionSearchResponse:
+    """
+    Search transactions by words in their description or notes.
+
+    Every word must match (prefix match, case and accent insensitive).
+    Results are ranked by relevance, then by date.
+
+    Parameters:
+    - **q**: Search terms, e.g. "amazon" or "sncf paris"
+    - **account_id** / **category_id**: Optional filters (repeatable)
+    - **date_from** / **date_to**: Optional date bounds
+    - **limit**: Maximum number of results (default: 20, max: 100)
+
+    Returns:
+    - Matching transactions, most relevant first
+    """
+    try:
+        date_range = None
+        if date_from or date_to:
+            date_range = DateRange(date_from or date.min, date_to or date.today())
+        filters = TransactionQuery(
+            account_ids=account_id or (),
+            category_ids=category_id or (),
+            date_range=date_range,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    try:
+        repo = AsyncSQLiteTransactionRepository(session)
+        transactions = await repo.search(q, filters=filters, limit=limit)
+
+        return TransactionSearchResponse(
+            items=[_to_response(tx) for tx in transactions],
+            query=q,
+        )
+
+    except Exception as e:
+        logger.error(f"Error searching transactions: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to search transactions",
+        )
+
+
+@router.get(
+    "/export",
+    summary="Export transactions",
+    description="Stream every filtered transaction as CSV, NDJSON or Parquet",
+    response_class=StreamingResponse,
+)
+async def export_transactions(
+    format: str = Query("csv", description="csv, ndjson or parquet"),
+    query: TransactionQuery = Depends(transaction_filters),
+) -> StreamingResponse:
+    """
+    Export all transactions matching the filters, oldest first.
+
+    Rows are read from a server-side cursor in batches and written to the
+    response as they come: memory stays constant whatever the row count.
+    Accepts the same filters as GET /transactions, without pagination.
+
+    Parameters:
+    - **format**: csv (default), ndjson or parquet (requires pyarrow)
+    - Same filters as GET /transactions (account_id, date_from, q, tag...)
+
+    Returns:
+    - File download (Content-Disposition: attachment)
+    """
+    try:
+        export_format = ExportFormat(format)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid format. Must be one of: {', '.join(f.value for f in ExportFormat)}",
+        )
+    if not export_format.available:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail=f"{export_format.value} export requires pyarrow (pip install pyarrow)",
+        )
+
+    return StreamingResponse(
+        encode(export_format, _export_batches(query)),
+        media_type=export_format.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="transactions.{export_format.value}"'
+        },
+    )
+
+
+async def _export_batches(query: TransactionQuery) -> AsyncIterator[List[TransactionRow]]:
+    """
+    Paquets de lignes à exporter, dans une session dédiée.
+
+    La session de la requête est fermée avant la fin du streaming: l'export
+    ouvre la sienne pour toute la durée de la réponse.
+    """
+    try:
+        async with get_async_database().get_session_context() as session:
+            repo = AsyncSQLiteTransactionRepository(session)
+            async for batch in repo.stream_rows(query, batch_size=EXPORT_BATCH_SIZE):
+                yield batch
+    except Exception as e:
+        # Statut déjà envoyé: la réponse est interrompue
+        logger.error(f"Error exporting transactions: {e}")
+        raise
+
+
 @router.get(
     "/{transaction_id}",
     response_model=TransactionResponse,
@@ -145,7 +339,7 @@ async def list_transactions(
 )
 async def get_transaction(
     transaction_id: UUID,
-    session: Session = Depends(get_session_local),
+    session: AsyncSession = Depends(get_async_session),
 ) -> TransactionResponse:
     """
     Get a single transaction by its ID.
@@ -157,8 +351,8 @@ async def get_transaction(
     - Transaction details
     """
     try:
-        repo = SQLiteTransactionRepository(session)
-        transaction = repo.get_by_id(transaction_id)
+        repo = AsyncSQLiteTransactionRepository(session)
+        transaction = await repo.get_by_id(transaction_id)
 
         if not transaction:
             raise HTTPException(
@@ -166,24 +360,7 @@ async def get_transaction(
                 detail=f"Transaction {transaction_id} not found",
             )
 
-        return TransactionResponse(
-            id=transaction.id,
-            account_id=transaction.account_id,
-            date=transaction.date,
-            value_date=transaction.value_date,
-            amount=str(transaction.amount.amount),
-            currency=transaction.amount.currency,
-            description=transaction.description,
-            category_id=transaction.category_id,
-            category_confidence=transaction.category_confidence,
-            is_recurring=transaction.is_recurring,
-            recurring_id=transaction.recurring_id,
-            tags=transaction.tags,
-            notes=transaction.notes,
-            import_hash=transaction.import_hash,
-            created_at=transaction.created_at,
-            updated_at=transaction.updated_at,
-        )
+        return _to_response(transaction)
 
     except HTTPException:
         raise
@@ -203,7 +380,7 @@ async def get_transaction(
 async def update_transaction_category(
     transaction_id: UUID,
     request: TransactionUpdateRequest,
-    session: Session = Depends(get_session_local),
+    session: AsyncSession = Depends(get_async_session),
 ) -> TransactionResponse:
     """
     Update transaction category assignment.
@@ -217,8 +394,8 @@ async def update_transaction_category(
     - Updated transaction
     """
     try:
-        repo = SQLiteTransactionRepository(session)
-        transaction = repo.get_by_id(transaction_id)
+        repo = AsyncSQLiteTransactionRepository(session)
+        transaction = await repo.get_by_id(transaction_id)
 
         if not transaction:
             raise HTTPException(
@@ -235,26 +412,9 @@ async def update_transaction_category(
             transaction.tags = request.tags
 
         # Save changes
-        repo.save(transaction)
-
-        return TransactionResponse(
-            id=transaction.id,
-            account_id=transaction.account_id,
-            date=transaction.date,
-            value_date=transaction.value_date,
-            amount=str(transaction.amount.amount),
-            currency=transaction.amount.currency,
-            description=transaction.description,
-            category_id=transaction.category_id,
-            category_confidence=transaction.category_confidence,
-            is_recurring=transaction.is_recurring,
-            recurring_id=transaction.recurring_id,
-            tags=transaction.tags,
-            notes=transaction.notes,
-            import_hash=transaction.import_hash,
-            created_at=transaction.created_at,
-            updated_at=transaction.updated_at,
-        )
+        await repo.save(transaction)
+
+        return _to_response(transaction)
 
     except HTTPException:
         raise
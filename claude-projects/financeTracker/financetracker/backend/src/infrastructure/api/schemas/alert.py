@@ -0,0 +1,39 @@
+"""
+Pydantic Schemas for Alert Responses
+"""
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class AlertResponse(BaseModel):
+    """Stored alert event."""
+
+    id: UUID
+    alert_type: str = Field(description="balance_below_threshold or category_over_budget")
+    trigger_date: date = Field(description="Projected breach date, or first day of the month for budgets")
+    amount: str = Field(description="Projected balance, or month spend for budgets")
+    threshold: str = Field(description="Balance threshold, or monthly budget")
+    account_id: Optional[UUID] = None
+    category_id: Optional[UUID] = None
+    message: str
+    created_at: datetime
+
+
+class AlertListResponse(BaseModel):
+    """Latest alert events, most recent first."""
+
+    items: list[AlertResponse]
+
+
+class AlertEvaluationResponse(BaseModel):
+    """Outcome of an alert re-evaluation."""
+
+    new_alerts: list[AlertResponse]
+    reprojected: int = Field(description="Accounts whose projection was recomputed")
+    rebased: int = Field(description="Accounts re-evaluated from their cached projection")
+    unchanged: int = Field(description="Accounts with no change since the last evaluation")
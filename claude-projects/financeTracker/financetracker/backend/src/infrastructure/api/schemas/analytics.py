@@ -0,0 +1,37 @@
+"""
+Pydantic Schemas for Analytics Responses
+"""
+from __future__ import annotations
+
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class MonthlyTotalResponse(BaseModel):
+    """Total of one category for one month."""
+
+    month: str = Field(description="Month (YYYY-MM)")
+    total: str = Field(description="Signed sum as string to preserve precision")
+    count: int
+
+
+class CategorySpendingResponse(BaseModel):
+    """Spending of one category over the requested period."""
+
+    category_id: Optional[UUID] = Field(None, description="null for uncategorized transactions")
+    name: Optional[str] = None
+    parent_id: Optional[UUID] = None
+    total: str = Field(description="Signed sum as string to preserve precision")
+    count: int
+    months: list[MonthlyTotalResponse]
+
+
+class SpendingResponse(BaseModel):
+    """Monthly spending by category."""
+
+    start_month: str
+    end_month: str
+    rollup: bool = Field(description="Subcategory totals are included in their ancestors")
+    categories: list[CategorySpendingResponse]
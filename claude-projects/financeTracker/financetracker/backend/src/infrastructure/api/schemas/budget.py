@@ -0,0 +1,35 @@
+"""
+Pydantic Schemas for Budget Responses
+"""
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class BudgetStatusResponse(BaseModel):
+    """Budget-vs-actual status of one budgeted category."""
+
+    category_id: UUID
+    name: str
+    budget: str = Field(description="Monthly budget as string to preserve precision")
+    spent: str = Field(description="Net month-to-date spend, subcategories included")
+    remaining: str = Field(description="Budget left (negative when exceeded)")
+    consumption: float = Field(description="Share of the budget spent (1.0 = 100%)")
+    burn_rate: str = Field(description="Average spend per elapsed day")
+    projected_spend: str = Field(description="Projected end-of-month spend")
+    projected_overshoot: str = Field(description="Projected overshoot (0 when within budget)")
+    is_over_budget: bool
+    is_projected_over: bool
+
+
+class BudgetReportResponse(BaseModel):
+    """Status of every budgeted category for the month."""
+
+    month: str = Field(description="Month (YYYY-MM)")
+    as_of: str = Field(description="Evaluation day (ISO format)")
+    days_elapsed: int
+    days_in_month: int
+    scenario: str
+    categories: list[BudgetStatusResponse]
@@ -3,6 +3,7 @@ Pydantic Schemas for Import Request/Response
 """
 from __future__ import annotations
 
+from datetime import date, datetime
 from uuid import UUID
 from typing import Optional
 from pydantic import BaseModel, Field
@@ -20,6 +21,41 @@ class ImportResultResponse(BaseModel):
     success_rate: float
     categorization_rate: float
     errors: list[str] = []
+    batch_id: Optional[UUID] = Field(None, description="Import batch, usable to undo the import")
+    already_imported: bool = Field(False, description="Same file already imported into this account")
 
     class Config:
         from_attributes = True
+
+
+class ImportBatchResponse(BaseModel):
+    """Recorded import of one statement file."""
+
+    id: UUID
+    account_id: UUID
+    file_digest: str = Field(description="SHA-256 of the file content")
+    file_name: str
+    adapter: str
+    row_count: int = Field(description="Transactions read from the file")
+    imported_count: int
+    skipped_count: int
+    error_count: int
+    first_date: Optional[date] = None
+    last_date: Optional[date] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ImportBatchListResponse(BaseModel):
+    """Latest import batches, most recent first."""
+
+    items: list[ImportBatchResponse]
+
+
+class UndoImportResponse(BaseModel):
+    """Outcome of an import undo."""
+
+    batch_id: UUID
+    deleted_count: int = Field(description="Transactions removed with the batch")
@@ -18,7 +18,7 @@ class TransactionResponse(BaseModel):
     id: UUID
     account_id: UUID
     date: date
-    value_date: date
+    value_date: Optional[date] = None
     amount: str = Field(description="Amount as string to preserve precision")
     currency: str
     description: str
@@ -64,17 +64,27 @@ class TransactionListResponse(BaseModel):
     """Paginated list of transactions."""
 
     items: list[TransactionResponse]
-    total: int
+    total: Optional[int] = Field(None, description="Filtered count (null if include_total=false)")
     page: int
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = Field(
+        None, description="Keyset cursor for the next page (pass as `after`)"
+    )
 
     @property
     def has_next(self) -> bool:
         """Check if there are more pages."""
-        return page < pages
+        return self.next_cursor is not None
 
     @property
     def has_previous(self) -> bool:
         """Check if there are previous pages."""
-        return page > 1
+        return self.page > 1
+
+
+class TransactionSearchResponse(BaseModel):
+    """Ranked full-text search results."""
+
+    items: list[TransactionResponse]
+    query: str
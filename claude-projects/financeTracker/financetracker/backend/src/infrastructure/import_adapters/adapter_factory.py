@@ -5,18 +5,59 @@ Registry and factory for all import adapters.
 
 Provides a simple way to get the right adapter for a file
 without needing to know about specific implementations.
+
+Selection is indexed: adapters publish a CSV header signature or magic
+bytes, and the factory reads the head of the file once and looks it up.
+Probing every adapter with can_parse() is only the fallback.
 """
 from __future__ import annotations
 
+import csv
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterable, Optional
 
-from src.infrastructure.import_adapters.base_adapter import ImportAdapter, UnsupportedFileFormat
+from src.infrastructure.import_adapters.bank_profile import (
+    BankProfile,
+    load_profiles,
+    normalize_header,
+    peek,
+)
+from src.infrastructure.import_adapters.base_adapter import (
+    HeaderSignature,
+    ImportAdapter,
+    UnsupportedFileFormat,
+)
+from src.infrastructure.import_adapters.csv_profile_adapter import ProfileCSVAdapter
 from src.infrastructure.import_adapters.lcl_csv_adapter import LCLCSVAdapter
+from src.infrastructure.import_adapters.ofx_adapter import OFXAdapter
+from src.infrastructure.import_adapters.profiles import BOURSORAMA_PROFILE
+from src.infrastructure.import_adapters.qif_adapter import QIFAdapter
 
 logger = logging.getLogger(__name__)
 
+# Octets lus pour la sélection (première ligne CSV, en-tête OFX/QIF)
+HEAD_SIZE = 4096
+_BOM = b"\xef\xbb\xbf"
+
+
+def _strip_preamble(head: bytes) -> bytes:
+    """Début significatif: sans BOM, blancs ni déclaration <?xml ...?>."""
+    head = head.lstrip().removeprefix(_BOM).lstrip()
+    if head[:5].lower() == b"<?xml":
+        end = head.find(b"?>")
+        head = head[end + 2:].lstrip() if end >= 0 else b""
+    return head
+
+
+def _first_line(head: bytes) -> str:
+    """Première ligne décodée (UTF-8, sinon CP1252)."""
+    line = head.removeprefix(_BOM).split(b"\n", 1)[0].rstrip(b"\r")
+    try:
+        return line.decode("utf-8")
+    except UnicodeDecodeError:
+        return line.decode("cp1252", errors="replace")
+
 
 class AdapterFactory:
     """
@@ -31,21 +72,37 @@ class AdapterFactory:
         "LCL CSV"
     """
 
-    def __init__(self):
-        """Initialize adapter registry."""
-        self._adapters: list[ImportAdapter] = [
+    def __init__(self, profiles: Iterable[BankProfile] = ()):
+        """
+        Initialize adapter registry.
+
+        Args:
+            profiles: Profils CSV supplémentaires (cf. bank_profile)
+        """
+        self._adapters: list[ImportAdapter] = []
+        # Index de sélection, alimentés par register_adapter
+        self._by_header: dict[HeaderSignature, ImportAdapter] = {}
+        self._by_magic: dict[bytes, ImportAdapter] = {}
+        self._magic_lengths: list[int] = []
+        self._delimiters: list[str] = []
+
+        for adapter in (
             LCLCSVAdapter(),
-            # Additional adapters can be registered here
-            # OFXAdapter(),
-            # BoursoramaCSVAdapter(),
-        ]
+            ProfileCSVAdapter(BOURSORAMA_PROFILE),
+            OFXAdapter(),
+            QIFAdapter(),
+        ):
+            self.register_adapter(adapter)
+        for profile in profiles:
+            self.register_profile(profile)
 
     def get_adapter(self, file_path: Path) -> ImportAdapter:
         """
         Obtient un adaptateur capable de parser le fichier.
 
-        Itère sur les adapters enregistrés et retourne le premier
-        qui peut parser le fichier.
+        Lit le début du fichier une fois et cherche sa signature dans
+        l'index; sinon itère sur les adapters enregistrés et retourne le
+        premier qui peut parser le fichier.
 
         Args:
             file_path: Chemin du fichier
@@ -65,7 +122,18 @@ class AdapterFactory:
         if not file_path.exists():
             raise UnsupportedFileFormat(f"File not found: {file_path}")
 
-        # Itérer sur les adapters
+        try:
+            with open(file_path, "rb") as f:
+                head = f.read(HEAD_SIZE)
+        except OSError as e:
+            logger.debug(f"Cannot read head of {file_path.name}: {e}")
+            head = b""
+
+        adapter = self._select(head, file_path.name)
+        if adapter is not None:
+            return adapter
+
+        # Repli: interroger chaque adapter
         for adapter in self._adapters:
             try:
                 if adapter.can_parse(file_path):
@@ -81,6 +149,31 @@ class AdapterFactory:
             f"Supported formats: {self._get_supported_formats()}"
         )
 
+    def get_adapter_for_stream(self, stream: BinaryIO, name: str) -> ImportAdapter:
+        """
+        Obtient l'adaptateur d'un flux binaire (ex: upload), sans le consommer.
+
+        Seul l'index de signatures est consulté: un adapter sans signature
+        n'est sélectionnable que depuis un chemin (get_adapter).
+
+        Args:
+            stream: Flux binaire positionnable
+            name: Nom du fichier d'origine (extension)
+
+        Returns:
+            ImportAdapter dont la signature correspond au contenu
+
+        Raises:
+            UnsupportedFileFormat: Si aucune signature ne correspond
+        """
+        adapter = self._select(peek(stream, HEAD_SIZE), name)
+        if adapter is None:
+            raise UnsupportedFileFormat(
+                f"No adapter found for file: {name}\n"
+                f"Supported formats: {self._get_supported_formats()}"
+            )
+        return adapter
+
     def register_adapter(self, adapter: ImportAdapter) -> None:
         """
         Enregistre un nouvel adaptateur.
@@ -89,8 +182,18 @@ class AdapterFactory:
             adapter: ImportAdapter instance
         """
         self._adapters.append(adapter)
+        self._index(adapter)
         logger.info(f"Registered adapter: {adapter.name}")
 
+    def register_profile(self, profile: BankProfile) -> None:
+        """
+        Enregistre un format CSV décrit par un profil.
+
+        Args:
+            profile: BankProfile de la banque
+        """
+        self.register_adapter(ProfileCSVAdapter(profile))
+
     def get_adapters(self) -> list[ImportAdapter]:
         """
         Retourne tous les adaptateurs enregistrés.
@@ -100,6 +203,61 @@ class AdapterFactory:
         """
         return self._adapters.copy()
 
+    # === Index de sélection ===
+
+    def _index(self, adapter: ImportAdapter) -> None:
+        """Ajoute les signatures de l'adapter (le premier enregistré l'emporte)."""
+        for magic in adapter.magic_bytes:
+            self._claim(self._by_magic, magic, adapter)
+            if len(magic) not in self._magic_lengths:
+                self._magic_lengths.append(len(magic))
+
+        signature = adapter.header_signature
+        if signature is not None:
+            self._claim(self._by_header, signature, adapter)
+            if signature[0] not in self._delimiters:
+                self._delimiters.append(signature[0])
+
+    @staticmethod
+    def _claim(index: dict, key, adapter: ImportAdapter) -> None:
+        owner = index.setdefault(key, adapter)
+        if owner is not adapter:
+            logger.warning(
+                f"Adapter {adapter.name} shares signature {key!r} with {owner.name}; "
+                f"{owner.name} is selected first"
+            )
+
+    def _select(self, head: bytes, name: str) -> Optional[ImportAdapter]:
+        """Adapter indexé pour ce contenu, si l'extension du fichier lui convient."""
+        adapter = self._lookup(head)
+        if adapter is not None and Path(name).suffix.lower() in adapter.supported_extensions:
+            logger.debug(f"Using adapter {adapter.name} for {name} (signature)")
+            return adapter
+        return None
+
+    def _lookup(self, head: bytes) -> Optional[ImportAdapter]:
+        """
+        Adapter dont la signature correspond au début du fichier.
+
+        Une recherche par longueur de préfixe magique et par délimiteur
+        connus, quel que soit le nombre d'adapters enregistrés.
+        """
+        start = _strip_preamble(head).upper()
+        for length in self._magic_lengths:
+            adapter = self._by_magic.get(start[:length])
+            if adapter is not None:
+                return adapter
+
+        if not self._by_header:
+            return None
+        line = _first_line(head)
+        for delimiter in self._delimiters:
+            cells = next(csv.reader([line], delimiter=delimiter), [])
+            adapter = self._by_header.get((delimiter, normalize_header(cells)))
+            if adapter is not None:
+                return adapter
+        return None
+
     def _get_supported_formats(self) -> str:
         """
         Retourne une description des formats supportés.
@@ -113,3 +271,14 @@ class AdapterFactory:
             formats.append(f"{adapter.name} ({ext_list})")
 
         return ", ".join(formats)
+
+
+def create_adapter_factory(profiles_path: str = "") -> AdapterFactory:
+    """
+    Factory avec les adapters intégrés et les profils d'un fichier JSON.
+
+    Args:
+        profiles_path: Fichier de profils (IMPORT_PROFILES_PATH), ignoré si vide
+    """
+    profiles = load_profiles(Path(profiles_path)) if profiles_path else []
+    return AdapterFactory(profiles)
@@ -0,0 +1,341 @@
+"""
+Bank Profiles: declarative CSV formats
+
+A BankProfile describes a bank export as data (delimiter, header
+signature, date format, amount columns, sign convention, encodings).
+compile() turns it into a row parser specialized once for the profile:
+column indices resolved, decimal normalization as a str.translate table,
+date parsing by slicing for the common numeric formats.
+
+The low-level helpers (dates, decimals, encoding sniffing) are shared by
+every adapter, CSV or not.
+
+Examples:
+    >>> profile = BankProfile(
+    ...     name="Ma Banque CSV",
+    ...     headers=("Date", "Libellé", "Montant"),
+    ...     date_column="Date",
+    ...     description_columns=("Libellé",),
+    ...     amount_column="Montant",
+    ... )
+    >>> parse_row = profile.compile()
+    >>> parse_row(["15/01/2025", "CB CARREFOUR", "-42,50"])
+    (datetime.date(2025, 1, 15), Decimal('-42.50'), 'CB CARREFOUR', None)
+"""
+from __future__ import annotations
+
+import codecs
+import json
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Ligne parsée: (date, montant signé, libellé, date de valeur)
+ParsedRow = tuple[date, Decimal, str, Optional[date]]
+RowParser = Callable[[Sequence[str]], Optional[ParsedRow]]
+
+SNIFF_SIZE = 64 * 1024
+_BOM = codecs.BOM_UTF8
+# Séparateurs de milliers typographiques (espace insécable, fine insécable)
+_SPACES = {"\u00a0": None, "\u202f": None}
+
+
+class SignConvention(str, Enum):
+    """Convention de signe des montants d'un export."""
+
+    SIGNED = "signed"              # Une colonne, dépenses négatives
+    INVERTED = "inverted"          # Une colonne, dépenses positives (relevés de carte)
+    DEBIT_CREDIT = "debit_credit"  # Deux colonnes, débit = dépense
+
+
+# === Helpers partagés ===
+
+def normalize_header(cells: Iterable[str]) -> tuple[str, ...]:
+    """En-tête comparable: sans BOM, espaces ni casse."""
+    return tuple(cell.strip().lstrip("\ufeff").strip().casefold() for cell in cells)
+
+
+def date_parser(date_format: str) -> Callable[[str], date]:
+    """
+    Parser de dates pour un format strptime.
+
+    ISO et jour/mois/année numériques (séparateur /, - ou .) sont lus par
+    découpage; toute autre forme passe par strptime.
+
+    Raises (parser):
+        ValueError: Si la date ne respecte pas le format
+    """
+    def slow(value: str) -> date:
+        return datetime.strptime(value, date_format).date()
+
+    if date_format == "%Y-%m-%d":
+        def parse(value: str) -> date:
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                return slow(value)
+        return parse
+
+    if date_format in ("%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y"):
+        separator = date_format[2]
+
+        def parse(value: str) -> date:
+            if len(value) == 10 and value[2] == separator and value[5] == separator:
+                try:
+                    return date(int(value[6:]), int(value[3:5]), int(value[:2]))
+                except ValueError:
+                    pass
+            return slow(value)
+        return parse
+
+    return slow
+
+
+def decimal_parser(decimal_separator: str = ",", thousands_separator: str = " ") -> Callable[[str], Decimal]:
+    """
+    Parser de montants pour une notation fixe ("1 234,56" ou "1,234.56").
+
+    Raises (parser):
+        ValueError: Si la valeur est vide ou n'est pas un nombre fini
+    """
+    mapping = dict(_SPACES)
+    if thousands_separator:
+        mapping[thousands_separator] = None
+    if decimal_separator != ".":
+        mapping[decimal_separator] = "."
+    table = str.maketrans(mapping)
+
+    def parse(value: str) -> Decimal:
+        value = value.strip()
+        if not value:
+            raise ValueError("Empty value")
+        try:
+            amount = Decimal(value.translate(table))
+        except InvalidOperation as e:
+            raise ValueError(f"Cannot parse decimal '{value}': {e}")
+        if not amount.is_finite():
+            raise ValueError(f"Cannot parse decimal '{value}': not a finite number")
+        return amount
+
+    return parse
+
+
+_comma_decimal = decimal_parser(",", " ")
+_dot_decimal = decimal_parser(".", ",")
+
+
+def parse_flexible_decimal(value: str) -> Decimal:
+    """
+    Montant en notation inconnue (OFX, QIF): le dernier séparateur est décimal.
+
+    Examples:
+        >>> parse_flexible_decimal("-1,234.56"), parse_flexible_decimal("-42,50")
+        (Decimal('-1234.56'), Decimal('-42.50'))
+    """
+    if value.rfind(",") > value.rfind("."):
+        return _comma_decimal(value.replace(".", ""))
+    return _dot_decimal(value)
+
+
+def detect_encoding(file_path: Path, encodings: Sequence[str] = ("utf-8", "cp1252")) -> Optional[str]:
+    """
+    Encodage d'un fichier texte (cf. sniff_encoding).
+
+    Returns:
+        Nom de l'encodage, ou None si le fichier est illisible
+    """
+    try:
+        with open(file_path, "rb") as f:
+            raw = f.read(SNIFF_SIZE)
+    except OSError as e:
+        logger.error(f"Error detecting encoding: {e}")
+        return None
+    return sniff_encoding(raw, encodings)
+
+
+def sniff_encoding(raw: bytes, encodings: Sequence[str] = ("utf-8", "cp1252")) -> str:
+    """
+    Encodage d'un début de contenu (fichier ou flux).
+
+    Essaie d'abord les encodages attendus (décodage strict); chardet n'est
+    importé et consulté que si aucun ne convient.
+    """
+    if raw.startswith(_BOM):
+        return "utf-8-sig"
+    for encoding in encodings:
+        try:
+            # Décodeur incrémental: un caractère coupé en fin de bloc n'est pas une erreur
+            codecs.getincrementaldecoder(encoding)().decode(raw, final=False)
+            return encoding
+        except (UnicodeDecodeError, LookupError):
+            continue
+
+    import chardet
+
+    detected = (chardet.detect(raw).get("encoding") or "").lower()
+    return detected or "iso-8859-1"
+
+
+def peek(stream: BinaryIO, size: int = SNIFF_SIZE) -> bytes:
+    """Lit le début d'un flux binaire positionnable sans le consommer."""
+    position = stream.tell()
+    head = stream.read(size)
+    stream.seek(position)
+    return head
+
+
+# === Profil ===
+
+@dataclass(frozen=True)
+class BankProfile:
+    """
+    Format CSV d'une banque, décrit par des données.
+
+    Invariants:
+    - toutes les colonnes référencées figurent dans headers
+    - DEBIT_CREDIT: debit_column et credit_column; sinon amount_column
+
+    Attributes:
+        name: Nom affiché de l'adaptateur (ex: "LCL CSV")
+        headers: En-tête exact de l'export (signature de détection)
+        date_column: Colonne de la date d'opération
+        description_columns: Colonnes du libellé, jointes par une espace
+        amount_column: Colonne du montant (SIGNED, INVERTED)
+        debit_column: Colonne des débits (DEBIT_CREDIT)
+        credit_column: Colonne des crédits (DEBIT_CREDIT)
+        sign: Convention de signe
+        delimiter: Séparateur de champs
+        date_format: Format strptime des dates
+        decimal_separator: Séparateur décimal des montants
+        thousands_separator: Séparateur de milliers ("" si aucun)
+        encodings: Encodages essayés avant chardet
+        value_date_column: Colonne de la date de valeur (optionnelle)
+        extensions: Extensions de fichier acceptées
+    """
+
+    name: str
+    headers: tuple[str, ...]
+    date_column: str
+    description_columns: tuple[str, ...]
+    amount_column: Optional[str] = None
+    debit_column: Optional[str] = None
+    credit_column: Optional[str] = None
+    sign: SignConvention = SignConvention.SIGNED
+    delimiter: str = ";"
+    date_format: str = "%d/%m/%Y"
+    decimal_separator: str = ","
+    thousands_separator: str = " "
+    encodings: tuple[str, ...] = ("utf-8", "cp1252")
+    value_date_column: Optional[str] = None
+    extensions: tuple[str, ...] = (".csv",)
+
+    def __post_init__(self) -> None:
+        """Validation à la création."""
+        for name in ("headers", "description_columns", "encodings", "extensions"):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
+        object.__setattr__(self, "sign", SignConvention(self.sign))
+
+        if not self.headers:
+            raise ValueError(f"Profile {self.name!r}: headers cannot be empty")
+        if not self.description_columns:
+            raise ValueError(f"Profile {self.name!r}: description_columns cannot be empty")
+        if self.sign is SignConvention.DEBIT_CREDIT:
+            if not (self.debit_column and self.credit_column):
+                raise ValueError(f"Profile {self.name!r}: debit_credit needs debit and credit columns")
+        elif not self.amount_column:
+            raise ValueError(f"Profile {self.name!r}: {self.sign.value} needs an amount column")
+
+        referenced = [
+            self.date_column, *self.description_columns, self.amount_column,
+            self.debit_column, self.credit_column, self.value_date_column,
+        ]
+        missing = [c for c in referenced if c and c not in self.headers]
+        if missing:
+            raise ValueError(f"Profile {self.name!r}: unknown columns {missing}")
+
+    @property
+    def signature(self) -> tuple[str, ...]:
+        """En-tête normalisé (cf. normalize_header)."""
+        return normalize_header(self.headers)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> BankProfile:
+        """Crée un profil depuis sa forme JSON (listes acceptées pour les tuples)."""
+        return cls(**data)
+
+    def compile(self) -> RowParser:
+        """
+        Compile le profil en parser de ligne (liste de cellules csv.reader).
+
+        Le parser retourne None pour une ligne sans date, libellé ou montant,
+        et lève ValueError pour une valeur illisible ou une ligne tronquée.
+        """
+        index = {column: i for i, column in enumerate(self.headers)}
+        width = len(self.headers)
+        date_i = index[self.date_column]
+        description_i = tuple(index[c] for c in self.description_columns)
+        value_date_i = index.get(self.value_date_column) if self.value_date_column else None
+        parse_date = date_parser(self.date_format)
+        parse_amount = decimal_parser(self.decimal_separator, self.thousands_separator)
+
+        if self.sign is SignConvention.DEBIT_CREDIT:
+            debit_i, credit_i = index[self.debit_column], index[self.credit_column]
+
+            def amount_of(row: Sequence[str]) -> Optional[Decimal]:
+                debit, credit = row[debit_i].strip(), row[credit_i].strip()
+                if debit and not credit:
+                    return -abs(parse_amount(debit))
+                if credit and not debit:
+                    return abs(parse_amount(credit))
+                if not debit:
+                    return None
+                raise ValueError("Both debit and credit specified")
+        else:
+            amount_i = index[self.amount_column]
+            inverted = self.sign is SignConvention.INVERTED
+
+            def amount_of(row: Sequence[str]) -> Optional[Decimal]:
+                value = row[amount_i].strip()
+                if not value:
+                    return None
+                amount = parse_amount(value)
+                return -amount if inverted else amount
+
+        def parse_row(row: Sequence[str]) -> Optional[ParsedRow]:
+            if len(row) < width:
+                raise ValueError(f"Expected {width} columns, got {len(row)}")
+            date_str = row[date_i].strip()
+            description = " ".join(filter(None, (row[i].strip() for i in description_i)))
+            if not date_str or not description:
+                return None
+            amount = amount_of(row)
+            if amount is None:
+                return None
+            try:
+                day = parse_date(date_str)
+                value_date = None
+                if value_date_i is not None and row[value_date_i].strip():
+                    value_date = parse_date(row[value_date_i].strip())
+            except ValueError as e:
+                raise ValueError(f"Invalid date format '{date_str}': {e}")
+            return day, amount, description, value_date
+
+        return parse_row
+
+
+def load_profiles(path: Path) -> list[BankProfile]:
+    """
+    Charge des profils depuis un fichier JSON (liste d'objets BankProfile).
+
+    Raises:
+        ValueError: Si un profil est invalide
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return [BankProfile.from_dict(item) for item in data]
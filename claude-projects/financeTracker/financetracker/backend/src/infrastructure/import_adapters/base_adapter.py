@@ -10,12 +10,17 @@ Architecture Hexagonal:
 """
 from __future__ import annotations
 
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 from uuid import UUID
 
-from src.domain.entities.transaction import Transaction
+from src.domain.entities.transaction import ImportKey, Transaction
+
+# Signature d'en-tête CSV: (délimiteur, en-tête normalisé)
+HeaderSignature = tuple[str, tuple[str, ...]]
 
 
 class ImportError(Exception):
@@ -33,6 +38,31 @@ class ParseError(ImportError):
     pass
 
 
+class ImportHasher:
+    """
+    Calcule l'import_hash des transactions d'un fichier, dans l'ordre du fichier.
+
+    Une instance par fichier: la n-ième ligne identique (même import_key)
+    reçoit le rang d'occurrence n, de sorte que deux achats identiques le
+    même jour ne se confondent pas et qu'un réimport retrouve les mêmes hash.
+
+    Examples:
+        >>> hasher = ImportHasher()
+        >>> for tx in transactions:
+        ...     hasher(tx)
+    """
+
+    def __init__(self) -> None:
+        self._seen: dict[ImportKey, int] = {}
+
+    def __call__(self, tx: Transaction) -> Transaction:
+        key = tx.import_key
+        occurrence = self._seen.get(key, 0)
+        self._seen[key] = occurrence + 1
+        tx.import_hash = tx.compute_import_hash(occurrence)
+        return tx
+
+
 class ImportAdapter(ABC):
     """
     Abstract base class for all import adapters.
@@ -96,6 +126,39 @@ class ImportAdapter(ABC):
         """
         ...
 
+    def parse_stream(
+        self,
+        stream: BinaryIO,
+        account_id: UUID,
+        name: str = "",
+    ) -> list[Transaction]:
+        """
+        Parses a binary stream (e.g. an upload spool) and returns Transaction entities.
+
+        The stream must be seekable. This default copies it by chunks to a
+        temporary file and calls parse(); adapters able to read the stream
+        directly override it.
+
+        Args:
+            stream: Binary stream positioned at the start of the content
+            account_id: UUID of the account to import to
+            name: Original file name (its extension is kept)
+
+        Returns:
+            List of Transaction entities parsed from the stream
+
+        Raises:
+            UnsupportedFileFormat: If file format is not supported
+            ParseError: If parsing fails
+        """
+        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(name).suffix) as tmp:
+            shutil.copyfileobj(stream, tmp)
+            tmp_path = Path(tmp.name)
+        try:
+            return self.parse(tmp_path, account_id)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -128,6 +191,31 @@ class ImportAdapter(ABC):
         """
         ...
 
+    @property
+    def header_signature(self) -> Optional[HeaderSignature]:
+        """
+        Signature d'en-tête CSV publiée pour l'index de l'AdapterFactory.
+
+        Returns:
+            (délimiteur, en-tête normalisé), None si l'adapter n'en a pas
+
+        Examples:
+            >>> LCLCSVAdapter().header_signature
+            (';', ('date', 'date valeur', 'libellé', 'débit', 'crédit'))
+        """
+        return None
+
+    @property
+    def magic_bytes(self) -> tuple[bytes, ...]:
+        """
+        Préfixes identifiant le format (en majuscules, après BOM et
+        déclaration XML), publiés pour l'index de l'AdapterFactory.
+
+        Returns:
+            Préfixes comme (b"OFXHEADER", b"<OFX>"), vide par défaut
+        """
+        return ()
+
     def __repr__(self) -> str:
         """Representation of the adapter."""
         return f"<{self.__class__.__name__}: {self.name}>"
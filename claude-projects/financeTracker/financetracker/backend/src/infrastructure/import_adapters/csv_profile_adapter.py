@@ -0,0 +1,216 @@
+"""
+Profile-driven CSV Import Adapter
+
+One adapter class for every CSV bank export: the format is a BankProfile,
+compiled once into a row parser (cf. bank_profile).
+
+Features:
+- Detection by exact header signature
+- Encoding: expected encodings first, chardet only as a fallback
+- Streaming: csv.reader rows go straight through the compiled parser,
+  from a file or directly from a binary stream (upload spool)
+- Import hash generation for deduplication
+"""
+from __future__ import annotations
+
+import csv
+import io
+import logging
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, TextIO
+from uuid import UUID
+
+from src.domain.entities.transaction import Transaction
+from src.domain.value_objects.money import Money
+from src.infrastructure.import_adapters.bank_profile import (
+    BankProfile,
+    detect_encoding,
+    normalize_header,
+    peek,
+    sniff_encoding,
+)
+from src.infrastructure.import_adapters.base_adapter import (
+    HeaderSignature,
+    ImportAdapter,
+    ImportHasher,
+    ParseError,
+    UnsupportedFileFormat,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileCSVAdapter(ImportAdapter):
+    """
+    Adapter CSV générique piloté par un BankProfile.
+
+    Examples:
+        >>> adapter = ProfileCSVAdapter(BOURSORAMA_PROFILE)
+        >>> adapter.name
+        'Boursorama CSV'
+        >>> transactions = adapter.parse(Path("export.csv"), account_id)
+    """
+
+    def __init__(self, profile: BankProfile):
+        """
+        Initialise l'adapter et compile le profil.
+
+        Args:
+            profile: Description du format CSV
+        """
+        self.profile = profile
+        self._parse_row = profile.compile()
+
+    @property
+    def name(self) -> str:
+        """Nom de l'adaptateur (celui du profil)."""
+        return self.profile.name
+
+    @property
+    def supported_extensions(self) -> list[str]:
+        """Extensions supportées."""
+        return list(self.profile.extensions)
+
+    @property
+    def header_signature(self) -> HeaderSignature:
+        """Délimiteur et en-tête normalisé du profil."""
+        return self.profile.delimiter, self.profile.signature
+
+    def can_parse(self, file_path: Path) -> bool:
+        """
+        Vérifie extension et signature d'en-tête.
+
+        Args:
+            file_path: Chemin du fichier
+
+        Returns:
+            True si l'en-tête correspond au profil
+        """
+        if file_path.suffix.lower() not in self.profile.extensions:
+            return False
+
+        try:
+            encoding = self._detect_encoding(file_path)
+            if not encoding:
+                return False
+            with open(file_path, "r", encoding=encoding, newline="") as f:
+                header = next(csv.reader(f, delimiter=self.profile.delimiter), None)
+            return header is not None and normalize_header(header) == self.profile.signature
+        except Exception as e:
+            logger.debug(f"Error checking {self.name} format: {e}")
+            return False
+
+    def parse(
+        self,
+        file_path: Path,
+        account_id: UUID,
+        auto_categorize: bool = False
+    ) -> list[Transaction]:
+        """
+        Parse un export CSV et retourne les transactions.
+
+        Les lignes illisibles sont journalisées et ignorées.
+
+        Args:
+            file_path: Chemin du fichier
+            account_id: UUID du compte d'importation
+            auto_categorize: Ignoré (catégorisation faite par le handler)
+
+        Returns:
+            Liste de Transaction entities
+
+        Raises:
+            UnsupportedFileFormat: Si l'en-tête ne correspond pas au profil
+            ParseError: Si le parsing échoue
+        """
+        if not file_path.exists():
+            raise ParseError(f"File not found: {file_path}")
+        if file_path.suffix.lower() not in self.profile.extensions:
+            raise UnsupportedFileFormat(f"File is not {self.name} format: {file_path}")
+
+        encoding = self._detect_encoding(file_path)
+        if not encoding:
+            raise ParseError(f"Could not detect file encoding: {file_path}")
+
+        with open(file_path, "rb") as f:
+            return self._parse_binary(f, account_id, str(file_path), encoding)
+
+    def parse_stream(
+        self,
+        stream: BinaryIO,
+        account_id: UUID,
+        name: str = "",
+    ) -> list[Transaction]:
+        """
+        Parse un export CSV depuis un flux binaire, sans copie sur disque.
+
+        Args:
+            stream: Flux binaire positionnable (ex: upload)
+            account_id: UUID du compte d'importation
+            name: Nom du fichier d'origine (journaux et erreurs)
+
+        Returns:
+            Liste de Transaction entities
+        """
+        encoding = sniff_encoding(peek(stream), self.profile.encodings)
+        return self._parse_binary(stream, account_id, name or "<stream>", encoding)
+
+    # === Méthodes privées ===
+
+    def _parse_binary(
+        self, stream: BinaryIO, account_id: UUID, source: str, encoding: str
+    ) -> list[Transaction]:
+        """Décode le flux au fil de la lecture et le parse."""
+        logger.info(f"Parsing {self.name} file with {encoding} encoding: {source}")
+        text = io.TextIOWrapper(stream, encoding=encoding, newline="")
+        try:
+            transactions = list(self._iter_transactions(text, source, account_id))
+        except (UnsupportedFileFormat, ParseError):
+            raise
+        except Exception as e:
+            logger.error(f"Error parsing {self.name} file: {e}")
+            raise ParseError(f"Error parsing file: {e}") from e
+        finally:
+            # Le flux appartient à l'appelant: ne pas le fermer avec le wrapper
+            text.detach()
+
+        logger.info(f"Successfully parsed {len(transactions)} transactions from {source}")
+        return transactions
+
+    def _iter_transactions(self, f: TextIO, source: str, account_id: UUID) -> Iterator[Transaction]:
+        """Parcourt le fichier ouvert ligne à ligne."""
+        reader = csv.reader(f, delimiter=self.profile.delimiter)
+        header = next(reader, None)
+        if header is None or normalize_header(header) != self.profile.signature:
+            raise UnsupportedFileFormat(f"File is not {self.name} format: {source}")
+
+        parse_row = self._parse_row
+        hash_row = ImportHasher()
+        errors = 0
+        for row_num, row in enumerate(reader, start=2):  # L'en-tête est la ligne 1
+            if not any(row):
+                continue
+            try:
+                parsed = parse_row(row)
+                if parsed is None:
+                    continue
+                day, amount, description, value_date = parsed
+                tx = Transaction(
+                    account_id=account_id,
+                    date=day,
+                    amount=Money(amount),
+                    description=description,
+                    value_date=value_date,
+                )
+            except ValueError as e:
+                errors += 1
+                logger.warning(f"Error parsing row: Row {row_num}: {e}")
+                continue
+            yield hash_row(tx)
+
+        if errors:
+            logger.warning(f"Parsing completed with {errors} errors")
+
+    def _detect_encoding(self, file_path: Path) -> Optional[str]:
+        """Encodage du fichier (encodages du profil, puis chardet)."""
+        return detect_encoding(file_path, self.profile.encodings)
@@ -0,0 +1,268 @@
+"""
+OFX Import Adapter
+
+Parses OFX/QFX statements, both OFX 1.x (SGML, leaf tags not closed) and
+OFX 2.x (XML).
+
+Format:
+    <STMTTRN>
+    <TRNTYPE>DEBIT
+    <DTPOSTED>20250115120000[+1:CET]
+    <TRNAMT>-42.50
+    <FITID>2025011500001
+    <NAME>CB CARREFOUR
+    </STMTTRN>
+
+Features:
+- Streaming: the file (or upload stream) is tokenized by chunks, one
+  transaction in memory
+- Encoding from the OFX header (CHARSET / encoding="..."), no chardet
+- Amounts with "." or "," decimal separator
+- Import hash generation for deduplication
+"""
+from __future__ import annotations
+
+import html
+import io
+import logging
+import re
+from datetime import date
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, TextIO
+from uuid import UUID
+
+from src.domain.entities.transaction import Transaction
+from src.domain.value_objects.money import Money
+from src.infrastructure.import_adapters.bank_profile import parse_flexible_decimal, peek
+from src.infrastructure.import_adapters.base_adapter import (
+    ImportAdapter,
+    ImportHasher,
+    ParseError,
+    UnsupportedFileFormat,
+)
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+HEAD_SIZE = 1024
+
+# <TAG>texte ou </TAG>; le texte court jusqu'à la balise suivante
+_TAG = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<]*)")
+_XML_ENCODING = re.compile(rb'encoding="([A-Za-z0-9_-]+)"')
+_SGML_CHARSET = re.compile(rb"CHARSET:\s*([A-Za-z0-9-]+)")
+
+
+def iter_tags(stream: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[bool, str, str]]:
+    """
+    Découpe un flux OFX en (fermante, BALISE, texte), bloc par bloc.
+
+    Le texte d'une balise s'arrête au '<' suivant: tout ce qui précède le
+    dernier '<' du tampon est complet, le reste attend le bloc suivant.
+    """
+    buffer = ""
+    while chunk := stream.read(chunk_size):
+        buffer += chunk
+        cut = buffer.rfind("<")
+        if cut <= 0:
+            continue
+        complete, buffer = buffer[:cut], buffer[cut:]
+        for match in _TAG.finditer(complete):
+            yield match.group(1) == "/", match.group(2).upper(), match.group(3).strip()
+    for match in _TAG.finditer(buffer):
+        yield match.group(1) == "/", match.group(2).upper(), match.group(3).strip()
+
+
+def _ofx_date(value: str) -> date:
+    """AAAAMMJJ[HHMMSS[.XXX][TZ]] → date."""
+    if len(value) < 8 or not value[:8].isdigit():
+        raise ValueError(f"Invalid OFX date '{value}'")
+    return date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+
+
+class OFXAdapter(ImportAdapter):
+    """
+    Adapter pour les relevés OFX/QFX (SGML et XML).
+
+    Examples:
+        >>> adapter = OFXAdapter()
+        >>> for tx in adapter.iter_transactions(Path("releve.ofx"), account_id):
+        ...     print(tx.date, tx.amount)
+    """
+
+    @property
+    def name(self) -> str:
+        """Nom de l'adaptateur."""
+        return "OFX"
+
+    @property
+    def supported_extensions(self) -> list[str]:
+        """Extensions supportées."""
+        return [".ofx", ".qfx"]
+
+    @property
+    def magic_bytes(self) -> tuple[bytes, ...]:
+        """En-tête SGML, instruction <?OFX?> (XML) ou racine <OFX>."""
+        return (b"OFXHEADER", b"<?OFX", b"<OFX>")
+
+    def can_parse(self, file_path: Path) -> bool:
+        """
+        Vérifie l'extension et la présence d'un en-tête OFX.
+
+        Args:
+            file_path: Chemin du fichier
+
+        Returns:
+            True si le début du fichier contient OFXHEADER ou <OFX>
+        """
+        if file_path.suffix.lower() not in self.supported_extensions:
+            return False
+        try:
+            head = self._read_head(file_path)
+        except OSError as e:
+            logger.debug(f"Error checking OFX format: {e}")
+            return False
+        return self._is_ofx(head)
+
+    def parse(
+        self,
+        file_path: Path,
+        account_id: UUID,
+        auto_categorize: bool = False
+    ) -> list[Transaction]:
+        """
+        Parse un relevé OFX et retourne les transactions.
+
+        Args:
+            file_path: Chemin du fichier
+            account_id: UUID du compte d'importation
+            auto_categorize: Ignoré (catégorisation faite par le handler)
+
+        Returns:
+            Liste de Transaction entities
+
+        Raises:
+            UnsupportedFileFormat: Si le fichier n'est pas un relevé OFX
+            ParseError: Si le parsing échoue
+        """
+        if not file_path.exists():
+            raise ParseError(f"File not found: {file_path}")
+        if not self.can_parse(file_path):
+            raise UnsupportedFileFormat(f"File is not OFX format: {file_path}")
+
+        with open(file_path, "rb") as f:
+            return self._parse_binary(f, account_id, str(file_path))
+
+    def parse_stream(
+        self,
+        stream: BinaryIO,
+        account_id: UUID,
+        name: str = "",
+    ) -> list[Transaction]:
+        """
+        Parse un relevé OFX depuis un flux binaire, sans copie sur disque.
+
+        Args:
+            stream: Flux binaire positionnable (ex: upload)
+            account_id: UUID du compte d'importation
+            name: Nom du fichier d'origine (journaux et erreurs)
+
+        Returns:
+            Liste de Transaction entities
+        """
+        source = name or "<stream>"
+        if not self._is_ofx(peek(stream, HEAD_SIZE)):
+            raise UnsupportedFileFormat(f"File is not OFX format: {source}")
+        return self._parse_binary(stream, account_id, source)
+
+    def iter_transactions(self, file_path: Path, account_id: UUID) -> Iterator[Transaction]:
+        """
+        Transactions du relevé, au fil de la lecture.
+
+        Les transactions illisibles sont journalisées et ignorées.
+        """
+        with open(file_path, "rb") as f:
+            yield from self._iter_stream(f, account_id)
+
+    # === Méthodes privées ===
+
+    def _parse_binary(self, stream: BinaryIO, account_id: UUID, source: str) -> list[Transaction]:
+        """Parse le flux complet (erreurs inattendues → ParseError)."""
+        try:
+            transactions = list(self._iter_stream(stream, account_id))
+        except Exception as e:
+            logger.error(f"Error parsing OFX file: {e}")
+            raise ParseError(f"Error parsing file: {e}") from e
+
+        logger.info(f"Successfully parsed {len(transactions)} transactions from {source}")
+        return transactions
+
+    def _iter_stream(self, stream: BinaryIO, account_id: UUID) -> Iterator[Transaction]:
+        """Décode le flux avec l'encodage de l'en-tête et le découpe en STMTTRN."""
+        text = io.TextIOWrapper(
+            stream, encoding=self._sniff_encoding(peek(stream, HEAD_SIZE)), errors="replace"
+        )
+        hash_row = ImportHasher()
+        try:
+            fields: Optional[dict[str, str]] = None
+            for closing, tag, value in iter_tags(text):
+                if tag == "STMTTRN":
+                    if closing and fields is not None:
+                        tx = self._to_transaction(fields, account_id)
+                        if tx is not None:
+                            yield hash_row(tx)
+                    fields = None if closing else {}
+                elif fields is not None and not closing and value:
+                    fields.setdefault(tag, html.unescape(value))
+        finally:
+            # Le flux appartient à l'appelant: ne pas le fermer avec le wrapper
+            text.detach()
+
+    def _to_transaction(self, fields: dict[str, str], account_id: UUID) -> Optional[Transaction]:
+        """Construit la transaction d'un bloc STMTTRN (None si illisible)."""
+        name, memo = fields.get("NAME", ""), fields.get("MEMO", "")
+        # NAME est souvent tronqué (32 caractères) et MEMO le complète
+        if name and memo.startswith(name):
+            description = memo
+        else:
+            description = " ".join(part for part in (name, memo) if part)
+
+        try:
+            if not description or "DTPOSTED" not in fields or "TRNAMT" not in fields:
+                raise ValueError(f"Incomplete transaction {fields.get('FITID', '')}")
+            tx = Transaction(
+                account_id=account_id,
+                date=_ofx_date(fields["DTPOSTED"]),
+                amount=Money(parse_flexible_decimal(fields["TRNAMT"])),
+                description=description,
+                value_date=_ofx_date(fields["DTAVAIL"]) if "DTAVAIL" in fields else None,
+            )
+        except ValueError as e:
+            logger.warning(f"Error parsing OFX transaction: {e}")
+            return None
+
+        return tx
+
+    @staticmethod
+    def _is_ofx(head: bytes) -> bool:
+        head = head.upper()
+        return b"OFXHEADER" in head or b"<OFX>" in head
+
+    @staticmethod
+    def _read_head(file_path: Path) -> bytes:
+        with open(file_path, "rb") as f:
+            return f.read(HEAD_SIZE)
+
+    @staticmethod
+    def _sniff_encoding(head: bytes) -> str:
+        """Encodage déclaré par l'en-tête (XML ou SGML), UTF-8 par défaut."""
+        match = _XML_ENCODING.search(head)
+        if match:
+            return match.group(1).decode("ascii")
+        match = _SGML_CHARSET.search(head)
+        if match:
+            charset = match.group(1).decode("ascii").upper()
+            if charset == "1252":
+                return "cp1252"
+            if charset.endswith("8859-1"):
+                return "iso-8859-1"
+        return "utf-8"
@@ -0,0 +1,41 @@
+"""
+Built-in bank profiles.
+
+Adding a bank = adding a BankProfile here, or in the JSON file named by
+IMPORT_PROFILES_PATH (same fields, see bank_profile.load_profiles).
+"""
+from __future__ import annotations
+
+from src.infrastructure.import_adapters.bank_profile import BankProfile, SignConvention
+
+# LCL: débits et crédits positifs dans deux colonnes
+#   Date;Date valeur;Libellé;Débit;Crédit
+#   15/01/2025;15/01/2025;CB CARREFOUR;42,50;
+LCL_PROFILE = BankProfile(
+    name="LCL CSV",
+    headers=("Date", "Date valeur", "Libellé", "Débit", "Crédit"),
+    date_column="Date",
+    description_columns=("Libellé",),
+    debit_column="Débit",
+    credit_column="Crédit",
+    sign=SignConvention.DEBIT_CREDIT,
+)
+
+# Boursorama: montant signé, dates ISO, champs entre guillemets
+#   dateOp;dateVal;label;category;categoryParent;supplierFound;amount;...
+#   2025-01-15;2025-01-15;"CB CARREFOUR";...;-42,50;...
+BOURSORAMA_PROFILE = BankProfile(
+    name="Boursorama CSV",
+    headers=(
+        "dateOp", "dateVal", "label", "category", "categoryParent",
+        "supplierFound", "amount", "comment", "accountNum", "accountLabel",
+        "accountbalance",
+    ),
+    date_column="dateOp",
+    description_columns=("label",),
+    amount_column="amount",
+    date_format="%Y-%m-%d",
+    value_date_column="dateVal",
+)
+
+BUILTIN_PROFILES: tuple[BankProfile, ...] = (LCL_PROFILE, BOURSORAMA_PROFILE)
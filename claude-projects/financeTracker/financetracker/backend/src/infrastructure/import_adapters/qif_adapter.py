@@ -0,0 +1,245 @@
+"""
+QIF Import Adapter
+
+Parses Quicken Interchange Format statements (bank, cash and card
+accounts).
+
+Format:
+    !Type:Bank
+    D15/01/2025
+    T-42,50
+    PCB CARREFOUR
+    ^
+
+Features:
+- Streaming (file or upload stream): one line, one record in memory
+- Day-first dates by default (French banks), 2-digit years and ' accepted
+- Amounts with "." or "," decimal separator
+- Non-transaction sections (!Account, !Type:Cat...) skipped
+- Import hash generation for deduplication
+"""
+from __future__ import annotations
+
+import io
+import logging
+from datetime import date
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Sequence
+from uuid import UUID
+
+from src.domain.entities.transaction import Transaction
+from src.domain.value_objects.money import Money
+from src.infrastructure.import_adapters.bank_profile import (
+    date_parser,
+    parse_flexible_decimal,
+    peek,
+    sniff_encoding,
+)
+from src.infrastructure.import_adapters.base_adapter import (
+    ImportAdapter,
+    ImportHasher,
+    ParseError,
+    UnsupportedFileFormat,
+)
+
+logger = logging.getLogger(__name__)
+
+# Sections contenant des opérations (!Type:<section>)
+TRANSACTION_SECTIONS = frozenset({"bank", "cash", "ccard", "oth a", "oth l"})
+HEAD_SIZE = 1024
+
+
+class QIFAdapter(ImportAdapter):
+    """
+    Adapter pour les relevés QIF.
+
+    Examples:
+        >>> adapter = QIFAdapter(date_formats=("%m/%d/%Y",))  # export US
+        >>> transactions = adapter.parse(Path("releve.qif"), account_id)
+    """
+
+    def __init__(self, date_formats: Sequence[str] = ("%d/%m/%y", "%d/%m/%Y")):
+        """
+        Initialise l'adapter.
+
+        Args:
+            date_formats: Formats de date essayés dans l'ordre (%y avant %Y:
+                strptime lirait "25" comme l'an 25 avec %Y)
+        """
+        self._date_parsers = [date_parser(fmt) for fmt in date_formats]
+
+    @property
+    def name(self) -> str:
+        """Nom de l'adaptateur."""
+        return "QIF"
+
+    @property
+    def supported_extensions(self) -> list[str]:
+        """Extensions supportées."""
+        return [".qif"]
+
+    @property
+    def magic_bytes(self) -> tuple[bytes, ...]:
+        """Première ligne !Type:, !Account ou !Option."""
+        return (b"!TYPE:", b"!ACCOUNT", b"!OPTION")
+
+    def can_parse(self, file_path: Path) -> bool:
+        """
+        Vérifie l'extension et l'en-tête !Type / !Account.
+
+        Args:
+            file_path: Chemin du fichier
+
+        Returns:
+            True si la première ligne non vide est un en-tête QIF
+        """
+        if file_path.suffix.lower() not in self.supported_extensions:
+            return False
+        try:
+            with open(file_path, "rb") as f:
+                return self._is_qif(f.read(HEAD_SIZE))
+        except OSError as e:
+            logger.debug(f"Error checking QIF format: {e}")
+        return False
+
+    def parse(
+        self,
+        file_path: Path,
+        account_id: UUID,
+        auto_categorize: bool = False
+    ) -> list[Transaction]:
+        """
+        Parse un relevé QIF et retourne les transactions.
+
+        Args:
+            file_path: Chemin du fichier
+            account_id: UUID du compte d'importation
+            auto_categorize: Ignoré (catégorisation faite par le handler)
+
+        Returns:
+            Liste de Transaction entities
+
+        Raises:
+            UnsupportedFileFormat: Si le fichier n'est pas un relevé QIF
+            ParseError: Si le parsing échoue
+        """
+        if not file_path.exists():
+            raise ParseError(f"File not found: {file_path}")
+        if not self.can_parse(file_path):
+            raise UnsupportedFileFormat(f"File is not QIF format: {file_path}")
+
+        with open(file_path, "rb") as f:
+            return self._parse_binary(f, account_id, str(file_path))
+
+    def parse_stream(
+        self,
+        stream: BinaryIO,
+        account_id: UUID,
+        name: str = "",
+    ) -> list[Transaction]:
+        """
+        Parse un relevé QIF depuis un flux binaire, sans copie sur disque.
+
+        Args:
+            stream: Flux binaire positionnable (ex: upload)
+            account_id: UUID du compte d'importation
+            name: Nom du fichier d'origine (journaux et erreurs)
+
+        Returns:
+            Liste de Transaction entities
+        """
+        source = name or "<stream>"
+        if not self._is_qif(peek(stream, HEAD_SIZE)):
+            raise UnsupportedFileFormat(f"File is not QIF format: {source}")
+        return self._parse_binary(stream, account_id, source)
+
+    def iter_transactions(self, file_path: Path, account_id: UUID) -> Iterator[Transaction]:
+        """
+        Transactions du relevé, au fil de la lecture.
+
+        Les enregistrements illisibles sont journalisés et ignorés.
+        """
+        with open(file_path, "rb") as f:
+            yield from self._iter_stream(f, account_id)
+
+    # === Méthodes privées ===
+
+    def _parse_binary(self, stream: BinaryIO, account_id: UUID, source: str) -> list[Transaction]:
+        """Parse le flux complet (erreurs inattendues → ParseError)."""
+        try:
+            transactions = list(self._iter_stream(stream, account_id))
+        except Exception as e:
+            logger.error(f"Error parsing QIF file: {e}")
+            raise ParseError(f"Error parsing file: {e}") from e
+
+        logger.info(f"Successfully parsed {len(transactions)} transactions from {source}")
+        return transactions
+
+    def _iter_stream(self, stream: BinaryIO, account_id: UUID) -> Iterator[Transaction]:
+        """Décode le flux et le découpe en enregistrements terminés par ^."""
+        text = io.TextIOWrapper(stream, encoding=sniff_encoding(peek(stream)), errors="replace")
+        hash_row = ImportHasher()
+        try:
+            section: Optional[str] = None
+            record: dict[str, str] = {}
+            for line in text:
+                line = line.rstrip("\r\n")
+                if not line:
+                    continue
+                code, value = line[0], line[1:].strip()
+                if code == "!":
+                    lowered = value.lower()
+                    section = lowered[5:].strip() if lowered.startswith("type:") else lowered
+                    record = {}
+                elif code == "^":
+                    if section in TRANSACTION_SECTIONS and record:
+                        tx = self._to_transaction(record, account_id)
+                        if tx is not None:
+                            yield hash_row(tx)
+                    record = {}
+                else:
+                    # Premier champ de chaque code (les splits S/E/$ sont ignorés)
+                    record.setdefault(code, value)
+        finally:
+            # Le flux appartient à l'appelant: ne pas le fermer avec le wrapper
+            text.detach()
+
+    def _to_transaction(self, record: dict[str, str], account_id: UUID) -> Optional[Transaction]:
+        """Construit la transaction d'un enregistrement (None si illisible)."""
+        payee, memo = record.get("P", ""), record.get("M", "")
+        description = " ".join(part for part in (payee, memo) if part)
+        amount = record.get("T") or record.get("U")
+
+        try:
+            if not description or "D" not in record or not amount:
+                raise ValueError(f"Incomplete record {record}")
+            tx = Transaction(
+                account_id=account_id,
+                date=self._parse_date(record["D"]),
+                amount=Money(parse_flexible_decimal(amount)),
+                description=description,
+            )
+        except ValueError as e:
+            logger.warning(f"Error parsing QIF record: {e}")
+            return None
+
+        return tx
+
+    @staticmethod
+    def _is_qif(head: bytes) -> bool:
+        """La première ligne non vide est un en-tête !Type / !Account / !Option."""
+        for line in head.splitlines():
+            line = line.strip().lstrip(b"\xef\xbb\xbf").lower()
+            if line:
+                return line.startswith((b"!type:", b"!account", b"!option"))
+        return False
+
+    def _parse_date(self, value: str) -> date:
+        """Date QIF: formats configurés; 1/5'25 est lu comme 1/5/25."""
+        value = value.replace("'", "/").replace(" ", "")
+        for parse in self._date_parsers:
+            try:
+                return parse(value)
+            except ValueError:
+                continue
+        raise ValueError(f"Invalid date format '{value}'")
@@ -6,6 +6,8 @@ Database setup, models, and repository implementations.
 from src.infrastructure.persistence.database import (
     Database,
     DatabaseConfig,
+    SQLiteProfile,
+    PoolStatus,
     initialize_database,
     get_database,
     get_session_local,
@@ -15,19 +17,30 @@ from src.infrastructure.persistence.models import (
     TransactionModel,
     AccountModel,
     CategoryModel,
+    CategoryClosureModel,
     RecurringTransactionModel,
     CategoryKeywordModel,
+    MonthlyCategoryTotalModel,
+    AccountProjectionModel,
+    AlertEventModel,
 )
 from src.infrastructure.persistence.repositories import (
     SQLiteTransactionRepository,
     SQLiteAccountRepository,
     SQLiteCategoryRepository,
+    SQLiteRecurringRepository,
+    SQLiteAnalyticsRepository,
+    SQLiteBudgetRepository,
+    SQLiteAlertRepository,
 )
+from src.infrastructure.persistence.unit_of_work import UnitOfWork
 
 __all__ = [
     # Database
     "Database",
     "DatabaseConfig",
+    "SQLiteProfile",
+    "PoolStatus",
     "initialize_database",
     "get_database",
     "get_session_local",
@@ -36,10 +49,20 @@ __all__ = [
     "TransactionModel",
     "AccountModel",
     "CategoryModel",
+    "CategoryClosureModel",
     "RecurringTransactionModel",
     "CategoryKeywordModel",
+    "MonthlyCategoryTotalModel",
+    "AccountProjectionModel",
+    "AlertEventModel",
     # Repositories
     "SQLiteTransactionRepository",
     "SQLiteAccountRepository",
     "SQLiteCategoryRepository",
+    "SQLiteRecurringRepository",
+    "SQLiteAnalyticsRepository",
+    "SQLiteBudgetRepository",
+    "SQLiteAlertRepository",
+    # Unit of Work
+    "UnitOfWork",
 ]
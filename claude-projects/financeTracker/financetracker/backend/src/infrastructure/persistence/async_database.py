@@ -0,0 +1,220 @@
+"""
+Async Database Setup (SQLAlchemy asyncio + aiosqlite)
+
+Pendant asynchrone de database.py pour les routes FastAPI.
+
+Architecture:
+- AsyncEngine sur aiosqlite: les requêtes sont attendues (await) au lieu
+  de bloquer la boucle d'événements
+- Construit à partir du Database synchrone: même base, même profil SQLite,
+  même cache partagé pour les bases en mémoire
+- Les outils synchrones (import, CLI, scripts) continuent d'utiliser Database
+"""
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Optional
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.persistence.database import (
+    Database,
+    DatabaseConfig,
+    PoolMonitor,
+    PoolStatus,
+    install_sqlite_profile,
+    install_storage_modes,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDatabase:
+    """Gère le moteur async et les AsyncSession SQLAlchemy."""
+
+    def __init__(self, config: DatabaseConfig, url: Optional[URL] = None):
+        """
+        Initialize async database manager.
+
+        Args:
+            config: DatabaseConfig instance (profil, pool)
+            url: URL synchrone de la base (défaut: config.database_url)
+        """
+        self.config = config
+        self.engine = self._create_engine(url)
+        self.pool_monitor = PoolMonitor(config.pool_capacity)
+        self.pool_monitor.install(self.engine.sync_engine)
+        self.SessionLocal = async_sessionmaker(
+            bind=self.engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+
+    @classmethod
+    def from_database(cls, database: Database) -> AsyncDatabase:
+        """
+        Crée le pendant async d'un Database synchrone (même base).
+
+        Args:
+            database: Database synchrone déjà initialisé
+
+        Returns:
+            AsyncDatabase ciblant la même base
+        """
+        return cls(database.config, url=database.engine.url)
+
+    def _create_engine(self, url: Optional[URL]) -> AsyncEngine:
+        """
+        Crée le moteur async avec le driver aiosqlite.
+
+        Returns:
+            SQLAlchemy AsyncEngine
+        """
+        url = url if url is not None else make_url(self.config.database_url)
+        if not self.config.is_sqlite:
+            engine = create_async_engine(url, echo=self.config.echo)
+            install_storage_modes(engine.sync_engine, self.config)
+            return engine
+
+        async_url = url.set(drivername="sqlite+aiosqlite")
+
+        connect_args = {
+            "check_same_thread": False,
+            "timeout": self.config.profile.busy_timeout_ms / 1000,
+        }
+
+        if self.config.is_in_memory:
+            engine = create_async_engine(
+                async_url,
+                connect_args=connect_args,
+                poolclass=StaticPool,
+                echo=self.config.echo,
+            )
+        else:
+            engine = create_async_engine(
+                async_url,
+                connect_args=connect_args,
+                pool_size=self.config.pool_size,
+                max_overflow=self.config.max_overflow,
+                echo=self.config.echo,
+            )
+
+        install_sqlite_profile(engine.sync_engine, self.config)
+        install_storage_modes(engine.sync_engine, self.config)
+        return engine
+
+    def get_session(self) -> AsyncSession:
+        """Retourne une nouvelle AsyncSession (à fermer par l'appelant)."""
+        return self.SessionLocal()
+
+    @asynccontextmanager
+    async def get_session_context(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Context manager async: commit en sortie, rollback sur erreur.
+
+        Yields:
+            SQLAlchemy AsyncSession
+        """
+        session = self.get_session()
+        try:
+            yield session
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Database error: {e}")
+            raise
+        finally:
+            await session.close()
+
+    def pool_status(self) -> PoolStatus:
+        """Retourne l'utilisation du pool de connexions async."""
+        return self.pool_monitor.status()
+
+    async def check_connection(self) -> bool:
+        """
+        Vérifie que la connexion async fonctionne.
+
+        Returns:
+            True si la connexion est OK, False sinon
+        """
+        try:
+            async with self.engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+                return True
+        except SQLAlchemyError as e:
+            logger.error(f"Async database connection failed: {e}")
+            return False
+
+    async def close(self) -> None:
+        """Ferme le pool de connexions async."""
+        await self.engine.dispose()
+        logger.info("Async database connections closed")
+
+
+# Global instance (singleton pattern, comme database.py)
+_async_db_instance: AsyncDatabase | None = None
+
+
+def initialize_async_database(database: Database) -> AsyncDatabase:
+    """
+    Initialize the global async database from the sync one.
+
+    Args:
+        database: Database synchrone initialisé
+
+    Returns:
+        AsyncDatabase instance
+    """
+    global _async_db_instance
+    if _async_db_instance is None:
+        _async_db_instance = AsyncDatabase.from_database(database)
+    return _async_db_instance
+
+
+def get_async_database() -> AsyncDatabase:
+    """
+    Get the global async database instance.
+
+    Raises:
+        RuntimeError: If async database not initialized
+    """
+    if _async_db_instance is None:
+        raise RuntimeError(
+            "Async database not initialized. Call initialize_async_database() first."
+        )
+    return _async_db_instance
+
+
+async def close_async_database() -> None:
+    """Dispose the global async engine (shutdown)."""
+    global _async_db_instance
+    if _async_db_instance is not None:
+        await _async_db_instance.close()
+        _async_db_instance = None
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency for getting an async database session.
+
+    Yields:
+        SQLAlchemy AsyncSession
+
+    Examples:
+        >>> @app.get("/items")
+        ... async def read_items(session: AsyncSession = Depends(get_async_session)):
+        ...     return await AsyncSQLiteTransactionRepository(session).count(query)
+    """
+    db = get_async_database()
+    async with db.get_session_context() as session:
+        yield session
@@ -6,35 +6,304 @@ et les opérations de vérification de santé.
 
 Architecture:
 - Utilise SQLite pour V1 (simple et sans serveur)
+- Profil de PRAGMA SQLite appliqué à chaque connexion (event "connect")
 - Session factory pour gérer les lifecycles
+- Utilisation du pool observable (PoolMonitor: connexions empruntées, pic)
 - Health check pour vérifier la connexion
 - Migrationsvia Alembic
 """
 from __future__ import annotations
 
-from typing import Generator
+from dataclasses import dataclass
+from typing import Generator, Optional
 from contextlib import contextmanager
-from sqlalchemy import create_engine, text, inspect
+from threading import Lock
+from uuid import uuid4
+
+from sqlalchemy import Engine, create_engine, event, text, inspect
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import QueuePool, StaticPool
 import logging
 
+from src.infrastructure.persistence.models import (
+    MONEY_STORAGE_DECIMAL,
+    MONEY_STORAGES,
+    UUID_STORAGE_TEXT,
+    UUID_STORAGES,
+)
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """
+    Profil de PRAGMA SQLite appliqué à l'ouverture de chaque connexion.
+
+    - journal_mode=WAL: les lectures ne sont plus bloquées par un import
+    - synchronous=NORMAL: sûr en WAL, un fsync par checkpoint au lieu d'un par commit
+    - cache_size_kib / mmap_size_mib: cache de pages et lecture mappée en mémoire
+    - temp_store=MEMORY: tris et index temporaires en RAM
+
+    Examples:
+        >>> DatabaseConfig("sqlite:///./data/finance.db", profile=SQLiteProfile.performance())
+    """
+
+    journal_mode: Optional[str] = None
+    synchronous: Optional[str] = None
+    cache_size_kib: Optional[int] = None
+    mmap_size_mib: Optional[int] = None
+    temp_store: Optional[str] = None
+    foreign_keys: bool = False
+    busy_timeout_ms: int = 30_000
+
+    @classmethod
+    def default(cls) -> SQLiteProfile:
+        """Valeurs par défaut de SQLite (journal DELETE, synchronous FULL)."""
+        return cls()
+
+    @classmethod
+    def performance(cls) -> SQLiteProfile:
+        """WAL + synchronous NORMAL + 64 Mio de cache + 256 Mio de mmap."""
+        return cls(
+            journal_mode="WAL",
+            synchronous="NORMAL",
+            cache_size_kib=64 * 1024,
+            mmap_size_mib=256,
+            temp_store="MEMORY",
+        )
+
+    @classmethod
+    def from_name(cls, name: str) -> SQLiteProfile:
+        """
+        Retourne un profil prédéfini par son nom.
+
+        Raises:
+            ValueError: Si le profil est inconnu
+        """
+        profiles = {"default": cls.default, "performance": cls.performance}
+        if name not in profiles:
+            raise ValueError(
+                f"Unknown SQLite profile: {name} (expected one of {sorted(profiles)})"
+            )
+        return profiles[name]()
+
+    def pragmas(self, in_memory: bool = False) -> list[str]:
+        """
+        Liste des PRAGMA à exécuter, dans l'ordre.
+
+        Args:
+            in_memory: True pour une base :memory: (ni WAL ni mmap)
+        """
+        statements = [f"PRAGMA busy_timeout = {self.busy_timeout_ms}"]
+        if self.journal_mode and not in_memory:
+            statements.append(f"PRAGMA journal_mode = {self.journal_mode}")
+        if self.synchronous:
+            statements.append(f"PRAGMA synchronous = {self.synchronous}")
+        if self.cache_size_kib:
+            # Valeur négative = taille en Kio plutôt qu'en nombre de pages
+            statements.append(f"PRAGMA cache_size = -{self.cache_size_kib}")
+        if self.mmap_size_mib and not in_memory:
+            statements.append(f"PRAGMA mmap_size = {self.mmap_size_mib * 1024 * 1024}")
+        if self.temp_store:
+            statements.append(f"PRAGMA temp_store = {self.temp_store}")
+        if in_memory:
+            # Cache partagé: pas de verrou de table pour les lecteurs
+            statements.append("PRAGMA read_uncommitted = 1")
+        statements.append(f"PRAGMA foreign_keys = {'ON' if self.foreign_keys else 'OFF'}")
+        return statements
+
+
 class DatabaseConfig:
     """Configuration de la base de données."""
 
-    def __init__(self, database_url: str = "sqlite:///./data/finance.db", echo: bool = False):
+    def __init__(
+        self,
+        database_url: str = "sqlite:///./data/finance.db",
+        echo: bool = False,
+        profile: Optional[SQLiteProfile] = None,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        money_storage: str = MONEY_STORAGE_DECIMAL,
+        uuid_storage: str = UUID_STORAGE_TEXT,
+    ):
         """
         Initialize database configuration.
 
         Args:
             database_url: Database URL (e.g., sqlite:///./data/finance.db)
             echo: Log SQL statements if True
+            profile: PRAGMA SQLite (défaut: SQLiteProfile.performance())
+            pool_size: Connexions gardées ouvertes (base fichier)
+            max_overflow: Connexions supplémentaires tolérées en pic
+            money_storage: Stockage des montants, "decimal" ou "cents" (INTEGER)
+            uuid_storage: Stockage des UUID, "text" ou "binary" (BLOB 16 octets)
+
+        Raises:
+            ValueError: Si money_storage ou uuid_storage est inconnu
         """
+        if money_storage not in MONEY_STORAGES:
+            raise ValueError(
+                f"Unknown money storage: {money_storage!r} "
+                f"(expected one of {', '.join(MONEY_STORAGES)})"
+            )
+        if uuid_storage not in UUID_STORAGES:
+            raise ValueError(
+                f"Unknown uuid storage: {uuid_storage!r} "
+                f"(expected one of {', '.join(UUID_STORAGES)})"
+            )
         self.database_url = database_url
         self.echo = echo
+        self.profile = profile or SQLiteProfile.performance()
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.money_storage = money_storage
+        self.uuid_storage = uuid_storage
+
+    @property
+    def is_sqlite(self) -> bool:
+        """True si la base est SQLite."""
+        return self.database_url.startswith("sqlite")
+
+    @property
+    def is_in_memory(self) -> bool:
+        """True pour une base SQLite en mémoire (sqlite:// ou :memory:)."""
+        return self.is_sqlite and (
+            ":memory:" in self.database_url
+            or self.database_url.rstrip("/") in ("sqlite:", "sqlite+pysqlite:")
+            or "mode=memory" in self.database_url
+        )
+
+    @property
+    def pool_capacity(self) -> Optional[int]:
+        """Connexions simultanées possibles (une seule pour une base en mémoire)."""
+        if not self.is_sqlite:
+            return None
+        if self.is_in_memory:
+            return 1
+        return self.pool_size + self.max_overflow
+
+
+@dataclass(frozen=True)
+class PoolStatus:
+    """
+    Instantané de l'utilisation du pool de connexions.
+
+    Attributes:
+        checked_out: Connexions actuellement empruntées
+        peak_checked_out: Maximum simultané observé depuis le démarrage
+        total_checkouts: Nombre total d'emprunts
+        capacity: Connexions simultanées possibles (None si non borné)
+    """
+
+    checked_out: int
+    peak_checked_out: int
+    total_checkouts: int
+    capacity: Optional[int]
+
+    @property
+    def utilization(self) -> Optional[float]:
+        """Part de la capacité actuellement utilisée (0.0 - 1.0)."""
+        if not self.capacity:
+            return None
+        return self.checked_out / self.capacity
+
+    def to_dict(self) -> dict:
+        """Représentation sérialisable (endpoint /health)."""
+        return {
+            "checked_out": self.checked_out,
+            "peak_checked_out": self.peak_checked_out,
+            "total_checkouts": self.total_checkouts,
+            "capacity": self.capacity,
+            "utilization": self.utilization,
+        }
+
+
+class PoolMonitor:
+    """
+    Compte les emprunts de connexions d'un moteur (events checkout/checkin).
+
+    Une session jamais fermée garde sa connexion: checked_out qui ne
+    redescend pas signale une fuite.
+    """
+
+    def __init__(self, capacity: Optional[int] = None):
+        """
+        Initialize monitor.
+
+        Args:
+            capacity: Connexions simultanées possibles (None si non borné)
+        """
+        self.capacity = capacity
+        self._lock = Lock()
+        self._checked_out = 0
+        self._peak = 0
+        self._total = 0
+
+    def install(self, engine: Engine) -> None:
+        """Enregistre les hooks checkout/checkin sur le pool du moteur."""
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        with self._lock:
+            self._checked_out += 1
+            self._total += 1
+            self._peak = max(self._peak, self._checked_out)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self._checked_out = max(0, self._checked_out - 1)
+
+    def status(self) -> PoolStatus:
+        """Retourne l'utilisation courante du pool."""
+        with self._lock:
+            return PoolStatus(
+                checked_out=self._checked_out,
+                peak_checked_out=self._peak,
+                total_checkouts=self._total,
+                capacity=self.capacity,
+            )
+
+
+def install_storage_modes(engine: Engine, config: DatabaseConfig) -> None:
+    """
+    Indique au moteur le stockage des montants et des UUID.
+
+    Lus par models.MoneyAmount et models.UUIDKey. À appeler avant toute
+    requête: le type de colonne et ses conversions sont résolus une fois
+    par dialect.
+
+    Args:
+        engine: Moteur SQLAlchemy synchrone
+        config: DatabaseConfig portant money_storage et uuid_storage
+    """
+    engine.dialect.money_storage = config.money_storage
+    engine.dialect.uuid_storage = config.uuid_storage
+
+
+def install_sqlite_profile(engine: Engine, config: DatabaseConfig) -> None:
+    """
+    Enregistre le hook "connect" qui applique le profil SQLite.
+
+    Partagé par le moteur synchrone et le moteur async (via sync_engine).
+
+    Args:
+        engine: Moteur SQLAlchemy synchrone
+        config: DatabaseConfig portant le profil
+    """
+    pragmas = config.profile.pragmas(in_memory=config.is_in_memory)
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record) -> None:
+        """Applique le profil SQLite à chaque nouvelle connexion."""
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in pragmas:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
 
 
 class Database:
@@ -49,6 +318,8 @@ class Database:
         """
         self.config = config
         self.engine = self._create_engine()
+        self.pool_monitor = PoolMonitor(config.pool_capacity)
+        self.pool_monitor.install(self.engine)
         self.SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
@@ -62,21 +333,43 @@ class Database:
         Returns:
             SQLAlchemy engine
         """
-        # Pour SQLite, désactiver la contrainte de clé étrangère par défaut
-        connect_args = {}
-
-        if self.config.database_url.startswith("sqlite"):
-            connect_args = {
-                "check_same_thread": False,  # Permettre l'accès multi-thread
-                "timeout": 30.0,  # Timeout de 30 secondes
-            }
-
-        engine = create_engine(
-            self.config.database_url,
-            connect_args=connect_args,
-            echo=self.config.echo,
-        )
-
+        if not self.config.is_sqlite:
+            engine = create_engine(self.config.database_url, echo=self.config.echo)
+            install_storage_modes(engine, self.config)
+            return engine
+
+        connect_args = {
+            "check_same_thread": False,  # Permettre l'accès multi-thread
+            "timeout": self.config.profile.busy_timeout_ms / 1000,
+        }
+
+        if self.config.is_in_memory:
+            # Une base :memory: n'existe que dans sa connexion: la partager
+            # entre tous les threads (sessions, TestClient, threadpool FastAPI).
+            # Nommée en cache partagé pour que le moteur async (aiosqlite)
+            # puisse ouvrir la même base.
+            engine = create_engine(
+                f"sqlite:///file:financetracker_{uuid4().hex}"
+                "?mode=memory&cache=shared&uri=true",
+                connect_args=connect_args,
+                poolclass=StaticPool,
+                echo=self.config.echo,
+            )
+        else:
+            # En WAL, lecteurs et écrivain travaillent en parallèle: un pool
+            # borné de connexions réutilisées évite de rouvrir le fichier
+            engine = create_engine(
+                self.config.database_url,
+                connect_args=connect_args,
+                poolclass=QueuePool,
+                pool_size=self.config.pool_size,
+                max_overflow=self.config.max_overflow,
+                pool_pre_ping=False,
+                echo=self.config.echo,
+            )
+
+        install_sqlite_profile(engine, self.config)
+        install_storage_modes(engine, self.config)
         return engine
 
     def get_session(self) -> Session:
@@ -140,6 +433,16 @@ class Database:
             logger.error(f"Database connection failed: {e}")
             return False
 
+    def pool_status(self) -> PoolStatus:
+        """
+        Retourne l'utilisation du pool de connexions.
+
+        Examples:
+            >>> db.pool_status().checked_out
+            0
+        """
+        return self.pool_monitor.status()
+
     def create_all_tables(self, base) -> None:
         """
         Crée toutes les tables à partir des modèles SQLAlchemy.
@@ -175,6 +478,9 @@ class Database:
         """
         Retourne la liste des noms de tables dans la base de données.
 
+        Les tables virtuelles (FTS5) et leurs tables internes sont exclues:
+        ce sont des index, pas des tables du modèle.
+
         Returns:
             List of table names
 
@@ -185,7 +491,22 @@ class Database:
             ['transactions', 'accounts', 'categories', ...]
         """
         inspector = inspect(self.engine)
-        return inspector.get_table_names()
+        names = inspector.get_table_names()
+
+        if self.engine.dialect.name != "sqlite":
+            return names
+
+        with self.engine.connect() as connection:
+            virtual = [
+                row[0] for row in connection.execute(text(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type = 'table' AND sql LIKE 'CREATE VIRTUAL TABLE%'"
+                ))
+            ]
+        return [
+            name for name in names
+            if not any(name == v or name.startswith(f"{v}_") for v in virtual)
+        ]
 
     def close(self) -> None:
         """Ferme le pool de connexions."""
@@ -12,9 +12,12 @@ Architecture:
 from __future__ import annotations
 
 from datetime import date, datetime
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
+from uuid import UUID
+
 from sqlalchemy import (
     Column,
+    LargeBinary,
     String,
     DateTime,
     Date,
@@ -26,13 +29,112 @@ from sqlalchemy import (
     Index,
     JSON,
     create_engine,
+    event,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
+from sqlalchemy.types import TypeDecorator
 
 Base = declarative_base()
 
 
+# Stockage des montants: "decimal" (NUMERIC) ou "cents" (INTEGER)
+MONEY_STORAGE_DECIMAL = "decimal"
+MONEY_STORAGE_CENTS = "cents"
+MONEY_STORAGES = (MONEY_STORAGE_DECIMAL, MONEY_STORAGE_CENTS)
+
+
+def money_in_cents(dialect) -> bool:
+    """True si le moteur stocke les montants en centimes (cf. install_storage_modes)."""
+    return getattr(dialect, "money_storage", MONEY_STORAGE_DECIMAL) == MONEY_STORAGE_CENTS
+
+
+class MoneyAmount(TypeDecorator):
+    """
+    Colonne de montant: NUMERIC (défaut) ou INTEGER en centimes.
+
+    Le mode est porté par le moteur (dialect.money_storage). En centimes:
+    - SQLite stocke un entier exact (pas de REAL ni de dérive des SUM)
+    - les agrégats SQL (SUM, solde) travaillent sur des entiers
+    - la lecture construit le Decimal directement depuis l'entier
+
+    Côté Python la valeur reste un Decimal à 2 décimales dans les deux modes.
+    """
+
+    impl = Numeric
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if money_in_cents(dialect):
+            return dialect.type_descriptor(Integer())
+        return super().load_dialect_impl(dialect)
+
+    def process_bind_param(self, value, dialect):
+        if value is None or not money_in_cents(dialect):
+            return value
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        return int(value.scaleb(2).to_integral_value(rounding=ROUND_HALF_UP))
+
+    def process_result_value(self, value, dialect):
+        if value is None or not money_in_cents(dialect):
+            return value
+        return Decimal(int(value)).scaleb(-2)
+
+
+# Stockage des identifiants: "text" (VARCHAR(36)) ou "binary" (BLOB de 16 octets)
+UUID_STORAGE_TEXT = "text"
+UUID_STORAGE_BINARY = "binary"
+UUID_STORAGES = (UUID_STORAGE_TEXT, UUID_STORAGE_BINARY)
+
+
+def uuid_as_binary(dialect) -> bool:
+    """True si le moteur stocke les UUID en BLOB (cf. install_storage_modes)."""
+    return getattr(dialect, "uuid_storage", UUID_STORAGE_TEXT) == UUID_STORAGE_BINARY
+
+
+class UUIDKey(TypeDecorator):
+    """
+    Colonne d'identifiant UUID: VARCHAR(36) (défaut) ou BLOB de 16 octets.
+
+    Le mode est porté par le moteur (dialect.uuid_storage). En binaire, les
+    lignes et les index (clés primaires, clés étrangères, index composites)
+    rétrécissent de 20 octets par UUID et les comparaisons portent sur 16
+    octets. L'ordre des BLOB est celui des chaînes hexadécimales: le tri
+    (date, id) de la pagination keyset est inchangé.
+
+    Côté Python la valeur reste la chaîne canonique dans les deux modes:
+    les repositories n'ont pas à connaître le stockage.
+    """
+
+    impl = String(36)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if uuid_as_binary(dialect):
+            return dialect.type_descriptor(LargeBinary(16))
+        return super().load_dialect_impl(dialect)
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if uuid_as_binary(dialect):
+            return value.bytes if isinstance(value, UUID) else UUID(value).bytes
+        return str(value) if isinstance(value, UUID) else value
+
+    def literal_processor(self, dialect):
+        if uuid_as_binary(dialect):
+            # Littéral BLOB (EXPLAIN QUERY PLAN, literal_binds)
+            return lambda value: f"X'{(value if isinstance(value, UUID) else UUID(value)).hex}'"
+        return super().literal_processor(dialect)
+
+    def process_result_value(self, value, dialect):
+        if value is None or not uuid_as_binary(dialect):
+            return value
+        h = value.hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 class TransactionModel(Base):
     """
     Modèle SQLAlchemy pour les transactions bancaires.
@@ -43,28 +145,29 @@ class TransactionModel(Base):
     __tablename__ = "transactions"
 
     # === Identité ===
-    id = Column(String(36), primary_key=True)
-    account_id = Column(String(36), ForeignKey("accounts.id"), nullable=False)
+    id = Column(UUIDKey(), primary_key=True)
+    account_id = Column(UUIDKey(), ForeignKey("accounts.id"), nullable=False)
 
     # === Données principales ===
     date = Column(Date, nullable=False, index=True)
     value_date = Column(Date, nullable=True)
-    amount = Column(Numeric(12, 2), nullable=False)  # Montant décimal
+    amount = Column(MoneyAmount(12, 2), nullable=False)  # Montant (décimal ou centimes)
     currency = Column(String(3), nullable=False, default="EUR")
     description = Column(String(500), nullable=False)
 
     # === Catégorisation ===
-    category_id = Column(String(36), ForeignKey("categories.id"), nullable=True, index=True)
+    category_id = Column(UUIDKey(), ForeignKey("categories.id"), nullable=True, index=True)
     category_confidence = Column(Float, nullable=False, default=0.0)
 
     # === Récurrence ===
     is_recurring = Column(Boolean, nullable=False, default=False)
-    recurring_id = Column(String(36), ForeignKey("recurring_transactions.id"), nullable=True)
+    recurring_id = Column(UUIDKey(), ForeignKey("recurring_transactions.id"), nullable=True)
 
     # === Métadonnées ===
     tags = Column(JSON, nullable=False, default=[])  # List of strings
     notes = Column(String(1000), nullable=False, default="")
     import_hash = Column(String(64), nullable=False, unique=True, index=True)
+    import_batch_id = Column(UUIDKey(), ForeignKey("import_batches.id"), nullable=True, index=True)
 
     # === Timestamps ===
     created_at = Column(DateTime, nullable=False, default=datetime.now)
@@ -84,6 +187,84 @@ class TransactionModel(Base):
         return f"<TransactionModel({self.id}, {self.date}, {self.amount} {self.currency})>"
 
 
+# Index de pagination keyset: couvre WHERE account_id = ? ORDER BY date DESC, id DESC
+# et les comptages filtrés par compte/période (déclaré hors classe pour DESC).
+Index(
+    "idx_transaction_account_date_id",
+    TransactionModel.account_id,
+    TransactionModel.date.desc(),
+    TransactionModel.id.desc(),
+)
+
+# Même schéma pour les listes filtrées par catégorie (TransactionQuery.category_ids)
+Index(
+    "idx_transaction_category_date_id",
+    TransactionModel.category_id,
+    TransactionModel.date.desc(),
+    TransactionModel.id.desc(),
+)
+
+
+# === Recherche plein texte (SQLite FTS5) ===
+#
+# Table FTS5 à contenu externe: le texte n'est pas dupliqué, l'index pointe
+# vers transactions.rowid. Les triggers maintiennent l'index à chaque
+# INSERT/UPDATE/DELETE, y compris hors ORM.
+# Note: VACUUM peut renuméroter les rowid (clé primaire non INTEGER); il
+# doit être suivi d'un rebuild (TRANSACTION_FTS_REBUILD).
+
+TRANSACTION_FTS_TABLE = "transactions_fts"
+
+TRANSACTION_FTS_DDL = (
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {TRANSACTION_FTS_TABLE} USING fts5(
+        description, notes,
+        content='transactions',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS transactions_fts_ai AFTER INSERT ON transactions BEGIN
+        INSERT INTO {TRANSACTION_FTS_TABLE}(rowid, description, notes)
+        VALUES (new.rowid, new.description, new.notes);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS transactions_fts_ad AFTER DELETE ON transactions BEGIN
+        INSERT INTO {TRANSACTION_FTS_TABLE}({TRANSACTION_FTS_TABLE}, rowid, description, notes)
+        VALUES ('delete', old.rowid, old.description, old.notes);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS transactions_fts_au
+        AFTER UPDATE OF description, notes ON transactions BEGIN
+        INSERT INTO {TRANSACTION_FTS_TABLE}({TRANSACTION_FTS_TABLE}, rowid, description, notes)
+        VALUES ('delete', old.rowid, old.description, old.notes);
+        INSERT INTO {TRANSACTION_FTS_TABLE}(rowid, description, notes)
+        VALUES (new.rowid, new.description, new.notes);
+    END""",
+)
+
+TRANSACTION_FTS_REBUILD = (
+    f"INSERT INTO {TRANSACTION_FTS_TABLE}({TRANSACTION_FTS_TABLE}) VALUES ('rebuild')"
+)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_transaction_fts(target, connection, **kw) -> None:
+    """Crée l'index FTS5 (et l'alimente s'il est ajouté à une base existante)."""
+    if connection.dialect.name != "sqlite":
+        return
+
+    existed = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE name = ?", (TRANSACTION_FTS_TABLE,)
+    ).first()
+    for statement in TRANSACTION_FTS_DDL:
+        connection.exec_driver_sql(statement)
+    if not existed:
+        connection.exec_driver_sql(TRANSACTION_FTS_REBUILD)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_transaction_fts(target, connection, **kw) -> None:
+    """Supprime l'index FTS5 (les triggers tombent avec la table transactions)."""
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {TRANSACTION_FTS_TABLE}")
+
+
 class AccountModel(Base):
     """
     Modèle SQLAlchemy pour les comptes bancaires.
@@ -94,7 +275,7 @@ class AccountModel(Base):
     __tablename__ = "accounts"
 
     # === Identité ===
-    id = Column(String(36), primary_key=True)
+    id = Column(UUIDKey(), primary_key=True)
 
     # === Données principales ===
     name = Column(String(255), nullable=False, index=True)
@@ -102,7 +283,7 @@ class AccountModel(Base):
     account_type = Column(String(50), nullable=False)  # checking, savings, investment
 
     # === Soldes ===
-    initial_balance = Column(Numeric(12, 2), nullable=False, default=0)
+    initial_balance = Column(MoneyAmount(12, 2), nullable=False, default=0)
     currency = Column(String(3), nullable=False, default="EUR")
 
     # === Statut ===
@@ -144,14 +325,14 @@ class CategoryModel(Base):
     __tablename__ = "categories"
 
     # === Identité ===
-    id = Column(String(36), primary_key=True)
+    id = Column(UUIDKey(), primary_key=True)
 
     # === Données principales ===
     name = Column(String(255), nullable=False, index=True)
     category_type = Column(String(50), nullable=False, index=True)  # income, expense, transfer, savings
 
     # === Hiérarchie ===
-    parent_id = Column(String(36), ForeignKey("categories.id"), nullable=True, index=True)
+    parent_id = Column(UUIDKey(), ForeignKey("categories.id"), nullable=True, index=True)
 
     # === Métadonnées visuelles ===
     icon = Column(String(100), nullable=True)
@@ -161,7 +342,7 @@ class CategoryModel(Base):
     keywords = Column(JSON, nullable=False, default=[])  # List of keywords
 
     # === Budgétisation ===
-    budget_default = Column(Numeric(10, 2), nullable=True)
+    budget_default = Column(MoneyAmount(10, 2), nullable=True)
 
     # === Timestamps ===
     created_at = Column(DateTime, nullable=False, default=datetime.now)
@@ -190,6 +371,126 @@ class CategoryModel(Base):
         return f"<CategoryModel({self.id}, {self.name}, {self.category_type})>"
 
 
+class CategoryClosureModel(Base):
+    """
+    Table de fermeture de la hiérarchie des catégories.
+
+    Une ligne par couple (ancêtre, descendant), y compris (c, c) à la
+    profondeur 0. Sous-arbre et ancêtres d'une catégorie deviennent une
+    jointure indexée au lieu d'une récursion. Maintenue par triggers sur
+    `categories` (cf. CATEGORY_CLOSURE_DDL).
+    """
+
+    __tablename__ = "category_closure"
+
+    ancestor_id = Column(UUIDKey(), ForeignKey("categories.id"), primary_key=True)
+    descendant_id = Column(UUIDKey(), ForeignKey("categories.id"), primary_key=True)
+    depth = Column(Integer, nullable=False)  # 0 = la catégorie elle-même
+
+    __table_args__ = (
+        # Ancêtres d'une catégorie (rollups); le sous-arbre utilise la clé primaire
+        Index("idx_category_closure_descendant", "descendant_id", "ancestor_id", "depth"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<CategoryClosureModel({self.ancestor_id} -> {self.descendant_id}, {self.depth})>"
+
+
+# === Maintenance de la table de fermeture ===
+#
+# Insertion: chemins des ancêtres du parent vers la nouvelle catégorie, puis
+# raccordement des enfants déjà présents (parent inséré après ses enfants).
+# Déplacement: les chemins des anciens ancêtres vers le sous-arbre sont
+# remplacés par ceux des nouveaux; un déplacement sous son propre
+# sous-arbre (cycle) est refusé. Suppression: chemins passant par la
+# catégorie retirés (ses enfants deviennent des racines de fait).
+
+CATEGORY_CLOSURE_TABLE = CategoryClosureModel.__tablename__
+
+CATEGORY_CLOSURE_DDL = (
+    f"""CREATE TRIGGER IF NOT EXISTS category_closure_ai AFTER INSERT ON categories BEGIN
+        INSERT INTO {CATEGORY_CLOSURE_TABLE} (ancestor_id, descendant_id, depth)
+        SELECT new.id, new.id, 0
+        UNION ALL
+        SELECT ancestor_id, new.id, depth + 1
+        FROM {CATEGORY_CLOSURE_TABLE} WHERE descendant_id = new.parent_id;
+        INSERT OR IGNORE INTO {CATEGORY_CLOSURE_TABLE} (ancestor_id, descendant_id, depth)
+        SELECT up.ancestor_id, down.descendant_id, up.depth + down.depth + 1
+        FROM {CATEGORY_CLOSURE_TABLE} AS up
+        JOIN categories AS child ON child.parent_id = new.id
+        JOIN {CATEGORY_CLOSURE_TABLE} AS down ON down.ancestor_id = child.id
+        WHERE up.descendant_id = new.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS category_closure_bu
+        BEFORE UPDATE OF parent_id ON categories
+        WHEN new.parent_id IS NOT NULL AND EXISTS (
+            SELECT 1 FROM {CATEGORY_CLOSURE_TABLE}
+            WHERE ancestor_id = new.id AND descendant_id = new.parent_id
+        )
+        BEGIN
+        SELECT RAISE(ABORT, 'category hierarchy cycle');
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS category_closure_au
+        AFTER UPDATE OF parent_id ON categories
+        WHEN old.parent_id IS NOT new.parent_id
+        BEGIN
+        DELETE FROM {CATEGORY_CLOSURE_TABLE}
+        WHERE descendant_id IN (
+            SELECT descendant_id FROM {CATEGORY_CLOSURE_TABLE} WHERE ancestor_id = new.id
+        )
+        AND ancestor_id IN (
+            SELECT ancestor_id FROM {CATEGORY_CLOSURE_TABLE}
+            WHERE descendant_id = new.id AND ancestor_id IS NOT new.id
+        );
+        INSERT INTO {CATEGORY_CLOSURE_TABLE} (ancestor_id, descendant_id, depth)
+        SELECT up.ancestor_id, down.descendant_id, up.depth + down.depth + 1
+        FROM {CATEGORY_CLOSURE_TABLE} AS up, {CATEGORY_CLOSURE_TABLE} AS down
+        WHERE up.descendant_id = new.parent_id AND down.ancestor_id = new.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS category_closure_bd BEFORE DELETE ON categories BEGIN
+        DELETE FROM {CATEGORY_CLOSURE_TABLE}
+        WHERE ancestor_id IN (
+            SELECT ancestor_id FROM {CATEGORY_CLOSURE_TABLE} WHERE descendant_id = old.id
+        )
+        AND descendant_id IN (
+            SELECT descendant_id FROM {CATEGORY_CLOSURE_TABLE} WHERE ancestor_id = old.id
+        );
+    END""",
+)
+
+# Recalcul complet depuis parent_id (ajout à une base existante, CLI).
+# UNION et borne de profondeur: termine même sur une hiérarchie cyclique.
+CATEGORY_CLOSURE_REBUILD = (
+    f"DELETE FROM {CATEGORY_CLOSURE_TABLE}",
+    f"""INSERT OR IGNORE INTO {CATEGORY_CLOSURE_TABLE} (ancestor_id, descendant_id, depth)
+        WITH RECURSIVE paths(ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM categories
+            UNION
+            SELECT paths.ancestor_id, categories.id, paths.depth + 1
+            FROM paths JOIN categories ON categories.parent_id = paths.descendant_id
+            WHERE paths.depth < 64
+        )
+        SELECT ancestor_id, descendant_id, MIN(depth)
+        FROM paths GROUP BY ancestor_id, descendant_id""",
+)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_category_closure_triggers(target, connection, **kw) -> None:
+    """Crée les triggers de fermeture (et recalcule si ajoutés à une base existante)."""
+    if connection.dialect.name != "sqlite":
+        return
+
+    existed = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'category_closure_ai'"
+    ).first()
+    for statement in CATEGORY_CLOSURE_DDL:
+        connection.exec_driver_sql(statement)
+    if not existed:
+        for statement in CATEGORY_CLOSURE_REBUILD:
+            connection.exec_driver_sql(statement)
+
+
 class RecurringTransactionModel(Base):
     """
     Modèle SQLAlchemy pour les transactions récurrentes.
@@ -200,18 +501,24 @@ class RecurringTransactionModel(Base):
     __tablename__ = "recurring_transactions"
 
     # === Identité ===
-    id = Column(String(36), primary_key=True)
-    account_id = Column(String(36), ForeignKey("accounts.id"), nullable=False, index=True)
+    id = Column(UUIDKey(), primary_key=True)
+    account_id = Column(UUIDKey(), ForeignKey("accounts.id"), nullable=False, index=True)
 
     # === Données principales ===
     name = Column(String(255), nullable=False, index=True)
-    amount = Column(Numeric(12, 2), nullable=False)
+    amount = Column(MoneyAmount(12, 2), nullable=False)
     currency = Column(String(3), nullable=False, default="EUR")
-    category_id = Column(String(36), ForeignKey("categories.id"), nullable=False, index=True)
+    category_id = Column(UUIDKey(), ForeignKey("categories.id"), nullable=False, index=True)
 
     # === Récurrence ===
     frequency = Column(String(50), nullable=False)  # daily, weekly, monthly, yearly
     day_of_month = Column(Integer, nullable=False)
+    interval = Column(Integer, nullable=False, default=1, server_default="1")
+    day_of_week = Column(Integer, nullable=True)  # 0 = lundi (weekly)
+    month_of_year = Column(Integer, nullable=True)  # 1-12 (yearly)
+    business_day_adjustment = Column(
+        String(30), nullable=False, default="none", server_default="none"
+    )
 
     # === Période ===
     start_date = Column(Date, nullable=False, index=True)
@@ -252,8 +559,8 @@ class CategoryKeywordModel(Base):
     __tablename__ = "category_keywords"
 
     # === Identité ===
-    id = Column(String(36), primary_key=True)
-    category_id = Column(String(36), ForeignKey("categories.id"), nullable=False, index=True)
+    id = Column(UUIDKey(), primary_key=True)
+    category_id = Column(UUIDKey(), ForeignKey("categories.id"), nullable=False, index=True)
 
     # === Données ===
     keyword = Column(String(255), nullable=False, index=True)
@@ -268,3 +575,268 @@ class CategoryKeywordModel(Base):
 
     def __repr__(self) -> str:
         return f"<CategoryKeywordModel({self.category_id}, {self.keyword})>"
+
+
+class MonthlyCategoryTotalModel(Base):
+    """
+    Rollup mensuel des transactions par (compte, catégorie, mois).
+
+    Table dérivée de `transactions`, maintenue par triggers SQLite à chaque
+    INSERT/UPDATE/DELETE (y compris hors ORM: recatégorisation en masse,
+    scripts). Les analyses lisent quelques centaines de lignes au lieu de
+    parcourir les transactions. category_id NULL = non catégorisé.
+    """
+
+    __tablename__ = "monthly_category_totals"
+
+    # === Identité ===
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    account_id = Column(UUIDKey(), ForeignKey("accounts.id"), nullable=False)
+    category_id = Column(UUIDKey(), ForeignKey("categories.id"), nullable=True)
+    month = Column(String(7), nullable=False)  # YYYY-MM
+
+    # === Agrégats ===
+    total = Column(MoneyAmount(14, 2), nullable=False, default=0)  # Somme signée
+    tx_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index(
+            "idx_monthly_totals_account_month_category",
+            "account_id", "month", "category_id",
+            unique=True,
+        ),
+        Index("idx_monthly_totals_month", "month"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<MonthlyCategoryTotalModel({self.account_id}, {self.category_id}, "
+            f"{self.month}, {self.total})>"
+        )
+
+
+
+class AccountProjectionModel(Base):
+    """
+    Projection en cache d'un compte pour le moteur d'alertes.
+
+    Corresponds to domain.value_objects.ProjectionSnapshot. lows contient
+    les records à la baisse du cumul planifié: [[date ISO, montant], ...].
+    """
+
+    __tablename__ = "account_projections"
+
+    # === Identité ===
+    account_id = Column(UUIDKey(), ForeignKey("accounts.id"), primary_key=True)
+
+    # === Entrées de la projection ===
+    as_of = Column(Date, nullable=False)
+    horizon_end = Column(Date, nullable=False)
+    scenario = Column(String(20), nullable=False)
+    recurring_digest = Column(String(32), nullable=False)
+
+    # === Résultat ===
+    lows = Column(JSON, nullable=False, default=list)
+    balance = Column(MoneyAmount(14, 2), nullable=False)
+    currency = Column(String(3), nullable=False, default="EUR")
+
+    # === Timestamps ===
+    updated_at = Column(DateTime, nullable=False, default=datetime.now, onupdate=datetime.now)
+
+    def __repr__(self) -> str:
+        return f"<AccountProjectionModel({self.account_id}, {self.as_of}, {self.balance})>"
+
+
+class AlertEventModel(Base):
+    """
+    Modèle SQLAlchemy pour les événements d'alerte.
+
+    Corresponds to domain.entities.Alert. dedup_key est unique: une même
+    situation n'est enregistrée qu'une fois.
+    """
+
+    __tablename__ = "alert_events"
+
+    # === Identité ===
+    id = Column(UUIDKey(), primary_key=True)
+    dedup_key = Column(String(120), nullable=False, unique=True)
+
+    # === Données principales ===
+    alert_type = Column(String(40), nullable=False)
+    trigger_date = Column(Date, nullable=False)
+    amount = Column(MoneyAmount(14, 2), nullable=False)
+    threshold = Column(MoneyAmount(14, 2), nullable=False)
+    currency = Column(String(3), nullable=False, default="EUR")
+    message = Column(String(500), nullable=False, default="")
+
+    # === Relations ===
+    account_id = Column(UUIDKey(), ForeignKey("accounts.id"), nullable=True)
+    category_id = Column(UUIDKey(), ForeignKey("categories.id"), nullable=True)
+
+    # === Timestamps ===
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    __table_args__ = (
+        Index("idx_alert_events_account_created", "account_id", "created_at"),
+        Index("idx_alert_events_created", "created_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<AlertEventModel({self.alert_type}, {self.trigger_date}, {self.amount})>"
+
+class ImportBatchModel(Base):
+    """
+    Modèle SQLAlchemy pour les lots d'import (provenance des transactions).
+
+    Corresponds to domain.entities.ImportBatch. (account_id, file_digest)
+    est unique: un fichier n'est importé qu'une fois par compte.
+    """
+
+    __tablename__ = "import_batches"
+
+    # === Identité ===
+    id = Column(UUIDKey(), primary_key=True)
+    account_id = Column(UUIDKey(), ForeignKey("accounts.id"), nullable=False)
+    file_digest = Column(String(64), nullable=False)
+
+    # === Données principales ===
+    file_name = Column(String(255), nullable=False, default="")
+    adapter = Column(String(100), nullable=False, default="")
+    row_count = Column(Integer, nullable=False, default=0)
+    imported_count = Column(Integer, nullable=False, default=0)
+    skipped_count = Column(Integer, nullable=False, default=0)
+    error_count = Column(Integer, nullable=False, default=0)
+    first_date = Column(Date, nullable=True)
+    last_date = Column(Date, nullable=True)
+
+    # === Timestamps ===
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    __table_args__ = (
+        Index("idx_import_batches_account_digest", "account_id", "file_digest", unique=True),
+        Index("idx_import_batches_account_created", "account_id", "created_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ImportBatchModel({self.id}, {self.file_name}, {self.imported_count}/{self.row_count})>"
+
+
+# === Colonnes ajoutées à une base existante ===
+#
+# create_all ne modifie pas une table déjà créée: les colonnes ajoutées depuis
+# sont créées ici (ALTER TABLE ADD COLUMN), avec leur index éventuel. Une
+# colonne NOT NULL doit avoir un server_default (exigé par SQLite).
+
+_recurring = RecurringTransactionModel.__table__.c
+
+ADDED_COLUMNS = (
+    (TransactionModel.__table__.c.import_batch_id, "ix_transactions_import_batch_id"),
+    (_recurring.interval, None),
+    (_recurring.day_of_week, None),
+    (_recurring.month_of_year, None),
+    (_recurring.business_day_adjustment, None),
+)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _add_missing_columns(target, connection, **kw) -> None:
+    """Ajoute les colonnes récentes aux tables créées avant elles."""
+    if connection.dialect.name != "sqlite":
+        return
+
+    for column, index_name in ADDED_COLUMNS:
+        table = column.table.name
+        existing = {row[1] for row in connection.exec_driver_sql(f"PRAGMA table_info({table})")}
+        if column.name in existing:
+            continue
+        ddl = f"{column.name} {column.type.compile(dialect=connection.dialect)}"
+        if column.server_default is not None:
+            ddl += f" DEFAULT '{column.server_default.arg}'"
+        if not column.nullable:
+            ddl += " NOT NULL"
+        connection.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {ddl}")
+        if index_name:
+            connection.exec_driver_sql(
+                f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({column.name})"
+            )
+
+
+# === Maintenance incrémentale des rollups mensuels ===
+#
+# category_id peut être NULL: la recherche de ligne utilise `IS` (et non `=`),
+# l'insertion n'a lieu que si la ligne n'existe pas encore. Une ligne dont le
+# compteur retombe à zéro est supprimée.
+
+MONTHLY_TOTALS_TABLE = MonthlyCategoryTotalModel.__tablename__
+
+_MONTHLY_TOTALS_MATCH = (
+    "account_id = {row}.account_id AND category_id IS {row}.category_id "
+    "AND month = substr({row}.date, 1, 7)"
+)
+
+
+def _monthly_totals_add(row: str) -> str:
+    """Statements ajoutant la transaction `row` (new/old) à son rollup."""
+    match = _MONTHLY_TOTALS_MATCH.format(row=row)
+    return f"""
+        UPDATE {MONTHLY_TOTALS_TABLE}
+        SET total = total + {row}.amount, tx_count = tx_count + 1
+        WHERE {match};
+        INSERT INTO {MONTHLY_TOTALS_TABLE} (account_id, category_id, month, total, tx_count)
+        SELECT {row}.account_id, {row}.category_id, substr({row}.date, 1, 7), {row}.amount, 1
+        WHERE NOT EXISTS (SELECT 1 FROM {MONTHLY_TOTALS_TABLE} WHERE {match});"""
+
+
+def _monthly_totals_remove(row: str) -> str:
+    """Statements retirant la transaction `row` (new/old) de son rollup."""
+    match = _MONTHLY_TOTALS_MATCH.format(row=row)
+    return f"""
+        UPDATE {MONTHLY_TOTALS_TABLE}
+        SET total = total - {row}.amount, tx_count = tx_count - 1
+        WHERE {match};
+        DELETE FROM {MONTHLY_TOTALS_TABLE} WHERE {match} AND tx_count <= 0;"""
+
+
+MONTHLY_TOTALS_DDL = (
+    f"""CREATE TRIGGER IF NOT EXISTS monthly_totals_ai AFTER INSERT ON transactions BEGIN
+        {_monthly_totals_add("new")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS monthly_totals_ad AFTER DELETE ON transactions BEGIN
+        {_monthly_totals_remove("old")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS monthly_totals_au
+        AFTER UPDATE OF account_id, category_id, date, amount ON transactions
+        WHEN old.account_id IS NOT new.account_id
+          OR old.category_id IS NOT new.category_id
+          OR old.date IS NOT new.date
+          OR old.amount IS NOT new.amount
+        BEGIN
+        {_monthly_totals_remove("old")}
+        {_monthly_totals_add("new")}
+    END""",
+)
+
+# Recalcul complet (ajout à une base existante, conversion de stockage, CLI)
+MONTHLY_TOTALS_REBUILD = (
+    f"DELETE FROM {MONTHLY_TOTALS_TABLE}",
+    f"""INSERT INTO {MONTHLY_TOTALS_TABLE} (account_id, category_id, month, total, tx_count)
+        SELECT account_id, category_id, substr(date, 1, 7), SUM(amount), COUNT(*)
+        FROM transactions
+        GROUP BY account_id, category_id, substr(date, 1, 7)""",
+)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_monthly_totals_triggers(target, connection, **kw) -> None:
+    """Crée les triggers de rollup (et recalcule si ajoutés à une base existante)."""
+    if connection.dialect.name != "sqlite":
+        return
+
+    existed = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'monthly_totals_ai'"
+    ).first()
+    for statement in MONTHLY_TOTALS_DDL:
+        connection.exec_driver_sql(statement)
+    if not existed:
+        for statement in MONTHLY_TOTALS_REBUILD:
+            connection.exec_driver_sql(statement)
@@ -6,9 +6,19 @@ SQLite implementations of domain repository ports.
 from src.infrastructure.persistence.repositories.sqlite_transaction_repository import SQLiteTransactionRepository
 from src.infrastructure.persistence.repositories.sqlite_account_repository import SQLiteAccountRepository
 from src.infrastructure.persistence.repositories.sqlite_category_repository import SQLiteCategoryRepository
+from src.infrastructure.persistence.repositories.sqlite_recurring_repository import SQLiteRecurringRepository
+from src.infrastructure.persistence.repositories.sqlite_analytics_repository import SQLiteAnalyticsRepository
+from src.infrastructure.persistence.repositories.sqlite_budget_repository import SQLiteBudgetRepository
+from src.infrastructure.persistence.repositories.sqlite_alert_repository import SQLiteAlertRepository
+from src.infrastructure.persistence.repositories.sqlite_import_batch_repository import SQLiteImportBatchRepository
 
 __all__ = [
     "SQLiteTransactionRepository",
     "SQLiteAccountRepository",
     "SQLiteCategoryRepository",
+    "SQLiteRecurringRepository",
+    "SQLiteAnalyticsRepository",
+    "SQLiteBudgetRepository",
+    "SQLiteAlertRepository",
+    "SQLiteImportBatchRepository",
 ]
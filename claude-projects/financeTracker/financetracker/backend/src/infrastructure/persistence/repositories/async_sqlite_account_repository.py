@@ -0,0 +1,62 @@
+"""
+Async SQLite Account Repository
+
+Variante asynchrone de SQLiteAccountRepository pour les routes FastAPI
+(même principe que AsyncSQLiteTransactionRepository: délégation via run_sync).
+"""
+from __future__ import annotations
+
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.account import Account
+from src.infrastructure.persistence.repositories.sqlite_account_repository import (
+    SQLiteAccountRepository,
+)
+
+
+class AsyncSQLiteAccountRepository:
+    """Accès asynchrone aux comptes (délègue à SQLiteAccountRepository)."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize repository with an async database session.
+
+        Args:
+            session: SQLAlchemy AsyncSession
+        """
+        self._session = session
+
+    async def _run(self, method: str, *args, **kwargs):
+        """Exécute une méthode de l'adapter synchrone dans la session async."""
+        return await self._session.run_sync(
+            lambda session: getattr(SQLiteAccountRepository(session), method)(
+                *args, **kwargs
+            )
+        )
+
+    # === Écriture ===
+
+    async def save(self, account: Account) -> None:
+        """Persiste un compte."""
+        await self._run("save", account)
+
+    async def delete(self, account_id: UUID) -> None:
+        """Supprime un compte."""
+        await self._run("delete", account_id)
+
+    # === Lecture ===
+
+    async def get_by_id(self, account_id: UUID) -> Optional[Account]:
+        """Récupère un compte par son ID."""
+        return await self._run("get_by_id", account_id)
+
+    async def find_active(self) -> List[Account]:
+        """Récupère les comptes actifs."""
+        return await self._run("find_active")
+
+    async def find_all(self) -> List[Account]:
+        """Récupère tous les comptes."""
+        return await self._run("find_all")
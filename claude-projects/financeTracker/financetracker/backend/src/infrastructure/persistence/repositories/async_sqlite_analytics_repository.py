@@ -0,0 +1,53 @@
+"""
+Async SQLite Analytics Repository
+
+Variante asynchrone de SQLiteAnalyticsRepository pour les routes FastAPI
+(même principe que AsyncSQLiteTransactionRepository: délégation via run_sync).
+"""
+from __future__ import annotations
+
+from typing import List, Sequence
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dto.spending_dto import CategorySpendingDTO
+from src.infrastructure.persistence.repositories.sqlite_analytics_repository import (
+    SQLiteAnalyticsRepository,
+)
+
+
+class AsyncSQLiteAnalyticsRepository:
+    """Accès asynchrone aux agrégats (délègue à SQLiteAnalyticsRepository)."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize repository with an async database session.
+
+        Args:
+            session: SQLAlchemy AsyncSession
+        """
+        self._session = session
+
+    async def _run(self, method: str, *args, **kwargs):
+        """Exécute une méthode de l'adapter synchrone dans la session async."""
+        return await self._session.run_sync(
+            lambda session: getattr(SQLiteAnalyticsRepository(session), method)(
+                *args, **kwargs
+            )
+        )
+
+    # === Lecture ===
+
+    async def spending_by_category(
+        self,
+        start_month: str,
+        end_month: str,
+        account_ids: Sequence[UUID] = (),
+        rollup: bool = True,
+    ) -> List[CategorySpendingDTO]:
+        """Totaux par catégorie et par mois sur une période."""
+        return await self._run(
+            "spending_by_category", start_month, end_month,
+            account_ids=account_ids, rollup=rollup,
+        )
@@ -0,0 +1,135 @@
+"""
+Async SQLite Transaction Repository
+
+Variante asynchrone de SQLiteTransactionRepository pour les routes FastAPI.
+
+Architecture:
+- Chaque méthode exécute l'adapter synchrone via AsyncSession.run_sync:
+  la construction SQL et le mapping restent à un seul endroit, les I/O
+  passent par aiosqlite et sont attendues sans bloquer la boucle
+- Même signatures que l'adapter synchrone, en coroutines
+- stream_rows fait exception: le SELECT est construit par l'adapter
+  synchrone mais lu via AsyncSession.stream (curseur côté serveur)
+"""
+from __future__ import annotations
+
+from datetime import date
+from typing import AsyncIterator, List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dto.transaction_row import TransactionRow
+from src.domain.entities.transaction import Transaction
+from src.domain.value_objects.date_range import DateRange
+from src.domain.value_objects.transaction_query import TransactionQuery
+from src.infrastructure.persistence.repositories.sqlite_transaction_repository import (
+    SQLiteTransactionRepository,
+)
+
+
+class AsyncSQLiteTransactionRepository:
+    """Accès asynchrone aux transactions (délègue à SQLiteTransactionRepository)."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize repository with an async database session.
+
+        Args:
+            session: SQLAlchemy AsyncSession
+        """
+        self._session = session
+
+    async def _run(self, method: str, *args, **kwargs):
+        """Exécute une méthode de l'adapter synchrone dans la session async."""
+        return await self._session.run_sync(
+            lambda session: getattr(SQLiteTransactionRepository(session), method)(
+                *args, **kwargs
+            )
+        )
+
+    # === Écriture ===
+
+    async def save(self, transaction: Transaction) -> None:
+        """Persiste une transaction unique."""
+        await self._run("save", transaction)
+
+    async def save_many(self, transactions: List[Transaction]) -> int:
+        """Persiste plusieurs transactions; retourne le nombre sauvegardé."""
+        return await self._run("save_many", transactions)
+
+    async def delete(self, transaction_id: UUID) -> bool:
+        """Supprime une transaction; True si supprimée."""
+        return await self._run("delete", transaction_id)
+
+    # === Lecture ===
+
+    async def get_by_id(self, transaction_id: UUID) -> Optional[Transaction]:
+        """Récupère une transaction par son ID."""
+        return await self._run("get_by_id", transaction_id)
+
+    async def find(
+        self,
+        query: TransactionQuery,
+        limit: Optional[int] = 100,
+        offset: int = 0,
+        after: Optional[tuple[date, UUID]] = None,
+    ) -> List[Transaction]:
+        """Récupère les transactions correspondant à une spécification."""
+        return await self._run("find", query, limit=limit, offset=offset, after=after)
+
+    async def find_rows(
+        self,
+        query: TransactionQuery,
+        limit: Optional[int] = 100,
+        offset: int = 0,
+        after: Optional[tuple[date, UUID]] = None,
+    ) -> List[TransactionRow]:
+        """Variante lecture seule de find() (TransactionRow, sans entités)."""
+        return await self._run("find_rows", query, limit=limit, offset=offset, after=after)
+
+    async def stream_rows(
+        self, query: TransactionQuery, batch_size: int = 1000
+    ) -> AsyncIterator[List[TransactionRow]]:
+        """
+        Lit toutes les transactions filtrées par paquets (export).
+
+        Args:
+            query: TransactionQuery (critères combinés en ET)
+            batch_size: Lignes par paquet (yield_per)
+
+        Yields:
+            Listes d'au plus batch_size TransactionRow, du plus ancien au plus récent
+        """
+        statement = SQLiteTransactionRepository(self._session.sync_session).rows_statement(query)
+        result = await self._session.stream(statement.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            yield [TransactionRow(*row) for row in partition]
+
+    async def find_by_account(
+        self,
+        account_id: UUID,
+        date_range: Optional[DateRange] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[tuple[date, UUID]] = None,
+    ) -> List[Transaction]:
+        """Récupère les transactions d'un compte (plus récentes d'abord)."""
+        return await self._run(
+            "find_by_account", account_id, date_range, limit=limit, offset=offset, after=after
+        )
+
+    async def search(
+        self,
+        text: str,
+        filters: Optional[TransactionQuery] = None,
+        limit: int = 20,
+    ) -> List[Transaction]:
+        """Recherche plein texte (FTS5), plus pertinentes d'abord."""
+        return await self._run("search", text, filters=filters, limit=limit)
+
+    # === Statistiques ===
+
+    async def count(self, query: TransactionQuery) -> int:
+        """Compte les transactions correspondant à une spécification."""
+        return await self._run("count", query)
@@ -0,0 +1,211 @@
+"""
+SQLite Alert Repository Implementation
+
+Implement the AlertRepository port using SQLAlchemy and SQLite.
+
+Architecture:
+- Soldes courants lus dans le rollup monthly_category_totals (maintenu par
+  triggers): quelques lignes par compte, quel que soit le nombre de
+  transactions
+- Une ligne de projection en cache par compte (account_projections)
+- Événements dédupliqués par dedup_key (index unique)
+"""
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+import logging
+
+from src.domain.entities.alert import Alert, AlertType
+from src.domain.repositories.alert_repository import AlertRepository
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.projection_snapshot import ProjectionSnapshot
+from src.domain.value_objects.scenario import Scenario
+from src.infrastructure.persistence.models import (
+    AccountModel,
+    AccountProjectionModel,
+    AlertEventModel,
+    MonthlyCategoryTotalModel,
+)
+
+logger = logging.getLogger(__name__)
+
+_totals = MonthlyCategoryTotalModel
+
+
+class SQLiteAlertRepository(AlertRepository):
+    """Implémentation SQLite du port AlertRepository."""
+
+    def __init__(self, session: Session):
+        """
+        Initialize repository with database session.
+
+        Args:
+            session: SQLAlchemy Session
+        """
+        self._session = session
+
+    # === Soldes ===
+
+    def current_balances(self, account_ids: Sequence[UUID]) -> dict[UUID, Money]:
+        """Solde initial + somme du rollup, en une requête."""
+        if not account_ids:
+            return {}
+        try:
+            net = (
+                select(_totals.account_id, func.sum(_totals.total).label("net"))
+                .where(_totals.account_id.in_([str(a) for a in account_ids]))
+                .group_by(_totals.account_id)
+                .subquery()
+            )
+            rows = self._session.execute(
+                select(
+                    AccountModel.id,
+                    AccountModel.initial_balance,
+                    AccountModel.currency,
+                    func.coalesce(net.c.net, 0).label("net"),
+                )
+                .outerjoin(net, net.c.account_id == AccountModel.id)
+                .where(AccountModel.id.in_([str(a) for a in account_ids]))
+            ).all()
+            return {
+                UUID(row.id): Money(row.initial_balance + Decimal(row.net), row.currency)
+                for row in rows
+            }
+        except SQLAlchemyError as e:
+            logger.error(f"Error reading account balances: {e}")
+            raise
+
+    # === Projections en cache ===
+
+    def find_snapshots(self, account_ids: Sequence[UUID]) -> dict[UUID, ProjectionSnapshot]:
+        """Récupère les projections en cache des comptes."""
+        if not account_ids:
+            return {}
+        try:
+            models = self._session.scalars(
+                select(AccountProjectionModel)
+                .where(AccountProjectionModel.account_id.in_([str(a) for a in account_ids]))
+            )
+            return {UUID(m.account_id): self._to_snapshot(m) for m in models}
+        except SQLAlchemyError as e:
+            logger.error(f"Error reading projection snapshots: {e}")
+            raise
+
+    def save_snapshots(self, snapshots: Iterable[ProjectionSnapshot]) -> None:
+        """Enregistre (ou remplace) les projections en cache."""
+        try:
+            for snapshot in snapshots:
+                self._session.merge(self._to_projection_model(snapshot))
+            self._session.flush()
+        except SQLAlchemyError as e:
+            self._session.rollback()
+            logger.error(f"Error saving projection snapshots: {e}")
+            raise
+
+    # === Événements ===
+
+    def add_alerts(self, alerts: Iterable[Alert]) -> List[Alert]:
+        """Enregistre les alertes dont la clé de déduplication est nouvelle."""
+        by_key = {alert.dedup_key: alert for alert in alerts}
+        if not by_key:
+            return []
+        try:
+            existing = set(self._session.scalars(
+                select(AlertEventModel.dedup_key)
+                .where(AlertEventModel.dedup_key.in_(list(by_key)))
+            ))
+            new = [alert for key, alert in by_key.items() if key not in existing]
+            self._session.add_all(self._to_event_model(alert) for alert in new)
+            self._session.flush()
+            if new:
+                logger.debug(f"{len(new)} alerts saved")
+            return new
+        except SQLAlchemyError as e:
+            self._session.rollback()
+            logger.error(f"Error saving alerts: {e}")
+            raise
+
+    def find_alerts(
+        self,
+        account_id: Optional[UUID] = None,
+        limit: int = 50,
+    ) -> List[Alert]:
+        """Récupère les dernières alertes, plus récentes d'abord."""
+        try:
+            statement = (
+                select(AlertEventModel)
+                .order_by(AlertEventModel.created_at.desc(), AlertEventModel.trigger_date)
+                .limit(limit)
+            )
+            if account_id is not None:
+                statement = statement.where(AlertEventModel.account_id == str(account_id))
+            return [self._to_alert(m) for m in self._session.scalars(statement)]
+        except SQLAlchemyError as e:
+            logger.error(f"Error reading alerts: {e}")
+            raise
+
+    # === Mapping ===
+
+    def _to_projection_model(self, snapshot: ProjectionSnapshot) -> AccountProjectionModel:
+        """Convertit un snapshot en modèle ORM."""
+        return AccountProjectionModel(
+            account_id=str(snapshot.account_id),
+            as_of=snapshot.as_of,
+            horizon_end=snapshot.horizon_end,
+            scenario=snapshot.scenario.value,
+            recurring_digest=snapshot.recurring_digest,
+            lows=[[day.isoformat(), str(cumulative)] for day, cumulative in snapshot.lows],
+            balance=snapshot.balance.amount,
+            currency=snapshot.balance.currency,
+        )
+
+    def _to_snapshot(self, model: AccountProjectionModel) -> ProjectionSnapshot:
+        """Convertit un modèle ORM en snapshot."""
+        return ProjectionSnapshot(
+            account_id=UUID(model.account_id),
+            as_of=model.as_of,
+            horizon_end=model.horizon_end,
+            scenario=Scenario(model.scenario),
+            recurring_digest=model.recurring_digest,
+            lows=tuple(
+                (date.fromisoformat(day), Decimal(cumulative)) for day, cumulative in model.lows
+            ),
+            balance=Money(model.balance, model.currency),
+        )
+
+    def _to_event_model(self, alert: Alert) -> AlertEventModel:
+        """Convertit une alerte en modèle ORM."""
+        return AlertEventModel(
+            id=str(alert.id),
+            dedup_key=alert.dedup_key,
+            alert_type=alert.alert_type.value,
+            trigger_date=alert.trigger_date,
+            amount=alert.amount.amount,
+            threshold=alert.threshold.amount,
+            currency=alert.amount.currency,
+            message=alert.message,
+            account_id=str(alert.account_id) if alert.account_id else None,
+            category_id=str(alert.category_id) if alert.category_id else None,
+            created_at=alert.created_at,
+        )
+
+    def _to_alert(self, model: AlertEventModel) -> Alert:
+        """Convertit un modèle ORM en alerte."""
+        return Alert(
+            id=UUID(model.id),
+            alert_type=AlertType(model.alert_type),
+            trigger_date=model.trigger_date,
+            amount=Money(model.amount, model.currency),
+            threshold=Money(model.threshold, model.currency),
+            account_id=UUID(model.account_id) if model.account_id else None,
+            category_id=UUID(model.category_id) if model.category_id else None,
+            message=model.message,
+            created_at=model.created_at,
+        )
@@ -0,0 +1,128 @@
+"""
+SQLite Analytics Repository
+
+Lectures agrégées pour les endpoints d'analyse.
+
+Architecture:
+- Read model: pas de port de domaine, pas d'entités, des DTO applicatifs
+- Lit exclusivement le rollup monthly_category_totals (maintenu par triggers,
+  cf. models.MONTHLY_TOTALS_DDL): quelques lignes par compte et par mois,
+  quel que soit le nombre de transactions
+- Cumul hiérarchique par jointure sur la table de fermeture category_closure
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+import logging
+
+from src.application.dto.spending_dto import CategorySpendingDTO
+from src.infrastructure.persistence.models import (
+    CategoryClosureModel,
+    CategoryModel,
+    MonthlyCategoryTotalModel,
+)
+
+logger = logging.getLogger(__name__)
+
+_totals = MonthlyCategoryTotalModel
+_closure = CategoryClosureModel
+
+
+class SQLiteAnalyticsRepository:
+    """Agrégats de dépenses par catégorie et par mois (lecture seule)."""
+
+    def __init__(self, session: Session):
+        """
+        Initialize repository with database session.
+
+        Args:
+            session: SQLAlchemy Session
+        """
+        self._session = session
+
+    # === Lecture ===
+
+    def spending_by_category(
+        self,
+        start_month: str,
+        end_month: str,
+        account_ids: Sequence[UUID] = (),
+        rollup: bool = True,
+    ) -> List[CategorySpendingDTO]:
+        """
+        Totaux par catégorie et par mois sur une période.
+
+        Args:
+            start_month: Premier mois inclus (YYYY-MM)
+            end_month: Dernier mois inclus (YYYY-MM)
+            account_ids: Comptes à inclure (tous si vide)
+            rollup: Cumule chaque sous-catégorie dans tous ses ancêtres
+
+        Returns:
+            Une entrée par catégorie (None = non catégorisé), triée par
+            montant absolu décroissant; mois triés chronologiquement
+        """
+        try:
+            if rollup:
+                # Chaque ligne compte pour sa catégorie et tous ses ancêtres;
+                # une catégorie absente de la hiérarchie reste seule
+                category = func.coalesce(_closure.ancestor_id, _totals.category_id)
+                source = _totals.__table__.outerjoin(
+                    _closure.__table__, _closure.descendant_id == _totals.category_id
+                )
+            else:
+                category = _totals.category_id
+                source = _totals.__table__
+
+            statement = (
+                select(
+                    category.label("category_id"),
+                    _totals.month,
+                    func.sum(_totals.total).label("total"),
+                    func.sum(_totals.tx_count).label("count"),
+                )
+                .select_from(source)
+                .where(_totals.month >= start_month, _totals.month <= end_month)
+                .group_by(category, _totals.month)
+                .order_by(_totals.month)
+            )
+            if account_ids:
+                statement = statement.where(
+                    _totals.account_id.in_([str(a) for a in account_ids])
+                )
+
+            rows = self._session.execute(statement).all()
+            return self._to_dtos(rows)
+        except SQLAlchemyError as e:
+            logger.error(f"Error reading monthly category totals: {e}")
+            raise
+
+    # === Helpers ===
+
+    def _to_dtos(self, rows) -> List[CategorySpendingDTO]:
+        """Regroupe les lignes (catégorie, mois) et ajoute noms et parents."""
+        categories = {
+            row.id: row
+            for row in self._session.execute(
+                select(CategoryModel.id, CategoryModel.name, CategoryModel.parent_id)
+            )
+        }
+
+        spending: dict[Optional[str], CategorySpendingDTO] = {}
+        for row in rows:
+            dto = spending.get(row.category_id)
+            if dto is None:
+                info = categories.get(row.category_id)
+                dto = spending[row.category_id] = CategorySpendingDTO(
+                    category_id=row.category_id,
+                    name=info.name if info else None,
+                    parent_id=info.parent_id if info else None,
+                )
+            dto.add(row.month, row.total, row.count)
+
+        return sorted(spending.values(), key=lambda dto: -abs(dto.total))
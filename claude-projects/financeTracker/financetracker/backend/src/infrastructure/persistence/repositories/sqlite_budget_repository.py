@@ -0,0 +1,111 @@
+"""
+SQLite Budget Repository Implementation
+
+Implement the BudgetRepository port using SQLAlchemy and SQLite.
+
+Architecture:
+- Dépense constatée lue dans le rollup monthly_category_totals (maintenu par
+  triggers), jamais dans les transactions
+- Sous-catégories cumulées par jointure sur la table de fermeture
+- Toutes les catégories budgétées en une requête, quel que soit leur nombre
+"""
+from __future__ import annotations
+
+from datetime import date
+from typing import List, Sequence
+from uuid import UUID
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+import logging
+
+from src.domain.repositories.budget_repository import BudgetRepository
+from src.domain.value_objects.budget_status import BudgetLine
+from src.domain.value_objects.money import Money
+from src.infrastructure.persistence.models import (
+    CategoryClosureModel,
+    CategoryModel,
+    MonthlyCategoryTotalModel,
+)
+
+logger = logging.getLogger(__name__)
+
+_totals = MonthlyCategoryTotalModel
+_closure = CategoryClosureModel
+
+
+class SQLiteBudgetRepository(BudgetRepository):
+    """Implémentation SQLite du port BudgetRepository."""
+
+    def __init__(self, session: Session):
+        """
+        Initialize repository with database session.
+
+        Args:
+            session: SQLAlchemy Session
+        """
+        self._session = session
+
+    # === Lecture ===
+
+    def find_budget_lines(
+        self,
+        month: date,
+        account_ids: Sequence[UUID] = (),
+    ) -> List[BudgetLine]:
+        """Récupère les catégories budgétées et leur dépense du mois."""
+        try:
+            join_totals = and_(
+                _totals.category_id == _closure.descendant_id,
+                _totals.month == f"{month:%Y-%m}",
+            )
+            if account_ids:
+                join_totals = and_(
+                    join_totals, _totals.account_id.in_([str(a) for a in account_ids])
+                )
+
+            statement = (
+                select(
+                    CategoryModel.id,
+                    CategoryModel.name,
+                    CategoryModel.budget_default,
+                    func.coalesce(func.sum(_totals.total), 0).label("net"),
+                )
+                .join(_closure, _closure.ancestor_id == CategoryModel.id)
+                .outerjoin(_totals.__table__, join_totals)
+                .where(CategoryModel.budget_default.is_not(None))
+                .group_by(CategoryModel.id)
+                .order_by(CategoryModel.name)
+            )
+            rows = self._session.execute(statement).all()
+            subtrees = self._subtrees([row.id for row in rows])
+
+            return [
+                BudgetLine(
+                    category_id=UUID(row.id),
+                    name=row.name,
+                    budget=Money(row.budget_default),
+                    # Dépenses négatives: la dépense nette est l'opposé de la somme
+                    spent=Money(-row.net),
+                    category_ids=subtrees.get(row.id, frozenset({UUID(row.id)})),
+                )
+                for row in rows
+            ]
+        except SQLAlchemyError as e:
+            logger.error(f"Error reading budget lines: {e}")
+            raise
+
+    # === Helpers ===
+
+    def _subtrees(self, category_ids: List[str]) -> dict[str, frozenset[UUID]]:
+        """Sous-arbre (catégorie comprise) de chaque catégorie, en une requête."""
+        if not category_ids:
+            return {}
+        subtrees: dict[str, set[UUID]] = {}
+        for ancestor_id, descendant_id in self._session.execute(
+            select(_closure.ancestor_id, _closure.descendant_id)
+            .where(_closure.ancestor_id.in_(category_ids))
+        ):
+            subtrees.setdefault(ancestor_id, set()).add(UUID(descendant_id))
+        return {k: frozenset(v) for k, v in subtrees.items()}
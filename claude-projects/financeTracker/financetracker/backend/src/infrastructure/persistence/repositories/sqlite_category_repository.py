@@ -14,7 +14,7 @@ import logging
 
 from src.domain.entities.category import Category, CategoryType
 from src.domain.repositories.category_repository import CategoryRepository
-from src.infrastructure.persistence.models import CategoryModel
+from src.infrastructure.persistence.models import CategoryClosureModel, CategoryModel
 
 logger = logging.getLogger(__name__)
 
@@ -123,6 +123,22 @@ class SQLiteCategoryRepository(CategoryRepository):
             logger.error(f"Error finding child categories: {e}")
             raise
 
+    def find_descendants(self, category_id: UUID) -> List[Category]:
+        """Récupère le sous-arbre d'une catégorie (une jointure sur category_closure)."""
+        try:
+            models = self._session.query(CategoryModel).join(
+                CategoryClosureModel,
+                CategoryClosureModel.descendant_id == CategoryModel.id,
+            ).filter(
+                CategoryClosureModel.ancestor_id == str(category_id),
+                CategoryClosureModel.depth > 0,
+            ).order_by(CategoryClosureModel.depth, CategoryModel.name).all()
+
+            return [self._to_entity(m) for m in models]
+        except SQLAlchemyError as e:
+            logger.error(f"Error finding descendant categories: {e}")
+            raise
+
     def find_by_keyword(self, keyword: str) -> List[Category]:
         """
         Récupère les catégories contenant un mot-clé.
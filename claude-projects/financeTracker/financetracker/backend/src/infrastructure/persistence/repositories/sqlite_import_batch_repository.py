@@ -0,0 +1,165 @@
+"""
+SQLite Import Batch Repository Implementation
+
+Implement the ImportBatchRepository port using SQLAlchemy and SQLite.
+
+Architecture:
+- Recherche par empreinte sur l'index unique (account_id, file_digest)
+- Annulation d'un lot: un DELETE ensembliste sur transactions.import_batch_id
+  (index); les triggers maintiennent rollups et index FTS
+"""
+from __future__ import annotations
+
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+import logging
+
+from src.domain.entities.import_batch import ImportBatch
+from src.domain.repositories.import_batch_repository import ImportBatchRepository
+from src.domain.value_objects.date_range import DateRange
+from src.infrastructure.persistence.models import ImportBatchModel, TransactionModel
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteImportBatchRepository(ImportBatchRepository):
+    """Implémentation SQLite du port ImportBatchRepository."""
+
+    def __init__(self, session: Session):
+        """
+        Initialize repository with database session.
+
+        Args:
+            session: SQLAlchemy Session
+        """
+        self._session = session
+
+    # === Écriture ===
+
+    def save(self, batch: ImportBatch) -> None:
+        """Enregistre (ou remplace) un lot."""
+        try:
+            self._session.merge(self._to_model(batch))
+            self._session.flush()
+        except SQLAlchemyError as e:
+            self._session.rollback()
+            logger.error(f"Error saving import batch: {e}")
+            raise
+
+    def delete_with_transactions(self, batch_id: UUID) -> Optional[int]:
+        """Supprime le lot et ses transactions en deux requêtes ensemblistes."""
+        try:
+            if self._session.get(ImportBatchModel, str(batch_id)) is None:
+                return None
+            count = self._session.execute(
+                delete(TransactionModel)
+                .where(TransactionModel.import_batch_id == str(batch_id))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            self._session.execute(
+                delete(ImportBatchModel)
+                .where(ImportBatchModel.id == str(batch_id))
+                .execution_options(synchronize_session=False)
+            )
+            self._session.expire_all()
+            logger.debug(f"Undid import batch {batch_id}: {count} transactions deleted")
+            return count
+        except SQLAlchemyError as e:
+            self._session.rollback()
+            logger.error(f"Error deleting import batch: {e}")
+            raise
+
+    # === Lecture ===
+
+    def get_by_id(self, batch_id: UUID) -> Optional[ImportBatch]:
+        """Récupère un lot par son ID."""
+        try:
+            model = self._session.get(ImportBatchModel, str(batch_id))
+            return self._to_entity(model) if model else None
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting import batch: {e}")
+            raise
+
+    def find_by_digest(self, account_id: UUID, file_digest: str) -> Optional[ImportBatch]:
+        """Lot ayant déjà importé ce fichier dans ce compte."""
+        try:
+            model = self._session.scalars(
+                select(ImportBatchModel).where(
+                    ImportBatchModel.account_id == str(account_id),
+                    ImportBatchModel.file_digest == file_digest,
+                )
+            ).first()
+            return self._to_entity(model) if model else None
+        except SQLAlchemyError as e:
+            logger.error(f"Error finding import batch by digest: {e}")
+            raise
+
+    def find_by_account(self, account_id: UUID, limit: int = 50) -> List[ImportBatch]:
+        """Derniers lots d'un compte, plus récents d'abord."""
+        try:
+            models = self._session.scalars(
+                select(ImportBatchModel)
+                .where(ImportBatchModel.account_id == str(account_id))
+                .order_by(ImportBatchModel.created_at.desc())
+                .limit(limit)
+            )
+            return [self._to_entity(m) for m in models]
+        except SQLAlchemyError as e:
+            logger.error(f"Error finding import batches: {e}")
+            raise
+
+    def find_spans(self, account_id: UUID) -> List[DateRange]:
+        """Périodes des lots du compte, lues sans charger les lots."""
+        try:
+            rows = self._session.execute(
+                select(ImportBatchModel.first_date, ImportBatchModel.last_date)
+                .where(
+                    ImportBatchModel.account_id == str(account_id),
+                    ImportBatchModel.first_date.is_not(None),
+                )
+                .order_by(ImportBatchModel.first_date)
+            ).all()
+            return [DateRange(row.first_date, row.last_date) for row in rows]
+        except SQLAlchemyError as e:
+            logger.error(f"Error reading import batch spans: {e}")
+            raise
+
+    # === Mappers (Domain ↔ Model) ===
+
+    @staticmethod
+    def _to_model(entity: ImportBatch) -> ImportBatchModel:
+        return ImportBatchModel(
+            id=str(entity.id),
+            account_id=str(entity.account_id),
+            file_digest=entity.file_digest,
+            file_name=entity.file_name,
+            adapter=entity.adapter,
+            row_count=entity.row_count,
+            imported_count=entity.imported_count,
+            skipped_count=entity.skipped_count,
+            error_count=entity.error_count,
+            first_date=entity.first_date,
+            last_date=entity.last_date,
+            created_at=entity.created_at,
+        )
+
+    @staticmethod
+    def _to_entity(model: ImportBatchModel) -> ImportBatch:
+        return ImportBatch(
+            id=UUID(model.id),
+            account_id=UUID(model.account_id),
+            file_digest=model.file_digest,
+            file_name=model.file_name,
+            adapter=model.adapter,
+            row_count=model.row_count,
+            imported_count=model.imported_count,
+            skipped_count=model.skipped_count,
+            error_count=model.error_count,
+            first_date=model.first_date,
+            last_date=model.last_date,
+            created_at=model.created_at,
+        )
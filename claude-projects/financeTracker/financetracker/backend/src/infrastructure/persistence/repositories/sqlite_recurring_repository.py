@@ -0,0 +1,171 @@
+"""
+SQLite Recurring Repository Implementation
+
+Implement the RecurringRepository port using SQLAlchemy and SQLite.
+"""
+from __future__ import annotations
+
+from datetime import date
+from typing import Optional, List
+from uuid import UUID
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+import logging
+
+from src.domain.entities.recurring_transaction import (
+    BusinessDayAdjustment,
+    Frequency,
+    RecurringTransaction,
+)
+from src.domain.repositories.recurring_repository import RecurringRepository
+from src.domain.value_objects.money import Money
+from src.infrastructure.persistence.models import RecurringTransactionModel
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteRecurringRepository(RecurringRepository):
+    """Implémentation SQLite du port RecurringRepository."""
+
+    def __init__(self, session: Session):
+        """
+        Initialize repository with database session.
+
+        Args:
+            session: SQLAlchemy Session
+        """
+        self._session = session
+
+    # === Écriture ===
+
+    def save(self, recurring_transaction: RecurringTransaction) -> None:
+        """Persiste une transaction récurrente."""
+        try:
+            model = self._to_model(recurring_transaction)
+            self._session.merge(model)
+            self._session.flush()
+            logger.debug(f"Recurring transaction saved: {recurring_transaction.id}")
+        except SQLAlchemyError as e:
+            self._session.rollback()
+            logger.error(f"Error saving recurring transaction: {e}")
+            raise
+
+    def delete(self, recurring_id: UUID) -> None:
+        """Supprime une transaction récurrente."""
+        try:
+            model = self._session.query(RecurringTransactionModel).filter_by(
+                id=str(recurring_id)
+            ).first()
+
+            if model:
+                self._session.delete(model)
+                self._session.flush()
+                logger.debug(f"Recurring transaction deleted: {recurring_id}")
+        except SQLAlchemyError as e:
+            self._session.rollback()
+            logger.error(f"Error deleting recurring transaction: {e}")
+            raise
+
+    # === Lecture ===
+
+    def get_by_id(self, recurring_id: UUID) -> Optional[RecurringTransaction]:
+        """Récupère une transaction récurrente par son ID."""
+        try:
+            model = self._session.query(RecurringTransactionModel).filter_by(
+                id=str(recurring_id)
+            ).first()
+
+            return self._to_entity(model) if model else None
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting recurring transaction: {e}")
+            raise
+
+    def find_by_account(self, account_id: UUID) -> List[RecurringTransaction]:
+        """Récupère toutes les transactions récurrentes d'un compte."""
+        try:
+            models = self._session.query(RecurringTransactionModel).filter_by(
+                account_id=str(account_id)
+            ).order_by(RecurringTransactionModel.name).all()
+
+            return [self._to_entity(m) for m in models]
+        except SQLAlchemyError as e:
+            logger.error(f"Error finding recurring transactions by account: {e}")
+            raise
+
+    def find_active(self, on_date: Optional[date] = None) -> List[RecurringTransaction]:
+        """Récupère les transactions récurrentes actives à une date."""
+        on_date = on_date or date.today()
+        try:
+            models = self._session.query(RecurringTransactionModel).filter(
+                RecurringTransactionModel.start_date <= on_date,
+                or_(
+                    RecurringTransactionModel.end_date.is_(None),
+                    RecurringTransactionModel.end_date >= on_date,
+                ),
+            ).order_by(RecurringTransactionModel.name).all()
+
+            return [self._to_entity(m) for m in models]
+        except SQLAlchemyError as e:
+            logger.error(f"Error finding active recurring transactions: {e}")
+            raise
+
+    def find_all(self) -> List[RecurringTransaction]:
+        """Récupère toutes les transactions récurrentes."""
+        try:
+            models = self._session.query(RecurringTransactionModel).order_by(
+                RecurringTransactionModel.name
+            ).all()
+
+            return [self._to_entity(m) for m in models]
+        except SQLAlchemyError as e:
+            logger.error(f"Error finding all recurring transactions: {e}")
+            raise
+
+    # === Mappers ===
+
+    def _to_model(self, entity: RecurringTransaction) -> RecurringTransactionModel:
+        """Convertit une entité de domaine en modèle SQLAlchemy."""
+        return RecurringTransactionModel(
+            id=str(entity.id),
+            account_id=str(entity.account_id),
+            name=entity.name,
+            amount=entity.amount.amount,
+            currency=entity.amount.currency,
+            category_id=str(entity.category_id),
+            frequency=entity.frequency.value,
+            day_of_month=entity.day_of_month,
+            interval=entity.interval,
+            day_of_week=entity.day_of_week,
+            month_of_year=entity.month_of_year,
+            business_day_adjustment=entity.business_day_adjustment.value,
+            start_date=entity.start_date,
+            end_date=entity.end_date,
+            is_variable=entity.is_variable,
+            variance_percent=entity.variance_percent,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+        )
+
+    def _to_entity(self, model: RecurringTransactionModel) -> RecurringTransaction:
+        """Convertit un modèle SQLAlchemy en entité de domaine (sans re-validation)."""
+        return RecurringTransaction.from_trusted(
+            id=UUID(model.id),
+            account_id=UUID(model.account_id),
+            name=model.name,
+            amount=Money.from_trusted(model.amount, model.currency),
+            category_id=UUID(model.category_id),
+            frequency=Frequency(model.frequency),
+            day_of_month=model.day_of_month,
+            interval=model.interval,
+            day_of_week=model.day_of_week,
+            month_of_year=model.month_of_year,
+            business_day_adjustment=BusinessDayAdjustment(model.business_day_adjustment),
+            start_date=model.start_date,
+            end_date=model.end_date,
+            is_variable=model.is_variable,
+            variance_percent=model.variance_percent,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
@@ -7,30 +7,90 @@ Architecture:
 - Implements domain.repositories.TransactionRepository port
 - Mappers between domain entities and SQLAlchemy models
 - Proper transaction handling and error management
+- save_chunked: doublons d'import_hash écartés avant insertion, puis un
+  SAVEPOINT par lot; un lot refusé est coupé en deux jusqu'à isoler les
+  lignes fautives (log2(taille) niveaux au plus)
 """
 from __future__ import annotations
 
-from typing import Optional, List
+import re
+from typing import Iterator, Optional, List
 from decimal import Decimal
 from uuid import UUID
 from datetime import date
 
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from sqlalchemy import (
+    Integer,
+    column,
+    exists,
+    func,
+    literal_column,
+    or_,
+    select,
+    table,
+    tuple_,
+    type_coerce,
+)
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql import Select
+from sqlalchemy.exc import DataError, IntegrityError, SQLAlchemyError, StatementError
 import logging
 
+from src.application.dto.transaction_row import TransactionRow
 from src.domain.entities.transaction import Transaction
-from src.domain.repositories.transaction_repository import TransactionRepository
+from src.domain.repositories.transaction_repository import (
+    TransactionBulkWritePort,
+    TransactionRepository,
+    TransactionQueryPort,
+    TransactionSearchPort,
+)
 from src.domain.value_objects.date_range import DateRange
 from src.domain.value_objects.money import Money
-from src.infrastructure.persistence.models import TransactionModel
+from src.domain.value_objects.save_report import (
+    DUPLICATE_HASH_REASON,
+    RejectedTransaction,
+    SaveReport,
+)
+from src.domain.value_objects.transaction_query import TransactionQuery
+from src.infrastructure.persistence.models import (
+    CategoryClosureModel,
+    TransactionModel,
+    TRANSACTION_FTS_TABLE,
+    money_in_cents,
+)
 
 logger = logging.getLogger(__name__)
 
+# Curseur de pagination keyset: (date, id) de la dernière ligne vue
+Cursor = tuple[date, UUID]
 
-class SQLiteTransactionRepository(TransactionRepository):
+# Index FTS5 (voir models.TRANSACTION_FTS_DDL), joint sur transactions.rowid
+_fts = table(TRANSACTION_FTS_TABLE, column("rowid"), column("rank"), column(TRANSACTION_FTS_TABLE))
+_transaction_rowid = literal_column("transactions.rowid")
+
+# Colonnes du modèle de lecture TransactionRow (même ordre que ROW_FIELDS)
+_ROW_COLUMNS = tuple(getattr(TransactionModel, name) for name in TransactionRow.ROW_FIELDS)
+
+
+def _is_row_error(error: SQLAlchemyError) -> bool:
+    """Erreur imputable aux lignes du lot (contrainte, valeur), pas à la base."""
+    if isinstance(error, (IntegrityError, DataError)):
+        return True
+    # Conversion d'une valeur avant envoi au driver (StatementError nue)
+    return type(error) is StatementError
+
+
+def _error_reason(error: SQLAlchemyError) -> str:
+    """Message du driver sans le SQL ni les paramètres."""
+    return str(getattr(error, "orig", None) or error).splitlines()[0]
+
+
+class SQLiteTransactionRepository(
+    TransactionRepository, TransactionQueryPort, TransactionSearchPort, TransactionBulkWritePort
+):
     """
-    Implémentation SQLite du port TransactionRepository.
+    Implémentation SQLite des ports TransactionRepository, TransactionQueryPort,
+    TransactionSearchPort (FTS5) et TransactionBulkWritePort.
 
     Gère la persistance des transactions via SQLAlchemy ORM.
     """
@@ -109,6 +169,82 @@ class SQLiteTransactionRepository(TransactionRepository):
             logger.error(f"Error saving transactions: {e}")
             raise
 
+    def save_chunked(
+        self, transactions: List[Transaction], chunk_size: int = 500
+    ) -> SaveReport:
+        """
+        Insère de nouvelles transactions par lots, chacun dans un SAVEPOINT.
+
+        Les doublons d'import_hash (déjà en base ou répétés dans la liste)
+        sont écartés avant l'insertion: une requête IN par lot. Un lot
+        refusé malgré tout est annulé seul puis coupé en deux et retenté:
+        les lignes valides sont insérées, chaque ligne fautive est rapportée.
+
+        Args:
+            transactions: Transactions à insérer
+            chunk_size: Taille des lots
+
+        Returns:
+            SaveReport (sauvegardées, refusées dans l'ordre d'origine)
+
+        Raises:
+            SQLAlchemyError: Erreur de la base elle-même (verrou, disque...)
+        """
+        rejected: list[RejectedTransaction] = []
+        seen: set[str] = set()
+        saved = 0
+        for start in range(0, len(transactions), chunk_size):
+            chunk = transactions[start:start + chunk_size]
+            existing = self._existing_hashes([tx.import_hash for tx in chunk])
+            fresh = []
+            for tx in chunk:
+                if tx.import_hash in existing or tx.import_hash in seen:
+                    rejected.append(RejectedTransaction(tx, DUPLICATE_HASH_REASON))
+                    continue
+                seen.add(tx.import_hash)
+                fresh.append(tx)
+            saved += self._insert_isolated(fresh, rejected)
+        if rejected:
+            logger.warning(f"{len(rejected)} transactions rejected, {saved} saved")
+        else:
+            logger.debug(f"{saved} transactions saved")
+        return SaveReport(saved, tuple(rejected))
+
+    def _existing_hashes(self, hashes: List[str]) -> set[str]:
+        """import_hash déjà en base parmi `hashes` (index unique)."""
+        try:
+            return set(self._session.scalars(
+                select(TransactionModel.import_hash).where(TransactionModel.import_hash.in_(hashes))
+            ))
+        except SQLAlchemyError as e:
+            logger.error(f"Error checking import hashes: {e}")
+            raise
+
+    def _insert_isolated(
+        self, chunk: List[Transaction], rejected: list[RejectedTransaction]
+    ) -> int:
+        """Insère un lot dans un SAVEPOINT; bisection si refusé."""
+        if not chunk:
+            return 0
+        try:
+            with self._session.begin_nested():
+                self._session.add_all([self._to_model(tx) for tx in chunk])
+                self._session.flush()
+            return len(chunk)
+        except SQLAlchemyError as e:
+            if not _is_row_error(e):
+                logger.error(f"Error saving transactions: {e}")
+                raise
+            if len(chunk) == 1:
+                rejected.append(RejectedTransaction(chunk[0], _error_reason(e)))
+                return 0
+
+        middle = len(chunk) // 2
+        return (
+            self._insert_isolated(chunk[:middle], rejected)
+            + self._insert_isolated(chunk[middle:], rejected)
+        )
+
     def delete(self, transaction_id: UUID) -> bool:
         """
         Supprime une transaction.
@@ -181,13 +317,23 @@ class SQLiteTransactionRepository(TransactionRepository):
             logger.error(f"Error getting transaction: {e}")
             raise
 
-    def find_by_date_range(self, date_range: DateRange, account_id: Optional[UUID] = None) -> List[Transaction]:
+    def find_by_date_range(
+        self,
+        date_range: DateRange,
+        account_id: Optional[UUID] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[Cursor] = None,
+    ) -> List[Transaction]:
         """
-        Récupère les transactions dans une plage de dates.
+        Récupère les transactions dans une plage de dates (plus anciennes d'abord).
 
         Args:
             date_range: DateRange object
             account_id: Optional filter by account
+            limit: Optional pagination limit (None = toutes)
+            offset: Pagination offset (ignoré si after est fourni)
+            after: Optional keyset cursor (date, id) de la dernière ligne vue
 
         Returns:
             List of Transaction entities
@@ -201,39 +347,45 @@ class SQLiteTransactionRepository(TransactionRepository):
             if account_id:
                 query = query.filter(TransactionModel.account_id == str(account_id))
 
-            models = query.order_by(TransactionModel.date.asc()).all()
+            models = self._paginate(
+                query, limit, offset, after, descending=False
+            ).all()
             return [self._to_entity(m) for m in models]
         except SQLAlchemyError as e:
             logger.error(f"Error finding transactions by date range: {e}")
             raise
 
-    def find_by_category(self, category_id: UUID, date_range: Optional[DateRange] = None) -> List[Transaction]:
+    def find_by_category(
+        self,
+        category_id: UUID,
+        date_range: Optional[DateRange] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[Cursor] = None,
+    ) -> List[Transaction]:
         """
-        Récupère toutes les transactions d'une catégorie.
+        Récupère les transactions d'une catégorie (plus récentes d'abord).
 
         Args:
             category_id: UUID de la catégorie
             date_range: Optional date filter
+            limit: Optional pagination limit (None = toutes)
+            offset: Pagination offset (ignoré si after est fourni)
+            after: Optional keyset cursor (date, id) de la dernière ligne vue
 
         Returns:
             List of Transaction entities
         """
-        try:
-            query = self._session.query(TransactionModel).filter(
-                TransactionModel.category_id == str(category_id)
-            )
-
-            if date_range:
-                query = query.filter(
-                    TransactionModel.date >= date_range.start,
-                    TransactionModel.date <= date_range.end,
-                )
-
-            models = query.order_by(TransactionModel.date.desc()).all()
-            return [self._to_entity(m) for m in models]
-        except SQLAlchemyError as e:
-            logger.error(f"Error finding transactions by category: {e}")
-            raise
+        return self.find(
+            TransactionQuery(
+                category_ids=(category_id,),
+                include_subcategories=False,
+                date_range=date_range,
+            ),
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
 
     def find_uncategorized(self, account_id: Optional[UUID] = None, limit: int = 50) -> List[Transaction]:
         """
@@ -268,38 +420,176 @@ class SQLiteTransactionRepository(TransactionRepository):
         account_id: UUID,
         date_range: Optional[DateRange] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[Cursor] = None,
     ) -> List[Transaction]:
         """
-        Récupère les transactions d'un compte.
+        Récupère les transactions d'un compte (plus récentes d'abord).
+
+        Avec `after`, la page est lue par recherche keyset sur l'index
+        (account_id, date DESC, id DESC): le coût ne dépend plus de la
+        profondeur de la page, contrairement à `offset`.
 
         Args:
             account_id: UUID du compte
             date_range: Optional date filter
             limit: Pagination limit (default 100)
-            offset: Pagination offset (default 0)
+            offset: Pagination offset (ignoré si after est fourni)
+            after: Optional keyset cursor (date, id) de la dernière ligne vue
+
+        Returns:
+            List of Transaction entities
+        """
+        return self.find(
+            TransactionQuery(account_ids=(account_id,), date_range=date_range),
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+
+    def find(
+        self,
+        query: TransactionQuery,
+        limit: Optional[int] = 100,
+        offset: int = 0,
+        after: Optional[Cursor] = None,
+    ) -> List[Transaction]:
+        """
+        Récupère les transactions correspondant à une spécification combinée.
+
+        La spécification est compilée en un seul SELECT (voir _apply_query),
+        trié par (date, id) décroissants et paginé en SQL.
+
+        Args:
+            query: TransactionQuery (critères combinés en ET)
+            limit: Pagination limit (None = toutes)
+            offset: Pagination offset (ignoré si after est fourni)
+            after: Optional keyset cursor (date, id) de la dernière ligne vue
 
         Returns:
             List of Transaction entities
         """
         try:
-            query = self._session.query(TransactionModel).filter(
-                TransactionModel.account_id == str(account_id)
-            )
+            sql = self._apply_query(self._session.query(TransactionModel), query)
+            models = self._paginate(sql, limit, offset, after).all()
+            return [self._to_entity(m) for m in models]
+        except SQLAlchemyError as e:
+            logger.error(f"Error finding transactions by query: {e}")
+            raise
 
-            if date_range:
-                query = query.filter(
-                    TransactionModel.date >= date_range.start,
-                    TransactionModel.date <= date_range.end,
-                )
+    def find_rows(
+        self,
+        query: TransactionQuery,
+        limit: Optional[int] = 100,
+        offset: int = 0,
+        after: Optional[Cursor] = None,
+    ) -> List[TransactionRow]:
+        """
+        Variante lecture seule de find() pour les listes paginées.
 
-            models = query.order_by(
-                TransactionModel.date.desc()
-            ).limit(limit).offset(offset).all()
+        Même SELECT filtré et trié que find(), mais exécuté en Core sur les
+        seules colonnes: chaque ligne devient directement un TransactionRow,
+        sans instance ORM (identity map) ni entité Transaction.
+
+        Args:
+            query: TransactionQuery (critères combinés en ET)
+            limit: Pagination limit (None = toutes)
+            offset: Pagination offset (ignoré si after est fourni)
+            after: Optional keyset cursor (date, id) de la dernière ligne vue
+
+        Returns:
+            List of TransactionRow
+        """
+        try:
+            sql = self._apply_query(self._session.query(*_ROW_COLUMNS), query)
+            statement = self._paginate(sql, limit, offset, after).statement
+            return [TransactionRow(*row) for row in self._session.execute(statement)]
+        except SQLAlchemyError as e:
+            logger.error(f"Error finding transaction rows by query: {e}")
+            raise
+
+    def rows_statement(self, query: TransactionQuery) -> Select:
+        """
+        SELECT des colonnes de TransactionRow pour un export complet.
+
+        Mêmes filtres que find_rows(), sans pagination, du plus ancien au
+        plus récent (ordre (date, id) stable). Construit sans I/O: utilisable
+        par la session synchrone comme par AsyncSession.stream().
+
+        Args:
+            query: TransactionQuery (critères combinés en ET)
+
+        Returns:
+            Select Core à exécuter
+        """
+        sql = self._apply_query(self._session.query(*_ROW_COLUMNS), query)
+        return self._paginate(sql, None, 0, None, descending=False).statement
+
+    def iter_rows(
+        self, query: TransactionQuery, batch_size: int = 1000
+    ) -> Iterator[TransactionRow]:
+        """
+        Parcourt toutes les transactions filtrées en mémoire constante.
+
+        Le résultat est lu par paquets de `batch_size` lignes (yield_per):
+        ni liste complète, ni identity map.
+
+        Args:
+            query: TransactionQuery (critères combinés en ET)
+            batch_size: Lignes lues par aller-retour au driver
+
+        Yields:
+            TransactionRow, du plus ancien au plus récent
+        """
+        statement = self.rows_statement(query).execution_options(yield_per=batch_size)
+        try:
+            for row in self._session.execute(statement):
+                yield TransactionRow(*row)
+        except SQLAlchemyError as e:
+            logger.error(f"Error iterating transaction rows: {e}")
+            raise
+
+    def search(
+        self,
+        text: str,
+        filters: Optional[TransactionQuery] = None,
+        limit: int = 20,
+    ) -> List[Transaction]:
+        """
+        Recherche plein texte (FTS5) dans les libellés et les notes.
+
+        Chaque mot est cherché en préfixe ("amaz" trouve "AMAZON"), tous les
+        mots doivent être présents; accents et casse sont ignorés. Les
+        résultats sont classés par pertinence (bm25) puis par date.
+
+        Args:
+            text: Termes de recherche (texte libre, pas de syntaxe FTS)
+            filters: Optional TransactionQuery appliquée en plus
+            limit: Nombre max de résultats
+
+        Returns:
+            List of Transaction entities, plus pertinentes d'abord
+        """
+        expression = self._fts_match_expression(text)
+        if expression is None:
+            return []
+
+        try:
+            query = self._session.query(TransactionModel).join(
+                _fts, _fts.c.rowid == _transaction_rowid
+            ).filter(_fts.c[TRANSACTION_FTS_TABLE].match(expression))
+
+            if filters is not None:
+                query = self._apply_query(query, filters)
 
+            models = query.order_by(
+                _fts.c.rank,
+                TransactionModel.date.desc(),
+                TransactionModel.id.desc(),
+            ).limit(limit).all()
             return [self._to_entity(m) for m in models]
         except SQLAlchemyError as e:
-            logger.error(f"Error finding transactions by account: {e}")
+            logger.error(f"Error searching transactions: {e}")
             raise
 
     def exists_by_hash(self, import_hash: str) -> bool:
@@ -309,7 +599,7 @@ class SQLiteTransactionRepository(TransactionRepository):
         Utilisé pour la déduplication à l'import.
 
         Args:
-            import_hash: SHA256 hash of (date|amount|description)
+            import_hash: blake2b hash of (account|date|amount|description|occurrence)
 
         Returns:
             True si la transaction existe
@@ -327,23 +617,84 @@ class SQLiteTransactionRepository(TransactionRepository):
 
     # === Statistiques ===
 
-    def count_by_account(self, account_id: UUID) -> int:
+    def count_by_account(
+        self,
+        account_id: UUID,
+        date_range: Optional[DateRange] = None,
+    ) -> int:
         """
         Compte le nombre de transactions d'un compte.
 
         Args:
             account_id: UUID du compte
+            date_range: Optional date filter
+
+        Returns:
+            Number of transactions
+        """
+        return self.count(
+            TransactionQuery(account_ids=(account_id,), date_range=date_range)
+        )
+
+    def count_by_category(
+        self,
+        category_id: UUID,
+        date_range: Optional[DateRange] = None,
+    ) -> int:
+        """
+        Compte le nombre de transactions d'une catégorie.
+
+        Args:
+            category_id: UUID de la catégorie
+            date_range: Optional date filter
+
+        Returns:
+            Number of transactions
+        """
+        return self.count(
+            TransactionQuery(
+                category_ids=(category_id,),
+                include_subcategories=False,
+                date_range=date_range,
+            )
+        )
+
+    def count_by_date_range(
+        self,
+        date_range: DateRange,
+        account_id: Optional[UUID] = None,
+    ) -> int:
+        """
+        Compte le nombre de transactions dans une plage de dates.
+
+        Args:
+            date_range: DateRange object
+            account_id: Optional filter by account
+
+        Returns:
+            Number of transactions
+        """
+        return self.count(
+            TransactionQuery(
+                account_ids=(account_id,) if account_id else (),
+                date_range=date_range,
+            )
+        )
+
+    def count(self, query: TransactionQuery) -> int:
+        """
+        Compte les transactions correspondant à une spécification combinée.
+
+        Args:
+            query: TransactionQuery (critères combinés en ET)
 
         Returns:
             Number of transactions
         """
         try:
-            count = self._session.query(TransactionModel).filter(
-                TransactionModel.account_id == str(account_id)
-            ).count()
-            return count
+            return self._apply_query(self._count_query(), query).scalar()
         except SQLAlchemyError as e:
-            logger.error(f"Error counting transactions: {e}")
+            logger.error(f"Error counting transactions by query: {e}")
             raise
 
     def get_balance_at_date(self, account_id: UUID, check_date: date) -> Money:
@@ -358,34 +709,194 @@ class SQLiteTransactionRepository(TransactionRepository):
             Money object representing balance
         """
         try:
-            result = self._session.query(
-                TransactionModel.currency,
-                Decimal(0)  # Placeholder, see calculation below
+            total, currency = self._session.query(
+                self._sum_amount(),
+                func.max(TransactionModel.currency),
             ).filter(
                 TransactionModel.account_id == str(account_id),
                 TransactionModel.date <= check_date,
-            ).first()
+            ).one()
 
-            if not result:
+            if total is None:
                 return Money.zero()
-
-            # Calcul du solde
-            from sqlalchemy import func
-            balance_result = self._session.query(
-                func.sum(TransactionModel.amount)
-            ).filter(
-                TransactionModel.account_id == str(account_id),
-                TransactionModel.date <= check_date,
-            ).scalar()
-
-            amount = Decimal(str(balance_result or 0))
-            currency = result[0] if result else "EUR"
-
-            return Money(amount, currency)
+            if self._money_in_cents:
+                return Money.from_cents(total, currency)
+            return Money(Decimal(str(total)), currency)
         except SQLAlchemyError as e:
             logger.error(f"Error calculating balance: {e}")
             raise
 
+    # === Helpers de requête ===
+
+    @property
+    def _money_in_cents(self) -> bool:
+        """True si les montants sont stockés en centimes (INTEGER)."""
+        return money_in_cents(self._session.get_bind().dialect)
+
+    def _sum_amount(self):
+        """SUM(amount): entier brut en centimes, sinon décimal."""
+        if self._money_in_cents:
+            return type_coerce(func.sum(TransactionModel.amount), Integer)
+        return func.sum(TransactionModel.amount)
+
+    def _count_query(self) -> Query:
+        """SELECT COUNT(id) sans sous-requête (contrairement à Query.count())."""
+        return self._session.query(func.count(TransactionModel.id))
+
+    @staticmethod
+    def _filter_date_range(query: Query, date_range: Optional[DateRange]) -> Query:
+        """Applique un filtre de dates optionnel."""
+        if date_range:
+            query = query.filter(
+                TransactionModel.date >= date_range.start,
+                TransactionModel.date <= date_range.end,
+            )
+        return query
+
+    def _apply_query(self, query: Query, spec: TransactionQuery) -> Query:
+        """
+        Compile une TransactionQuery en clauses WHERE sur TransactionModel.
+
+        Les égalités simples (un seul compte, une seule catégorie) sont
+        émises en `=` plutôt qu'en `IN` pour que SQLite puisse parcourir les
+        index composites (account_id|category_id, date DESC, id DESC) dans
+        l'ordre de tri, sans tri temporaire.
+
+        Args:
+            query: Requête sur TransactionModel (lignes ou COUNT)
+            spec: Critères à appliquer
+
+        Returns:
+            Requête filtrée
+        """
+        if spec.account_ids:
+            query = query.filter(
+                self._in_or_equal(TransactionModel.account_id, spec.account_ids)
+            )
+
+        if spec.category_ids:
+            condition = self._in_or_equal(TransactionModel.category_id, spec.category_ids)
+            if spec.include_subcategories:
+                condition = or_(
+                    condition,
+                    TransactionModel.category_id.in_(
+                        self._descendant_category_ids(spec.category_ids)
+                    ),
+                )
+            query = query.filter(condition)
+        elif spec.uncategorized:
+            query = query.filter(TransactionModel.category_id.is_(None))
+
+        query = self._filter_date_range(query, spec.date_range)
+
+        if spec.min_amount is not None:
+            query = query.filter(TransactionModel.amount >= spec.min_amount)
+        if spec.max_amount is not None:
+            query = query.filter(TransactionModel.amount <= spec.max_amount)
+
+        if spec.min_confidence is not None:
+            query = query.filter(TransactionModel.category_confidence >= spec.min_confidence)
+
+        if spec.text:
+            expression = self._fts_match_expression(spec.text)
+            if expression is not None:
+                query = query.filter(
+                    _transaction_rowid.in_(
+                        select(_fts.c.rowid).where(
+                            _fts.c[TRANSACTION_FTS_TABLE].match(expression)
+                        )
+                    )
+                )
+
+        # Chaque tag requis doit figurer dans le tableau JSON `tags`
+        for tag in spec.tags:
+            tag_values = func.json_each(TransactionModel.tags).table_valued("value")
+            query = query.filter(exists().where(tag_values.c.value == tag))
+
+        return query
+
+    @staticmethod
+    def _fts_match_expression(text: str) -> Optional[str]:
+        """
+        Traduit un texte libre en expression MATCH FTS5 sûre.
+
+        Les mots sont extraits puis cités, ce qui neutralise la syntaxe FTS5
+        (guillemets, opérateurs, parenthèses) saisie par l'utilisateur.
+
+        Examples:
+            >>> SQLiteTransactionRepository._fts_match_expression("CB amazon.fr")
+            '"CB"* "amazon"* "fr"*'
+        """
+        words = re.findall(r"\w+", text or "")
+        if not words:
+            return None
+        return " ".join(f'"{word}"*' for word in words)
+
+    @staticmethod
+    def _in_or_equal(column, values: tuple[UUID, ...]):
+        """`column = ?` pour une valeur, `column IN (...)` sinon."""
+        if len(values) == 1:
+            return column == str(values[0])
+        return column.in_([str(v) for v in values])
+
+    @staticmethod
+    def _descendant_category_ids(category_ids: tuple[UUID, ...]):
+        """
+        Sous-requête des descendants des catégories données (table de fermeture).
+
+        Les catégories elles-mêmes ne sont pas incluses: elles sont
+        filtrées directement, même si elles n'existent pas dans `categories`.
+        """
+        return select(CategoryClosureModel.descendant_id).where(
+            SQLiteTransactionRepository._in_or_equal(
+                CategoryClosureModel.ancestor_id, category_ids
+            ),
+            CategoryClosureModel.depth > 0,
+        )
+
+    @staticmethod
+    def _paginate(
+        query: Query,
+        limit: Optional[int],
+        offset: int,
+        after: Optional[Cursor],
+        descending: bool = True,
+    ) -> Query:
+        """
+        Applique l'ordre (date, id) et la pagination offset ou keyset.
+
+        L'id départage les transactions du même jour, ce qui rend l'ordre
+        total et le curseur (date, id) stable entre deux pages.
+
+        Args:
+            query: Requête sur TransactionModel
+            limit: Taille de page (None = pas de limite)
+            offset: Décalage (ignoré si after est fourni)
+            after: Curseur (date, id) de la dernière ligne de la page précédente
+            descending: Plus récentes d'abord si True
+
+        Returns:
+            Requête ordonnée et paginée
+        """
+        key = tuple_(TransactionModel.date, TransactionModel.id)
+
+        if after is not None:
+            after_date, after_id = after
+            bound = (after_date, str(after_id))
+            query = query.filter(key < bound if descending else key > bound)
+
+        if descending:
+            query = query.order_by(TransactionModel.date.desc(), TransactionModel.id.desc())
+        else:
+            query = query.order_by(TransactionModel.date.asc(), TransactionModel.id.asc())
+
+        if limit is not None:
+            query = query.limit(limit)
+        if offset and after is None:
+            query = query.offset(offset)
+
+        return query
+
     # === Mappers (Domain ↔ Model) ===
 
     def _to_model(self, entity: Transaction) -> TransactionModel:
@@ -413,6 +924,7 @@ class SQLiteTransactionRepository(TransactionRepository):
             tags=entity.tags,
             notes=entity.notes,
             import_hash=entity.import_hash,
+            import_batch_id=str(entity.import_batch_id) if entity.import_batch_id else None,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
         )
@@ -421,20 +933,21 @@ class SQLiteTransactionRepository(TransactionRepository):
         """
         Convertit un modèle SQLAlchemy en entité de domaine.
 
+        Les données relues ont été validées à l'écriture: construction de
+        confiance, sans __post_init__ ni quantize.
+
         Args:
             model: TransactionModel instance
 
         Returns:
             Transaction entity
         """
-        from uuid import UUID
-
-        return Transaction(
+        return Transaction.from_trusted(
             id=UUID(model.id),
             account_id=UUID(model.account_id),
             date=model.date,
             value_date=model.value_date,
-            amount=Money(model.amount, model.currency),
+            amount=Money.from_trusted(model.amount, model.currency),
             description=model.description,
             category_id=UUID(model.category_id) if model.category_id else None,
             category_confidence=model.category_confidence,
@@ -443,6 +956,7 @@ class SQLiteTransactionRepository(TransactionRepository):
             tags=model.tags or [],
             notes=model.notes,
             import_hash=model.import_hash,
+            import_batch_id=UUID(model.import_batch_id) if model.import_batch_id else None,
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
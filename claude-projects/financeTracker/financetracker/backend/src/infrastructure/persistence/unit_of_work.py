@@ -0,0 +1,106 @@
+"""
+Unit of Work (SQLAlchemy)
+
+Regroupe les repositories d'une requête autour d'une seule session.
+
+Architecture:
+- Une session (donc une connexion du pool) par unité de travail
+- Tous les repositories partagent cette session: une seule transaction
+- Commit une fois en sortie, rollback sur erreur, session toujours fermée
+"""
+from __future__ import annotations
+
+from typing import Optional
+import logging
+
+from sqlalchemy.orm import Session
+
+from src.infrastructure.persistence.database import Database, get_database
+from src.infrastructure.persistence.repositories.sqlite_account_repository import (
+    SQLiteAccountRepository,
+)
+from src.infrastructure.persistence.repositories.sqlite_alert_repository import (
+    SQLiteAlertRepository,
+)
+from src.infrastructure.persistence.repositories.sqlite_budget_repository import (
+    SQLiteBudgetRepository,
+)
+from src.infrastructure.persistence.repositories.sqlite_category_repository import (
+    SQLiteCategoryRepository,
+)
+from src.infrastructure.persistence.repositories.sqlite_import_batch_repository import (
+    SQLiteImportBatchRepository,
+)
+from src.infrastructure.persistence.repositories.sqlite_recurring_repository import (
+    SQLiteRecurringRepository,
+)
+from src.infrastructure.persistence.repositories.sqlite_transaction_repository import (
+    SQLiteTransactionRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class UnitOfWork:
+    """
+    Session unique partagée par les repositories, commitée une seule fois.
+
+    Examples:
+        >>> with UnitOfWork(db) as uow:
+        ...     uow.transactions.save_many(transactions)
+        ...     uow.accounts.save(account)
+        >>> # commit ici (rollback si exception), session fermée
+    """
+
+    def __init__(self, database: Optional[Database] = None):
+        """
+        Initialize unit of work.
+
+        Args:
+            database: Database à utiliser (défaut: instance globale)
+        """
+        self._database = database
+        self._session: Optional[Session] = None
+
+    def __enter__(self) -> UnitOfWork:
+        database = self._database or get_database()
+        self._session = database.get_session()
+        self.transactions = SQLiteTransactionRepository(self._session)
+        self.accounts = SQLiteAccountRepository(self._session)
+        self.categories = SQLiteCategoryRepository(self._session)
+        self.recurring = SQLiteRecurringRepository(self._session)
+        self.budgets = SQLiteBudgetRepository(self._session)
+        self.alerts = SQLiteAlertRepository(self._session)
+        self.import_batches = SQLiteImportBatchRepository(self._session)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        try:
+            if exc_type is None:
+                try:
+                    self.commit()
+                except Exception as e:
+                    self.rollback()
+                    logger.error(f"Unit of work commit failed: {e}")
+                    raise
+            else:
+                self.rollback()
+                logger.error(f"Unit of work rolled back: {exc}")
+        finally:
+            self._session.close()
+            self._session = None
+
+    @property
+    def session(self) -> Session:
+        """Session courante (uniquement dans le bloc with)."""
+        if self._session is None:
+            raise RuntimeError("Unit of work is not active. Use it as a context manager.")
+        return self._session
+
+    def commit(self) -> None:
+        """Valide la transaction en cours."""
+        self.session.commit()
+
+    def rollback(self) -> None:
+        """Annule la transaction en cours."""
+        self.session.rollback()
@@ -0,0 +1,22 @@
+"""
+Infrastructure Schedulers
+
+In-process periodic jobs (alerts, SQLite maintenance).
+"""
+from src.infrastructure.schedulers.scheduler import (
+    JobMetrics,
+    ScheduledJob,
+    Scheduler,
+    initialize_scheduler,
+    get_scheduler,
+    shutdown_scheduler,
+)
+
+__all__ = [
+    "JobMetrics",
+    "ScheduledJob",
+    "Scheduler",
+    "initialize_scheduler",
+    "get_scheduler",
+    "shutdown_scheduler",
+]
@@ -0,0 +1,125 @@
+"""
+Periodic maintenance jobs.
+
+Jobs:
+- alerts: réévalue les alertes de tous les comptes actifs; les projections
+  en cache et les soldes (balance snapshots) sont rafraîchis au passage,
+  seuls les comptes modifiés sont reprojetés
+- wal_checkpoint: reporte le WAL dans la base sans bloquer (PASSIVE)
+- analyze: statistiques du planificateur (ANALYZE)
+- rollups: recalcul complet des tables dérivées (rollup mensuel, fermeture
+  des catégories), filet de sécurité derrière les triggers
+- vacuum: compacte le fichier; suivi du rebuild FTS (VACUUM peut
+  renuméroter les rowid indexés par transactions_fts)
+
+Chaque fonction est utilisable seule (CLI, scripts).
+"""
+from __future__ import annotations
+
+import logging
+from decimal import Decimal
+from functools import partial
+
+from sqlalchemy import text
+
+from src.infrastructure.persistence.database import Database
+from src.infrastructure.persistence.models import (
+    CATEGORY_CLOSURE_REBUILD,
+    MONTHLY_TOTALS_REBUILD,
+    TRANSACTION_FTS_REBUILD,
+)
+from src.infrastructure.schedulers.scheduler import ScheduledJob
+
+logger = logging.getLogger(__name__)
+
+# Périodes en secondes
+ALERTS_INTERVAL = 15 * 60
+WAL_CHECKPOINT_INTERVAL = 10 * 60
+ANALYZE_INTERVAL = 24 * 3600
+ROLLUPS_INTERVAL = 24 * 3600
+VACUUM_INTERVAL = 7 * 24 * 3600
+
+
+def evaluate_alerts(database: Database, threshold: Decimal = Decimal("0")):
+    """Réévalue les alertes de tous les comptes actifs (une unité de travail)."""
+    # Imports différés: la couche application n'est chargée que si le job tourne
+    from src.application.commands.evaluate_alerts import EvaluateAlertsCommand
+    from src.application.handlers.alert_handler import AlertHandler
+    from src.infrastructure.persistence.unit_of_work import UnitOfWork
+
+    with UnitOfWork(database) as uow:
+        return AlertHandler(
+            account_repository=uow.accounts,
+            recurring_repository=uow.recurring,
+            alert_repository=uow.alerts,
+            budget_repository=uow.budgets,
+            threshold=threshold,
+        ).handle(EvaluateAlertsCommand())
+
+
+def checkpoint_wal(database: Database) -> tuple[int, int, int]:
+    """
+    Checkpoint PASSIVE: ne bloque ni les lecteurs ni l'écrivain.
+
+    Returns:
+        (busy, pages du WAL, pages reportées); (0, -1, -1) hors mode WAL
+    """
+    with database.engine.connect() as connection:
+        busy, log_pages, checkpointed = connection.exec_driver_sql(
+            "PRAGMA wal_checkpoint(PASSIVE)"
+        ).one()
+    logger.debug(f"WAL checkpoint: {checkpointed}/{log_pages} pages")
+    return busy, log_pages, checkpointed
+
+
+def analyze(database: Database) -> None:
+    """Met à jour les statistiques du planificateur de requêtes."""
+    with database.engine.begin() as connection:
+        connection.exec_driver_sql("ANALYZE")
+
+
+def rebuild_rollups(database: Database) -> None:
+    """Recalcule rollup mensuel et fermeture des catégories (une transaction)."""
+    with database.engine.begin() as connection:
+        for statement in (*MONTHLY_TOTALS_REBUILD, *CATEGORY_CLOSURE_REBUILD):
+            connection.exec_driver_sql(statement)
+
+
+def vacuum(database: Database) -> None:
+    """VACUUM (hors transaction) puis rebuild de l'index plein texte."""
+    with database.engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    ) as connection:
+        connection.exec_driver_sql("VACUUM")
+    with database.engine.begin() as connection:
+        connection.execute(text(TRANSACTION_FTS_REBUILD))
+
+
+def default_jobs(database: Database, alert_threshold: Decimal = Decimal("0")) -> list[ScheduledJob]:
+    """
+    Jobs périodiques de l'API.
+
+    Args:
+        database: Base de données maintenue
+        alert_threshold: Seuil des alertes de solde
+
+    Returns:
+        Jobs à enregistrer dans le Scheduler (maintenance SQLite uniquement
+        sur une base SQLite)
+    """
+    jobs = [
+        ScheduledJob(
+            "alerts",
+            partial(evaluate_alerts, database, alert_threshold),
+            interval=ALERTS_INTERVAL,
+            initial_delay=60,
+        ),
+    ]
+    if database.config.is_sqlite:
+        jobs += [
+            ScheduledJob("wal_checkpoint", partial(checkpoint_wal, database), WAL_CHECKPOINT_INTERVAL),
+            ScheduledJob("analyze", partial(analyze, database), ANALYZE_INTERVAL),
+            ScheduledJob("rollups", partial(rebuild_rollups, database), ROLLUPS_INTERVAL),
+            ScheduledJob("vacuum", partial(vacuum, database), VACUUM_INTERVAL),
+        ]
+    return jobs
@@ -0,0 +1,346 @@
+"""
+In-process job scheduler.
+
+Architecture:
+- Un thread de dispatch réveille les jobs à échéance et les soumet à un
+  pool de threads borné (max_workers)
+- Contre-pression: au plus max_workers + max_pending jobs soumis à la fois;
+  au-delà, le job est refusé et retenté peu après (jamais de file infinie)
+- Coalescence: un job n'a jamais plus d'une exécution en cours; les
+  échéances manquées pendant qu'il tourne sont fusionnées en une seule
+- Métriques par job (exécutions, échecs, durées, échéances fusionnées,
+  refus) exposées par status()
+"""
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from threading import BoundedSemaphore, Event, Lock, Thread
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Délai avant de retenter un job refusé faute de place dans le pool
+RETRY_DELAY_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class ScheduledJob:
+    """
+    Job périodique.
+
+    Attributes:
+        name: Nom unique du job
+        func: Fonction sans argument exécutée dans le pool
+        interval: Période en secondes
+        initial_delay: Délai avant la première exécution (défaut: interval)
+    """
+
+    name: str
+    func: Callable[[], object]
+    interval: float
+    initial_delay: Optional[float] = None
+
+    def __post_init__(self):
+        """Valide le job."""
+        if self.interval <= 0:
+            raise ValueError("interval must be positive")
+        if self.initial_delay is not None and self.initial_delay < 0:
+            raise ValueError("initial_delay cannot be negative")
+
+
+@dataclass
+class JobMetrics:
+    """
+    Compteurs et durées d'un job.
+
+    Attributes:
+        runs: Exécutions terminées (succès ou échec)
+        failures: Exécutions terminées en erreur
+        coalesced: Échéances fusionnées car le job tournait encore
+        rejected: Soumissions refusées (pool saturé)
+        last_duration_ms / max_duration_ms / total_duration_ms: Durées d'exécution
+        last_started_at: Début de la dernière exécution
+        last_error: Message de la dernière erreur
+    """
+
+    runs: int = 0
+    failures: int = 0
+    coalesced: int = 0
+    rejected: int = 0
+    last_duration_ms: Optional[float] = None
+    max_duration_ms: float = 0.0
+    total_duration_ms: float = 0.0
+    last_started_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+
+    @property
+    def average_duration_ms(self) -> Optional[float]:
+        """Durée moyenne d'exécution."""
+        return self.total_duration_ms / self.runs if self.runs else None
+
+    def to_dict(self) -> dict:
+        """Représentation sérialisable (endpoint /health)."""
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "coalesced": self.coalesced,
+            "rejected": self.rejected,
+            "last_duration_ms": self.last_duration_ms,
+            "average_duration_ms": self.average_duration_ms,
+            "max_duration_ms": self.max_duration_ms,
+            "last_started_at": self.last_started_at.isoformat() if self.last_started_at else None,
+            "last_error": self.last_error,
+        }
+
+
+@dataclass
+class _JobState:
+    """État interne d'un job (protégé par le verrou du scheduler)."""
+
+    job: ScheduledJob
+    next_run: float
+    running: bool = False
+    metrics: JobMetrics = field(default_factory=JobMetrics)
+
+
+class Scheduler:
+    """
+    Ordonnanceur de jobs périodiques sur un pool de threads borné.
+
+    Examples:
+        >>> scheduler = Scheduler(max_workers=2)
+        >>> scheduler.add_job(ScheduledJob("analyze", analyze, interval=86400))
+        >>> scheduler.start()
+        >>> scheduler.status()["jobs"]["analyze"]["runs"]
+        0
+        >>> scheduler.stop()
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_pending: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_workers: Threads du pool (jobs exécutés simultanément)
+            max_pending: Jobs acceptés en attente d'un thread libre
+            clock: Horloge monotone en secondes (injectable pour les tests)
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_pending < 0:
+            raise ValueError("max_pending cannot be negative")
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._clock = clock
+        self._slots = BoundedSemaphore(max_workers + max_pending)
+        self._lock = Lock()
+        self._jobs: dict[str, _JobState] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[Thread] = None
+        self._wakeup = Event()
+        self._stopping = False
+
+    # === Configuration ===
+
+    def add_job(self, job: ScheduledJob) -> None:
+        """Enregistre un job; première exécution après initial_delay."""
+        delay = job.interval if job.initial_delay is None else job.initial_delay
+        with self._lock:
+            if job.name in self._jobs:
+                raise ValueError(f"job already registered: {job.name}")
+            self._jobs[job.name] = _JobState(job=job, next_run=self._clock() + delay)
+        self._wakeup.set()
+
+    def trigger(self, name: str) -> None:
+        """Rend un job immédiatement exigible (coalescé s'il tourne déjà)."""
+        with self._lock:
+            self._jobs[name].next_run = self._clock()
+        self._wakeup.set()
+
+    # === Cycle de vie ===
+
+    @property
+    def is_running(self) -> bool:
+        """True si le thread de dispatch tourne."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Démarre le pool et le thread de dispatch."""
+        if self.is_running:
+            return
+        self._stopping = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="financetracker-job"
+        )
+        self._thread = Thread(
+            target=self._dispatch_loop, name="financetracker-scheduler", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Scheduler started: {len(self._jobs)} jobs, {self.max_workers} workers")
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Arrête le dispatch; les jobs non commencés sont annulés.
+
+        Args:
+            wait: Attendre la fin des jobs en cours
+        """
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+        logger.info("Scheduler stopped")
+
+    # === Dispatch ===
+
+    def run_pending(self) -> float:
+        """
+        Soumet les jobs à échéance.
+
+        Returns:
+            Secondes avant la prochaine échéance
+        """
+        now = self._clock()
+        with self._lock:
+            due = [s for s in self._jobs.values() if s.next_run <= now]
+            for state in due:
+                self._dispatch(state, now)
+            next_run = min((s.next_run for s in self._jobs.values()), default=now + 60)
+        return max(next_run - now, 0.0)
+
+    def _dispatch(self, state: _JobState, now: float) -> None:
+        """Soumet un job exigible, ou le coalesce/retarde (verrou tenu)."""
+        interval = state.job.interval
+        if state.running:
+            # Exécution précédente en cours: une seule exécution à la fois
+            state.metrics.coalesced += 1
+        elif self._executor is None or not self._slots.acquire(blocking=False):
+            state.metrics.rejected += 1
+            state.next_run = now + min(RETRY_DELAY_SECONDS, interval)
+            return
+        else:
+            state.running = True
+            try:
+                self._executor.submit(self._run, state)
+            except RuntimeError:
+                # Pool en cours d'arrêt
+                state.running = False
+                self._slots.release()
+                return
+
+        # Échéances manquées fusionnées en une seule
+        missed = int((now - state.next_run) // interval)
+        state.metrics.coalesced += missed
+        state.next_run += (missed + 1) * interval
+
+    def _run(self, state: _JobState) -> None:
+        """Exécute un job dans le pool et enregistre ses métriques."""
+        name = state.job.name
+        started_at = datetime.now()
+        start = time.perf_counter()
+        error: Optional[str] = None
+        try:
+            state.job.func()
+        except Exception as e:
+            error = str(e)
+            logger.error(f"Scheduled job {name} failed: {e}")
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                metrics = state.metrics
+                metrics.runs += 1
+                metrics.last_started_at = started_at
+                metrics.last_duration_ms = duration_ms
+                metrics.total_duration_ms += duration_ms
+                metrics.max_duration_ms = max(metrics.max_duration_ms, duration_ms)
+                if error is not None:
+                    metrics.failures += 1
+                    metrics.last_error = error
+                state.running = False
+            self._slots.release()
+            logger.debug(f"Scheduled job {name} finished in {duration_ms:.1f} ms")
+
+    def _dispatch_loop(self) -> None:
+        """Boucle du thread de dispatch."""
+        while not self._stopping:
+            # Effacé avant le calcul: un trigger() concurrent réveille l'attente
+            self._wakeup.clear()
+            delay = self.run_pending()
+            self._wakeup.wait(timeout=delay)
+
+    # === Métriques ===
+
+    def status(self) -> dict:
+        """Instantané du scheduler et des métriques de chaque job."""
+        now = self._clock()
+        with self._lock:
+            return {
+                "running": self.is_running,
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "jobs": {
+                    name: {
+                        "interval": state.job.interval,
+                        "in_progress": state.running,
+                        "next_run_in": round(max(state.next_run - now, 0.0), 3),
+                        **state.metrics.to_dict(),
+                    }
+                    for name, state in self._jobs.items()
+                },
+            }
+
+
+# Global instance (singleton pattern)
+_scheduler_instance: Scheduler | None = None
+
+
+def initialize_scheduler(
+    jobs: list[ScheduledJob],
+    max_workers: int = 2,
+    max_pending: int = 0,
+) -> Scheduler:
+    """
+    Crée et démarre le scheduler global (API lifespan).
+
+    Args:
+        jobs: Jobs périodiques à enregistrer
+        max_workers: Threads du pool
+        max_pending: Jobs acceptés en attente d'un thread libre
+
+    Returns:
+        Scheduler démarré
+    """
+    global _scheduler_instance
+    if _scheduler_instance is None:
+        scheduler = Scheduler(max_workers=max_workers, max_pending=max_pending)
+        for job in jobs:
+            scheduler.add_job(job)
+        scheduler.start()
+        _scheduler_instance = scheduler
+    return _scheduler_instance
+
+
+def get_scheduler() -> Optional[Scheduler]:
+    """Scheduler global, ou None s'il n'est pas démarré."""
+    return _scheduler_instance
+
+
+def shutdown_scheduler(wait: bool = True) -> None:
+    """Arrête le scheduler global (API lifespan)."""
+    global _scheduler_instance
+    if _scheduler_instance is not None:
+        _scheduler_instance.stop(wait=wait)
+        _scheduler_instance = None
@@ -0,0 +1,9 @@
+"""
+Entry point: python -m src.interfaces.cli <command> ...
+"""
+import sys
+
+from src.interfaces.cli.app import main
+
+if __name__ == "__main__":
+    sys.exit(main())
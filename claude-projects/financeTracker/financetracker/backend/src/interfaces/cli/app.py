@@ -0,0 +1,403 @@
+"""
+Command-line interface for offline bulk operations.
+
+Commandes:
+- import: importe des fichiers, dossiers ou globs; parsing en parallèle
+  (processus), persistance fichier par fichier dans une unité de travail
+- recategorize: catégorise les transactions sans catégorie, par lots
+- project: projection de solde (texte ou JSON)
+- rebuild-rollups: recalcul complet des tables dérivées
+- bench: débit d'écriture et latence de lecture sur une base temporaire
+
+Architecture:
+- Parle directement aux repositories (UnitOfWork), sans passer par l'API
+- Démarrage rapide: seuls argparse et la stdlib sont importés au chargement;
+  couche application, SQLAlchemy et adapters (chardet) sont importés par la
+  commande qui en a besoin, FastAPI jamais
+
+Usage:
+    python -m src.interfaces.cli import exports/ --account-id <uuid> --workers 4
+    python -m src.interfaces.cli recategorize --batch-size 1000
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Fichiers retenus dans un dossier: formats des adapters intégrés
+DEFAULT_PATTERNS = ("*.csv", "*.ofx", "*.qfx", "*.qif")
+
+
+# === Helpers ===
+
+def expand_paths(
+    patterns: Sequence[str], file_patterns: Sequence[str] = DEFAULT_PATTERNS
+) -> list[Path]:
+    """
+    Résout fichiers, dossiers et globs en une liste de fichiers.
+
+    Un dossier est parcouru récursivement avec `file_patterns`; un glob
+    accepte `**`. L'ordre des arguments est conservé, sans doublons.
+
+    Args:
+        patterns: Chemins, dossiers ou globs donnés sur la ligne de commande
+        file_patterns: Motifs des fichiers retenus dans un dossier
+
+    Returns:
+        Fichiers existants, triés par argument
+    """
+    files: dict[Path, None] = {}
+    for raw in patterns:
+        path = Path(raw)
+        if path.is_dir():
+            matches = sorted(
+                p for pattern in file_patterns for p in path.rglob(pattern) if p.is_file()
+            )
+        elif glob.has_magic(raw):
+            matches = sorted(Path(p) for p in glob.glob(raw, recursive=True) if Path(p).is_file())
+        else:
+            matches = [path]
+        files.update(dict.fromkeys(matches))
+    return list(files)
+
+
+def _rate(rows: int, elapsed: float) -> str:
+    """Débit lisible en lignes par seconde."""
+    return f"{rows / elapsed:,.0f} rows/s" if elapsed > 0 else "n/a rows/s"
+
+
+@contextmanager
+def _open_database(database_url: Optional[str]):
+    """
+    Ouvre la base (URL explicite ou settings) et crée le schéma manquant.
+
+    Instance propre à la commande, fermée à la sortie: le singleton de
+    l'API (initialize_database) n'est pas touché.
+    """
+    from src.config import settings
+    from src.infrastructure.persistence.database import Database, DatabaseConfig, SQLiteProfile
+    from src.infrastructure.persistence.models import Base
+
+    database = Database(DatabaseConfig(
+        database_url=database_url or settings.database_url,
+        profile=SQLiteProfile.from_name(settings.database_profile),
+        pool_size=settings.database_pool_size,
+        money_storage=settings.money_storage,
+        uuid_storage=settings.uuid_storage,
+    ))
+    try:
+        database.create_all_tables(Base)
+        yield database
+    finally:
+        database.close()
+
+
+def _parse_file(path: Path, account_id):
+    """
+    Parse un fichier (exécuté dans un processus de travail).
+
+    L'empreinte du fichier est calculée ici aussi, hors du processus
+    principal.
+
+    Returns:
+        ((transactions, ImportSource), None) ou (None, message d'erreur)
+    """
+    from src.application.handlers.import_handler import ImportSource, file_digest
+    from src.config import settings
+    from src.infrastructure.import_adapters.adapter_factory import create_adapter_factory
+    from src.infrastructure.import_adapters.base_adapter import ImportError as AdapterError
+
+    try:
+        adapter = create_adapter_factory(settings.import_profiles_path).get_adapter(path)
+        transactions = adapter.parse(path, account_id, auto_categorize=False)
+        return (transactions, ImportSource(file_digest(path), path.name, adapter.name)), None
+    except (AdapterError, OSError) as e:
+        return None, str(e)
+
+
+def _parse_all(files: list[Path], account_id, workers: int):
+    """Parse les fichiers dans l'ordre, en parallèle si workers > 1."""
+    if workers <= 1 or len(files) <= 1:
+        for path in files:
+            yield path, _parse_file(path, account_id)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(files))) as pool:
+        # map conserve l'ordre: le fichier i est persisté pendant que les
+        # suivants sont parsés
+        yield from zip(files, pool.map(_parse_file, files, [account_id] * len(files)))
+
+
+# === Commandes ===
+
+def cmd_import(args: argparse.Namespace) -> int:
+    """Importe des fichiers de relevés dans un compte."""
+    from uuid import UUID
+
+    from src.application.handlers.import_handler import ImportTransactionsHandler
+    from src.infrastructure.persistence.unit_of_work import UnitOfWork
+
+    files = expand_paths(args.paths, args.pattern or DEFAULT_PATTERNS)
+    if not files:
+        print("No files to import", file=sys.stderr)
+        return 1
+
+    account_id = UUID(args.account_id)
+    failures = rows = imported = skipped = 0
+    started = time.perf_counter()
+
+    with _open_database(args.database_url) as database:
+        for path, (parsed, error) in _parse_all(files, account_id, args.workers):
+            if error is not None:
+                failures += 1
+                print(f"{path}: error: {error}", file=sys.stderr)
+                continue
+            transactions, source = parsed
+
+            try:
+                with UnitOfWork(database) as uow:
+                    handler = ImportTransactionsHandler(
+                        adapter_factory=None,
+                        transaction_repository=uow.transactions,
+                        category_repository=uow.categories,
+                        batch_repository=uow.import_batches,
+                    )
+                    result = handler.import_parsed(
+                        transactions, account_id, auto_categorize=not args.no_categorize,
+                        source=source,
+                    )
+            except Exception as e:
+                failures += 1
+                print(f"{path}: error: {e}", file=sys.stderr)
+                continue
+
+            rows += len(transactions)
+            imported += result.imported_count
+            skipped += result.skipped_count
+            if result.already_imported:
+                print(f"{path}: already imported (batch {result.batch_id}), skipped")
+                continue
+            print(
+                f"{path}: {result.imported_count} imported, "
+                f"{result.skipped_count} skipped, {result.categorized_count} categorized"
+            )
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"{len(files)} files, {rows} rows ({imported} imported, {skipped} skipped, "
+        f"{failures} failed files) in {elapsed:.2f}s: {_rate(rows, elapsed)}"
+    )
+    return 1 if failures else 0
+
+
+def cmd_recategorize(args: argparse.Namespace) -> int:
+    """Catégorise les transactions sans catégorie, lot par lot."""
+    from uuid import UUID
+
+    from src.domain.services.categorization_service import CategorizationService
+    from src.domain.value_objects.transaction_query import TransactionQuery
+    from src.infrastructure.persistence.unit_of_work import UnitOfWork
+
+    query = TransactionQuery(
+        account_ids=(UUID(args.account_id),) if args.account_id else (),
+        uncategorized=True,
+    )
+    scanned = categorized = 0
+    cursor = None
+    started = time.perf_counter()
+
+    with _open_database(args.database_url) as database:
+        while True:
+            # Un lot = une unité de travail: le travail fait reste acquis
+            with UnitOfWork(database) as uow:
+                batch = uow.transactions.find(query, limit=args.batch_size, after=cursor)
+                if not batch:
+                    break
+                service = CategorizationService(uow.categories, uow.transactions)
+                changed = []
+                for tx in batch:
+                    result = service.categorize(tx)
+                    if result.category_id:
+                        tx.category_id = result.category_id
+                        tx.category_confidence = result.confidence
+                        changed.append(tx)
+                uow.transactions.save_many(changed)
+
+            scanned += len(batch)
+            categorized += len(changed)
+            # Curseur keyset: les lignes catégorisées sortent du filtre, les
+            # autres ne sont pas relues
+            cursor = (batch[-1].date, batch[-1].id)
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"{categorized}/{scanned} transactions categorized in {elapsed:.2f}s: "
+        f"{_rate(scanned, elapsed)}"
+    )
+    return 0
+
+
+def cmd_project(args: argparse.Namespace) -> int:
+    """Affiche la projection de solde."""
+    import json
+
+    from src.application.handlers.projection_handler import ProjectionHandler
+    from src.application.queries.get_projection import GetProjectionQuery
+    from src.domain.value_objects.scenario import Scenario
+    from src.infrastructure.persistence.unit_of_work import UnitOfWork
+
+    query = GetProjectionQuery(months=args.months, scenario=Scenario(args.scenario))
+    with _open_database(args.database_url) as database, UnitOfWork(database) as uow:
+        dto = ProjectionHandler(
+            account_repository=uow.accounts,
+            recurring_repository=uow.recurring,
+            transaction_repository=uow.transactions,
+        ).handle(query)
+
+    if args.json:
+        print(json.dumps(dto.to_dict(), indent=2))
+    else:
+        print(dto)
+        print(
+            f"{dto.num_negative_days}/{dto.num_days} negative days, "
+            f"status: {'critical' if dto.is_critical else 'warning' if dto.is_warning else 'ok'}"
+        )
+    return 0
+
+
+def cmd_rebuild_rollups(args: argparse.Namespace) -> int:
+    """Recalcule le rollup mensuel et la fermeture des catégories."""
+    from src.infrastructure.schedulers.jobs import rebuild_rollups
+
+    with _open_database(args.database_url) as database:
+        started = time.perf_counter()
+        rebuild_rollups(database)
+        elapsed = time.perf_counter() - started
+    print(f"Rollups rebuilt in {elapsed:.2f}s")
+    return 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    """Mesure écriture et lecture sur une base temporaire jetable."""
+    import tempfile
+    from datetime import date, timedelta
+    from decimal import Decimal
+    from uuid import uuid4
+
+    from src.domain.entities.transaction import Transaction
+    from src.domain.value_objects.money import Money
+    from src.domain.value_objects.transaction_query import TransactionQuery
+    from src.infrastructure.persistence.database import Database, DatabaseConfig, SQLiteProfile
+    from src.infrastructure.persistence.models import Base
+    from src.infrastructure.persistence.unit_of_work import UnitOfWork
+
+    account_id = uuid4()
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Database(DatabaseConfig(
+            f"sqlite:///{tmp}/bench.db", profile=SQLiteProfile.from_name(args.profile)
+        ))
+        database.create_all_tables(Base)
+
+        started = time.perf_counter()
+        for start in range(0, args.rows, args.batch_size):
+            batch = []
+            for i in range(start, min(start + args.batch_size, args.rows)):
+                tx = Transaction(
+                    account_id=account_id,
+                    date=date.today() - timedelta(days=i % 1000),
+                    amount=Money(Decimal(-(i % 20000)) / 100),
+                    description=f"CB MARCHAND {i % 997} REF{i}",
+                )
+                tx.ensure_import_hash()
+                batch.append(tx)
+            with UnitOfWork(database) as uow:
+                uow.transactions.save_many(batch)
+        write_elapsed = time.perf_counter() - started
+
+        query = TransactionQuery(account_ids=(account_id,))
+        started = time.perf_counter()
+        with UnitOfWork(database) as uow:
+            for _ in range(args.reads):
+                uow.transactions.find_rows(query, limit=50)
+        read_elapsed = time.perf_counter() - started
+        database.close()
+
+    print(f"write: {args.rows} rows in {write_elapsed:.2f}s: {_rate(args.rows, write_elapsed)}")
+    print(f"read: {args.reads} pages in {read_elapsed:.2f}s: "
+          f"{read_elapsed / max(args.reads, 1) * 1000:.2f} ms/page")
+    return 0
+
+
+# === Parser ===
+
+def build_parser() -> argparse.ArgumentParser:
+    """Construit le parser de la CLI et de ses sous-commandes."""
+    parser = argparse.ArgumentParser(
+        prog="financetracker",
+        description="Finance Tracker offline bulk operations",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="log at INFO level")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_command(name: str, func, help: str) -> argparse.ArgumentParser:
+        command = commands.add_parser(name, help=help, description=help)
+        command.add_argument("--database-url", help="override DATABASE_URL")
+        command.set_defaults(func=func)
+        return command
+
+    importer = add_command("import", cmd_import, "import statement files")
+    importer.add_argument("paths", nargs="+", help="files, directories or globs (** allowed)")
+    importer.add_argument("--account-id", required=True, help="target account UUID")
+    importer.add_argument("--workers", type=int, default=1, help="parsing processes")
+    importer.add_argument(
+        "--pattern", action="append",
+        help=f"file pattern in directories, repeatable (default: {' '.join(DEFAULT_PATTERNS)})",
+    )
+    importer.add_argument("--no-categorize", action="store_true", help="skip auto-categorization")
+
+    recategorize = add_command(
+        "recategorize", cmd_recategorize, "categorize uncategorized transactions"
+    )
+    recategorize.add_argument("--account-id", help="limit to one account")
+    recategorize.add_argument("--batch-size", type=int, default=500)
+
+    project = add_command("project", cmd_project, "project account balances")
+    project.add_argument("--months", type=int, default=6)
+    project.add_argument(
+        "--scenario", default="realistic", choices=["pessimistic", "realistic", "optimistic"]
+    )
+    project.add_argument("--json", action="store_true", help="print the full projection as JSON")
+
+    add_command("rebuild-rollups", cmd_rebuild_rollups, "rebuild derived tables")
+
+    bench = add_command("bench", cmd_bench, "benchmark writes and reads on a scratch database")
+    bench.add_argument("--rows", type=int, default=10_000)
+    bench.add_argument("--batch-size", type=int, default=1_000)
+    bench.add_argument("--reads", type=int, default=200)
+    bench.add_argument("--profile", default="performance", choices=["default", "performance"])
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Point d'entrée: parse les arguments et exécute la commande."""
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(levelname)s %(name)s: %(message)s",
+    )
+    try:
+        return args.func(args)
+    except (ValueError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
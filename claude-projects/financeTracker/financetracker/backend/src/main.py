@@ -2,22 +2,74 @@
 FinanceTracker - Personal Finance Management API
 
 Point d'entrée principal de l'application FastAPI.
+
+Démarrage à froid: seul FastAPI est importé avec ce module. La
+configuration, SQLAlchemy et le scheduler sont importés dans le lifespan,
+les routers (et derrière eux application, repositories et adapters) au
+premier appel ASGI ou à la première génération du schéma OpenAPI.
 """
 from contextlib import asynccontextmanager
+from decimal import Decimal
+import importlib
 import logging
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.config import settings
-from src.infrastructure.persistence.database import initialize_database, DatabaseConfig
-
 logger = logging.getLogger(__name__)
 
+# Routers montés sous /api/v1: (module, tag)
+ROUTERS = (
+    ("src.infrastructure.api.routes.import_routes", "import"),
+    ("src.infrastructure.api.routes.transactions", "transactions"),
+    ("src.infrastructure.api.routes.projection", "projection"),
+    ("src.infrastructure.api.routes.accounts", "accounts"),
+    ("src.infrastructure.api.routes.analytics", "analytics"),
+    ("src.infrastructure.api.routes.budgets", "budgets"),
+    ("src.infrastructure.api.routes.alerts", "alerts"),
+)
+
+
+class FinanceTrackerAPI(FastAPI):
+    """FastAPI application whose routers are imported on first use."""
+
+    _routers_included = False
+
+    def include_routers(self) -> None:
+        """Import and mount the API routers (idempotent)."""
+        if self._routers_included:
+            return
+        for module_name, tag in ROUTERS:
+            module = importlib.import_module(module_name)
+            self.include_router(module.router, prefix="/api/v1", tags=[tag])
+        self._routers_included = True
+
+    async def __call__(self, scope, receive, send) -> None:
+        # Premier appel: lifespan sous un serveur ASGI, sinon première requête
+        self.include_routers()
+        await super().__call__(scope, receive, send)
+
+    def openapi(self) -> dict:
+        self.include_routers()
+        return super().openapi()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifecycle: startup and shutdown events."""
+    from src.config import settings
+    from src.infrastructure.persistence.database import (
+        initialize_database,
+        DatabaseConfig,
+        SQLiteProfile,
+    )
+    from src.infrastructure.persistence.async_database import (
+        initialize_async_database,
+        close_async_database,
+    )
+    from src.infrastructure.schedulers import initialize_scheduler, shutdown_scheduler
+    from src.infrastructure.schedulers.jobs import default_jobs
+
     # Startup
     print(f"🚀 Starting FinanceTracker API (debug={settings.debug})")
     try:
@@ -25,22 +77,36 @@ async def lifespan(app: FastAPI):
         db_config = DatabaseConfig(
             database_url=settings.database_url,
             echo=settings.debug,
+            profile=SQLiteProfile.from_name(settings.database_profile),
+            pool_size=settings.database_pool_size,
+            money_storage=settings.money_storage,
+            uuid_storage=settings.uuid_storage,
         )
         db = initialize_database(db_config)
         if db.check_connection():
             print("✅ Database connected")
         else:
             print("⚠️ Database connection failed")
+        # Async engine on the same database, used by the routes
+        await initialize_async_database(db).check_connection()
     except Exception as e:
         print(f"❌ Database initialization error: {e}")
         raise
-    # TODO: Start scheduler
+    # Periodic jobs (alerts, SQLite maintenance) on a bounded thread pool
+    if settings.scheduler_enabled:
+        initialize_scheduler(
+            default_jobs(db, Decimal(str(settings.default_alert_threshold))),
+            max_workers=settings.scheduler_workers,
+            max_pending=settings.scheduler_max_pending,
+        )
     yield
     # Shutdown
+    shutdown_scheduler()
+    await close_async_database()
     print("👋 Shutting down FinanceTracker API")
 
 
-app = FastAPI(
+app = FinanceTrackerAPI(
     title="FinanceTracker API",
     description="Personal finance tracking and budget projection",
     version="0.1.0",
@@ -68,20 +134,26 @@ app.add_middleware(
 # Health check
 @app.get("/health", tags=["system"])
 async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "version": "0.1.0"}
-
-
-# Include routers
-from src.infrastructure.api.routes import import_routes, transactions, projection, accounts
-
-app.include_router(import_routes.router, prefix="/api/v1", tags=["import"])
-app.include_router(transactions.router, prefix="/api/v1", tags=["transactions"])
-app.include_router(projection.router, prefix="/api/v1", tags=["projection"])
-app.include_router(accounts.router, prefix="/api/v1", tags=["accounts"])
+    """Health check endpoint (with connection pool usage and job metrics)."""
+    from src.infrastructure.persistence.database import get_database
+    from src.infrastructure.persistence.async_database import get_async_database
+    from src.infrastructure.schedulers import get_scheduler
+
+    scheduler = get_scheduler()
+    return {
+        "status": "healthy",
+        "version": "0.1.0",
+        "database": {
+            "pool": get_database().pool_status().to_dict(),
+            "async_pool": get_async_database().pool_status().to_dict(),
+        },
+        "scheduler": scheduler.status() if scheduler else None,
+    }
 
 
 if __name__ == "__main__":
     import uvicorn
 
+    from src.config import settings
+
     uvicorn.run("src.main:app", host="0.0.0.0", port=8000, reload=settings.debug)
@@ -1,12 +1,16 @@
 """E2E tests for CSV import workflow via API."""
 from __future__ import annotations
 
+import csv
+import io
+import json
 from pathlib import Path
 from uuid import uuid4
 import pytest
 from fastapi.testclient import TestClient
 
 from src.main import app
+from src.infrastructure.api.export import ExportFormat
 from src.infrastructure.persistence.database import initialize_database, DatabaseConfig, get_database
 from src.infrastructure.persistence.models import Base
 from src.domain.repositories.transaction_repository import TransactionRepository
@@ -31,6 +35,9 @@ def client():
     with TestClient(app) as client:
         yield client
 
+    # The database is a process-wide singleton: reset it between tests
+    db.drop_all_tables(DeclarativeBase)
+
 
 @pytest.fixture
 def test_csv_file(tmp_path) -> Path:
@@ -54,6 +61,10 @@ class TestImportFlowViaAPI:
         response = client.get("/health")
         assert response.status_code == 200
         assert response.json()["status"] == "healthy"
+        assert response.json()["database"]["pool"]["checked_out"] == 0
+        scheduler = response.json()["scheduler"]
+        assert scheduler["running"] is True
+        assert {"alerts", "vacuum"} <= set(scheduler["jobs"])
 
     def test_create_account_and_import_csv(
         self,
@@ -157,6 +168,74 @@ class TestImportFlowViaAPI:
         assert second_import.json()["imported_count"] == 0
         assert second_import.json()["skipped_count"] == 4
 
+    def test_reupload_recognized_and_import_undone(
+        self,
+        client: TestClient,
+        test_csv_file: Path,
+    ):
+        """
+        E2E test: re-upload short-circuits on the file digest, undo removes the batch.
+        """
+        account_id = client.post(
+            "/api/v1/accounts",
+            json={"name": "Undo", "bank": "LCL", "account_type": "checking", "initial_balance": "0"},
+        ).json()["id"]
+
+        def upload():
+            with open(test_csv_file, "rb") as f:
+                return client.post(
+                    "/api/v1/import",
+                    files={"file": ("transactions.csv", f, "text/csv")},
+                    data={"account_id": account_id, "auto_categorize": "false"},
+                ).json()
+
+        first = upload()
+        again = upload()
+        assert (first["imported_count"], first["already_imported"]) == (4, False)
+        assert again["already_imported"] is True
+        assert again["batch_id"] == first["batch_id"]
+
+        batches = client.get(f"/api/v1/import/batches?account_id={account_id}").json()["items"]
+        assert [(b["id"], b["row_count"], b["first_date"], b["last_date"]) for b in batches] == [
+            (first["batch_id"], 4, "2025-01-15", "2025-01-25"),
+        ]
+
+        undo = client.delete(f"/api/v1/import/batches/{first['batch_id']}")
+        assert undo.status_code == 200
+        assert undo.json()["deleted_count"] == 4
+        assert client.get(f"/api/v1/transactions?account_id={account_id}").json()["total"] == 0
+        assert client.delete(f"/api/v1/import/batches/{first['batch_id']}").status_code == 404
+
+        # Lot annulé: le fichier peut être réimporté
+        assert upload()["imported_count"] == 4
+
+    def test_import_parses_upload_without_temp_copy(
+        self,
+        client: TestClient,
+        monkeypatch,
+    ):
+        """
+        E2E test: a QIF upload (octet-stream) is parsed from the upload spool.
+        """
+        account_id = client.post(
+            "/api/v1/accounts",
+            json={"name": "QIF", "bank": "LCL", "account_type": "checking", "initial_balance": "0"},
+        ).json()["id"]
+
+        def no_temp_file(*args, **kwargs):
+            raise AssertionError("upload copied to a temporary file")
+
+        monkeypatch.setattr("tempfile.NamedTemporaryFile", no_temp_file)
+        content = b"!Type:Bank\nD15/01/2025\nT-42,50\nPCB CARREFOUR\n^\nD20/01/2025\nT2400,00\nPVIR CAF\n^\n"
+        response = client.post(
+            "/api/v1/import",
+            files={"file": ("releve.qif", content, "application/octet-stream")},
+            data={"account_id": account_id, "auto_categorize": "false"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["imported_count"] == 2
+
     def test_get_projection(self, client: TestClient):
         """
         E2E test: Get projection with default parameters.
@@ -261,3 +340,212 @@ class TestImportFlowViaAPI:
         assert data["total"] == 4
         assert data["pages"] == 2
         assert len(data["items"]) == 2
+
+        # List items serialize exactly like the detail endpoint
+        for item in data["items"]:
+            detail = client.get(f"/api/v1/transactions/{item['id']}")
+            assert detail.status_code == 200
+            assert item == detail.json()
+
+    def test_export_streams_filtered_transactions(
+        self,
+        client: TestClient,
+        test_csv_file: Path,
+    ):
+        """
+        E2E test: Import → Export CSV and NDJSON with the list filters.
+        """
+        account_id = client.post("/api/v1/accounts", json={
+            "name": "Export Test",
+            "bank": "LCL",
+            "account_type": "checking",
+            "initial_balance": "1000.00",
+        }).json()["id"]
+        with open(test_csv_file, "rb") as f:
+            files = {"file": ("transactions.csv", f, "text/csv")}
+            client.post("/api/v1/import", files=files, data={"account_id": account_id})
+        listed = client.get(f"/api/v1/transactions?account_id={account_id}").json()["items"]
+
+        response = client.get(f"/api/v1/transactions/export?account_id={account_id}")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert 'filename="transactions.csv"' in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [r["id"] for r in rows] == [t["id"] for t in reversed(listed)]
+        assert rows[0]["description"] == "CB CARREFOUR"
+        assert rows[0]["amount"] == "-42.50"
+
+        response = client.get(
+            f"/api/v1/transactions/export?format=ndjson&account_id={account_id}&amount_max=0"
+        )
+        assert response.status_code == 200
+        exported = [json.loads(line) for line in response.text.splitlines()]
+        assert exported == [t for t in reversed(listed) if t["amount"].startswith("-")]
+
+    def test_export_parquet_round_trip(
+        self,
+        client: TestClient,
+        test_csv_file: Path,
+        monkeypatch,
+    ):
+        """
+        E2E test: Import → Parquet export (one row group per batch) read back with pyarrow.
+        """
+        pq = pytest.importorskip("pyarrow.parquet")
+        from src.infrastructure.api.routes import transactions as transactions_routes
+
+        monkeypatch.setattr(transactions_routes, "EXPORT_BATCH_SIZE", 3)
+        account_id = client.post("/api/v1/accounts", json={
+            "name": "Parquet Test",
+            "bank": "LCL",
+            "account_type": "checking",
+            "initial_balance": "1000.00",
+        }).json()["id"]
+        with open(test_csv_file, "rb") as f:
+            files = {"file": ("transactions.csv", f, "text/csv")}
+            client.post("/api/v1/import", files=files, data={"account_id": account_id})
+        listed = client.get(f"/api/v1/transactions?account_id={account_id}").json()["items"]
+
+        response = client.get(f"/api/v1/transactions/export?format=parquet&account_id={account_id}")
+        assert response.status_code == 200
+        assert 'filename="transactions.parquet"' in response.headers["content-disposition"]
+        parquet_file = pq.ParquetFile(io.BytesIO(response.content))
+        assert parquet_file.num_row_groups == 2
+        exported = parquet_file.read().to_pylist()
+
+        for row in exported:
+            for key in ("date", "value_date", "created_at", "updated_at"):
+                row[key] = row[key].isoformat() if row[key] else None
+        assert exported == list(reversed(listed))
+
+    def test_export_rejects_unknown_format(self, client: TestClient):
+        """Unknown format is a 400; parquet without pyarrow is a 501."""
+        assert client.get("/api/v1/transactions/export?format=xlsx").status_code == 400
+        if not ExportFormat.PARQUET.available:
+            response = client.get("/api/v1/transactions/export?format=parquet")
+            assert response.status_code == 501
+
+    def test_spending_analytics_follows_recategorization(
+        self,
+        client: TestClient,
+        test_csv_file: Path,
+    ):
+        """
+        E2E test: Import → Recategorize → Spending from the monthly rollup.
+        """
+        account_response = client.post("/api/v1/accounts", json={
+            "name": "Analytics Test",
+            "bank": "LCL",
+            "account_type": "checking",
+            "initial_balance": "0",
+        })
+        account_id = account_response.json()["id"]
+
+        with open(test_csv_file, "rb") as f:
+            files = {"file": ("transactions.csv", f, "text/csv")}
+            form_data = {"account_id": account_id, "auto_categorize": "false"}
+            client.post("/api/v1/import", files=files, data=form_data)
+
+        transactions = client.get(f"/api/v1/transactions?account_id={account_id}").json()["items"]
+        moved = transactions[0]
+        category_id = str(uuid4())
+        client.put(f"/api/v1/transactions/{moved['id']}/category", json={"category_id": category_id})
+
+        response = client.get(
+            f"/api/v1/analytics/spending?account_id={account_id}&end_month=2025-01&months=3"
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["start_month"], data["end_month"]) == ("2024-11", "2025-01")
+
+        totals = {c["category_id"]: (c["total"], c["count"]) for c in data["categories"]}
+        assert totals[category_id] == (moved["amount"], 1)
+        assert totals[None][1] == len(transactions) - 1
+        assert sum(float(total) for total, _ in totals.values()) == pytest.approx(2221.75)
+
+    def test_spending_rejects_invalid_month(self, client: TestClient):
+        """Invalid end_month is a validation error."""
+        response = client.get("/api/v1/analytics/spending?end_month=2025-13")
+        assert response.status_code == 422
+
+    def test_budget_status_reads_recategorized_spend(
+        self,
+        client: TestClient,
+        test_csv_file: Path,
+    ):
+        """
+        E2E test: Budget category → Import → Recategorize → Budget status.
+        """
+        from src.domain.entities.category import Category, CategoryType
+        from src.infrastructure.persistence.repositories import SQLiteCategoryRepository
+
+        groceries = Category(
+            name="Courses", category_type=CategoryType.EXPENSE, budget_default=100.0
+        )
+        with get_database().get_session_context() as session:
+            SQLiteCategoryRepository(session).save(groceries)
+
+        account_id = client.post("/api/v1/accounts", json={
+            "name": "Budget Test",
+            "bank": "LCL",
+            "account_type": "checking",
+            "initial_balance": "0",
+        }).json()["id"]
+        with open(test_csv_file, "rb") as f:
+            files = {"file": ("transactions.csv", f, "text/csv")}
+            form_data = {"account_id": account_id, "auto_categorize": "false"}
+            client.post("/api/v1/import", files=files, data=form_data)
+
+        for tx in client.get(f"/api/v1/transactions?account_id={account_id}").json()["items"]:
+            if tx["description"].startswith(("CB CARREFOUR", "CB MONOPRIX")):
+                client.put(
+                    f"/api/v1/transactions/{tx['id']}/category",
+                    json={"category_id": str(groceries.id)},
+                )
+
+        response = client.get("/api/v1/budgets/status?as_of=2025-01-25")
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["month"], data["days_elapsed"], data["days_in_month"]) == ("2025-01", 25, 31)
+
+        [status] = data["categories"]
+        assert status["category_id"] == str(groceries.id)
+        assert float(status["spent"]) == pytest.approx(78.25)
+        assert float(status["projected_spend"]) == pytest.approx(78.25 / 25 * 31)
+        assert status["is_projected_over"] is False
+
+    def test_budget_status_rejects_invalid_scenario(self, client: TestClient):
+        """Unknown scenario is a 400."""
+        response = client.get("/api/v1/budgets/status?scenario=wishful")
+        assert response.status_code == 400
+
+
+    def test_import_raises_balance_alert_once(
+        self,
+        client: TestClient,
+        test_csv_file: Path,
+    ):
+        """
+        E2E test: Import → Balance alert for the imported account → No duplicate.
+        """
+        account_id = client.post("/api/v1/accounts", json={
+            "name": "Alert Test",
+            "bank": "LCL",
+            "account_type": "checking",
+            "initial_balance": "-3000.00",
+        }).json()["id"]
+
+        with open(test_csv_file, "rb") as f:
+            files = {"file": ("transactions.csv", f, "text/csv")}
+            form_data = {"account_id": account_id, "auto_categorize": "false"}
+            client.post("/api/v1/import", files=files, data=form_data)
+
+        response = client.get(f"/api/v1/alerts?account_id={account_id}")
+        assert response.status_code == 200
+        [alert] = response.json()["items"]
+        assert alert["alert_type"] == "balance_below_threshold"
+        assert float(alert["amount"]) == pytest.approx(-3000 + 2221.75)
+
+        evaluation = client.post(f"/api/v1/alerts/evaluate?account_id={account_id}").json()
+        assert evaluation["new_alerts"] == []
+        assert evaluation["unchanged"] == 1
@@ -0,0 +1,76 @@
+"""
+Cold-start regression tests (python -X importtime).
+
+Imports each entry point in a fresh interpreter and checks that:
+- heavy modules (SQLAlchemy, chardet, settings, routers) stay deferred
+- the cumulative import time fits the startup budget (best of 3 runs)
+
+The budgets leave room for slow machines: the eager src.main used to
+take ~650 ms, the lazy one ~230 ms, most of it FastAPI itself.
+"""
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).parents[2]
+RUNS = 3
+
+# Module -> (budget en ms, modules qui ne doivent pas être importés)
+ENTRY_POINTS = {
+    "src.main": (
+        600,
+        {"sqlalchemy", "chardet", "pydantic_settings", "src.infrastructure.api.routes"},
+    ),
+    "src.interfaces.cli.app": (
+        100,
+        {"fastapi", "sqlalchemy", "chardet", "pydantic_settings"},
+    ),
+}
+
+
+def import_profile(module: str) -> dict[str, int]:
+    """Temps d'import cumulé (µs) de chaque module chargé par `import module`."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    ).stderr
+
+    profile = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+@pytest.mark.parametrize("module", list(ENTRY_POINTS))
+def test_heavy_modules_are_deferred(module: str):
+    _, forbidden = ENTRY_POINTS[module]
+
+    loaded = set(import_profile(module))
+
+    assert not forbidden & loaded
+
+
+@pytest.mark.parametrize("module", list(ENTRY_POINTS))
+def test_import_time_within_budget(module: str):
+    budget_ms, _ = ENTRY_POINTS[module]
+
+    best_ms = min(import_profile(module)[module] for _ in range(RUNS)) / 1000
+
+    assert best_ms <= budget_ms, f"{module} imports in {best_ms:.0f} ms (budget {budget_ms} ms)"
+
+
+def test_routers_are_mounted_on_first_use():
+    from src.main import app
+
+    paths = app.openapi()["paths"]
+
+    assert "/api/v1/import" in paths
+    assert "/api/v1/alerts" in paths
+    assert "/health" in paths
@@ -9,8 +9,10 @@ import pytest
 from pathlib import Path
 
 from src.infrastructure.import_adapters.adapter_factory import AdapterFactory
+from src.infrastructure.import_adapters.base_adapter import ImportAdapter, UnsupportedFileFormat
+from src.infrastructure.import_adapters.csv_profile_adapter import ProfileCSVAdapter
 from src.infrastructure.import_adapters.lcl_csv_adapter import LCLCSVAdapter
-from src.infrastructure.import_adapters.base_adapter import UnsupportedFileFormat
+from src.infrastructure.import_adapters.ofx_adapter import OFXAdapter
 
 # Path to test fixtures
 FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures"
@@ -80,6 +82,76 @@ class TestAdapterFactoryDiscovery:
             factory.get_adapter(nonexistent)
 
 
+class TestAdapterFactorySignatureIndex:
+    """Tests for signature-based selection."""
+
+    @pytest.fixture
+    def no_probing(self, monkeypatch):
+        """Fait échouer tout appel à can_parse (sélection par l'index seul)."""
+        def fail(self, file_path):
+            raise AssertionError(f"{self.name} probed")
+
+        for cls in (ProfileCSVAdapter, OFXAdapter):
+            monkeypatch.setattr(cls, "can_parse", fail)
+
+    def test_csv_selected_by_header_signature(self, factory: AdapterFactory, no_probing):
+        """L'en-tête LCL est trouvé sans sonder les adapters."""
+        assert isinstance(factory.get_adapter(LCL_SAMPLE), LCLCSVAdapter)
+
+    def test_header_signature_ignores_bom_case_and_encoding(
+        self, factory: AdapterFactory, no_probing, tmp_path: Path
+    ):
+        """BOM, casse et CP1252 n'empêchent pas la correspondance."""
+        utf8 = tmp_path / "bom.csv"
+        utf8.write_bytes(b"\xef\xbb\xbfDATE;Date valeur;Libell\xc3\xa9;D\xc3\xa9bit;Cr\xc3\xa9dit\r\n")
+        cp1252 = tmp_path / "latin.csv"
+        cp1252.write_bytes("Date;Date valeur;Libellé;Débit;Crédit\n".encode("cp1252"))
+
+        assert factory.get_adapter(utf8).name == "LCL CSV"
+        assert factory.get_adapter(cp1252).name == "LCL CSV"
+
+    def test_xml_ofx_selected_by_magic_bytes(
+        self, factory: AdapterFactory, no_probing, tmp_path: Path
+    ):
+        """La déclaration XML est ignorée avant les octets magiques."""
+        path = tmp_path / "releve.ofx"
+        path.write_bytes(b'<?xml version="1.0"?>\n<?OFX OFXHEADER="200"?>\n<OFX></OFX>')
+
+        assert factory.get_adapter(path).name == "OFX"
+
+    def test_adapter_without_signature_found_by_probing(
+        self, factory: AdapterFactory, tmp_path: Path
+    ):
+        """Un adapter sans signature reste trouvé par can_parse."""
+        class TextAdapter(ImportAdapter):
+            name = "Text"
+            supported_extensions = [".txt"]
+
+            def can_parse(self, file_path: Path) -> bool:
+                return file_path.suffix == ".txt"
+
+            def parse(self, file_path, account_id, auto_categorize=False):
+                return []
+
+        factory.register_adapter(TextAdapter())
+        path = tmp_path / "notes.txt"
+        path.write_text("Date;Date valeur;Libellé;Débit;Crédit\n", encoding="utf-8")
+
+        # L'index pointe vers LCL mais l'extension ne correspond pas: repli
+        assert factory.get_adapter(path).name == "Text"
+
+    def test_first_registered_signature_wins(self, factory: AdapterFactory):
+        """Un doublon de signature n'écrase pas l'adapter existant."""
+        class DummyAdapter(LCLCSVAdapter):
+            @property
+            def name(self) -> str:
+                return "Dummy"
+
+        factory.register_adapter(DummyAdapter())
+
+        assert factory.get_adapter(LCL_SAMPLE).name == "LCL CSV"
+
+
 class TestAdapterFactorySupportedFormats:
     """Tests for supported formats reporting."""
 
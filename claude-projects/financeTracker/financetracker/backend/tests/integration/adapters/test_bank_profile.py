@@ -0,0 +1,230 @@
+"""
+Integration tests for bank profiles and ProfileCSVAdapter.
+
+Tests the compiled row parsers (sign conventions, date and decimal
+formats), profile validation and loading, and CSV files parsed through
+the factory with built-in and custom profiles.
+"""
+from __future__ import annotations
+
+import json
+import tempfile
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.import_adapters.adapter_factory import (
+    AdapterFactory,
+    create_adapter_factory,
+)
+from src.infrastructure.import_adapters.bank_profile import (
+    BankProfile,
+    SignConvention,
+    date_parser,
+    decimal_parser,
+    detect_encoding,
+    load_profiles,
+    parse_flexible_decimal,
+)
+from src.infrastructure.import_adapters.base_adapter import UnsupportedFileFormat
+from src.infrastructure.import_adapters.csv_profile_adapter import ProfileCSVAdapter
+from src.infrastructure.import_adapters.profiles import BOURSORAMA_PROFILE
+
+CARD_PROFILE = {
+    "name": "Carte CSV",
+    "headers": ["Posted", "Merchant", "City", "Amount"],
+    "date_column": "Posted",
+    "description_columns": ["Merchant", "City"],
+    "amount_column": "Amount",
+    "sign": "inverted",
+    "delimiter": ",",
+    "date_format": "%Y-%m-%d",
+    "decimal_separator": ".",
+    "thousands_separator": "",
+}
+
+
+class TestParsers:
+    """Shared date and decimal helpers."""
+
+    @pytest.mark.parametrize("fmt, value, expected", [
+        ("%d/%m/%Y", "15/01/2025", date(2025, 1, 15)),
+        ("%d/%m/%Y", "5/1/2025", date(2025, 1, 5)),
+        ("%d.%m.%Y", "15.01.2025", date(2025, 1, 15)),
+        ("%Y-%m-%d", "2025-01-15", date(2025, 1, 15)),
+        ("%m/%d/%Y", "01/15/2025", date(2025, 1, 15)),
+    ])
+    def test_date_parser(self, fmt, value, expected):
+        assert date_parser(fmt)(value) == expected
+
+    @pytest.mark.parametrize("value", ["31/02/2025", "2025-01-15", ""])
+    def test_date_parser_rejects_invalid_dates(self, value):
+        with pytest.raises(ValueError):
+            date_parser("%d/%m/%Y")(value)
+
+    def test_decimal_parser_notations(self):
+        assert decimal_parser(",", " ")("1 234,56") == Decimal("1234.56")
+        assert decimal_parser(",", ".")("1.234,56") == Decimal("1234.56")
+        assert decimal_parser(".", ",")("-1,234.56") == Decimal("-1234.56")
+        assert decimal_parser(",", " ")("1 234,56") == Decimal("1234.56")
+
+    @pytest.mark.parametrize("value", ["", "abc", "NaN", "Infinity"])
+    def test_decimal_parser_rejects_non_numbers(self, value):
+        with pytest.raises(ValueError):
+            decimal_parser()(value)
+
+    def test_flexible_decimal_uses_last_separator(self):
+        assert parse_flexible_decimal("-1,234.56") == Decimal("-1234.56")
+        assert parse_flexible_decimal("-1.234,56") == Decimal("-1234.56")
+        assert parse_flexible_decimal("42.5") == Decimal("42.5")
+
+    def test_detect_encoding_prefers_expected_encodings(self, tmp_path: Path):
+        latin = tmp_path / "latin.csv"
+        latin.write_bytes("Libellé;Montant\n".encode("cp1252"))
+        bom = tmp_path / "bom.csv"
+        bom.write_bytes(b"\xef\xbb\xbfDate;Montant\n")
+
+        assert detect_encoding(latin) == "cp1252"
+        assert detect_encoding(bom) == "utf-8-sig"
+        assert detect_encoding(tmp_path / "missing.csv") is None
+
+
+class TestCompiledProfile:
+    """BankProfile.compile() for each sign convention."""
+
+    def test_debit_credit(self):
+        profile = BankProfile(
+            name="DC", headers=("D", "L", "Debit", "Credit"), date_column="D",
+            description_columns=("L",), debit_column="Debit", credit_column="Credit",
+            sign=SignConvention.DEBIT_CREDIT,
+        )
+        parse = profile.compile()
+
+        assert parse(["15/01/2025", "CB", "42,50", ""])[1] == Decimal("-42.50")
+        assert parse(["15/01/2025", "VIR", "", "2 400,00"])[1] == Decimal("2400.00")
+        # Débit déjà signé dans certains exports
+        assert parse(["15/01/2025", "CB", "-42,50", ""])[1] == Decimal("-42.50")
+        assert parse(["15/01/2025", "VIDE", "", ""]) is None
+        with pytest.raises(ValueError, match="Both debit and credit"):
+            parse(["15/01/2025", "X", "1,00", "2,00"])
+
+    def test_inverted_amount_and_joined_description(self):
+        parse = BankProfile.from_dict(CARD_PROFILE).compile()
+
+        assert parse(["2025-01-15", "CARREFOUR", "LYON", "42.50"]) == (
+            date(2025, 1, 15), Decimal("-42.50"), "CARREFOUR LYON", None,
+        )
+        assert parse(["2025-01-16", "REMBOURSEMENT", "", "-10.00"])[1:3] == (
+            Decimal("10.00"), "REMBOURSEMENT",
+        )
+
+    def test_value_date_and_row_errors(self):
+        parse = BOURSORAMA_PROFILE.compile()
+        row = ["2025-01-15", "2025-01-17", "CB CARREFOUR", "", "", "", "-42,50", "", "", "", ""]
+
+        assert parse(row) == (
+            date(2025, 1, 15), Decimal("-42.50"), "CB CARREFOUR", date(2025, 1, 17),
+        )
+        with pytest.raises(ValueError, match="Expected 11 columns"):
+            parse(row[:5])
+        with pytest.raises(ValueError, match="Invalid date format"):
+            parse(["15/01/2025", *row[1:]])
+
+    @pytest.mark.parametrize("changes, message", [
+        ({"amount_column": None}, "needs an amount column"),
+        ({"date_column": "Missing"}, "unknown columns"),
+        ({"headers": []}, "headers cannot be empty"),
+        ({"sign": "debit_credit"}, "needs debit and credit"),
+        ({"sign": "sideways"}, "sideways"),
+    ])
+    def test_invalid_profiles_are_rejected(self, changes, message):
+        with pytest.raises(ValueError, match=message):
+            BankProfile.from_dict({**CARD_PROFILE, **changes})
+
+
+class TestProfileCSVAdapter:
+    """CSV files parsed through profiles and the factory."""
+
+    def test_boursorama_file(self, tmp_path: Path):
+        path = tmp_path / "export.csv"
+        path.write_text(
+            ";".join(BOURSORAMA_PROFILE.headers) + "\n"
+            '2025-01-15;2025-01-15;"CB CARREFOUR";"Alimentation";"Vie quotidienne";"carrefour";'
+            '-42,50;;"0001";"Compte";1 000,00\n'
+            '2025-01-20;2025-01-20;"VIR SALAIRE";"Salaire";"Revenus";"";"2 400,00";;"0001";"Compte";3 400,00\n'
+            "not-a-date;;\"CASSE\";;;;1;;;;\n",
+            encoding="utf-8",
+        )
+        adapter = AdapterFactory().get_adapter(path)
+
+        transactions = adapter.parse(path, uuid4())
+
+        assert adapter.name == "Boursorama CSV"
+        assert [(t.description, t.amount.amount) for t in transactions] == [
+            ("CB CARREFOUR", Decimal("-42.50")),
+            ("VIR SALAIRE", Decimal("2400.00")),
+        ]
+        assert all(t.import_hash for t in transactions)
+
+    def test_identical_rows_get_occurrence_ranked_hashes(self, tmp_path: Path):
+        path = tmp_path / "lcl.csv"
+        path.write_text(
+            "Date;Date valeur;Libellé;Débit;Crédit\n"
+            + "15/01/2025;15/01/2025;CB BOULANGERIE;2,10;\n" * 2
+            + "16/01/2025;16/01/2025;CB BOULANGERIE;2,10;\n",
+            encoding="utf-8",
+        )
+        adapter = AdapterFactory().get_adapter(path)
+        account_id = uuid4()
+
+        first = [t.import_hash for t in adapter.parse(path, account_id)]
+        again = [t.import_hash for t in adapter.parse(path, account_id)]
+        other_account = [t.import_hash for t in adapter.parse(path, uuid4())]
+
+        assert len(set(first)) == 3
+        assert again == first
+        assert not set(other_account) & set(first)
+
+    def test_header_mismatch_raises(self, tmp_path: Path):
+        path = tmp_path / "other.csv"
+        path.write_text("a;b;c\n1;2;3\n", encoding="utf-8")
+
+        with pytest.raises(UnsupportedFileFormat):
+            ProfileCSVAdapter(BOURSORAMA_PROFILE).parse(path, uuid4())
+
+    def test_parse_stream_from_upload_spool(self, tmp_path: Path):
+        path = tmp_path / "lcl.csv"
+        path.write_bytes(
+            "Date;Date valeur;Libellé;Débit;Crédit\n15/01/2025;15/01/2025;CB CAFÉ;42,50;\n"
+            .encode("cp1252")
+        )
+        adapter = AdapterFactory().get_adapter(path)
+
+        with tempfile.SpooledTemporaryFile(max_size=1024 * 1024) as spool:
+            spool.write(path.read_bytes())
+            spool.seek(0)
+            transactions = adapter.parse_stream(spool, uuid4(), "lcl.csv")
+            assert not spool.closed
+
+        assert [(t.description, t.amount.amount) for t in transactions] == [
+            ("CB CAFÉ", Decimal("-42.50")),
+        ]
+
+    def test_custom_profile_from_json(self, tmp_path: Path):
+        profiles_path = tmp_path / "profiles.json"
+        profiles_path.write_text(json.dumps([CARD_PROFILE]), encoding="utf-8")
+        path = tmp_path / "card.csv"
+        path.write_text(
+            "Posted,Merchant,City,Amount\n2025-01-15,FNAC,PARIS,19.99\n", encoding="utf-8"
+        )
+
+        assert [p.name for p in load_profiles(profiles_path)] == ["Carte CSV"]
+        factory = create_adapter_factory(str(profiles_path))
+        transactions = factory.get_adapter(path).parse(path, uuid4())
+
+        assert [(t.description, t.amount.amount) for t in transactions] == [
+            ("FNAC PARIS", Decimal("-19.99")),
+        ]
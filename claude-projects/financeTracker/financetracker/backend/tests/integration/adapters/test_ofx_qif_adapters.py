@@ -0,0 +1,216 @@
+"""
+Integration tests for the streaming OFX and QIF adapters.
+
+Tests SGML and XML OFX statements (including tags split across read
+chunks), QIF sections and records, and selection through the factory.
+"""
+from __future__ import annotations
+
+import io
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.import_adapters.adapter_factory import AdapterFactory
+from src.infrastructure.import_adapters.base_adapter import UnsupportedFileFormat
+from src.infrastructure.import_adapters.ofx_adapter import OFXAdapter, iter_tags
+from src.infrastructure.import_adapters.qif_adapter import QIFAdapter
+
+OFX_SGML = """OFXHEADER:100
+DATA:OFXSGML
+VERSION:102
+ENCODING:USASCII
+CHARSET:1252
+
+<OFX>
+<BANKMSGSRSV1><STMTTRNRS><STMTRS>
+<BANKTRANLIST>
+<DTSTART>20250101
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20250115120000[+1:CET]
+<TRNAMT>-42,50
+<FITID>0001
+<NAME>CB CARREFOUR
+<MEMO>CB CARREFOUR LYON 14/01
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>CREDIT
+<DTPOSTED>20250120
+<DTAVAIL>20250121
+<TRNAMT>2400.00
+<FITID>0002
+<NAME>VIR SEPA SALAIRE
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>2025XX01
+<TRNAMT>-1.00
+<NAME>CASSE
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20250122
+<TRNAMT>-3.00
+<NAME>CAF\xc9 &amp; CO
+</STMTTRN>
+</BANKTRANLIST>
+</STMTRS></STMTTRNRS></BANKMSGSRSV1>
+</OFX>
+"""
+
+OFX_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<?OFX OFXHEADER="200" VERSION="220"?>
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN><TRNTYPE>DEBIT</TRNTYPE><DTPOSTED>20250203</DTPOSTED><TRNAMT>-9.99</TRNAMT>
+<FITID>X1</FITID><NAME>ABONNEMENT MUSIQUE</NAME></STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+QIF = """!Account
+NCompte courant
+TBank
+^
+!Type:Bank
+D15/01/2025
+T-42,50
+PCB CARREFOUR
+MLYON
+^
+D20/01'25
+T2,400.00
+PVIR SALAIRE
+SSalaire
+$2,400.00
+^
+D99/99/2025
+T-1,00
+PCASSE
+^
+!Type:Cat
+NAlimentation
+^
+"""
+
+
+def _write(tmp_path: Path, name: str, content: str, encoding: str = "utf-8") -> Path:
+    path = tmp_path / name
+    path.write_bytes(content.encode(encoding))
+    return path
+
+
+class TestOFXAdapter:
+    """Tests for OFXAdapter."""
+
+    def test_iter_tags_across_chunk_boundaries(self):
+        stream = io.StringIO("<A><B>hello world<C>x</A>")
+        tags = list(iter_tags(stream, chunk_size=3))
+
+        assert tags == [
+            (False, "A", ""), (False, "B", "hello world"), (False, "C", "x"), (True, "A", ""),
+        ]
+
+    def test_sgml_statement(self, tmp_path: Path):
+        path = _write(tmp_path, "releve.ofx", OFX_SGML, encoding="cp1252")
+
+        transactions = OFXAdapter().parse(path, uuid4())
+
+        assert [(t.date, t.amount.amount, t.description) for t in transactions] == [
+            (date(2025, 1, 15), Decimal("-42.50"), "CB CARREFOUR LYON 14/01"),
+            (date(2025, 1, 20), Decimal("2400.00"), "VIR SEPA SALAIRE"),
+            (date(2025, 1, 22), Decimal("-3.00"), "CAFÉ & CO"),
+        ]
+        assert transactions[1].value_date == date(2025, 1, 21)
+        assert len({t.import_hash for t in transactions}) == 3
+
+    def test_small_chunks_give_same_tags(self):
+        expected = list(iter_tags(io.StringIO(OFX_SGML)))
+
+        assert list(iter_tags(io.StringIO(OFX_SGML), chunk_size=7)) == expected
+
+    def test_xml_statement(self, tmp_path: Path):
+        path = _write(tmp_path, "releve.qfx", OFX_XML)
+
+        transactions = OFXAdapter().parse(path, uuid4())
+
+        assert [(t.date, t.amount.amount) for t in transactions] == [
+            (date(2025, 2, 3), Decimal("-9.99")),
+        ]
+
+    def test_rejects_non_ofx(self, tmp_path: Path):
+        path = _write(tmp_path, "fake.ofx", "Date;Montant\n")
+
+        assert OFXAdapter().can_parse(path) is False
+        with pytest.raises(UnsupportedFileFormat):
+            OFXAdapter().parse(path, uuid4())
+
+
+class TestQIFAdapter:
+    """Tests for QIFAdapter."""
+
+    def test_bank_section_records(self, tmp_path: Path):
+        path = _write(tmp_path, "releve.qif", QIF)
+
+        transactions = QIFAdapter().parse(path, uuid4())
+
+        assert [(t.date, t.amount.amount, t.description) for t in transactions] == [
+            (date(2025, 1, 15), Decimal("-42.50"), "CB CARREFOUR LYON"),
+            (date(2025, 1, 20), Decimal("2400.00"), "VIR SALAIRE"),
+        ]
+
+    def test_month_first_dates(self, tmp_path: Path):
+        path = _write(tmp_path, "us.qif", "!Type:CCard\nD01/15/2025\nT-5.00\nPSHOP\n^\n")
+
+        transactions = QIFAdapter(date_formats=("%m/%d/%Y",)).parse(path, uuid4())
+
+        assert transactions[0].date == date(2025, 1, 15)
+
+    def test_rejects_non_qif(self, tmp_path: Path):
+        path = _write(tmp_path, "fake.qif", "D15/01/2025\n")
+
+        assert QIFAdapter().can_parse(path) is False
+
+
+def test_factory_selects_statement_adapters(tmp_path: Path):
+    factory = AdapterFactory()
+
+    assert factory.get_adapter(_write(tmp_path, "a.ofx", OFX_SGML, "cp1252")).name == "OFX"
+    assert factory.get_adapter(_write(tmp_path, "b.qif", QIF)).name == "QIF"
+    assert {"OFX", "QIF", "Boursorama CSV", "LCL CSV"} <= {a.name for a in factory.get_adapters()}
+
+
+class TestParseStream:
+    """Parsing straight from a binary stream (upload spool)."""
+
+    def test_ofx_and_qif_streams_match_files(self, tmp_path: Path):
+        for adapter, name, content, encoding in (
+            (OFXAdapter(), "releve.ofx", OFX_SGML, "cp1252"),
+            (QIFAdapter(), "releve.qif", QIF, "utf-8"),
+        ):
+            path = _write(tmp_path, name, content, encoding)
+            stream = io.BytesIO(path.read_bytes())
+            account_id = uuid4()
+
+            from_stream = adapter.parse_stream(stream, account_id, name)
+
+            assert [t.import_hash for t in from_stream] == [
+                t.import_hash for t in adapter.parse(path, account_id)
+            ]
+            assert not stream.closed
+
+    def test_factory_selects_stream_without_consuming_it(self):
+        stream = io.BytesIO(QIF.encode("utf-8"))
+        stream.seek(0)
+
+        adapter = AdapterFactory().get_adapter_for_stream(stream, "releve.qif")
+
+        assert adapter.name == "QIF"
+        assert stream.tell() == 0
+        assert len(adapter.parse_stream(stream, uuid4(), "releve.qif")) == 2
+
+    def test_unknown_stream_raises(self):
+        with pytest.raises(UnsupportedFileFormat, match="No adapter found"):
+            AdapterFactory().get_adapter_for_stream(io.BytesIO(b"hello"), "notes.csv")
@@ -0,0 +1,170 @@
+"""
+Integration tests for the offline CLI (src.interfaces.cli).
+
+Runs the commands in-process against a file database: path expansion,
+parallel import with deduplication, batch recategorization, projection,
+rollup rebuild, and the lazy imports that keep start-up fast.
+"""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from src.domain.entities.category import Category, CategoryType
+from src.infrastructure.persistence.database import Database, DatabaseConfig
+from src.infrastructure.persistence.models import TransactionModel
+from src.infrastructure.persistence.repositories import SQLiteCategoryRepository
+from src.interfaces.cli.app import expand_paths, main
+
+BACKEND_DIR = Path(__file__).parents[3]
+HEADER = "Date;Date valeur;Libellé;Débit;Crédit\n"
+
+
+def _write_statement(path: Path, label: str, rows: int = 5, month: int = 1) -> Path:
+    """Relevé LCL mensuel de `rows` lignes aux libellés distincts."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [
+        f"{day:02d}/{month:02d}/2025;{day:02d}/{month:02d}/2025;CB {label} {day};{day},50;\n"
+        for day in range(1, rows + 1)
+    ]
+    path.write_text(HEADER + "".join(lines), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def database_url(tmp_path: Path) -> str:
+    return f"sqlite:///{tmp_path}/cli.db"
+
+
+def _count(database_url: str, *criteria) -> int:
+    db = Database(DatabaseConfig(database_url))
+    try:
+        with db.get_session_context() as session:
+            return session.scalar(
+                select(func.count()).select_from(TransactionModel).where(*criteria)
+            )
+    finally:
+        db.close()
+
+
+class TestExpandPaths:
+    """Files, directories and globs resolve to an ordered, unique list."""
+
+    def test_directories_globs_and_duplicates(self, tmp_path: Path):
+        first = _write_statement(tmp_path / "2025" / "jan.csv", "A")
+        second = _write_statement(tmp_path / "2025" / "nested" / "feb.csv", "B")
+        (tmp_path / "2025" / "notes.txt").write_text("ignored")
+        other = _write_statement(tmp_path / "other.csv", "C")
+
+        files = expand_paths([
+            str(tmp_path / "2025"),
+            str(tmp_path / "**" / "*.csv"),
+            str(first),
+        ])
+
+        assert files == [first, second, other]
+
+    def test_plain_missing_path_is_kept(self, tmp_path: Path):
+        # Un chemin explicite inexistant est signalé à l'import, pas ignoré
+        assert expand_paths([str(tmp_path / "missing.csv")]) == [tmp_path / "missing.csv"]
+
+
+class TestImportCommand:
+    """Tests for `financetracker import`."""
+
+    def test_parallel_import_then_deduplicated_rerun(self, tmp_path: Path, database_url, capsys):
+        for month in range(3):
+            _write_statement(tmp_path / "exports" / f"m{month}.csv", f"SHOP{month}", month=month + 1)
+        account_id = str(uuid4())
+        argv = [
+            "import", str(tmp_path / "exports"), "--account-id", account_id,
+            "--workers", "2", "--database-url", database_url,
+        ]
+
+        assert main(argv) == 0
+        assert _count(database_url, TransactionModel.account_id == account_id) == 15
+        out = capsys.readouterr().out
+        assert "3 files, 15 rows (15 imported, 0 skipped" in out
+        assert "rows/s" in out
+
+        # Fichiers déjà importés: reconnus par empreinte, sans dédoublonnage
+        assert main(argv) == 0
+        out = capsys.readouterr().out
+        assert "(0 imported, 15 skipped" in out
+        assert out.count("already imported") == 3
+        assert _count(database_url) == 15
+
+    def test_unsupported_file_fails_without_stopping(self, tmp_path: Path, database_url, capsys):
+        good = _write_statement(tmp_path / "good.csv", "GOOD")
+        bad = tmp_path / "bad.csv"
+        bad.write_text("col1,col2\n1,2\n", encoding="utf-8")
+
+        code = main([
+            "import", str(bad), str(good), "--account-id", str(uuid4()),
+            "--database-url", database_url,
+        ])
+
+        assert code == 1
+        assert "bad.csv: error" in capsys.readouterr().err
+        assert _count(database_url) == 5
+
+
+class TestOtherCommands:
+    """Tests for recategorize, project and rebuild-rollups."""
+
+    def test_recategorize_in_batches(self, tmp_path: Path, database_url, capsys):
+        _write_statement(tmp_path / "a.csv", "BOULANGERIE", rows=7)
+        _write_statement(tmp_path / "b.csv", "MYSTERE", rows=3, month=2)
+        assert main([
+            "import", str(tmp_path), "--account-id", str(uuid4()),
+            "--no-categorize", "--database-url", database_url,
+        ]) == 0
+
+        db = Database(DatabaseConfig(database_url))
+        bakery = Category(
+            name="Boulangerie", category_type=CategoryType.EXPENSE, keywords=["BOULANGERIE"]
+        )
+        with db.get_session_context() as session:
+            SQLiteCategoryRepository(session).save(bakery)
+        db.close()
+        capsys.readouterr()
+
+        assert main(["recategorize", "--batch-size", "3", "--database-url", database_url]) == 0
+
+        assert "7/10 transactions categorized" in capsys.readouterr().out
+        assert _count(database_url, TransactionModel.category_id == str(bakery.id)) == 7
+        assert _count(database_url, TransactionModel.category_id.is_(None)) == 3
+
+    def test_project_json_and_rebuild_rollups(self, database_url, capsys):
+        assert main(["project", "--months", "2", "--json", "--database-url", database_url]) == 0
+        projection = json.loads(capsys.readouterr().out)
+        assert projection["scenario"] == "realistic"
+
+        assert main(["rebuild-rollups", "--database-url", database_url]) == 0
+        assert "Rollups rebuilt" in capsys.readouterr().out
+
+    def test_invalid_arguments_exit_with_usage(self, database_url):
+        with pytest.raises(SystemExit) as exc:
+            main(["project", "--scenario", "magic", "--database-url", database_url])
+        assert exc.value.code == 2
+
+
+def test_startup_does_not_import_fastapi_or_chardet(database_url):
+    """Loading the CLI and running a database command stays off the web stack."""
+    code = (
+        "import sys\n"
+        "from src.interfaces.cli.app import main\n"
+        f"main(['rebuild-rollups', '--database-url', {database_url!r}])\n"
+        "print(sorted(m for m in ('fastapi', 'chardet', 'starlette') if m in sys.modules))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    ).stdout
+
+    assert out.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,133 @@
+"""
+Integration tests for SQLiteAlertRepository.
+
+Tests balance snapshots read from the monthly rollup, cached projection
+round trips and alert deduplication.
+"""
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.account import Account
+from src.domain.entities.alert import Alert, AlertType
+from src.domain.entities.transaction import Transaction
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.projection_snapshot import ProjectionSnapshot
+from src.domain.value_objects.scenario import Scenario
+from src.infrastructure.persistence.database import Database, DatabaseConfig
+from src.infrastructure.persistence.models import Base
+from src.infrastructure.persistence.repositories import (
+    SQLiteAccountRepository,
+    SQLiteAlertRepository,
+    SQLiteTransactionRepository,
+)
+
+
+@pytest.fixture(params=[("decimal", "text"), ("cents", "binary")], ids=["default", "compact"])
+def database(request) -> Database:
+    """Database in both the default and the compact storage modes."""
+    money_storage, uuid_storage = request.param
+    db = Database(DatabaseConfig(
+        "sqlite:///:memory:", money_storage=money_storage, uuid_storage=uuid_storage
+    ))
+    db.create_all_tables(Base)
+    yield db
+    db.drop_all_tables(Base)
+    db.close()
+
+
+@pytest.fixture
+def accounts(database: Database) -> list[Account]:
+    """Deux comptes, dont un seul avec des transactions."""
+    funded = Account(name="Courant", bank="LCL", initial_balance=Money(Decimal("100.00")))
+    empty = Account(name="Livret", bank="LCL", initial_balance=Money(Decimal("50.00")))
+    with database.get_session_context() as session:
+        repo = SQLiteAccountRepository(session)
+        repo.save(funded)
+        repo.save(empty)
+        transactions = [
+            Transaction(
+                account_id=funded.id,
+                date=day,
+                amount=Money(Decimal(amount)),
+                description=f"CB {uuid4().hex[:8]}",
+            )
+            for day, amount in (
+                (date(2025, 1, 3), "-30.25"),
+                (date(2025, 2, 9), "1200.00"),
+                (date(2025, 2, 10), "-400.50"),
+            )
+        ]
+        for tx in transactions:
+            tx.ensure_import_hash()
+        SQLiteTransactionRepository(session).save_many(transactions)
+    return [funded, empty]
+
+
+class TestAlertRepository:
+    """Tests for SQLiteAlertRepository."""
+
+    def test_current_balances(self, database: Database, accounts: list[Account]):
+        funded, empty = accounts
+        with database.get_session_context() as session:
+            balances = SQLiteAlertRepository(session).current_balances(
+                [funded.id, empty.id, uuid4()]
+            )
+
+        assert balances == {
+            funded.id: Money(Decimal("869.25")),
+            empty.id: Money(Decimal("50.00")),
+        }
+
+    def test_snapshot_round_trip_and_replace(self, database: Database, accounts: list[Account]):
+        funded, _ = accounts
+        snapshot = ProjectionSnapshot.from_changes(
+            funded.id, date(2025, 3, 10), date(2025, 6, 8), Scenario.PESSIMISTIC, "digest",
+            {date(2025, 4, 5): Decimal("-880.00"), date(2025, 5, 5): Decimal("-880.00")},
+            Money(Decimal("869.25")),
+        )
+        with database.get_session_context() as session:
+            repo = SQLiteAlertRepository(session)
+            repo.save_snapshots([snapshot])
+            repo.save_snapshots([snapshot.rebased(Money(Decimal("10.00")))])
+
+        with database.get_session_context() as session:
+            stored = SQLiteAlertRepository(session).find_snapshots([funded.id])
+
+        assert stored == {funded.id: snapshot.rebased(Money(Decimal("10.00")))}
+
+    def test_add_alerts_deduplicates(self, database: Database, accounts: list[Account]):
+        funded, empty = accounts
+
+        def breach(account, day):
+            return Alert(
+                alert_type=AlertType.BALANCE_BELOW_THRESHOLD,
+                trigger_date=day,
+                amount=Money(Decimal("-12.50")),
+                threshold=Money(Decimal("0")),
+                account_id=account.id,
+                message="below",
+            )
+
+        with database.get_session_context() as session:
+            repo = SQLiteAlertRepository(session)
+            first = repo.add_alerts([breach(funded, date(2025, 4, 5))])
+            second = repo.add_alerts([
+                breach(funded, date(2025, 4, 5)),
+                breach(funded, date(2025, 4, 3)),
+                breach(empty, date(2025, 4, 5)),
+            ])
+
+        with database.get_session_context() as session:
+            repo = SQLiteAlertRepository(session)
+            funded_alerts = repo.find_alerts(account_id=funded.id)
+            all_alerts = repo.find_alerts(limit=10)
+
+        assert len(first) == 1 and len(second) == 2
+        assert sorted(a.trigger_date for a in funded_alerts) == [date(2025, 4, 3), date(2025, 4, 5)]
+        assert len(all_alerts) == 3
+        assert funded_alerts[0].amount == Money(Decimal("-12.50"))
@@ -0,0 +1,199 @@
+"""
+Integration tests for the monthly category rollup and SQLiteAnalyticsRepository.
+
+Tests that the triggers keep monthly_category_totals equal to a full
+recomputation on insert, update, recategorization and delete, and the
+category hierarchy rollup.
+"""
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, text, update
+
+from src.domain.entities.category import Category, CategoryType
+from src.domain.entities.transaction import Transaction
+from src.domain.value_objects.money import Money
+from src.infrastructure.persistence.database import Database, DatabaseConfig
+from src.infrastructure.persistence.models import (
+    MONTHLY_TOTALS_REBUILD,
+    Base,
+    MonthlyCategoryTotalModel,
+    TransactionModel,
+)
+from src.infrastructure.persistence.repositories import (
+    SQLiteAnalyticsRepository,
+    SQLiteCategoryRepository,
+    SQLiteTransactionRepository,
+)
+
+
+@pytest.fixture(params=[("decimal", "text"), ("cents", "binary")], ids=["default", "compact"])
+def database(request) -> Database:
+    """Database in both the default and the compact storage modes."""
+    money_storage, uuid_storage = request.param
+    db = Database(DatabaseConfig(
+        "sqlite:///:memory:", money_storage=money_storage, uuid_storage=uuid_storage
+    ))
+    db.create_all_tables(Base)
+    yield db
+    db.drop_all_tables(Base)
+    db.close()
+
+
+def _transaction(account_id, day: date, amount: str, category_id=None, label="CB") -> Transaction:
+    tx = Transaction(
+        account_id=account_id,
+        date=day,
+        amount=Money(Decimal(amount)),
+        description=f"{label} {uuid4().hex[:8]}",
+        category_id=category_id,
+    )
+    tx.ensure_import_hash()
+    return tx
+
+
+def _rollup(session) -> set[tuple]:
+    """Contenu du rollup: {(compte, catégorie, mois, total, nombre)}."""
+    return {
+        (r.account_id, r.category_id, r.month, r.total, r.tx_count)
+        for r in session.scalars(select(MonthlyCategoryTotalModel))
+    }
+
+
+def _rebuilt(session) -> set[tuple]:
+    """Contenu du rollup recalculé depuis les transactions."""
+    for statement in MONTHLY_TOTALS_REBUILD:
+        session.execute(text(statement))
+    session.expire_all()
+    return _rollup(session)
+
+
+class TestMonthlyTotalsMaintenance:
+    """The triggers keep the rollup equal to a full recomputation."""
+
+    def test_insert_accumulates_per_month_and_category(self, database: Database):
+        account_id, category_id = uuid4(), uuid4()
+        with database.get_session_context() as session:
+            repo = SQLiteTransactionRepository(session)
+            repo.save_many([
+                _transaction(account_id, date(2025, 1, 5), "-10.10", category_id),
+                _transaction(account_id, date(2025, 1, 20), "-5.25", category_id),
+                _transaction(account_id, date(2025, 2, 1), "-1.00", category_id),
+                _transaction(account_id, date(2025, 2, 3), "-2.00"),
+            ])
+
+            assert _rollup(session) == {
+                (str(account_id), str(category_id), "2025-01", Decimal("-15.35"), 2),
+                (str(account_id), str(category_id), "2025-02", Decimal("-1.00"), 1),
+                (str(account_id), None, "2025-02", Decimal("-2.00"), 1),
+            }
+
+    def test_recategorize_update_and_delete(self, database: Database):
+        account_id, groceries, leisure = uuid4(), uuid4(), uuid4()
+        with database.get_session_context() as session:
+            repo = SQLiteTransactionRepository(session)
+            first = _transaction(account_id, date(2025, 3, 10), "-30.00")
+            second = _transaction(account_id, date(2025, 3, 12), "-12.00", groceries)
+            third = _transaction(account_id, date(2025, 3, 31), "-8.00", groceries)
+            repo.save_many([first, second, third])
+
+            # Recatégorisation unitaire (ORM) et en masse (Core UPDATE)
+            first.category_id = groceries
+            repo.save(first)
+            session.execute(
+                update(TransactionModel)
+                .where(TransactionModel.id == str(third.id))
+                .values(category_id=str(leisure))
+            )
+            # Changement de montant et de mois
+            second.amount = Money(Decimal("-14.50"))
+            second.date = date(2025, 4, 1)
+            repo.save(second)
+            repo.delete(third.id)
+            session.expire_all()
+
+            assert _rollup(session) == {
+                (str(account_id), str(groceries), "2025-03", Decimal("-30.00"), 1),
+                (str(account_id), str(groceries), "2025-04", Decimal("-14.50"), 1),
+            }
+            assert _rollup(session) == _rebuilt(session)
+
+    def test_rebuild_matches_incremental(self, database: Database):
+        accounts, categories = [uuid4(), uuid4()], [uuid4(), uuid4(), None]
+        with database.get_session_context() as session:
+            repo = SQLiteTransactionRepository(session)
+            transactions = [
+                _transaction(
+                    accounts[i % 2], date(2025, 1 + i % 6, 1 + i % 28),
+                    f"-{i}.{i % 100:02d}", categories[i % 3],
+                )
+                for i in range(60)
+            ]
+            repo.save_many(transactions)
+            for tx in transactions[::7]:
+                repo.delete(tx.id)
+
+            assert _rollup(session) == _rebuilt(session)
+
+
+class TestSpendingByCategory:
+    """Tests for SQLiteAnalyticsRepository.spending_by_category."""
+
+    @pytest.fixture
+    def tree(self, database: Database) -> dict:
+        """Alimentation > Courses, Loisirs; transactions sur deux comptes."""
+        food = Category(name="Alimentation", category_type=CategoryType.EXPENSE)
+        groceries = Category(name="Courses", category_type=CategoryType.EXPENSE, parent_id=food.id)
+        leisure = Category(name="Loisirs", category_type=CategoryType.EXPENSE)
+        account_id, other_account = uuid4(), uuid4()
+
+        with database.get_session_context() as session:
+            categories = SQLiteCategoryRepository(session)
+            for category in (food, groceries, leisure):
+                categories.save(category)
+            SQLiteTransactionRepository(session).save_many([
+                _transaction(account_id, date(2025, 1, 3), "-10.00", food.id),
+                _transaction(account_id, date(2025, 1, 9), "-40.00", groceries.id),
+                _transaction(account_id, date(2025, 2, 9), "-25.00", groceries.id),
+                _transaction(account_id, date(2025, 2, 14), "-15.00", leisure.id),
+                _transaction(other_account, date(2025, 2, 20), "-99.00", groceries.id),
+                _transaction(account_id, date(2024, 12, 31), "-500.00", food.id),
+            ])
+        return {"food": food, "groceries": groceries, "leisure": leisure,
+                "account": account_id, "other": other_account}
+
+    def test_rollup_includes_descendants(self, database: Database, tree: dict):
+        with database.get_session_context() as session:
+            spending = SQLiteAnalyticsRepository(session).spending_by_category(
+                "2025-01", "2025-02", account_ids=[tree["account"]]
+            )
+
+        by_name = {dto.name: dto for dto in spending}
+        food = by_name["Alimentation"]
+        assert food.total == Decimal("-75.00")
+        assert food.count == 3
+        assert [(m.month, m.total) for m in food.months] == [
+            ("2025-01", Decimal("-50.00")),
+            ("2025-02", Decimal("-25.00")),
+        ]
+        assert by_name["Courses"].total == Decimal("-65.00")
+        assert by_name["Courses"].parent_id == str(tree["food"].id)
+        assert by_name["Loisirs"].total == Decimal("-15.00")
+        assert [dto.name for dto in spending] == ["Alimentation", "Courses", "Loisirs"]
+
+    def test_without_rollup_and_all_accounts(self, database: Database, tree: dict):
+        with database.get_session_context() as session:
+            spending = SQLiteAnalyticsRepository(session).spending_by_category(
+                "2025-01", "2025-02", rollup=False
+            )
+
+        totals = {dto.name: dto.total for dto in spending}
+        assert totals == {
+            "Alimentation": Decimal("-10.00"),
+            "Courses": Decimal("-164.00"),
+            "Loisirs": Decimal("-15.00"),
+        }
@@ -0,0 +1,153 @@
+"""
+Integration tests for the async persistence layer (aiosqlite).
+
+Tests AsyncDatabase and the async repositories against the same SQLite
+database as the synchronous stack.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.account import Account, AccountType
+from src.domain.entities.transaction import Transaction
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.transaction_query import TransactionQuery
+from src.infrastructure.persistence.async_database import AsyncDatabase
+from src.infrastructure.persistence.database import Database, DatabaseConfig
+from src.infrastructure.persistence.models import Base
+from src.infrastructure.persistence.repositories import (
+    SQLiteAccountRepository,
+    SQLiteTransactionRepository,
+)
+from src.infrastructure.persistence.repositories.async_sqlite_account_repository import (
+    AsyncSQLiteAccountRepository,
+)
+from src.infrastructure.persistence.repositories.async_sqlite_transaction_repository import (
+    AsyncSQLiteTransactionRepository,
+)
+
+
+@pytest.fixture(params=["memory", "file"])
+def database(request, tmp_path) -> Database:
+    """Sync database (in-memory shared cache or WAL file)."""
+    url = "sqlite:///:memory:" if request.param == "memory" else f"sqlite:///{tmp_path}/finance.db"
+    db = Database(DatabaseConfig(url))
+    db.create_all_tables(Base)
+    yield db
+    db.drop_all_tables(Base)
+    db.close()
+
+
+def _save_days(database: Database, account_id, days) -> None:
+    """Persiste une transaction par jour de janvier 2025 (stack synchrone)."""
+    with database.get_session_context() as session:
+        transactions = []
+        for day in days:
+            tx = Transaction(
+                account_id=account_id,
+                date=date(2025, 1, day),
+                amount=Money(Decimal("-10.00")),
+                description=f"CB AMAZON {day}",
+            )
+            tx.ensure_import_hash()
+            transactions.append(tx)
+        SQLiteTransactionRepository(session).save_many(transactions)
+
+
+class TestAsyncRepositories:
+    """Tests for async repositories."""
+
+    def test_reads_data_written_by_sync_stack(self, database: Database):
+        """Le moteur async voit la même base que le moteur synchrone."""
+        account_id = uuid4()
+        _save_days(database, account_id, range(1, 11))
+
+        async def scenario():
+            async_db = AsyncDatabase.from_database(database)
+            try:
+                async with async_db.get_session_context() as session:
+                    repo = AsyncSQLiteTransactionRepository(session)
+                    query = TransactionQuery(account_ids=[account_id])
+                    page = await repo.find(query, limit=3)
+                    total = await repo.count(query)
+                    found = await repo.search("amazon", limit=50)
+                    return page, total, found
+            finally:
+                await async_db.close()
+
+        page, total, found = asyncio.run(scenario())
+
+        assert [tx.date.day for tx in page] == [10, 9, 8]
+        assert total == 10
+        assert len(found) == 10
+
+    def test_stream_rows_reads_in_batches(self, database: Database):
+        """L'export lit toutes les lignes filtrées, par paquets, du plus ancien au plus récent."""
+        account_id = uuid4()
+        _save_days(database, account_id, range(1, 11))
+        _save_days(database, uuid4(), range(1, 4))
+        query = TransactionQuery(account_ids=[account_id])
+
+        async def scenario():
+            async_db = AsyncDatabase.from_database(database)
+            try:
+                async with async_db.get_session_context() as session:
+                    repo = AsyncSQLiteTransactionRepository(session)
+                    return [batch async for batch in repo.stream_rows(query, batch_size=4)]
+            finally:
+                await async_db.close()
+
+        batches = asyncio.run(scenario())
+
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert [row.date.day for batch in batches for row in batch] == list(range(1, 11))
+        with database.get_session_context() as session:
+            rows = list(SQLiteTransactionRepository(session).iter_rows(query, batch_size=3))
+        assert rows == [row for batch in batches for row in batch]
+
+    def test_write_is_committed(self, database: Database):
+        """Une écriture async est visible après commit par le moteur synchrone."""
+        account = Account(
+            name="Compte courant",
+            bank="LCL",
+            account_type=AccountType.CHECKING,
+            initial_balance=Money(Decimal("100.00")),
+        )
+
+        async def scenario():
+            async_db = AsyncDatabase.from_database(database)
+            try:
+                async with async_db.get_session_context() as session:
+                    await AsyncSQLiteAccountRepository(session).save(account)
+            finally:
+                await async_db.close()
+
+        asyncio.run(scenario())
+
+        with database.get_session_context() as session:
+            assert SQLiteAccountRepository(session).get_by_id(account.id) is not None
+
+    def test_concurrent_requests(self, database: Database):
+        """Plusieurs sessions concurrentes sur une seule boucle d'événements."""
+        account_id = uuid4()
+        _save_days(database, account_id, range(1, 21))
+
+        async def one_request(async_db: AsyncDatabase) -> int:
+            async with async_db.get_session_context() as session:
+                return await AsyncSQLiteTransactionRepository(session).count(
+                    TransactionQuery(account_ids=[account_id])
+                )
+
+        async def scenario():
+            async_db = AsyncDatabase.from_database(database)
+            try:
+                return await asyncio.gather(*(one_request(async_db) for _ in range(8)))
+            finally:
+                await async_db.close()
+
+        assert asyncio.run(scenario()) == [20] * 8
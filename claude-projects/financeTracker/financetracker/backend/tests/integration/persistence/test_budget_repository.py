@@ -0,0 +1,107 @@
+"""
+Integration tests for SQLiteBudgetRepository.
+
+Tests that budget lines read the monthly rollup with subcategories
+included, filtered by month and account.
+"""
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.category import Category, CategoryType
+from src.domain.entities.transaction import Transaction
+from src.domain.value_objects.money import Money
+from src.infrastructure.persistence.database import Database, DatabaseConfig
+from src.infrastructure.persistence.models import Base
+from src.infrastructure.persistence.repositories import (
+    SQLiteBudgetRepository,
+    SQLiteCategoryRepository,
+    SQLiteTransactionRepository,
+)
+
+
+@pytest.fixture(params=[("decimal", "text"), ("cents", "binary")], ids=["default", "compact"])
+def database(request) -> Database:
+    """Database in both the default and the compact storage modes."""
+    money_storage, uuid_storage = request.param
+    db = Database(DatabaseConfig(
+        "sqlite:///:memory:", money_storage=money_storage, uuid_storage=uuid_storage
+    ))
+    db.create_all_tables(Base)
+    yield db
+    db.drop_all_tables(Base)
+    db.close()
+
+
+def _transaction(account_id, day: date, amount: str, category_id) -> Transaction:
+    tx = Transaction(
+        account_id=account_id,
+        date=day,
+        amount=Money(Decimal(amount)),
+        description=f"CB {uuid4().hex[:8]}",
+        category_id=category_id,
+    )
+    tx.ensure_import_hash()
+    return tx
+
+
+@pytest.fixture
+def tree(database: Database) -> dict:
+    """Alimentation (400) > Courses (250); Loisirs sans budget."""
+    food = Category(name="Alimentation", category_type=CategoryType.EXPENSE, budget_default=400.0)
+    groceries = Category(
+        name="Courses", category_type=CategoryType.EXPENSE, parent_id=food.id, budget_default=250.0
+    )
+    leisure = Category(name="Loisirs", category_type=CategoryType.EXPENSE)
+    account_id, other_account = uuid4(), uuid4()
+
+    with database.get_session_context() as session:
+        categories = SQLiteCategoryRepository(session)
+        for category in (food, groceries, leisure):
+            categories.save(category)
+        SQLiteTransactionRepository(session).save_many([
+            _transaction(account_id, date(2025, 3, 2), "-20.00", food.id),
+            _transaction(account_id, date(2025, 3, 5), "-80.00", groceries.id),
+            # Remboursement: réduit la dépense nette
+            _transaction(account_id, date(2025, 3, 6), "10.00", groceries.id),
+            _transaction(other_account, date(2025, 3, 7), "-45.00", groceries.id),
+            _transaction(account_id, date(2025, 2, 28), "-300.00", groceries.id),
+            _transaction(account_id, date(2025, 3, 8), "-60.00", leisure.id),
+        ])
+    return {"food": food, "groceries": groceries, "account": account_id}
+
+
+class TestFindBudgetLines:
+    """Tests for SQLiteBudgetRepository.find_budget_lines."""
+
+    def test_budgeted_categories_with_subtree_spend(self, database: Database, tree: dict):
+        with database.get_session_context() as session:
+            lines = SQLiteBudgetRepository(session).find_budget_lines(date(2025, 3, 1))
+
+        by_name = {line.name: line for line in lines}
+        assert set(by_name) == {"Alimentation", "Courses"}
+        food, groceries = by_name["Alimentation"], by_name["Courses"]
+        assert food.budget.amount == Decimal("400.00")
+        assert food.spent.amount == Decimal("135.00")
+        assert food.category_ids == {tree["food"].id, tree["groceries"].id}
+        assert groceries.spent.amount == Decimal("115.00")
+        assert groceries.category_ids == {tree["groceries"].id}
+
+    def test_account_filter_and_empty_month(self, database: Database, tree: dict):
+        with database.get_session_context() as session:
+            repo = SQLiteBudgetRepository(session)
+            filtered = repo.find_budget_lines(date(2025, 3, 1), account_ids=[tree["account"]])
+            empty = repo.find_budget_lines(date(2025, 4, 1))
+
+        assert {line.name: line.spent.amount for line in filtered} == {
+            "Alimentation": Decimal("90.00"),
+            "Courses": Decimal("70.00"),
+        }
+        assert {line.name: line.spent.amount for line in empty} == {
+            "Alimentation": Decimal("0.00"),
+            "Courses": Decimal("0.00"),
+        }
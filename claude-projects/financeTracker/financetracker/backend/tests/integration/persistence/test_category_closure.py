@@ -0,0 +1,185 @@
+"""
+Integration tests for the category closure table.
+
+Tests that the triggers keep category_closure equal to a full
+recomputation from parent_id on insert, move and delete, and the
+subtree queries built on it.
+"""
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete, select, text, update
+from sqlalchemy.exc import IntegrityError
+
+from src.domain.entities.category import Category, CategoryType
+from src.domain.entities.transaction import Transaction
+from src.domain.repositories.category_repository import CategoryRepository
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.transaction_query import TransactionQuery
+from src.infrastructure.persistence.database import Database, DatabaseConfig
+from src.infrastructure.persistence.models import (
+    CATEGORY_CLOSURE_REBUILD,
+    Base,
+    CategoryClosureModel,
+    CategoryModel,
+)
+from src.infrastructure.persistence.repositories import (
+    SQLiteCategoryRepository,
+    SQLiteTransactionRepository,
+)
+from tests.factories.category_factory import CategoryFactory
+
+
+@pytest.fixture(params=["text", "binary"])
+def database(request) -> Database:
+    """Database with text and binary UUID storage."""
+    db = Database(DatabaseConfig("sqlite:///:memory:", uuid_storage=request.param))
+    db.create_all_tables(Base)
+    yield db
+    db.drop_all_tables(Base)
+    db.close()
+
+
+def _closure(session) -> set[tuple]:
+    """Contenu de la table: {(ancêtre, descendant, profondeur)}."""
+    return {
+        (row.ancestor_id, row.descendant_id, row.depth)
+        for row in session.scalars(select(CategoryClosureModel))
+    }
+
+
+def _rebuilt(session) -> set[tuple]:
+    """Contenu recalculé depuis parent_id."""
+    for statement in CATEGORY_CLOSURE_REBUILD:
+        session.execute(text(statement))
+    session.expire_all()
+    return _closure(session)
+
+
+def _chain(*names: str) -> list[Category]:
+    """Catégories imbriquées: chacune est l'enfant de la précédente."""
+    chain, parent_id = [], None
+    for name in names:
+        category = Category(name=name, category_type=CategoryType.EXPENSE, parent_id=parent_id)
+        chain.append(category)
+        parent_id = category.id
+    return chain
+
+
+class TestClosureMaintenance:
+    """The triggers keep the closure equal to a full recomputation."""
+
+    def test_insert_full_hierarchy(self, database: Database):
+        with database.get_session_context() as session:
+            repo = SQLiteCategoryRepository(session)
+            for category in CategoryFactory.full_hierarchy().values():
+                repo.save(category)
+
+            closure = _closure(session)
+            assert closure == _rebuilt(session)
+
+    def test_insert_child_before_parent(self, database: Database):
+        root, food, market = _chain("Dépenses", "Alimentation", "Marché")
+        with database.get_session_context() as session:
+            repo = SQLiteCategoryRepository(session)
+            for category in (market, food, root):
+                repo.save(category)
+
+            assert (str(root.id), str(market.id), 2) in _closure(session)
+            assert _closure(session) == _rebuilt(session)
+
+    def test_move_subtree(self, database: Database):
+        root, food, market = _chain("Dépenses", "Alimentation", "Marché")
+        other = Category(name="Quotidien", category_type=CategoryType.EXPENSE)
+        with database.get_session_context() as session:
+            repo = SQLiteCategoryRepository(session)
+            for category in (root, food, market, other):
+                repo.save(category)
+
+            repo.save(replace(food, parent_id=other.id))
+
+            closure = _closure(session)
+            assert (str(other.id), str(market.id), 2) in closure
+            assert not any(a == str(root.id) and d == str(market.id) for a, d, _ in closure)
+            assert closure == _rebuilt(session)
+
+    def test_cycle_rejected(self, database: Database):
+        root, food, market = _chain("Dépenses", "Alimentation", "Marché")
+        with database.get_session_context() as session:
+            repo = SQLiteCategoryRepository(session)
+            for category in (root, food, market):
+                repo.save(category)
+            before = _closure(session)
+
+            with pytest.raises(IntegrityError, match="cycle"):
+                session.execute(
+                    update(CategoryModel)
+                    .where(CategoryModel.id == str(root.id))
+                    .values(parent_id=str(market.id))
+                )
+            assert _closure(session) == before
+
+    def test_delete_detaches_children(self, database: Database):
+        root, food, market = _chain("Dépenses", "Alimentation", "Marché")
+        with database.get_session_context() as session:
+            repo = SQLiteCategoryRepository(session)
+            for category in (root, food, market):
+                repo.save(category)
+
+            # Core DELETE: seul le trigger agit (pas de cascade ORM)
+            session.execute(delete(CategoryModel).where(CategoryModel.id == str(food.id)))
+
+            assert _closure(session) == {
+                (str(root.id), str(root.id), 0),
+                (str(market.id), str(market.id), 0),
+            }
+
+
+class TestSubtreeQueries:
+    """Subtree lookups read the closure table."""
+
+    def test_find_descendants_matches_port_default(self, database: Database):
+        hierarchy = CategoryFactory.full_hierarchy()
+        root, food, market = _chain("Dépenses", "Alimentation", "Marché")
+        with database.get_session_context() as session:
+            repo = SQLiteCategoryRepository(session)
+            for category in (*hierarchy.values(), root, food, market):
+                repo.save(category)
+
+            for category in (root, food, market, *hierarchy.values()):
+                expected = CategoryRepository.find_descendants(repo, category.id)
+                found = repo.find_descendants(category.id)
+                assert {c.id for c in found} == {c.id for c in expected}
+
+            assert [c.name for c in repo.find_descendants(root.id)] == ["Alimentation", "Marché"]
+
+    def test_transaction_filter_follows_moves(self, database: Database):
+        root, food, market = _chain("Dépenses", "Alimentation", "Marché")
+        other = Category(name="Quotidien", category_type=CategoryType.EXPENSE)
+        account_id = uuid4()
+        with database.get_session_context() as session:
+            categories = SQLiteCategoryRepository(session)
+            for category in (root, food, market, other):
+                categories.save(category)
+            transactions = SQLiteTransactionRepository(session)
+            tx = Transaction(
+                account_id=account_id,
+                date=date(2025, 1, 15),
+                amount=Money(Decimal("-4.20")),
+                description="MARCHE",
+                category_id=market.id,
+            )
+            tx.ensure_import_hash()
+            transactions.save(tx)
+
+            assert transactions.count(TransactionQuery(category_ids=[root.id])) == 1
+
+            categories.save(replace(food, parent_id=other.id))
+
+            assert transactions.count(TransactionQuery(category_ids=[root.id])) == 0
+            assert transactions.count(TransactionQuery(category_ids=[other.id])) == 1
@@ -5,12 +5,20 @@ Tests the SQLAlchemy setup with in-memory SQLite.
 """
 from __future__ import annotations
 
+from datetime import date
+from decimal import Decimal
+
 import pytest
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
-from src.infrastructure.persistence.database import Database, DatabaseConfig
+from src.domain.entities.recurring_transaction import BusinessDayAdjustment, RecurringTransaction
+from src.domain.value_objects.money import Money
+from src.infrastructure.persistence.database import Database, DatabaseConfig, SQLiteProfile
 from src.infrastructure.persistence.models import Base
+from src.infrastructure.persistence.repositories.sqlite_recurring_repository import (
+    SQLiteRecurringRepository,
+)
 
 
 @pytest.fixture
@@ -81,10 +89,15 @@ class TestDatabaseSetup:
         """Les tables sont créées."""
         tables = in_memory_db.get_table_names()
 
-        assert len(tables) == 5
+        assert len(tables) == 10
         assert "transactions" in tables
         assert "accounts" in tables
         assert "categories" in tables
+        assert "monthly_category_totals" in tables
+        assert "category_closure" in tables
+        assert "account_projections" in tables
+        assert "alert_events" in tables
+        assert "import_batches" in tables
 
     def test_transaction_model_structure(self, session: Session):
         """Vérifie la structure du modèle Transaction."""
@@ -156,3 +169,99 @@ class TestDatabaseSession:
             # Execute a valid query
             result = session.execute(text("SELECT 1"))
             assert result is not None
+
+
+class TestSQLiteProfile:
+    """Tests for the SQLite tuning profile."""
+
+    @staticmethod
+    def _pragma(db: Database, name: str):
+        with db.engine.connect() as connection:
+            return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+    def test_performance_profile_applied_on_connect(self, tmp_path):
+        """Le profil performance active WAL, NORMAL, cache, mmap et temp_store."""
+        db = Database(DatabaseConfig(
+            f"sqlite:///{tmp_path}/finance.db", profile=SQLiteProfile.performance()
+        ))
+
+        assert self._pragma(db, "journal_mode") == "wal"
+        assert self._pragma(db, "synchronous") == 1  # NORMAL
+        assert self._pragma(db, "cache_size") == -64 * 1024
+        assert self._pragma(db, "mmap_size") == 256 * 1024 * 1024
+        assert self._pragma(db, "temp_store") == 2  # MEMORY
+        assert self._pragma(db, "foreign_keys") == 0
+        db.close()
+
+    def test_default_profile_keeps_sqlite_defaults(self, tmp_path):
+        """Le profil default laisse le journal en mode delete."""
+        db = Database(DatabaseConfig(
+            f"sqlite:///{tmp_path}/finance.db", profile=SQLiteProfile.default()
+        ))
+
+        assert self._pragma(db, "journal_mode") == "delete"
+        assert self._pragma(db, "synchronous") == 2  # FULL
+        db.close()
+
+    def test_in_memory_database_shared_across_threads(self):
+        """Une base :memory: est visible depuis un autre thread (StaticPool)."""
+        import threading
+
+        db = Database(DatabaseConfig("sqlite:///:memory:"))
+        db.create_all_tables(Base)
+        tables = []
+
+        thread = threading.Thread(target=lambda: tables.extend(db.get_table_names()))
+        thread.start()
+        thread.join()
+
+        assert "transactions" in tables
+        db.close()
+
+    def test_unknown_profile(self):
+        """Lève ValueError pour un profil inconnu."""
+        with pytest.raises(ValueError, match="Unknown SQLite profile"):
+            SQLiteProfile.from_name("turbo")
+
+
+class TestSchemaUpgrade:
+    """Tests for columns added to databases created by earlier versions."""
+
+    def test_recurrence_columns_added_to_existing_database(self, tmp_path):
+        """Une base antérieure aux règles de récurrence reste lisible."""
+        url = f"sqlite:///{tmp_path}/old.db"
+        rent = RecurringTransaction(
+            name="Loyer",
+            amount=Money(Decimal("-1200.00")),
+            day_of_month=5,
+            start_date=date(2024, 1, 1),
+        )
+        db = Database(DatabaseConfig(url))
+        db.create_all_tables(Base)
+        with db.get_session_context() as session:
+            SQLiteRecurringRepository(session).save(rent)
+        with db.engine.begin() as conn:
+            # Table recréée avec le schéma d'origine (sans les colonnes récentes)
+            added = {"interval", "day_of_week", "month_of_year", "business_day_adjustment"}
+            columns = [
+                row[1] for row in conn.exec_driver_sql("PRAGMA table_info(recurring_transactions)")
+                if row[1] not in added
+            ]
+            conn.exec_driver_sql(
+                f"CREATE TABLE old_recurring AS SELECT {', '.join(columns)} FROM recurring_transactions"
+            )
+            conn.exec_driver_sql("DROP TABLE recurring_transactions")
+            conn.exec_driver_sql("ALTER TABLE old_recurring RENAME TO recurring_transactions")
+        db.close()
+
+        db = Database(DatabaseConfig(url))
+        db.create_all_tables(Base)
+        with db.get_session_context() as session:
+            [found] = SQLiteRecurringRepository(session).find_active(date(2025, 1, 1))
+        db.close()
+
+        assert found.id == rent.id
+        assert found.interval == 1
+        assert found.day_of_week is None
+        assert found.month_of_year is None
+        assert found.business_day_adjustment is BusinessDayAdjustment.NONE
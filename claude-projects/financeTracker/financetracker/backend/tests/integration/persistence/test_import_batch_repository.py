@@ -0,0 +1,156 @@
+"""
+Integration tests for SQLiteImportBatchRepository.
+
+Tests digest lookups, date spans, the bulk undo of a batch (with rollup
+maintenance) and the import_batch_id column added to existing databases.
+"""
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from src.domain.entities.import_batch import ImportBatch
+from src.domain.entities.transaction import Transaction
+from src.domain.value_objects.date_range import DateRange
+from src.domain.value_objects.money import Money
+from src.infrastructure.persistence.database import Database, DatabaseConfig
+from src.infrastructure.persistence.models import Base, MonthlyCategoryTotalModel
+from src.infrastructure.persistence.repositories import (
+    SQLiteImportBatchRepository,
+    SQLiteTransactionRepository,
+)
+
+
+@pytest.fixture(params=["text", "binary"])
+def database(request) -> Database:
+    """Database with textual and binary UUID keys."""
+    db = Database(DatabaseConfig("sqlite:///:memory:", uuid_storage=request.param))
+    db.create_all_tables(Base)
+    yield db
+    db.drop_all_tables(Base)
+    db.close()
+
+
+def _batch(account_id, digest: str, first: date, last: date) -> ImportBatch:
+    return ImportBatch(
+        account_id=account_id, file_digest=digest, file_name=f"{digest}.csv",
+        adapter="LCL CSV", row_count=2, first_date=first, last_date=last,
+    )
+
+
+class TestImportBatchRepository:
+    """Round trips and lookups."""
+
+    def test_find_by_digest_is_scoped_to_account(self, database: Database):
+        account_id = uuid4()
+        batch = _batch(account_id, "abc", date(2025, 1, 1), date(2025, 1, 31))
+        with database.get_session_context() as session:
+            SQLiteImportBatchRepository(session).save(batch)
+
+        with database.get_session_context() as session:
+            repo = SQLiteImportBatchRepository(session)
+            found = repo.find_by_digest(account_id, "abc")
+            assert found == batch
+            assert repo.find_by_digest(uuid4(), "abc") is None
+            assert repo.find_by_digest(account_id, "other") is None
+
+    def test_save_updates_counts(self, database: Database):
+        batch = _batch(uuid4(), "abc", date(2025, 1, 1), date(2025, 1, 31))
+        with database.get_session_context() as session:
+            repo = SQLiteImportBatchRepository(session)
+            repo.save(batch)
+            repo.save(replace(batch, imported_count=2))
+
+        with database.get_session_context() as session:
+            assert SQLiteImportBatchRepository(session).get_by_id(batch.id).imported_count == 2
+
+    def test_spans_and_listing(self, database: Database):
+        account_id = uuid4()
+        feb = _batch(account_id, "feb", date(2025, 2, 1), date(2025, 2, 28))
+        jan = _batch(account_id, "jan", date(2025, 1, 1), date(2025, 1, 31))
+        empty = ImportBatch(account_id=account_id, file_digest="empty")
+        with database.get_session_context() as session:
+            repo = SQLiteImportBatchRepository(session)
+            for batch in (feb, jan, empty):
+                repo.save(batch)
+
+        with database.get_session_context() as session:
+            repo = SQLiteImportBatchRepository(session)
+            assert repo.find_spans(account_id) == [jan.span, feb.span]
+            assert repo.find_spans(uuid4()) == []
+            assert {b.id for b in repo.find_by_account(account_id)} == {feb.id, jan.id, empty.id}
+            assert len(repo.find_by_account(account_id, limit=2)) == 2
+
+
+class TestUndoImport:
+    """delete_with_transactions removes exactly one batch's rows."""
+
+    def test_bulk_delete_keeps_other_rows_and_rollups(self, database: Database):
+        account_id = uuid4()
+        batch = _batch(account_id, "jan", date(2025, 1, 5), date(2025, 1, 6))
+
+        def tx(day: int, batch_id=None) -> Transaction:
+            t = Transaction(
+                account_id=account_id, date=date(2025, 1, day),
+                amount=Money(Decimal("-10.00")), description=f"CB {day}",
+                import_batch_id=batch_id,
+            )
+            t.ensure_import_hash()
+            return t
+
+        with database.get_session_context() as session:
+            SQLiteImportBatchRepository(session).save(batch)
+            SQLiteTransactionRepository(session).save_many(
+                [tx(5, batch.id), tx(6, batch.id), tx(7)]
+            )
+
+        with database.get_session_context() as session:
+            repo = SQLiteImportBatchRepository(session)
+            assert repo.delete_with_transactions(batch.id) == 2
+            assert repo.delete_with_transactions(batch.id) is None
+
+        with database.get_session_context() as session:
+            remaining = SQLiteTransactionRepository(session).find_by_date_range(
+                DateRange(date(2025, 1, 1), date(2025, 1, 31)), account_id
+            )
+            total = session.scalar(select(func.sum(MonthlyCategoryTotalModel.tx_count)))
+            assert SQLiteImportBatchRepository(session).get_by_id(batch.id) is None
+
+        assert [t.description for t in remaining] == ["CB 7"]
+        assert remaining[0].import_batch_id is None
+        # Rollup maintenu par les triggers lors du DELETE ensembliste
+        assert total == 1
+
+
+def test_import_batch_column_added_to_existing_database(tmp_path):
+    """Une base antérieure aux lots reçoit la colonne au démarrage."""
+    url = f"sqlite:///{tmp_path}/old.db"
+    db = Database(DatabaseConfig(url))
+    db.create_all_tables(Base)
+    with db.engine.begin() as conn:
+        # Table recréée sans la colonne (DROP COLUMN refusé: clé étrangère)
+        columns = [
+            row[1] for row in conn.exec_driver_sql("PRAGMA table_info(transactions)")
+            if row[1] != "import_batch_id"
+        ]
+        conn.exec_driver_sql(
+            f"CREATE TABLE old_transactions AS SELECT {', '.join(columns)} FROM transactions"
+        )
+        conn.exec_driver_sql("DROP TABLE transactions")
+        conn.exec_driver_sql("ALTER TABLE old_transactions RENAME TO transactions")
+    db.close()
+
+    db = Database(DatabaseConfig(url))
+    db.create_all_tables(Base)
+    with db.engine.connect() as conn:
+        columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(transactions)")}
+        indexes = {row[1] for row in conn.exec_driver_sql("PRAGMA index_list(transactions)")}
+    db.close()
+
+    assert "import_batch_id" in columns
+    assert "ix_transactions_import_batch_id" in indexes
@@ -9,15 +9,21 @@ import pytest
 from decimal import Decimal
 from datetime import date
 from uuid import uuid4
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from src.infrastructure.persistence.database import Database, DatabaseConfig
-from src.infrastructure.persistence.models import Base
-from src.infrastructure.persistence.repositories import SQLiteTransactionRepository
+from src.infrastructure.persistence.models import Base, TransactionModel
+from src.infrastructure.persistence.repositories import (
+    SQLiteCategoryRepository,
+    SQLiteTransactionRepository,
+)
+from src.domain.entities.category import Category, CategoryType
 from src.domain.entities.transaction import Transaction
 from src.domain.entities.account import Account, AccountType
 from src.domain.value_objects.money import Money
 from src.domain.value_objects.date_range import DateRange
+from src.domain.value_objects.transaction_query import TransactionQuery
 
 
 @pytest.fixture
@@ -115,8 +121,9 @@ class TestTransactionRepositorySave:
 
     def test_duplicate_import_hash_raises_error(self, repository: SQLiteTransactionRepository):
         """Lève erreur si import_hash est déjà en base."""
+        account_id = uuid4()
         tx1 = Transaction(
-            account_id=uuid4(),
+            account_id=account_id,
             date=date(2025, 1, 15),
             amount=Money(Decimal("-42.50")),
             description="CB CARREFOUR",
@@ -124,7 +131,7 @@ class TestTransactionRepositorySave:
         tx1.ensure_import_hash()
 
         tx2 = Transaction(
-            account_id=uuid4(),
+            account_id=account_id,
             date=date(2025, 1, 15),
             amount=Money(Decimal("-42.50")),
             description="CB CARREFOUR",
@@ -140,6 +147,83 @@ class TestTransactionRepositorySave:
         with pytest.raises(ValueError, match="already exists"):
             repository.save(tx2)
 
+    def test_identical_rows_with_distinct_occurrences_are_saved(
+        self, repository: SQLiteTransactionRepository
+    ):
+        """Deux achats identiques le même jour (rangs 0 et 1) coexistent."""
+        account_id = uuid4()
+        twins = [
+            Transaction(
+                account_id=account_id,
+                date=date(2025, 1, 15),
+                amount=Money(Decimal("-2.10")),
+                description="CB BOULANGERIE",
+            )
+            for _ in range(2)
+        ]
+        for occurrence, tx in enumerate(twins):
+            tx.ensure_import_hash(occurrence)
+
+        assert repository.save_many(twins) == 2
+        assert repository.count_by_account(account_id) == 2
+
+    def test_save_chunked_reports_rejected_rows(
+        self, repository: SQLiteTransactionRepository, session: Session
+    ):
+        """Les lots refusés sont bissectés: seules les lignes fautives sont rejetées."""
+        account_id = uuid4()
+        rows = []
+        for day in range(1, 11):
+            tx = Transaction(
+                account_id=account_id,
+                date=date(2025, 1, day),
+                amount=Money(Decimal("-5.00")),
+                description=f"CB MARCHAND {day}",
+            )
+            tx.ensure_import_hash()
+            rows.append(tx)
+        repository.save(rows[2])
+        in_file_twin = Transaction(
+            account_id=account_id,
+            date=rows[7].date,
+            amount=rows[7].amount,
+            description=rows[7].description,
+            import_hash=rows[7].import_hash,
+        )
+
+        report = repository.save_chunked(rows + [in_file_twin], chunk_size=4)
+        session.commit()
+
+        assert report.saved_count == 9
+        assert [r.transaction for r in report.rejected] == [rows[2], in_file_twin]
+        assert all("import_hash" in r.reason for r in report.rejected)
+        assert repository.count_by_account(account_id) == 10
+
+    def test_save_chunked_bisects_failing_chunks(
+        self, repository: SQLiteTransactionRepository, session: Session
+    ):
+        """Une ligne refusée par la base n'annule que son propre insert."""
+        account_id = uuid4()
+        rows = []
+        for day in range(1, 9):
+            tx = Transaction(
+                account_id=account_id,
+                date=date(2025, 1, day),
+                amount=Money(Decimal("-5.00")),
+                description=f"CB MARCHAND {day}",
+            )
+            tx.ensure_import_hash()
+            rows.append(tx)
+        rows[5].description = None  # NOT NULL
+
+        report = repository.save_chunked(rows, chunk_size=8)
+        session.commit()
+
+        assert report.saved_count == 7
+        assert [r.transaction for r in report.rejected] == [rows[5]]
+        assert "NOT NULL constraint failed" in report.rejected[0].reason
+        assert repository.count_by_account(account_id) == 7
+
 
 class TestTransactionRepositoryRead:
     """Tests for reading transactions."""
@@ -233,6 +317,272 @@ class TestTransactionRepositoryRead:
         assert results[0].account_id == account_id1
 
 
+class TestTransactionRepositoryPagination:
+    """Tests for keyset pagination and filtered counts."""
+
+    @staticmethod
+    def _save_days(repository, account_id, days, category_id=None, label="CB ACHAT"):
+        """Persiste une transaction par jour de janvier 2025."""
+        transactions = []
+        for day in days:
+            tx = Transaction(
+                account_id=account_id,
+                date=date(2025, 1, day),
+                amount=Money(Decimal("-10.00")),
+                description=f"{label} {day}",
+                category_id=category_id,
+            )
+            tx.ensure_import_hash()
+            transactions.append(tx)
+        repository.save_many(transactions)
+        return transactions
+
+    def test_keyset_pages_cover_all_rows_once(self, repository: SQLiteTransactionRepository):
+        """Parcourt toutes les pages via le curseur (date, id)."""
+        account_id = uuid4()
+        saved = self._save_days(repository, account_id, range(1, 12))
+        # Même jour, description différente -> départagé par l'id
+        self._save_days(repository, account_id, [10], label="CB AUTRE")
+
+        seen = []
+        cursor = None
+        while True:
+            page = repository.find_by_account(account_id, limit=5, after=cursor)
+            seen.extend(page)
+            if len(page) < 5:
+                break
+            cursor = (page[-1].date, page[-1].id)
+
+        assert len(seen) == len(saved) + 1
+        assert len({tx.id for tx in seen}) == len(seen)
+        keys = [(tx.date, str(tx.id)) for tx in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    def test_keyset_matches_offset(self, repository: SQLiteTransactionRepository):
+        """La deuxième page keyset est identique à la page offset."""
+        account_id = uuid4()
+        self._save_days(repository, account_id, range(1, 21))
+
+        first = repository.find_by_account(account_id, limit=7)
+        by_offset = repository.find_by_account(account_id, limit=7, offset=7)
+        by_cursor = repository.find_by_account(
+            account_id, limit=7, after=(first[-1].date, first[-1].id)
+        )
+
+        assert [tx.id for tx in by_cursor] == [tx.id for tx in by_offset]
+
+    def test_count_by_account_honours_date_range(self, repository: SQLiteTransactionRepository):
+        """Le comptage applique le filtre de dates."""
+        account_id = uuid4()
+        self._save_days(repository, account_id, range(1, 21))
+
+        date_range = DateRange(date(2025, 1, 5), date(2025, 1, 9))
+
+        assert repository.count_by_account(account_id) == 20
+        assert repository.count_by_account(account_id, date_range) == 5
+
+    def test_category_and_date_range_paginated_in_sql(self, repository: SQLiteTransactionRepository):
+        """Les branches catégorie et période paginent en SQL."""
+        account_id = uuid4()
+        category_id = uuid4()
+        self._save_days(repository, account_id, range(1, 16), category_id=category_id)
+        date_range = DateRange(date(2025, 1, 1), date(2025, 1, 31))
+
+        by_category = repository.find_by_category(category_id, limit=4, offset=4)
+        by_dates = repository.find_by_date_range(date_range, limit=4)
+        next_dates = repository.find_by_date_range(
+            date_range, limit=4, after=(by_dates[-1].date, by_dates[-1].id)
+        )
+
+        assert [tx.date.day for tx in by_category] == [11, 10, 9, 8]
+        assert [tx.date.day for tx in by_dates] == [1, 2, 3, 4]
+        assert [tx.date.day for tx in next_dates] == [5, 6, 7, 8]
+        assert repository.count_by_category(category_id) == 15
+        assert repository.count_by_date_range(date_range, account_id=account_id) == 15
+
+
+class TestTransactionRepositoryQuery:
+    """Tests for combined TransactionQuery filters."""
+
+    @staticmethod
+    def _save(repository, account_id, day, amount, description, **kwargs):
+        """Persiste une transaction de janvier 2025."""
+        tx = Transaction(
+            account_id=account_id,
+            date=date(2025, 1, day),
+            amount=Money(Decimal(amount)),
+            description=description,
+            **kwargs,
+        )
+        tx.ensure_import_hash()
+        repository.save(tx)
+        return tx
+
+    def test_combined_filters(self, repository: SQLiteTransactionRepository):
+        """Compte, période, montant, texte, tags et confiance en ET."""
+        account_id = uuid4()
+        other_account = uuid4()
+        food = uuid4()
+        match = self._save(
+            repository, account_id, 10, "-42.50", "CB CARREFOUR MARKET",
+            category_id=food, category_confidence=0.9, tags=["courses", "famille"],
+        )
+        self._save(repository, account_id, 11, "-42.50", "CB CARREFOUR CITY",
+                   category_id=food, category_confidence=0.4, tags=["courses"])
+        self._save(repository, account_id, 12, "-5.00", "CB CARREFOUR EXPRESS",
+                   category_id=food, category_confidence=0.9, tags=["courses", "famille"])
+        self._save(repository, other_account, 10, "-42.50", "CB CARREFOUR DRIVE",
+                   category_id=food, category_confidence=0.9, tags=["courses", "famille"])
+
+        query = TransactionQuery(
+            account_ids=[account_id],
+            date_range=DateRange(date(2025, 1, 1), date(2025, 1, 31)),
+            max_amount=Decimal("-10"),
+            text="carrefour",
+            tags=["Courses", "famille"],
+            min_confidence=0.8,
+        )
+
+        assert [tx.id for tx in repository.find(query)] == [match.id]
+        assert repository.count(query) == 1
+
+    def test_category_includes_descendants(self, session: Session, repository: SQLiteTransactionRepository):
+        """Une catégorie parente inclut ses sous-catégories (table de fermeture)."""
+        categories = SQLiteCategoryRepository(session)
+        root = Category(name="Dépenses", category_type=CategoryType.EXPENSE)
+        food = Category(name="Alimentation", category_type=CategoryType.EXPENSE, parent_id=root.id)
+        market = Category(name="Marché", category_type=CategoryType.EXPENSE, parent_id=food.id)
+        for category in (root, food, market):
+            categories.save(category)
+
+        account_id = uuid4()
+        self._save(repository, account_id, 1, "-1.00", "A", category_id=food.id)
+        self._save(repository, account_id, 2, "-2.00", "B", category_id=market.id)
+        self._save(repository, account_id, 3, "-3.00", "C")
+
+        assert repository.count(TransactionQuery(category_ids=[root.id])) == 2
+        assert repository.count(TransactionQuery(category_ids=[food.id])) == 2
+        assert repository.count(
+            TransactionQuery(category_ids=[food.id], include_subcategories=False)
+        ) == 1
+        assert repository.count(TransactionQuery(uncategorized=True)) == 1
+
+    def test_empty_query_lists_all_accounts(self, repository: SQLiteTransactionRepository):
+        """Sans critère, toutes les transactions sont paginées."""
+        for day in range(1, 6):
+            self._save(repository, uuid4(), day, "-1.00", f"CB {day}")
+
+        page = repository.find(TransactionQuery(), limit=3)
+
+        assert [tx.date.day for tx in page] == [5, 4, 3]
+        assert repository.count(TransactionQuery()) == 5
+
+    def test_find_rows_matches_find(self, repository: SQLiteTransactionRepository):
+        """Le modèle de lecture renvoie les mêmes lignes, dans le même ordre."""
+        account_id = uuid4()
+        for day in range(1, 8):
+            self._save(
+                repository, account_id, day, f"-{day}.50", f"CB MAGASIN {day}",
+                category_id=uuid4() if day % 2 else None, tags=["courses"],
+            )
+        query = TransactionQuery(account_ids=[account_id])
+
+        entities = repository.find(query, limit=5)
+        rows = repository.find_rows(query, limit=5)
+
+        assert [row.id for row in rows] == [str(tx.id) for tx in entities]
+        for row, tx in zip(rows, entities):
+            assert row.amount == str(tx.amount.amount)
+            assert row.category_id == (str(tx.category_id) if tx.category_id else None)
+            assert (row.date, row.tags, row.created_at) == (tx.date, tx.tags, tx.created_at)
+        assert not hasattr(rows[0], "__dict__")
+
+        cursor = (entities[-1].date, entities[-1].id)
+        assert [r.id for r in repository.find_rows(query, after=cursor)] == [
+            str(tx.id) for tx in repository.find(query, after=cursor)
+        ]
+
+    def test_single_account_uses_keyset_index(self, session: Session, repository: SQLiteTransactionRepository):
+        """Un compte + tri (date, id) est servi par l'index sans tri temporaire."""
+        query = repository._apply_query(
+            session.query(TransactionModel),
+            TransactionQuery(account_ids=[uuid4()]),
+        )
+        statement = repository._paginate(query, 10, 0, None).statement
+        compiled = statement.compile(
+            dialect=session.bind.dialect, compile_kwargs={"literal_binds": True}
+        )
+
+        plan = " ".join(
+            row[-1] for row in session.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+        )
+
+        assert "idx_transaction_account_date_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+class TestTransactionRepositorySearch:
+    """Tests for FTS5 full-text search."""
+
+    @staticmethod
+    def _save(repository, day, description, notes="", account_id=None):
+        """Persiste une transaction de janvier 2025."""
+        tx = Transaction(
+            account_id=account_id or uuid4(),
+            date=date(2025, 1, day),
+            amount=Money(Decimal("-10.00")),
+            description=description,
+            notes=notes,
+        )
+        tx.ensure_import_hash()
+        repository.save(tx)
+        return tx
+
+    def test_prefix_case_and_accent_insensitive(self, repository: SQLiteTransactionRepository):
+        """Recherche par préfixe, sans casse ni accents, dans libellé et notes."""
+        amazon = self._save(repository, 1, "CB AMAZON EU SARL")
+        cafe = self._save(repository, 2, "CB CAFÉ DE LA GARE")
+        noted = self._save(repository, 3, "VIR SEPA", notes="remboursement amazon")
+        self._save(repository, 4, "PRLV SNCF")
+
+        assert {tx.id for tx in repository.search("amaz")} == {amazon.id, noted.id}
+        assert [tx.id for tx in repository.search("cafe gare")] == [cafe.id]
+        assert repository.search("amazon sncf") == []
+
+    def test_ranked_by_relevance(self, repository: SQLiteTransactionRepository):
+        """Les libellés les plus pertinents sortent en premier (bm25)."""
+        weak = self._save(repository, 5, "CB AMAZON PRIME VIDEO ABONNEMENT MENSUEL")
+        strong = self._save(repository, 1, "AMAZON AMAZON")
+
+        assert [tx.id for tx in repository.search("amazon")] == [strong.id, weak.id]
+
+    def test_index_follows_updates_and_deletes(self, repository: SQLiteTransactionRepository):
+        """Les triggers maintiennent l'index FTS5."""
+        tx = self._save(repository, 1, "PRLV SNCF")
+
+        tx.description = "TRAIN PARIS"
+        repository.save(tx)
+        assert repository.search("sncf") == []
+        assert [t.id for t in repository.search("paris")] == [tx.id]
+
+        repository.delete(tx.id)
+        assert repository.search("paris") == []
+
+    def test_filters_and_fts_syntax_is_neutralized(self, repository: SQLiteTransactionRepository):
+        """Les filtres s'appliquent et la syntaxe FTS5 saisie est ignorée."""
+        account_id = uuid4()
+        mine = self._save(repository, 1, "CB AMAZON", account_id=account_id)
+        self._save(repository, 2, "CB AMAZON")
+
+        results = repository.search(
+            'amazon "(', filters=TransactionQuery(account_ids=[account_id])
+        )
+
+        assert [tx.id for tx in results] == [mine.id]
+        assert repository.search('"*()') == []
+        assert repository.count(TransactionQuery(text="amazon")) == 2
+
+
 class TestTransactionRepositoryDelete:
     """Tests for deleting transactions."""
 
@@ -289,3 +639,153 @@ class TestTransactionRepositoryStats:
 
         assert repository.exists_by_hash(tx.import_hash) is True
         assert repository.exists_by_hash("nonexistent_hash") is False
+
+
+class TestTransactionRepositoryMoneyStorage:
+    """Tests for the integer-cents money storage mode."""
+
+    @pytest.fixture(params=["decimal", "cents"])
+    def storage_db(self, request) -> Database:
+        db = Database(DatabaseConfig("sqlite:///:memory:", money_storage=request.param))
+        db.create_all_tables(Base)
+        yield db
+        db.drop_all_tables(Base)
+        db.close()
+
+    def _save_amounts(self, repository, account_id, amounts) -> None:
+        for i, amount in enumerate(amounts):
+            tx = Transaction(
+                account_id=account_id,
+                date=date(2025, 1, 1 + i % 28),
+                amount=Money(Decimal(amount)),
+                description=f"PAIEMENT {i}",
+            )
+            tx.ensure_import_hash()
+            repository.save(tx)
+
+    def test_roundtrip_and_filters(self, storage_db: Database):
+        """Montants relus à l'identique et filtres min/max identiques."""
+        account_id = uuid4()
+        with storage_db.get_session_context() as session:
+            repository = SQLiteTransactionRepository(session)
+            self._save_amounts(repository, account_id, ["-42.50", "1500.05", "-0.01"])
+
+            amounts = sorted(
+                tx.amount.amount
+                for tx in repository.find(TransactionQuery(account_ids=[account_id]))
+            )
+            assert amounts == [Decimal("-42.50"), Decimal("-0.01"), Decimal("1500.05")]
+
+            query = TransactionQuery(min_amount=Decimal("-42.50"), max_amount=Decimal("-0.01"))
+            assert repository.count(query) == 2
+
+    def test_balance_is_exact(self, storage_db: Database):
+        """Le solde de nombreux centimes ne dérive pas."""
+        account_id = uuid4()
+        with storage_db.get_session_context() as session:
+            repository = SQLiteTransactionRepository(session)
+            self._save_amounts(repository, account_id, ["0.10"] * 30 + ["-0.30"])
+
+            balance = repository.get_balance_at_date(account_id, date(2025, 12, 31))
+            assert balance == Money(Decimal("2.70"))
+            assert balance.amount.as_tuple().exponent == -2
+
+    def test_cents_are_stored_as_integers(self, storage_db: Database):
+        """En mode cents, SQLite stocke un INTEGER."""
+        account_id = uuid4()
+        with storage_db.get_session_context() as session:
+            self._save_amounts(SQLiteTransactionRepository(session), account_id, ["-42.50"])
+            stored_type, stored = session.execute(
+                text("SELECT typeof(amount), amount FROM transactions")
+            ).one()
+
+        if storage_db.config.money_storage == "cents":
+            assert (stored_type, stored) == ("integer", -4250)
+        else:
+            assert stored_type == "real"
+
+    def test_unknown_storage_rejected(self):
+        with pytest.raises(ValueError):
+            DatabaseConfig("sqlite:///:memory:", money_storage="float")
+
+
+class TestTransactionRepositoryUUIDStorage:
+    """Tests for the binary (BLOB) UUID storage mode."""
+
+    @pytest.fixture(params=["text", "binary"])
+    def storage_db(self, request) -> Database:
+        db = Database(DatabaseConfig("sqlite:///:memory:", uuid_storage=request.param))
+        db.create_all_tables(Base)
+        yield db
+        db.drop_all_tables(Base)
+        db.close()
+
+    def _save(self, repository, account_id, count, category_id=None, label="PAIEMENT") -> list[Transaction]:
+        saved = []
+        for i in range(count):
+            tx = Transaction(
+                account_id=account_id,
+                date=date(2025, 1, 1 + i % 3),
+                amount=Money(Decimal("-10.00")),
+                description=f"{label} {i}",
+                category_id=category_id,
+            )
+            tx.ensure_import_hash()
+            repository.save(tx)
+            saved.append(tx)
+        return saved
+
+    def test_roundtrip_and_filters(self, storage_db: Database):
+        """Identifiants relus à l'identique, filtres compte/catégorie identiques."""
+        account_id, category_id = uuid4(), uuid4()
+        with storage_db.get_session_context() as session:
+            repository = SQLiteTransactionRepository(session)
+            saved = self._save(repository, account_id, 3, category_id)
+            self._save(repository, uuid4(), 2, label="VIREMENT")
+
+            found = repository.get_by_id(saved[0].id)
+            assert found.id == saved[0].id
+            assert found.account_id == account_id
+            assert found.category_id == category_id
+
+            assert repository.count(TransactionQuery(account_ids=[account_id])) == 3
+            assert repository.count(TransactionQuery(category_ids=[category_id])) == 3
+
+            rows = repository.find_rows(TransactionQuery(account_ids=[account_id]))
+            assert {row.id for row in rows} == {str(tx.id) for tx in saved}
+
+    def test_keyset_pagination(self, storage_db: Database):
+        """Le curseur (date, id) parcourt toutes les lignes sans doublon."""
+        account_id = uuid4()
+        with storage_db.get_session_context() as session:
+            repository = SQLiteTransactionRepository(session)
+            saved = self._save(repository, account_id, 7)
+            query = TransactionQuery(account_ids=[account_id])
+
+            seen, after = [], None
+            while True:
+                page = repository.find(query, limit=3, after=after)
+                if not page:
+                    break
+                seen.extend(tx.id for tx in page)
+                after = (page[-1].date, page[-1].id)
+
+            assert sorted(seen) == sorted(tx.id for tx in saved)
+            assert seen == [tx.id for tx in repository.find(query)]
+
+    def test_ids_are_stored_as_blobs(self, storage_db: Database):
+        """En mode binary, SQLite stocke un BLOB de 16 octets."""
+        with storage_db.get_session_context() as session:
+            self._save(SQLiteTransactionRepository(session), uuid4(), 1)
+            stored_type, stored_length = session.execute(
+                text("SELECT typeof(id), length(id) FROM transactions")
+            ).one()
+
+        if storage_db.config.uuid_storage == "binary":
+            assert (stored_type, stored_length) == ("blob", 16)
+        else:
+            assert (stored_type, stored_length) == ("text", 36)
+
+    def test_unknown_storage_rejected(self):
+        with pytest.raises(ValueError):
+            DatabaseConfig("sqlite:///:memory:", uuid_storage="int")
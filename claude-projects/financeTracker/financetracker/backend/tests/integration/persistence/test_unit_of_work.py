@@ -0,0 +1,163 @@
+"""
+Integration tests for UnitOfWork and the connection pool metric.
+
+Tests the shared session / single commit semantics and that connections
+always return to the pool.
+"""
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.account import Account, AccountType
+from src.domain.entities.recurring_transaction import Frequency, RecurringTransaction
+from src.domain.entities.transaction import Transaction
+from src.domain.value_objects.money import Money
+from src.infrastructure.persistence.database import Database, DatabaseConfig
+from src.infrastructure.persistence.models import Base
+from src.infrastructure.persistence.unit_of_work import UnitOfWork
+
+
+@pytest.fixture(params=["memory", "file"])
+def database(request, tmp_path) -> Database:
+    """Database in memory or as a WAL file (QueuePool)."""
+    url = "sqlite:///:memory:" if request.param == "memory" else f"sqlite:///{tmp_path}/finance.db"
+    db = Database(DatabaseConfig(url, pool_size=2, max_overflow=1))
+    db.create_all_tables(Base)
+    yield db
+    db.drop_all_tables(Base)
+    db.close()
+
+
+def _account() -> Account:
+    return Account(
+        name="Compte courant",
+        bank="LCL",
+        account_type=AccountType.CHECKING,
+        initial_balance=Money(Decimal("100.00")),
+    )
+
+
+def _transaction(account_id) -> Transaction:
+    tx = Transaction(
+        account_id=account_id,
+        date=date(2025, 1, 15),
+        amount=Money(Decimal("-42.50")),
+        description="CB CARREFOUR",
+    )
+    tx.ensure_import_hash()
+    return tx
+
+
+class TestUnitOfWork:
+    """Tests for UnitOfWork."""
+
+    def test_repositories_share_one_session(self, database: Database):
+        """Tous les repositories utilisent la même session."""
+        with UnitOfWork(database) as uow:
+            assert uow.transactions._session is uow.session
+            assert uow.accounts._session is uow.session
+            assert uow.categories._session is uow.session
+            assert uow.recurring._session is uow.session
+
+    def test_commits_all_repositories_once(self, database: Database):
+        """Les écritures de plusieurs repositories sont commitées ensemble."""
+        account = _account()
+        tx = _transaction(account.id)
+
+        with UnitOfWork(database) as uow:
+            uow.accounts.save(account)
+            uow.transactions.save(tx)
+
+        with UnitOfWork(database) as uow:
+            assert uow.accounts.get_by_id(account.id) is not None
+            assert uow.transactions.get_by_id(tx.id) is not None
+
+    def test_rolls_back_everything_on_error(self, database: Database):
+        """Une exception annule toutes les écritures de l'unité de travail."""
+        account = _account()
+        tx = _transaction(account.id)
+
+        with pytest.raises(RuntimeError):
+            with UnitOfWork(database) as uow:
+                uow.accounts.save(account)
+                uow.transactions.save(tx)
+                raise RuntimeError("boom")
+
+        with UnitOfWork(database) as uow:
+            assert uow.accounts.get_by_id(account.id) is None
+            assert uow.transactions.get_by_id(tx.id) is None
+
+    def test_session_outside_block_raises(self, database: Database):
+        """La session n'est accessible que dans le bloc with."""
+        uow = UnitOfWork(database)
+        with pytest.raises(RuntimeError):
+            uow.session
+
+    def test_recurring_repository_roundtrip(self, database: Database):
+        """Le repository des récurrentes est fonctionnel (plus de Mock)."""
+        account = _account()
+        rent = RecurringTransaction(
+            account_id=account.id,
+            name="Loyer",
+            amount=Money(Decimal("-1200.00")),
+            category_id=uuid4(),
+            frequency=Frequency.MONTHLY,
+            day_of_month=5,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31),
+        )
+
+        with UnitOfWork(database) as uow:
+            uow.accounts.save(account)
+            uow.recurring.save(rent)
+
+        with UnitOfWork(database) as uow:
+            assert uow.recurring.get_by_id(rent.id) == rent
+            assert uow.recurring.find_active(date(2024, 6, 1)) == [rent]
+            assert uow.recurring.find_active(date(2025, 1, 1)) == []
+            assert uow.recurring.find_by_account(account.id) == [rent]
+
+
+class TestPoolStatus:
+    """Tests for the connection pool metric."""
+
+    def test_connections_return_to_pool(self, database: Database):
+        """Aucune connexion ne reste empruntée après les unités de travail."""
+        for _ in range(10):
+            with UnitOfWork(database) as uow:
+                uow.accounts.find_all()
+                assert database.pool_status().checked_out == 1
+
+        status = database.pool_status()
+        assert status.checked_out == 0
+        assert status.peak_checked_out == 1
+        assert status.total_checkouts >= 10
+
+    def test_connection_returned_after_rollback(self, database: Database):
+        """Une erreur ne fait pas fuir la connexion."""
+        with pytest.raises(RuntimeError):
+            with UnitOfWork(database) as uow:
+                uow.accounts.find_all()
+                raise RuntimeError("boom")
+
+        assert database.pool_status().checked_out == 0
+
+    def test_leaked_session_is_visible(self, database: Database):
+        """Une session jamais fermée apparaît dans la métrique."""
+        session = database.get_session()
+        session.connection()
+        assert database.pool_status().checked_out == 1
+
+        session.close()
+        assert database.pool_status().checked_out == 0
+
+    def test_capacity(self, database: Database):
+        """Capacité: 1 en mémoire (StaticPool), pool_size + max_overflow sinon."""
+        status = database.pool_status()
+        expected = 1 if database.config.is_in_memory else 3
+        assert status.capacity == expected
+        assert status.to_dict()["utilization"] == 0.0
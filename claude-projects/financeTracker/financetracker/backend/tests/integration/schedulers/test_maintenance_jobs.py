@@ -0,0 +1,131 @@
+"""
+Integration tests for the periodic maintenance jobs.
+
+Tests SQLite maintenance on a file database (WAL checkpoint, ANALYZE,
+VACUUM followed by the FTS rebuild, rollup rebuild) and the alert job.
+"""
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete, func, select, text
+
+from src.domain.entities.account import Account
+from src.domain.entities.transaction import Transaction
+from src.domain.value_objects.money import Money
+from src.infrastructure.persistence.database import Database, DatabaseConfig, SQLiteProfile
+from src.infrastructure.persistence.models import (
+    Base,
+    AlertEventModel,
+    MonthlyCategoryTotalModel,
+    TransactionModel,
+)
+from src.infrastructure.persistence.repositories import (
+    SQLiteAccountRepository,
+    SQLiteTransactionRepository,
+)
+from src.infrastructure.schedulers.jobs import (
+    analyze,
+    checkpoint_wal,
+    default_jobs,
+    evaluate_alerts,
+    rebuild_rollups,
+    vacuum,
+)
+
+
+@pytest.fixture
+def database(tmp_path) -> Database:
+    """File database with the performance profile (WAL)."""
+    db = Database(DatabaseConfig(
+        f"sqlite:///{tmp_path}/finance.db", profile=SQLiteProfile.performance()
+    ))
+    db.create_all_tables(Base)
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def account(database: Database) -> Account:
+    """Compte à découvert avec quelques transactions."""
+    account = Account(name="Courant", bank="LCL", initial_balance=Money(Decimal("-500.00")))
+    with database.get_session_context() as session:
+        SQLiteAccountRepository(session).save(account)
+        transactions = []
+        for i in range(30):
+            tx = Transaction(
+                account_id=account.id,
+                date=date(2025, 1 + i % 3, 1 + i % 28),
+                amount=Money(Decimal(f"-{i + 1}.50")),
+                description=f"CB MAGASIN {i} REF{uuid4().hex[:6]}",
+            )
+            tx.ensure_import_hash()
+            transactions.append(tx)
+        SQLiteTransactionRepository(session).save_many(transactions)
+    return account
+
+
+class TestSQLiteMaintenance:
+    """Tests for the SQLite maintenance jobs."""
+
+    def test_vacuum_keeps_full_text_search_consistent(self, database: Database, account: Account):
+        # Des suppressions laissent des trous que VACUUM peut renuméroter
+        with database.get_session_context() as session:
+            session.execute(
+                delete(TransactionModel).where(TransactionModel.description.like("CB MAGASIN 1%"))
+            )
+
+        vacuum(database)
+
+        with database.get_session_context() as session:
+            results = SQLiteTransactionRepository(session).search("magasin 25")
+            # Lève SQLITE_CORRUPT_VTAB si l'index pointe vers de mauvais rowid
+            session.execute(
+                text("INSERT INTO transactions_fts(transactions_fts) VALUES ('integrity-check')")
+            )
+        assert [tx.description.split()[2] for tx in results] == ["25"]
+
+    def test_checkpoint_and_analyze(self, database: Database, account: Account):
+        busy, log_pages, checkpointed = checkpoint_wal(database)
+        assert busy == 0
+        assert log_pages >= checkpointed >= 0
+
+        analyze(database)
+        with database.engine.connect() as connection:
+            assert connection.exec_driver_sql("SELECT count(*) FROM sqlite_stat1").scalar() > 0
+
+    def test_rebuild_rollups_restores_drift(self, database: Database, account: Account):
+        total = select(func.sum(MonthlyCategoryTotalModel.total), func.count())
+        with database.get_session_context() as session:
+            expected = session.execute(total).one()
+            session.execute(delete(MonthlyCategoryTotalModel))
+
+        rebuild_rollups(database)
+
+        with database.get_session_context() as session:
+            assert session.execute(total).one() == expected
+
+
+class TestJobs:
+    """Tests for the job list and the alert job."""
+
+    def test_alert_job_records_events(self, database: Database, account: Account):
+        evaluation = evaluate_alerts(database, Decimal("0"))
+
+        assert evaluation.reprojected == 1
+        assert [a.account_id for a in evaluation.new_alerts] == [str(account.id)]
+        with database.get_session_context() as session:
+            assert session.execute(select(AlertEventModel.account_id)).scalars().all() == [
+                str(account.id)
+            ]
+        assert evaluate_alerts(database, Decimal("0")).unchanged == 1
+
+    def test_default_jobs(self, database: Database):
+        jobs = {job.name: job for job in default_jobs(database)}
+
+        assert set(jobs) == {"alerts", "wal_checkpoint", "analyze", "rollups", "vacuum"}
+        assert jobs["vacuum"].interval > jobs["analyze"].interval > jobs["alerts"].interval
+
@@ -0,0 +1,135 @@
+"""
+Integration tests for the in-process Scheduler.
+
+Tests coalescing of overlapping runs, backpressure on the bounded pool,
+per-job metrics and the dispatch thread lifecycle.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from src.infrastructure.schedulers.scheduler import ScheduledJob, Scheduler
+
+
+class FakeClock:
+    """Horloge monotone pilotée par le test."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def scheduler(clock: FakeClock):
+    """Scheduler démarré sur une horloge figée: le dispatch ne se déclenche que via run_pending."""
+    scheduler = Scheduler(max_workers=1, max_pending=0, clock=clock)
+    yield scheduler
+    scheduler.stop()
+
+
+class TestScheduling:
+    """Deterministic dispatch through run_pending."""
+
+    def test_overlapping_runs_are_coalesced(self, scheduler: Scheduler, clock: FakeClock):
+        release = threading.Event()
+        calls = []
+        scheduler.add_job(ScheduledJob(
+            "slow", lambda: (calls.append(1), release.wait(5)), interval=10, initial_delay=0
+        ))
+        scheduler.start()
+        _wait_for(lambda: calls)
+
+        # Trois échéances passent pendant l'exécution: aucune n'est empilée
+        clock.now += 35
+        scheduler.run_pending()
+        release.set()
+        _wait_for(lambda: scheduler.status()["jobs"]["slow"]["runs"] == 1)
+
+        metrics = scheduler.status()["jobs"]["slow"]
+        assert len(calls) == 1
+        assert metrics["coalesced"] == 3
+        assert metrics["next_run_in"] == pytest.approx(5)
+
+    def test_full_pool_rejects_and_retries(self, scheduler: Scheduler, clock: FakeClock):
+        release = threading.Event()
+        scheduler.add_job(ScheduledJob("first", lambda: release.wait(5), interval=60, initial_delay=0))
+        scheduler.add_job(ScheduledJob("second", lambda: None, interval=60, initial_delay=0))
+        scheduler.start()
+        _wait_for(lambda: scheduler.status()["jobs"]["first"]["in_progress"])
+
+        status = scheduler.status()["jobs"]
+        assert status["second"]["rejected"] >= 1
+        assert status["second"]["runs"] == 0
+        assert status["second"]["next_run_in"] <= 1.0
+
+        release.set()
+        _wait_for(lambda: scheduler.status()["jobs"]["first"]["runs"] == 1)
+        clock.now += 1
+        scheduler.trigger("second")
+        _wait_for(lambda: scheduler.status()["jobs"]["second"]["runs"] == 1)
+
+    def test_failures_and_timings_are_recorded(self, scheduler: Scheduler, clock: FakeClock):
+        def broken():
+            raise RuntimeError("disk full")
+
+        scheduler.add_job(ScheduledJob("broken", broken, interval=60, initial_delay=0))
+        scheduler.start()
+        _wait_for(lambda: scheduler.status()["jobs"]["broken"]["runs"] == 1)
+
+        metrics = scheduler.status()["jobs"]["broken"]
+        assert metrics["failures"] == 1
+        assert metrics["last_error"] == "disk full"
+        assert metrics["last_duration_ms"] >= 0
+        assert metrics["max_duration_ms"] == metrics["average_duration_ms"]
+        assert scheduler.is_running
+
+    def test_first_run_waits_for_interval(self, scheduler: Scheduler, clock: FakeClock):
+        scheduler.add_job(ScheduledJob("daily", lambda: None, interval=86400))
+
+        assert scheduler.run_pending() == pytest.approx(86400)
+        assert scheduler.status()["jobs"]["daily"]["runs"] == 0
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError, match="interval"):
+            ScheduledJob("never", lambda: None, interval=0)
+        with pytest.raises(ValueError, match="max_workers"):
+            Scheduler(max_workers=0)
+        scheduler = Scheduler()
+        scheduler.add_job(ScheduledJob("once", lambda: None, interval=1))
+        with pytest.raises(ValueError, match="already registered"):
+            scheduler.add_job(ScheduledJob("once", lambda: None, interval=1))
+
+
+class TestLifecycle:
+    """Real clock: the dispatch thread runs due jobs until stopped."""
+
+    def test_trigger_runs_job_and_stop_joins(self):
+        scheduler = Scheduler(max_workers=2)
+        ran = threading.Event()
+        scheduler.add_job(ScheduledJob("job", ran.set, interval=3600))
+        scheduler.start()
+        try:
+            scheduler.trigger("job")
+            assert ran.wait(5)
+        finally:
+            scheduler.stop()
+
+        assert not scheduler.is_running
+        assert scheduler.status()["jobs"]["job"]["runs"] == 1
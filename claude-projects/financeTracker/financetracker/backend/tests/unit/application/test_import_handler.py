@@ -5,17 +5,32 @@ Tests the import orchestration without database dependencies.
 """
 from __future__ import annotations
 
+import io
 from pathlib import Path
 from uuid import uuid4
 
 import pytest
 
 from src.application.commands.import_transactions import ImportTransactionsCommand
-from src.application.handlers.import_handler import ImportTransactionsHandler
+from src.application.handlers.import_handler import (
+    ImportSource,
+    ImportTransactionsHandler,
+    file_digest,
+)
+from src.domain.entities.import_batch import ImportBatch
 from src.domain.entities.transaction import Transaction
 from src.domain.repositories.category_repository import CategoryRepository
-from src.domain.repositories.transaction_repository import TransactionRepository
+from src.domain.repositories.import_batch_repository import ImportBatchRepository
+from src.domain.repositories.transaction_repository import (
+    TransactionBulkWritePort,
+    TransactionRepository,
+)
 from src.domain.value_objects.money import Money
+from src.domain.value_objects.save_report import (
+    DUPLICATE_HASH_REASON,
+    RejectedTransaction,
+    SaveReport,
+)
 from src.infrastructure.import_adapters.adapter_factory import AdapterFactory
 from src.infrastructure.import_adapters.base_adapter import ImportAdapter
 from decimal import Decimal
@@ -43,6 +58,7 @@ class MockAdapter(ImportAdapter):
         return file_path.suffix == ".csv"
 
     def parse(self, file_path: Path, account_id, auto_categorize: bool = False):
+        self.parsed_content = file_path.read_bytes()
         return self.transactions
 
 
@@ -57,6 +73,9 @@ class MockAdapterFactory(AdapterFactory):
             raise FileNotFoundError(f"File not found: {file_path}")
         return self.adapter
 
+    def get_adapter_for_stream(self, stream, name: str) -> ImportAdapter:
+        return self.adapter
+
 
 class MockTransactionRepository(TransactionRepository):
     """Mock transaction repository for testing."""
@@ -106,6 +125,31 @@ class MockTransactionRepository(TransactionRepository):
         return 0
 
 
+class MockBulkTransactionRepository(MockTransactionRepository, TransactionBulkWritePort):
+    """Mock repository skipping stored hashes and refusing descriptions in `refused`."""
+
+    def __init__(self, refused: set[str] = frozenset()):
+        super().__init__()
+        self.refused = refused
+        self.hash_lookups = 0
+
+    def exists_by_hash(self, import_hash):
+        self.hash_lookups += 1
+        return super().exists_by_hash(import_hash)
+
+    def save_chunked(self, transactions, chunk_size=500):
+        stored = {tx.import_hash for tx in self.transactions.values()}
+        rejected, saved = [], []
+        for tx in transactions:
+            if tx.import_hash in stored:
+                rejected.append(RejectedTransaction(tx, DUPLICATE_HASH_REASON))
+            elif tx.description in self.refused:
+                rejected.append(RejectedTransaction(tx, "NOT NULL constraint failed: transactions.notes"))
+            else:
+                saved.append(tx)
+        return SaveReport(self.save_many(saved), tuple(rejected))
+
+
 class MockCategoryRepository(CategoryRepository):
     """Mock category repository for testing."""
 
@@ -137,6 +181,44 @@ class MockCategoryRepository(CategoryRepository):
         return []
 
 
+class MockImportBatchRepository(ImportBatchRepository):
+    """In-memory import batch repository for testing."""
+
+    def __init__(self, tx_repo: MockTransactionRepository):
+        self.batches = {}
+        self.tx_repo = tx_repo
+
+    def save(self, batch):
+        self.batches[batch.id] = batch
+
+    def delete_with_transactions(self, batch_id):
+        if self.batches.pop(batch_id, None) is None:
+            return None
+        doomed = [
+            tx.id for tx in self.tx_repo.transactions.values()
+            if tx.import_batch_id == batch_id
+        ]
+        for tx_id in doomed:
+            self.tx_repo.delete(tx_id)
+        return len(doomed)
+
+    def get_by_id(self, batch_id):
+        return self.batches.get(batch_id)
+
+    def find_by_digest(self, account_id, file_digest):
+        return next(
+            (b for b in self.batches.values()
+             if b.account_id == account_id and b.file_digest == file_digest),
+            None,
+        )
+
+    def find_by_account(self, account_id, limit=50):
+        return [b for b in self.batches.values() if b.account_id == account_id][:limit]
+
+    def find_spans(self, account_id):
+        return [b.span for b in self.batches.values() if b.account_id == account_id and b.span]
+
+
 # === Fixtures ===
 
 
@@ -233,6 +315,24 @@ class TestImportHandlerBasic:
             handler.handle(cmd)
 
 
+    def test_handle_stream_without_file(
+        self, handler: ImportTransactionsHandler, mock_adapter: MockAdapter, account_id
+    ):
+        """Importe depuis un flux (upload); file_path ne sert qu'au nom."""
+        cmd = ImportTransactionsCommand(
+            file_path=Path("upload.csv"),
+            account_id=account_id,
+            auto_categorize=False,
+            stream=io.BytesIO(b"Date;Montant\n"),
+        )
+
+        result = handler.handle(cmd)
+
+        assert result.imported_count == 2
+        # Adapter sans parse_stream: le flux est recopié pour parse()
+        assert mock_adapter.parsed_content == b"Date;Montant\n"
+
+
 class TestImportHandlerDeduplication:
     """Tests for duplicate detection."""
 
@@ -297,6 +397,146 @@ class TestImportHandlerDeduplication:
         assert result.categorization_rate == 0.0  # Pas de catégorisation
 
 
+class TestImportHandlerPartialFailure:
+    """Tests for imports persisted through TransactionBulkWritePort."""
+
+    def test_rejected_rows_are_reported_without_aborting(
+        self, mock_factory, cat_repo, account_id, tmp_path
+    ):
+        """Les lignes refusées sont rapportées une à une, les autres importées."""
+        tx_repo = MockBulkTransactionRepository(refused={"CB MONOPRIX"})
+        handler = ImportTransactionsHandler(mock_factory, tx_repo, cat_repo)
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("test")
+
+        result = handler.handle(ImportTransactionsCommand(
+            file_path=csv_file, account_id=account_id, auto_categorize=False,
+        ))
+
+        assert (result.imported_count, result.error_count) == (1, 1)
+        assert len(result.errors) == 1
+        assert "CB MONOPRIX" in result.errors[0]
+        assert "NOT NULL constraint failed" in result.errors[0]
+        assert [tx.description for tx in tx_repo.transactions.values()] == ["CB CARREFOUR"]
+
+    def test_reimport_counts_duplicates_as_skipped(
+        self, mock_factory, cat_repo, account_id, tmp_path
+    ):
+        """Les doublons écartés par save_chunked sont ignorés, sans requête par ligne."""
+        tx_repo = MockBulkTransactionRepository()
+        handler = ImportTransactionsHandler(mock_factory, tx_repo, cat_repo)
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("test")
+        command = ImportTransactionsCommand(
+            file_path=csv_file, account_id=account_id, auto_categorize=False,
+        )
+
+        first = handler.handle(command)
+        again = handler.handle(command)
+
+        assert (first.imported_count, first.skipped_count) == (2, 0)
+        assert (again.imported_count, again.skipped_count, again.error_count) == (0, 2, 0)
+        assert again.errors == []
+        assert tx_repo.hash_lookups == 0
+
+
+class TestImportHandlerBatches:
+    """Tests for import batches: digest short-circuit, date spans, undo."""
+
+    @pytest.fixture
+    def batch_repo(self, tx_repo):
+        return MockImportBatchRepository(tx_repo)
+
+    @pytest.fixture
+    def batch_handler(self, mock_factory, tx_repo, cat_repo, batch_repo):
+        return ImportTransactionsHandler(mock_factory, tx_repo, cat_repo, batch_repo)
+
+    def _command(self, path: Path, account_id) -> ImportTransactionsCommand:
+        return ImportTransactionsCommand(file_path=path, account_id=account_id, auto_categorize=False)
+
+    def test_reupload_short_circuits_on_digest(
+        self, batch_handler, batch_repo, mock_adapter: MockAdapter, account_id, tmp_path
+    ):
+        """Le même fichier réimporté n'est ni reparsé ni dédoublonné."""
+        csv_file = tmp_path / "janvier.csv"
+        csv_file.write_text("test")
+
+        first = batch_handler.handle(self._command(csv_file, account_id))
+        del mock_adapter.parsed_content
+        again = batch_handler.handle(self._command(csv_file, account_id))
+
+        batch = batch_repo.get_by_id(first.batch_id)
+        assert (batch.file_name, batch.adapter, batch.row_count) == ("janvier.csv", "Mock", 2)
+        assert (batch.first_date, batch.last_date) == (date(2025, 1, 15), date(2025, 1, 16))
+        assert batch.imported_count == 2
+        assert again.already_imported and again.batch_id == first.batch_id
+        assert (again.imported_count, again.skipped_count) == (0, 2)
+        assert not hasattr(mock_adapter, "parsed_content")
+
+    def test_same_file_in_another_account_is_imported(
+        self, batch_handler, account_id, tmp_path
+    ):
+        """L'empreinte est propre au compte."""
+        csv_file = tmp_path / "janvier.csv"
+        csv_file.write_text("test")
+        batch_handler.handle(self._command(csv_file, account_id))
+
+        result = batch_handler.handle(self._command(csv_file, uuid4()))
+
+        assert not result.already_imported
+        assert result.imported_count == 2
+
+    def test_overlapping_statement_skips_covered_interior(
+        self, tx_repo, cat_repo, batch_repo, account_id
+    ):
+        """Seuls les jours hors de l'intérieur d'une période importée sont relus."""
+        batch_repo.save(ImportBatch(
+            account_id=account_id, file_digest="jan",
+            first_date=date(2025, 1, 1), last_date=date(2025, 1, 31),
+        ))
+        rows = [
+            Transaction(
+                account_id=account_id, date=day, amount=Money(Decimal("-1")),
+                description=f"CB {day}",
+            )
+            for day in (date(2025, 1, 15), date(2025, 1, 31), date(2025, 2, 2))
+        ]
+        handler = ImportTransactionsHandler(None, tx_repo, cat_repo, batch_repo)
+
+        result = handler.import_parsed(rows, account_id, False, ImportSource("jan-feb"))
+
+        # Le 31/01 (bord de période, relevé peut-être partiel) passe par le hash
+        assert (result.imported_count, result.skipped_count) == (2, 1)
+        assert {tx.date for tx in tx_repo.transactions.values()} == {
+            date(2025, 1, 31), date(2025, 2, 2),
+        }
+        assert all(tx.import_batch_id == result.batch_id for tx in tx_repo.transactions.values())
+        assert batch_repo.get_by_id(result.batch_id).skipped_count == 1
+
+    def test_undo_import_removes_batch_transactions(
+        self, batch_handler, batch_repo, tx_repo, account_id, tmp_path
+    ):
+        """undo_import supprime le lot et ses transactions."""
+        csv_file = tmp_path / "janvier.csv"
+        csv_file.write_text("test")
+        result = batch_handler.handle(self._command(csv_file, account_id))
+
+        assert batch_handler.undo_import(result.batch_id) == 2
+        assert tx_repo.transactions == {}
+        assert batch_repo.batches == {}
+        with pytest.raises(LookupError):
+            batch_handler.undo_import(result.batch_id)
+
+    def test_file_digest_rewinds_stream(self, tmp_path):
+        """L'empreinte d'un flux ne consomme pas le flux."""
+        path = tmp_path / "a.csv"
+        path.write_bytes(b"Date;Montant\n")
+        stream = io.BytesIO(b"Date;Montant\n")
+
+        assert file_digest(stream) == file_digest(path)
+        assert stream.tell() == 0
+
+
 class TestImportResultDTO:
     """Tests for ImportResultDTO."""
 
@@ -0,0 +1,265 @@
+"""
+Unit tests for AlertService and ProjectionSnapshot.
+
+Tests threshold breach detection, reuse of cached projections when only
+the balance changes, and budget overshoot alerts.
+"""
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.account import Account
+from src.domain.entities.alert import Alert, AlertType
+from src.domain.entities.recurring_transaction import RecurringTransaction, Frequency
+from src.domain.repositories.account_repository import AccountRepository
+from src.domain.repositories.alert_repository import AlertRepository
+from src.domain.repositories.budget_repository import BudgetRepository
+from src.domain.repositories.recurring_repository import RecurringRepository
+from src.domain.services.alert_service import AlertService
+from src.domain.value_objects.budget_status import BudgetLine
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.projection_snapshot import ProjectionSnapshot
+from src.domain.value_objects.scenario import Scenario
+
+
+TODAY = date(2025, 3, 10)
+
+
+# === Mocks ===
+
+
+class MockAccountRepository(AccountRepository):
+    """Mock AccountRepository for testing."""
+
+    def __init__(self, accounts: list[Account]):
+        self.accounts = accounts
+
+    def save(self, account):
+        pass
+
+    def delete(self, account_id):
+        pass
+
+    def get_by_id(self, account_id):
+        return next((a for a in self.accounts if a.id == account_id), None)
+
+    def find_by_name(self, name):
+        return None
+
+    def find_by_bank(self, bank):
+        return []
+
+    def find_active(self):
+        return [a for a in self.accounts if a.is_active]
+
+    def find_all(self):
+        return self.accounts
+
+
+class MockRecurringRepository(RecurringRepository):
+    """Mock RecurringRepository for testing."""
+
+    def __init__(self, recurring_txs: list[RecurringTransaction] = None):
+        self.recurring_txs = recurring_txs or []
+
+    def save(self, recurring_transaction):
+        pass
+
+    def delete(self, recurring_id):
+        pass
+
+    def get_by_id(self, recurring_id):
+        return None
+
+    def find_by_account(self, account_id):
+        return [r for r in self.recurring_txs if r.account_id == account_id]
+
+    def find_active(self, on_date=None):
+        return [r for r in self.recurring_txs if r.is_active_on(on_date or date.today())]
+
+    def find_all(self):
+        return self.recurring_txs
+
+
+class MockBudgetRepository(BudgetRepository):
+    """Mock BudgetRepository for testing."""
+
+    def __init__(self, lines: list[BudgetLine] = None):
+        self.lines = lines or []
+
+    def find_budget_lines(self, month, account_ids=()):
+        return self.lines
+
+
+class InMemoryAlertRepository(AlertRepository):
+    """In-memory AlertRepository for testing."""
+
+    def __init__(self, balances: dict = None):
+        self.balances = balances or {}
+        self.snapshots = {}
+        self.events = {}
+
+    def current_balances(self, account_ids):
+        return {a: self.balances[a] for a in account_ids if a in self.balances}
+
+    def find_snapshots(self, account_ids):
+        return {a: self.snapshots[a] for a in account_ids if a in self.snapshots}
+
+    def save_snapshots(self, snapshots):
+        for snapshot in snapshots:
+            self.snapshots[snapshot.account_id] = snapshot
+
+    def add_alerts(self, alerts):
+        new = [a for a in alerts if a.dedup_key not in self.events]
+        self.events.update((a.dedup_key, a) for a in new)
+        return new
+
+    def find_alerts(self, account_id=None, limit=50):
+        return list(self.events.values())[:limit]
+
+
+# === Fixtures ===
+
+
+@pytest.fixture
+def account():
+    return Account(name="Courant", bank="LCL")
+
+
+@pytest.fixture
+def rent(account):
+    return RecurringTransaction(
+        name="Loyer",
+        amount=Money(Decimal("-800.00")),
+        frequency=Frequency.MONTHLY,
+        day_of_month=5,
+        start_date=date(2025, 1, 1),
+        account_id=account.id,
+    )
+
+
+def _service(account, alerts, recurring=(), lines=()):
+    return AlertService(
+        MockAccountRepository([account]),
+        MockRecurringRepository(list(recurring)),
+        alerts,
+        MockBudgetRepository(list(lines)),
+        threshold=Decimal("0"),
+        horizon_days=60,
+    )
+
+
+# === Tests: ProjectionSnapshot ===
+
+
+class TestProjectionSnapshot:
+    """Tests for the cached cumulative curve."""
+
+    def test_keeps_record_lows_only(self):
+        snapshot = ProjectionSnapshot.from_changes(
+            uuid4(), TODAY, date(2025, 5, 9), Scenario.REALISTIC, "d",
+            {
+                date(2025, 3, 20): Decimal("-100"),
+                date(2025, 3, 25): Decimal("300"),
+                date(2025, 4, 1): Decimal("-250"),
+                date(2025, 4, 5): Decimal("-100"),
+            },
+            Money(Decimal("0")),
+        )
+
+        assert snapshot.lows == (
+            (date(2025, 3, 20), Decimal("-100")),
+            (date(2025, 4, 5), Decimal("-150")),
+        )
+        assert snapshot.first_breach(Decimal("120"), Decimal("0")) == (
+            date(2025, 4, 5), Decimal("-30")
+        )
+        assert snapshot.first_breach(Decimal("200"), Decimal("0")) is None
+        assert snapshot.first_breach(Decimal("-5"), Decimal("0")) == (TODAY, Decimal("-5"))
+
+
+# === Tests: AlertService ===
+
+
+class TestAlertService:
+    """Tests for AlertService.evaluate."""
+
+    def test_detects_projected_breach_date(self, account, rent):
+        alerts = InMemoryAlertRepository({account.id: Money(Decimal("1000.00"))})
+
+        evaluation = _service(account, alerts, [rent]).evaluate(on_date=TODAY)
+
+        [alert] = evaluation.alerts
+        assert alert.alert_type == AlertType.BALANCE_BELOW_THRESHOLD
+        assert alert.account_id == account.id
+        # 1000 - 800 (5 avril) - 800 (5 mai)
+        assert alert.trigger_date == date(2025, 5, 5)
+        assert alert.amount.amount == Decimal("-600.00")
+        assert evaluation.reprojected == 1
+
+    def test_balance_change_reuses_cached_projection(self, account, rent, monkeypatch):
+        alerts = InMemoryAlertRepository({account.id: Money(Decimal("2000.00"))})
+        service = _service(account, alerts, [rent])
+        assert service.evaluate(on_date=TODAY).alerts == []
+
+        # Import: seul le solde change, les occurrences ne sont pas régénérées
+        monkeypatch.setattr(
+            "src.domain.services.alert_service.scheduled_changes",
+            lambda *args: pytest.fail("projection recomputed"),
+        )
+        alerts.balances[account.id] = Money(Decimal("500.00"))
+        evaluation = service.evaluate(account_ids=[account.id], on_date=TODAY)
+
+        assert (evaluation.reprojected, evaluation.rebased) == (0, 1)
+        assert [a.trigger_date for a in evaluation.alerts] == [date(2025, 4, 5)]
+
+        unchanged = service.evaluate(on_date=TODAY)
+        assert (unchanged.unchanged, unchanged.alerts) == (1, [])
+
+    def test_recurring_change_or_new_day_reprojects(self, account, rent):
+        alerts = InMemoryAlertRepository({account.id: Money(Decimal("2000.00"))})
+        service = _service(account, alerts, [rent])
+        service.evaluate(on_date=TODAY)
+
+        assert service.evaluate(on_date=date(2025, 3, 11)).reprojected == 1
+        service.recurring_repository.recurring_txs = []
+        assert service.evaluate(on_date=date(2025, 3, 11)).reprojected == 1
+
+    def test_unaffected_accounts_are_not_evaluated(self, account, rent):
+        alerts = InMemoryAlertRepository({account.id: Money(Decimal("-10.00"))})
+
+        evaluation = _service(account, alerts, [rent]).evaluate(
+            account_ids=[uuid4()], on_date=TODAY
+        )
+
+        assert evaluation.alerts == []
+        assert alerts.snapshots == {}
+
+    def test_category_over_budget_once_per_month(self, account):
+        category_id = uuid4()
+        line = BudgetLine(
+            category_id=category_id,
+            name="Courses",
+            budget=Money(Decimal("300")),
+            spent=Money(Decimal("320")),
+            category_ids=frozenset({category_id}),
+        )
+        alerts = InMemoryAlertRepository({account.id: Money(Decimal("5000.00"))})
+        service = _service(account, alerts, lines=[line])
+
+        [alert] = service.evaluate(on_date=TODAY).alerts
+        assert alert.alert_type == AlertType.CATEGORY_OVER_BUDGET
+        assert (alert.category_id, alert.trigger_date) == (category_id, date(2025, 3, 1))
+        assert service.evaluate(on_date=date(2025, 3, 12)).alerts == []
+
+
+class TestAlert:
+    """Tests for the Alert entity."""
+
+    def test_balance_alert_requires_account(self):
+        with pytest.raises(ValueError, match="account_id"):
+            Alert(alert_type=AlertType.BALANCE_BELOW_THRESHOLD)
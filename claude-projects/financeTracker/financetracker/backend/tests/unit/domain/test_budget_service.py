@@ -0,0 +1,177 @@
+"""
+Unit tests for BudgetService.
+
+Tests month-to-date burn rate and end-of-month projection of budgets,
+with and without recurring transactions.
+"""
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.recurring_transaction import RecurringTransaction, Frequency
+from src.domain.repositories.budget_repository import BudgetRepository
+from src.domain.repositories.recurring_repository import RecurringRepository
+from src.domain.services.budget_service import BudgetService
+from src.domain.value_objects.budget_status import BudgetLine, BudgetStatus
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.scenario import Scenario
+
+
+# === Mocks ===
+
+
+class MockBudgetRepository(BudgetRepository):
+    """Mock BudgetRepository for testing."""
+
+    def __init__(self, lines: list[BudgetLine] = None):
+        self.lines = lines or []
+        self.calls = []
+
+    def find_budget_lines(self, month, account_ids=()):
+        self.calls.append((month, tuple(account_ids)))
+        return self.lines
+
+
+class MockRecurringRepository(RecurringRepository):
+    """Mock RecurringRepository for testing."""
+
+    def __init__(self, recurring_txs: list[RecurringTransaction] = None):
+        self.recurring_txs = recurring_txs or []
+
+    def save(self, recurring_transaction):
+        pass
+
+    def delete(self, recurring_id):
+        pass
+
+    def get_by_id(self, recurring_id):
+        return None
+
+    def find_by_account(self, account_id):
+        return [rtx for rtx in self.recurring_txs if rtx.account_id == account_id]
+
+    def find_active(self, on_date=None):
+        return [rtx for rtx in self.recurring_txs if rtx.is_active_on(on_date or date.today())]
+
+    def find_all(self):
+        return self.recurring_txs
+
+
+# === Fixtures ===
+
+
+@pytest.fixture
+def category_id():
+    return uuid4()
+
+
+def _line(category_id, budget: str, spent: str, name: str = "Courses") -> BudgetLine:
+    return BudgetLine(
+        category_id=category_id,
+        name=name,
+        budget=Money(Decimal(budget)),
+        spent=Money(Decimal(spent)),
+        category_ids=frozenset({category_id}),
+    )
+
+
+def _monthly(category_id, amount: str, day: int, account_id=None) -> RecurringTransaction:
+    return RecurringTransaction(
+        name="Abonnement",
+        amount=Money(Decimal(amount)),
+        category_id=category_id,
+        frequency=Frequency.MONTHLY,
+        day_of_month=day,
+        start_date=date(2025, 1, 1),
+        account_id=account_id or uuid4(),
+    )
+
+
+# === Tests ===
+
+
+class TestBudgetStatus:
+    """Tests for the BudgetStatus value object."""
+
+    def test_days_elapsed_is_validated(self, category_id):
+        with pytest.raises(ValueError, match="days_elapsed"):
+            BudgetStatus(
+                category_id=category_id, name="Courses", month=date(2025, 2, 1),
+                as_of=date(2025, 2, 28), days_elapsed=29, days_in_month=28,
+                budget=Money(Decimal("1")), spent=Money(Decimal("0")),
+                burn_rate=Money(Decimal("0")), projected_spend=Money(Decimal("0")),
+            )
+
+
+class TestBudgetService:
+    """Tests for BudgetService.statuses."""
+
+    def test_linear_burn_rate_projection(self, category_id):
+        """Sans récurrence, la fin de mois prolonge le rythme constaté."""
+        budgets = MockBudgetRepository([_line(category_id, "400", "150")])
+        service = BudgetService(budgets, MockRecurringRepository())
+
+        [status] = service.statuses(on_date=date(2025, 3, 10))
+
+        assert budgets.calls == [(date(2025, 3, 1), ())]
+        assert status.burn_rate.amount == Decimal("15.00")
+        assert status.projected_spend.amount == Decimal("465.00")
+        assert status.projected_overshoot.amount == Decimal("65.00")
+        assert status.consumption == Decimal("0.3750")
+        assert status.is_projected_over() and not status.is_over_budget()
+
+    def test_upcoming_recurring_is_added_once(self, category_id):
+        """Une récurrence à venir s'ajoute telle quelle, pas au rythme journalier."""
+        recurring = MockRecurringRepository([_monthly(category_id, "-100", day=20)])
+        service = BudgetService(
+            MockBudgetRepository([_line(category_id, "600", "150")]), recurring
+        )
+
+        [status] = service.statuses(on_date=date(2025, 3, 10))
+
+        assert status.projected_spend.amount == Decimal("565.00")
+        assert not status.is_projected_over()
+
+    def test_past_recurring_is_not_extrapolated(self, category_id):
+        """Une récurrence échue est retirée du rythme discrétionnaire."""
+        recurring = MockRecurringRepository([_monthly(category_id, "-100", day=5)])
+        service = BudgetService(
+            MockBudgetRepository([_line(category_id, "400", "150")]), recurring
+        )
+
+        [status] = service.statuses(on_date=date(2025, 3, 10))
+
+        assert status.burn_rate.amount == Decimal("15.00")
+        assert status.projected_spend.amount == Decimal("255.00")
+
+    def test_recurring_filtered_by_category_and_account(self, category_id):
+        account_id = uuid4()
+        recurring = MockRecurringRepository([
+            _monthly(uuid4(), "-100", day=20, account_id=account_id),
+            _monthly(category_id, "-100", day=20),
+        ])
+        service = BudgetService(
+            MockBudgetRepository([_line(category_id, "400", "0")]), recurring
+        )
+
+        [status] = service.statuses(on_date=date(2025, 3, 10), account_ids=(account_id,))
+
+        assert status.projected_spend.amount == Decimal("0.00")
+
+    def test_sorted_by_projected_consumption(self):
+        groceries, leisure = uuid4(), uuid4()
+        service = BudgetService(
+            MockBudgetRepository([
+                _line(groceries, "400", "100", "Courses"),
+                _line(leisure, "100", "50", "Loisirs"),
+            ]),
+            MockRecurringRepository(),
+        )
+
+        statuses = service.statuses(on_date=date(2025, 3, 10), scenario=Scenario.PESSIMISTIC)
+
+        assert [s.name for s in statuses] == ["Loisirs", "Courses"]
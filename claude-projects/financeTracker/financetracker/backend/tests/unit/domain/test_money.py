@@ -0,0 +1,58 @@
+"""
+Unit tests for Money value object.
+
+Tests rounding and the integer-cents conversions.
+"""
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from src.domain.value_objects.money import Money
+
+
+class TestMoneyCents:
+    """Tests for from_cents / to_cents."""
+
+    @pytest.mark.parametrize(
+        "cents, expected",
+        [(-4250, "-42.50"), (150, "1.50"), (0, "0.00"), (1, "0.01"), (123456789, "1234567.89")],
+    )
+    def test_from_cents(self, cents: int, expected: str):
+        money = Money.from_cents(cents)
+        assert money == Money(Decimal(expected))
+        assert str(money.amount) == expected
+        assert money.to_cents() == cents
+
+    def test_from_cents_matches_constructor_hash(self):
+        """Le chemin rapide produit un objet identique (égalité et hash)."""
+        assert hash(Money.from_cents(150, "USD")) == hash(Money(Decimal("1.5"), "USD"))
+
+    def test_from_cents_validates_currency(self):
+        with pytest.raises(ValueError):
+            Money.from_cents(100, "EURO")
+
+    def test_to_cents_after_rounding(self):
+        assert Money(Decimal("10.005")).to_cents() == 1001
+        assert Money(Decimal("-10.005")).to_cents() == -1001
+
+    def test_constructor_still_quantizes(self):
+        assert str(Money(Decimal("2")).amount) == "2.00"
+        assert str(Money(3).amount) == "3.00"
+        assert str(Money(Decimal("1.5")).amount) == "1.50"
+
+
+class TestMoneyCompact:
+    """Tests for the slotted layout and the trusted constructor."""
+
+    def test_is_slotted_and_frozen(self):
+        money = Money(Decimal("1.00"))
+        assert not hasattr(money, "__dict__")
+        with pytest.raises(AttributeError):
+            money.amount = Decimal("2.00")
+
+    def test_from_trusted(self):
+        money = Money.from_trusted(Decimal("-42.50"), "EUR")
+        assert money == Money(Decimal("-42.50"))
+        assert hash(money) == hash(Money(Decimal("-42.50")))
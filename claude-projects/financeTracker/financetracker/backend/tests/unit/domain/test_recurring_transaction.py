@@ -10,7 +10,11 @@ from datetime import date, timedelta
 from decimal import Decimal
 from uuid import uuid4
 
-from src.domain.entities.recurring_transaction import RecurringTransaction, Frequency
+from src.domain.entities.recurring_transaction import (
+    BusinessDayAdjustment,
+    Frequency,
+    RecurringTransaction,
+)
 from src.domain.value_objects.money import Money
 
 
@@ -348,6 +352,188 @@ class TestRecurringTransactionMethods:
         assert income.is_expense() is False
 
 
+class TestRecurrenceRules:
+    """Tests pour les règles de récurrence étendues et occurrences_between."""
+
+    def test_weekly_on_weekday(self):
+        """Hebdomadaire: déclenche le jour de semaine demandé."""
+        recurring = RecurringTransaction(
+            name="Marché",
+            amount=Money(Decimal("-30.00")),
+            frequency=Frequency.WEEKLY,
+            day_of_week=4,  # vendredi
+            start_date=date(2025, 1, 1),  # mercredi
+        )
+
+        assert recurring.occurrences_between(date(2025, 1, 1), date(2025, 1, 31)) == [
+            date(2025, 1, 3),
+            date(2025, 1, 10),
+            date(2025, 1, 17),
+            date(2025, 1, 24),
+            date(2025, 1, 31),
+        ]
+        assert recurring.should_trigger_on(date(2025, 1, 10)) is True
+        assert recurring.should_trigger_on(date(2025, 1, 11)) is False
+
+    def test_weekly_defaults_to_start_weekday(self):
+        """Sans day_of_week, la semaine est ancrée sur start_date."""
+        recurring = RecurringTransaction(
+            name="Cours",
+            amount=Money(Decimal("-15.00")),
+            frequency=Frequency.WEEKLY,
+            interval=2,
+            start_date=date(2025, 1, 6),  # lundi
+        )
+
+        assert recurring.occurrences_between(date(2025, 1, 1), date(2025, 2, 5)) == [
+            date(2025, 1, 6),
+            date(2025, 1, 20),
+            date(2025, 2, 3),
+        ]
+
+    def test_every_n_months(self):
+        """Tous les 3 mois, ancré sur le mois de start_date."""
+        recurring = RecurringTransaction(
+            name="Assurance trimestrielle",
+            amount=Money(Decimal("-90.00")),
+            frequency=Frequency.MONTHLY,
+            interval=3,
+            day_of_month=31,
+            start_date=date(2025, 2, 1),
+        )
+
+        assert recurring.occurrences_between(date(2025, 1, 1), date(2025, 12, 31)) == [
+            date(2025, 2, 28),
+            date(2025, 5, 31),
+            date(2025, 8, 31),
+            date(2025, 11, 30),
+        ]
+
+    def test_yearly_month_of_year(self):
+        """Annuel: déclenche dans le mois demandé, pas toujours en janvier."""
+        recurring = RecurringTransaction(
+            name="Taxe foncière",
+            amount=Money(Decimal("-800.00")),
+            frequency=Frequency.YEARLY,
+            month_of_year=10,
+            day_of_month=15,
+            start_date=date(2025, 1, 1),
+        )
+
+        assert recurring.should_trigger_on(date(2025, 10, 15)) is True
+        assert recurring.should_trigger_on(date(2025, 1, 15)) is False
+        assert recurring.next_occurrence_after(date(2025, 10, 15)) == date(2026, 10, 15)
+
+    def test_yearly_leap_day_clamped(self):
+        """Un 29 février annuel tombe le 28 les années non bissextiles."""
+        recurring = RecurringTransaction(
+            name="Anniversaire",
+            amount=Money(Decimal("-50.00")),
+            frequency=Frequency.YEARLY,
+            month_of_year=2,
+            day_of_month=29,
+            start_date=date(2024, 1, 1),
+        )
+
+        assert recurring.occurrences_between(date(2024, 1, 1), date(2026, 12, 31)) == [
+            date(2024, 2, 29),
+            date(2025, 2, 28),
+            date(2026, 2, 28),
+        ]
+
+    def test_every_n_days(self):
+        """Tous les N jours depuis start_date."""
+        recurring = RecurringTransaction(
+            name="Abonnement",
+            amount=Money(Decimal("-5.00")),
+            frequency=Frequency.DAILY,
+            interval=10,
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 25),
+        )
+
+        assert recurring.occurrences_between(date(2024, 12, 1), date(2025, 3, 1)) == [
+            date(2025, 1, 1),
+            date(2025, 1, 11),
+            date(2025, 1, 21),
+        ]
+
+    def test_business_day_following(self):
+        """Un loyer du 1er tombant un samedi est reporté au lundi."""
+        recurring = RecurringTransaction(
+            name="Loyer",
+            amount=Money(Decimal("-1200.00")),
+            frequency=Frequency.MONTHLY,
+            day_of_month=1,
+            start_date=date(2025, 1, 1),
+            business_day_adjustment=BusinessDayAdjustment.FOLLOWING,
+        )
+
+        # 1er mars 2025 = samedi
+        assert recurring.should_trigger_on(date(2025, 3, 1)) is False
+        assert recurring.should_trigger_on(date(2025, 3, 3)) is True
+        assert recurring.next_occurrence_after(date(2025, 2, 15)) == date(2025, 3, 3)
+
+    def test_business_day_modified_following(self):
+        """Modified following: recule si le report change de mois."""
+        recurring = RecurringTransaction(
+            name="Salaire",
+            amount=Money(Decimal("3000.00")),
+            frequency=Frequency.MONTHLY,
+            day_of_month=31,
+            start_date=date(2025, 1, 1),
+            business_day_adjustment=BusinessDayAdjustment.MODIFIED_FOLLOWING,
+        )
+
+        # 31 mai 2025 = samedi -> vendredi 30 mai
+        assert recurring.occurrences_between(date(2025, 5, 1), date(2025, 6, 5)) == [
+            date(2025, 5, 30),
+        ]
+
+    def test_occurrences_match_daily_predicate(self):
+        """occurrences_between est cohérent avec une évaluation jour par jour."""
+        recurring = RecurringTransaction(
+            name="Loyer",
+            amount=Money(Decimal("-1200.00")),
+            frequency=Frequency.MONTHLY,
+            interval=2,
+            day_of_month=30,
+            start_date=date(2025, 1, 15),
+            end_date=date(2026, 6, 1),
+            business_day_adjustment=BusinessDayAdjustment.PRECEDING,
+        )
+
+        window_start, window_end = date(2024, 12, 1), date(2026, 12, 31)
+        brute_force = [
+            window_start + timedelta(days=offset)
+            for offset in range((window_end - window_start).days + 1)
+            if recurring.should_trigger_on(window_start + timedelta(days=offset))
+        ]
+
+        assert recurring.occurrences_between(window_start, window_end) == brute_force
+        assert len(brute_force) == 9
+
+    def test_invalid_interval(self):
+        """interval doit être >= 1."""
+        with pytest.raises(ValueError, match="interval"):
+            RecurringTransaction(
+                name="Test",
+                amount=Money(Decimal("100.00")),
+                frequency=Frequency.MONTHLY,
+                interval=0,
+            )
+
+    def test_invalid_day_of_week(self):
+        """day_of_week doit être entre 0 et 6."""
+        with pytest.raises(ValueError, match="day_of_week"):
+            RecurringTransaction(
+                name="Test",
+                amount=Money(Decimal("100.00")),
+                frequency=Frequency.WEEKLY,
+                day_of_week=7,
+            )
+
+
 class TestRecurringTransactionSerialization:
     """Tests pour la sérialisation."""
 
@@ -418,3 +604,35 @@ class TestRecurringTransactionSerialization:
         assert recurring.end_date == date(2026, 12, 31)
         assert recurring.is_variable is True
         assert recurring.variance_percent == 5.0
+
+
+class TestRecurringTransactionTrusted:
+    """Tests pour la construction de confiance (lecture en base)."""
+
+    def test_from_trusted_equals_validated(self):
+        """from_trusted produit la même entité que le constructeur."""
+        recurring = RecurringTransaction(
+            name="Loyer",
+            amount=Money(Decimal("-1200.00")),
+            category_id=uuid4(),
+            frequency=Frequency.MONTHLY,
+            day_of_month=5,
+            start_date=date(2025, 1, 1),
+        )
+        values = {name: getattr(recurring, name) for name in RecurringTransaction.__slots__}
+
+        trusted = RecurringTransaction.from_trusted(**values)
+
+        assert trusted == recurring
+        assert trusted.occurrences_between(date(2025, 1, 1), date(2025, 3, 31)) == [
+            date(2025, 1, 5), date(2025, 2, 5), date(2025, 3, 5),
+        ]
+
+    def test_from_trusted_requires_every_field(self):
+        with pytest.raises(TypeError):
+            RecurringTransaction.from_trusted(name="Loyer")
+
+    def test_is_slotted(self):
+        """Pas de __dict__ par instance."""
+        recurring = RecurringTransaction(name="Loyer", amount=Money(Decimal("-1.00")))
+        assert not hasattr(recurring, "__dict__")
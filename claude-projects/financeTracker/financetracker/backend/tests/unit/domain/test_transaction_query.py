@@ -0,0 +1,65 @@
+"""
+Test suite for TransactionQuery value object.
+
+Teste la normalisation et les invariants de la spécification de filtres.
+"""
+from __future__ import annotations
+
+import pytest
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+from src.domain.value_objects.date_range import DateRange
+from src.domain.value_objects.transaction_query import TransactionQuery
+
+
+class TestTransactionQuery:
+    """Tests pour TransactionQuery."""
+
+    def test_empty_query(self):
+        """Sans critère, la requête est vide."""
+        assert TransactionQuery().is_empty()
+
+    def test_collections_are_normalized_to_tuples(self):
+        """Les listes deviennent des tuples dédoublonnés (hashable)."""
+        account_id = uuid4()
+
+        query = TransactionQuery(account_ids=[account_id, account_id], tags=[" Courses ", ""])
+
+        assert query.account_ids == (account_id,)
+        assert query.tags == ("courses",)
+        assert hash(query) == hash(TransactionQuery(account_ids=(account_id,), tags=("courses",)))
+        assert not query.is_empty()
+
+    def test_amounts_converted_to_decimal(self):
+        """Les bornes de montant sont converties en Decimal."""
+        query = TransactionQuery(min_amount=-10, max_amount="5.5")
+
+        assert query.min_amount == Decimal("-10")
+        assert query.max_amount == Decimal("5.5")
+
+    def test_blank_text_is_ignored(self):
+        """Un texte vide n'est pas un critère."""
+        assert TransactionQuery(text="   ").is_empty()
+
+    def test_invalid_amount_range(self):
+        """Lève ValueError si min_amount > max_amount."""
+        with pytest.raises(ValueError, match="min_amount"):
+            TransactionQuery(min_amount=Decimal("10"), max_amount=Decimal("-10"))
+
+    def test_invalid_confidence(self):
+        """Lève ValueError si min_confidence hors de [0, 1]."""
+        with pytest.raises(ValueError, match="min_confidence"):
+            TransactionQuery(min_confidence=1.5)
+
+    def test_uncategorized_excludes_categories(self):
+        """uncategorized et category_ids sont incompatibles."""
+        with pytest.raises(ValueError, match="uncategorized"):
+            TransactionQuery(category_ids=[uuid4()], uncategorized=True)
+
+    def test_date_range_only(self):
+        """Une période seule suffit à rendre la requête non vide."""
+        query = TransactionQuery(date_range=DateRange(date(2025, 1, 1), date(2025, 1, 31)))
+
+        assert not query.is_empty()